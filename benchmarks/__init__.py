@@ -0,0 +1 @@
+"""Benchmarks of Windows Shell resources (winshlrc)."""
@@ -0,0 +1,236 @@
+"""Shared benchmark case."""
+
+import gc
+import os
+import time
+import tracemalloc
+
+# The path to top of the winshl-kb source tree.
+PROJECT_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# The paths below are all derived from the project path directory.
+# They are enumerated explicitly here so that they can be overwritten for
+# compatibility with different build systems.
+DATA_PATH = os.path.join(PROJECT_PATH, "winshlrc", "data")
+TEST_DATA_PATH = os.path.join(PROJECT_PATH, "test_data")
+
+
+class BenchmarkResult:
+    """Benchmark result.
+
+    Attributes:
+      allocated_blocks (float): mean number of memory blocks allocated, and not
+          freed, per operation.
+      maximum_time (float): maximum of the mean time per operation of
+          the samples in nanoseconds.
+      mean_time (float): mean time per operation in nanoseconds.
+      minimum_time (float): minimum of the mean time per operation of
+          the samples in nanoseconds.
+      name (str): name of the benchmark, such as "Class.benchmarkName".
+      number_of_operations (int): number of operations timed.
+      peak_memory (int): maximum of the peak traced memory per operation
+          in bytes.
+    """
+
+    def __init__(self, name):
+        """Initializes a benchmark result.
+
+        Args:
+          name (str): name of the benchmark.
+        """
+        super().__init__()
+        self.allocated_blocks = 0.0
+        self.maximum_time = 0.0
+        self.mean_time = 0.0
+        self.minimum_time = 0.0
+        self.name = name
+        self.number_of_operations = 0
+        self.peak_memory = 0
+
+    def CopyToDict(self):
+        """Copies the benchmark result to a dictionary.
+
+        Returns:
+          dict[str, object]: benchmark result values.
+        """
+        return {
+            "allocated_blocks": self.allocated_blocks,
+            "maximum_time": self.maximum_time,
+            "mean_time": self.mean_time,
+            "minimum_time": self.minimum_time,
+            "name": self.name,
+            "number_of_operations": self.number_of_operations,
+            "peak_memory": self.peak_memory,
+        }
+
+
+class BaseBenchmarkCase:
+    """The base benchmark case.
+
+    A benchmark is a method of which the name starts with "benchmark" and that
+    performs a single operation. The setUp and tearDown methods are called once
+    per benchmark, not per operation.
+    """
+
+    # Minimum duration, in seconds, of the timed operations of a benchmark.
+    MINIMUM_DURATION = 0.2
+
+    # Minimum duration, in seconds, of a sample of timed operations.
+    MINIMUM_SAMPLE_DURATION = 0.001
+
+    # Maximum number of operations of which the allocations are traced.
+    MAXIMUM_TRACED_OPERATIONS = 100
+
+    def _GetDataFilePath(self, path_segments):
+        """Retrieves the path of a file in the data directory.
+
+        Args:
+          path_segments (list[str]): path segments inside the data directory.
+
+        Returns:
+          str: path of the data file.
+        """
+        # Note that we need to pass the individual path segments to os.path.join
+        # and not a list.
+        return os.path.join(DATA_PATH, *path_segments)
+
+    def _GetTestFilePath(self, path_segments):
+        """Retrieves the path of a test file in the test data directory.
+
+        Args:
+          path_segments (list[str]): path segments inside the test data directory.
+
+        Returns:
+          str: path of the test file.
+        """
+        # Note that we need to pass the individual path segments to os.path.join
+        # and not a list.
+        return os.path.join(TEST_DATA_PATH, *path_segments)
+
+    def _MeasureAllocations(self, function, number_of_operations):
+        """Measures the memory allocations of an operation.
+
+        Args:
+          function (function): function that performs the operation.
+          number_of_operations (int): number of operations to trace.
+
+        Returns:
+          tuple[float, int]: mean number of memory blocks allocated, and not freed,
+              per operation and maximum of the peak traced memory per operation
+              in bytes.
+        """
+        number_of_operations = min(number_of_operations, self.MAXIMUM_TRACED_OPERATIONS)
+
+        gc.collect()
+        tracemalloc.start()
+        try:
+            peak_memory = 0
+            snapshot = tracemalloc.take_snapshot()
+
+            for _ in range(number_of_operations):
+                tracemalloc.reset_peak()
+                current_memory, _ = tracemalloc.get_traced_memory()
+
+                function()
+
+                _, operation_peak_memory = tracemalloc.get_traced_memory()
+                peak_memory = max(peak_memory, operation_peak_memory - current_memory)
+
+            statistics = tracemalloc.take_snapshot().compare_to(snapshot, "filename")
+
+        finally:
+            tracemalloc.stop()
+
+        allocated_blocks = sum(statistic.count_diff for statistic in statistics)
+
+        return allocated_blocks / number_of_operations, peak_memory
+
+    def _MeasureTime(self, function):
+        """Measures the time of an operation.
+
+        Operations are timed in samples of multiple operations so that the
+        overhead of the timer is negligible for fast operations. Samples are
+        taken until their total duration exceeds the minimum duration.
+
+        Args:
+          function (function): function that performs the operation.
+
+        Returns:
+          tuple[list[float], int]: mean time per operation in nanoseconds per
+              sample and the number of operations.
+        """
+        # Call the function once so that lazy initialization is not timed.
+        function()
+
+        minimum_sample_duration = int(self.MINIMUM_SAMPLE_DURATION * 1000000000)
+
+        operations_per_sample = 1
+        while True:
+            start_time = time.perf_counter_ns()
+            for _ in range(operations_per_sample):
+                function()
+            sample_time = time.perf_counter_ns() - start_time
+
+            if sample_time >= minimum_sample_duration:
+                break
+
+            operations_per_sample *= 2
+
+        operation_times = [sample_time / operations_per_sample]
+        total_time = sample_time
+        minimum_duration = int(self.MINIMUM_DURATION * 1000000000)
+
+        while total_time < minimum_duration:
+            start_time = time.perf_counter_ns()
+            for _ in range(operations_per_sample):
+                function()
+            sample_time = time.perf_counter_ns() - start_time
+
+            operation_times.append(sample_time / operations_per_sample)
+            total_time += sample_time
+
+        return operation_times, len(operation_times) * operations_per_sample
+
+    def GetBenchmarkNames(self):
+        """Retrieves the names of the benchmarks.
+
+        Returns:
+          list[str]: names of the benchmark methods.
+        """
+        return sorted(name for name in dir(self) if name.startswith("benchmark"))
+
+    def RunBenchmark(self, name):
+        """Runs a benchmark.
+
+        Args:
+          name (str): name of the benchmark method.
+
+        Returns:
+          BenchmarkResult: benchmark result.
+        """
+        function = getattr(self, name)
+
+        self.setUp()
+        try:
+            operation_times, number_of_operations = self._MeasureTime(function)
+            allocated_blocks, peak_memory = self._MeasureAllocations(
+                function, number_of_operations
+            )
+        finally:
+            self.tearDown()
+
+        benchmark_result = BenchmarkResult(f"{type(self).__name__:s}.{name:s}")
+        benchmark_result.allocated_blocks = allocated_blocks
+        benchmark_result.maximum_time = max(operation_times)
+        benchmark_result.mean_time = sum(operation_times) / len(operation_times)
+        benchmark_result.minimum_time = min(operation_times)
+        benchmark_result.number_of_operations = number_of_operations
+        benchmark_result.peak_memory = peak_memory
+
+        return benchmark_result
+
+    def setUp(self):  # pylint: disable=invalid-name
+        """Sets up the needed objects used throughout the benchmark."""
+
+    def tearDown(self):  # pylint: disable=invalid-name
+        """Cleans up the objects used throughout the benchmark."""
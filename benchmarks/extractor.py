@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Benchmarks for the Windows shell extractor."""
+
+import os
+import shutil
+import tempfile
+import uuid
+
+from dfwinreg import definitions as dfwinreg_definitions
+from dfwinreg import fake as dfwinreg_fake
+
+from winshlrc import extractor
+from winshlrc import path_resolver
+from winshlrc import resource_file
+from winshlrc import statistics
+
+from tests import synthetic_lib
+
+from benchmarks import benchmark_lib
+
+
+class WindowsShellExtractorBenchmark(benchmark_lib.BaseBenchmarkCase):
+    """Benchmarks for the Windows shell extractor."""
+
+    # pylint: disable=protected-access
+
+    _NUMBER_OF_CLASS_IDENTIFIERS = 10000
+
+    # Names of the shell folders, where names that reference a string resource
+    # are resolved using test_data/wrc_test.dll.
+    _NAMES = [
+        "@%SystemRoot%\\system32\\wrc_test.dll,-1000",
+        "@%SystemRoot%\\system32\\wrc_test.dll,-1111",
+        "Shell folder",
+        None,
+    ]
+
+    def _CreateClassIdentifiersKey(self, number_of_class_identifiers):
+        """Creates a synthetic class identifiers key.
+
+        Args:
+          number_of_class_identifiers (int): number of class identifier keys.
+
+        Returns:
+          dfwinreg.FakeWinRegistryKey: class identifiers key.
+        """
+        class_identifiers_key = dfwinreg_fake.FakeWinRegistryKey("CLSID")
+
+        for index in range(number_of_class_identifiers):
+            identifier = uuid.UUID(int=index)
+            class_identifier_key = dfwinreg_fake.FakeWinRegistryKey(
+                f"{{{identifier!s}}}"
+            )
+
+            name = self._NAMES[index % len(self._NAMES)]
+            if name:
+                registry_value = dfwinreg_fake.FakeWinRegistryValue(
+                    "",
+                    data=f"{name:s}\x00".encode("utf-16-le"),
+                    data_type=dfwinreg_definitions.REG_SZ,
+                )
+                class_identifier_key.AddValue(registry_value)
+
+            # Only half of the class identifiers define a shell folder.
+            if index % 2 == 0:
+                shell_folder_key = dfwinreg_fake.FakeWinRegistryKey("ShellFolder")
+                class_identifier_key.AddSubkey("ShellFolder", shell_folder_key)
+
+            class_identifiers_key.AddSubkey(
+                class_identifier_key.name, class_identifier_key
+            )
+
+        return class_identifiers_key
+
+    def setUp(self):
+        """Sets up the needed objects used throughout the benchmark."""
+        self._class_identifiers_key = self._CreateClassIdentifiersKey(
+            self._NUMBER_OF_CLASS_IDENTIFIERS
+        )
+
+        self._extractor = extractor.WindowsShellExtractor()
+        self._extractor._path_resolver = path_resolver.ResourceDirectoryPathResolver(
+            benchmark_lib.TEST_DATA_PATH
+        )
+
+        self._windows_resource_file = resource_file.WindowsResourceFile(
+            "C:\\Windows\\System32\\wrc_test.dll"
+        )
+        self._windows_resource_file.Open(self._GetTestFilePath(["wrc_test.dll"]))
+
+        self._temporary_directory = tempfile.mkdtemp()
+        self._software_path = os.path.join(self._temporary_directory, "SOFTWARE")
+        synthetic_lib.WriteSoftwareRegistryFile(
+            self._software_path, self._NUMBER_OF_CLASS_IDENTIFIERS, names=self._NAMES
+        )
+
+    def tearDown(self):
+        """Cleans up the objects used throughout the benchmark."""
+        self._windows_resource_file.Close()
+        self._extractor.Close()
+        shutil.rmtree(self._temporary_directory, True)
+
+    def benchmarkCollectShellFolders(self):
+        """Benchmarks collecting shell folders from a SOFTWARE Registry file."""
+        windows_shell_extractor = extractor.WindowsShellExtractor()
+        windows_shell_extractor.OpenRegistryFiles(
+            [self._software_path], resources_path=benchmark_lib.TEST_DATA_PATH
+        )
+        list(windows_shell_extractor.CollectShellFolders())
+        windows_shell_extractor.Close()
+
+    def benchmarkCollectShellFoldersFromKey(self):
+        """Benchmarks collecting shell folders from 10k class identifiers."""
+        list(self._extractor._CollectShellFoldersFromKey(self._class_identifiers_key))
+
+    def benchmarkCollectShellFoldersFromKeyWithStatistics(self):
+        """Benchmarks collecting shell folders with statistics enabled."""
+        self._extractor._statistics = statistics.ExtractionStatistics()
+        list(self._extractor._CollectShellFoldersFromKey(self._class_identifiers_key))
+        self._extractor._statistics = None
+
+    def benchmarkGetString(self):
+        """Benchmarks retrieving a string from a Windows resource file."""
+        self._extractor._GetString(self._windows_resource_file, 1000)
+
+    def benchmarkResolveName(self):
+        """Benchmarks resolving a name that references a string resource."""
+        self._extractor._ResolveName(self._NAMES[0])
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Benchmarks for the Windows shell knowledge base."""
+
+import uuid
+
+from winshlrc import knowledge_base
+
+from benchmarks import benchmark_lib
+
+
+class WindowsShellKnowledgeBaseBenchmark(benchmark_lib.BaseBenchmarkCase):
+    """Benchmarks for the Windows shell knowledge base."""
+
+    # pylint: disable=protected-access
+
+    _NUMBER_OF_IDENTIFIERS = 100000
+
+    def setUp(self):
+        """Sets up the needed objects used throughout the benchmark."""
+        self._knowledge_base = knowledge_base.WindowsShellKnowledgeBase()
+        self._knowledge_base.ReadFromDirectory(benchmark_lib.DATA_PATH)
+
+        self._knowledge_base._BuildIndex()
+
+        # Half of the identifiers are defined and half are not.
+        defined_identifiers = list(self._knowledge_base._index)
+        self._identifiers = b"".join(
+            (
+                defined_identifiers[index % len(defined_identifiers)]
+                if index % 2
+                else uuid.UUID(int=index).bytes_le
+            )
+            for index in range(self._NUMBER_OF_IDENTIFIERS)
+        )
+
+    def benchmarkResolve100000Identifiers(self):
+        """Benchmarks resolving 100000 identifiers."""
+        self._knowledge_base.ResolveIdentifiers(self._identifiers)
+
+    def benchmarkResolve100000IdentifiersWithoutNumPy(self):
+        """Benchmarks resolving 100000 identifiers without NumPy."""
+        self._knowledge_base._ResolveIdentifiersWithoutNumPy(self._identifiers)
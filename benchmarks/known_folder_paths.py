@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Benchmarks for the classifier of file paths by known folder."""
+
+from winshlrc import knowledge_base
+from winshlrc import known_folder_paths
+
+from benchmarks import benchmark_lib
+
+
+class KnownFolderPathClassifierBenchmark(benchmark_lib.BaseBenchmarkCase):
+    """Benchmarks for the classifier of file paths by known folder."""
+
+    # pylint: disable=protected-access
+
+    _NUMBER_OF_PATHS = 100000
+
+    _PATHS = [
+        "C:\\Users\\{username:s}\\AppData\\Roaming\\Microsoft\\Windows\\Recent\\"
+        "file{index:d}.lnk",
+        "C:\\Users\\{username:s}\\Desktop\\file{index:d}.txt",
+        "C:\\Windows\\System32\\file{index:d}.dll",
+        "C:\\Program Files\\Application\\file{index:d}.exe",
+        "D:\\Data\\file{index:d}.bin",
+    ]
+
+    _USERNAMES = ["user1", "user2", "user3", "user4"]
+
+    def setUp(self):
+        """Sets up the needed objects used throughout the benchmark."""
+        test_knowledge_base = knowledge_base.WindowsShellKnowledgeBase()
+        test_knowledge_base.ReadFromDirectory(benchmark_lib.DATA_PATH)
+
+        self._classifier = known_folder_paths.KnownFolderPathClassifier()
+        for definition in test_knowledge_base.GetKnownFolderDefinitions():
+            self._classifier.AddKnownFolderDefinition(definition)
+
+        for username in self._USERNAMES:
+            self._classifier.AddUserProfile(username)
+
+        self._classifier._BuildTrie()
+
+        self._paths = [
+            self._PATHS[index % len(self._PATHS)].format(
+                index=index, username=self._USERNAMES[index % len(self._USERNAMES)]
+            )
+            for index in range(self._NUMBER_OF_PATHS)
+        ]
+
+    def benchmarkClassify100000Paths(self):
+        """Benchmarks classifying 100000 paths."""
+        for _ in self._classifier.ClassifyPaths(self._paths):
+            pass
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Benchmarks for the fuzzy search of definitions by name."""
+
+import uuid
+
+from unittest import mock
+
+from winshlrc import knowledge_base
+from winshlrc import name_search
+from winshlrc import resources
+
+from benchmarks import benchmark_lib
+
+
+class NameSearchIndexBenchmark(benchmark_lib.BaseBenchmarkCase):
+    """Benchmarks for the fuzzy search index of definitions by name."""
+
+    # pylint: disable=protected-access
+
+    _NUMBER_OF_DEFINITIONS = 50000
+
+    _WORDS = [
+        "Control",
+        "Devices",
+        "Folder",
+        "Library",
+        "Network",
+        "Panel",
+        "Printers",
+        "Settings",
+    ]
+
+    def setUp(self):
+        """Sets up the needed objects used throughout the benchmark."""
+        test_knowledge_base = knowledge_base.WindowsShellKnowledgeBase()
+        test_knowledge_base.ReadFromDirectory(benchmark_lib.DATA_PATH)
+
+        self._search_index = name_search.NameSearchIndex()
+        self._search_index.AddKnowledgeBase(test_knowledge_base)
+
+        # Synthetic definitions of which the names share many trigrams.
+        number_of_words = len(self._WORDS)
+        for index in range(self._NUMBER_OF_DEFINITIONS):
+            definition = resources.ShellFolderDefinition()
+            definition.identifier = str(uuid.UUID(int=index))
+            definition.name = " ".join(
+                [
+                    self._WORDS[index % number_of_words],
+                    self._WORDS[(index // number_of_words) % number_of_words],
+                    f"{index:d}",
+                ]
+            )
+            self._search_index.AddShellFolderDefinition(definition)
+
+        self._search_index.Search("Control Panel")
+
+    def benchmarkSearch(self):
+        """Benchmarks searching 50000 definitions."""
+        self._search_index.Search("Control Panel\\All Tasks")
+
+    def benchmarkSearchWithoutNumPy(self):
+        """Benchmarks searching 50000 definitions without NumPy."""
+        with mock.patch.object(name_search, "numpy", None):
+            self._search_index.Search("Control Panel\\All Tasks")
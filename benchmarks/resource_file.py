@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""Benchmarks for the Windows Resource (WRC) file class."""
+
+import os
+import shutil
+import tempfile
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as dfvfs_path_spec_factory
+from dfvfs.resolver import resolver as dfvfs_resolver
+
+from winshlrc import resource_file
+
+from tests import synthetic_lib
+
+from benchmarks import benchmark_lib
+
+
+class WindowsResourceFileBenchmark(benchmark_lib.BaseBenchmarkCase):
+    """Benchmarks for the Windows Resource file object."""
+
+    # pylint: disable=protected-access
+
+    _LANGUAGE_IDENTIFIERS = [0x0407, 0x0409, 0x040C]
+
+    # The strings of the large synthetic file result in a resource section of
+    # about 4 MiB.
+    _LARGE_STRING_SIZE = 1024
+
+    _NUMBER_OF_LARGE_SYNTHETIC_STRINGS = 2048
+
+    _NUMBER_OF_SYNTHETIC_STRINGS = 4096
+
+    _SYNTHETIC_WINDOWS_PATH = "C:\\Windows\\System32\\en-US\\synthetic.dll.mui"
+
+    _WINDOWS_PATH = "C:\\Windows\\System32\\wrc_test.dll"
+
+    def setUp(self):
+        """Sets up the needed objects used throughout the benchmark."""
+        self._path = self._GetTestFilePath(["wrc_test.dll"])
+        self._path_spec = dfvfs_path_spec_factory.Factory.NewPathSpec(
+            dfvfs_definitions.TYPE_INDICATOR_OS, location=self._path
+        )
+
+        self._windows_resource_file = resource_file.WindowsResourceFile(
+            self._WINDOWS_PATH
+        )
+        self._windows_resource_file.Open(self._path)
+
+        self._temporary_directory = tempfile.mkdtemp()
+        self._synthetic_path = os.path.join(
+            self._temporary_directory, "synthetic.dll.mui"
+        )
+
+        resource_file_writer = synthetic_lib.ResourceFileWriter()
+        for language_identifier in self._LANGUAGE_IDENTIFIERS:
+            resource_file_writer.AddStringTable(
+                language_identifier,
+                synthetic_lib.GetStrings(
+                    self._NUMBER_OF_SYNTHETIC_STRINGS, language_identifier
+                ),
+            )
+        resource_file_writer.Write(self._synthetic_path)
+
+        self._large_synthetic_path = os.path.join(
+            self._temporary_directory, "large.dll.mui"
+        )
+        self._large_synthetic_path_spec = dfvfs_path_spec_factory.Factory.NewPathSpec(
+            dfvfs_definitions.TYPE_INDICATOR_OS, location=self._large_synthetic_path
+        )
+
+        strings = synthetic_lib.GetStrings(
+            self._NUMBER_OF_LARGE_SYNTHETIC_STRINGS, 0x0409
+        )
+        resource_file_writer = synthetic_lib.ResourceFileWriter()
+        resource_file_writer.AddStringTable(
+            0x0409,
+            {
+                string_identifier: string.ljust(self._LARGE_STRING_SIZE, ".")
+                for string_identifier, string in strings.items()
+            },
+        )
+        resource_file_writer.Write(self._large_synthetic_path)
+
+    def tearDown(self):
+        """Cleans up the objects used throughout the benchmark."""
+        self._windows_resource_file.Close()
+        shutil.rmtree(self._temporary_directory, True)
+
+    def benchmarkGetMUIResource(self):
+        """Benchmarks opening a file and retrieving the MUI resource."""
+        windows_resource_file = resource_file.WindowsResourceFile(self._WINDOWS_PATH)
+        windows_resource_file.Open(self._path)
+        windows_resource_file.GetMUIResource()
+        windows_resource_file.Close()
+
+    def benchmarkGetStringCached(self):
+        """Benchmarks retrieving a string from a cached string table."""
+        self._windows_resource_file.GetString(1000)
+
+    def benchmarkGetStringTableResource(self):
+        """Benchmarks opening a file and retrieving the string table resource."""
+        windows_resource_file = resource_file.WindowsResourceFile(self._WINDOWS_PATH)
+        windows_resource_file.Open(self._path)
+        windows_resource_file.GetStringTableResource()
+        windows_resource_file.Close()
+
+    def benchmarkGetStringSynthetic(self):
+        """Benchmarks retrieving a string from a file with 3 x 4096 strings."""
+        windows_resource_file = resource_file.WindowsResourceFile(
+            self._SYNTHETIC_WINDOWS_PATH
+        )
+        windows_resource_file.Open(self._synthetic_path)
+        windows_resource_file.GetString(1000 + self._NUMBER_OF_SYNTHETIC_STRINGS - 1)
+        windows_resource_file.Close()
+
+    def benchmarkGetStringUncached(self):
+        """Benchmarks opening a file and retrieving a string."""
+        windows_resource_file = resource_file.WindowsResourceFile(self._WINDOWS_PATH)
+        windows_resource_file.Open(self._path)
+        windows_resource_file.GetString(1000)
+        windows_resource_file.Close()
+
+    def benchmarkOpenFileObject(self):
+        """Benchmarks opening a file using a dfVFS file-like object."""
+        windows_resource_file = resource_file.WindowsResourceFile(self._WINDOWS_PATH)
+        file_object = dfvfs_resolver.Resolver.OpenFileObject(self._path_spec)
+        windows_resource_file.OpenFileObject(file_object)
+        windows_resource_file.Close()
+
+    def benchmarkOpenFileObjectReadAhead(self):
+        """Benchmarks opening a file using a dfVFS file-like object and read-ahead."""
+        windows_resource_file = resource_file.WindowsResourceFile(
+            self._WINDOWS_PATH, read_ahead=True
+        )
+        file_object = dfvfs_resolver.Resolver.OpenFileObject(self._path_spec)
+        windows_resource_file.OpenFileObject(file_object)
+        windows_resource_file.Close()
+
+    def benchmarkOpenLargeFileObjectReadAhead(self):
+        """Benchmarks opening a 4 MiB file using dfVFS and read-ahead."""
+        windows_resource_file = resource_file.WindowsResourceFile(
+            self._SYNTHETIC_WINDOWS_PATH, read_ahead=True
+        )
+        file_object = dfvfs_resolver.Resolver.OpenFileObject(
+            self._large_synthetic_path_spec
+        )
+        windows_resource_file.OpenFileObject(file_object)
+        windows_resource_file.GetString(
+            1000 + self._NUMBER_OF_LARGE_SYNTHETIC_STRINGS - 1
+        )
+        windows_resource_file.Close()
+
+    def benchmarkOpenLargeMemoryMapped(self):
+        """Benchmarks opening a 4 MiB file that is memory mapped."""
+        windows_resource_file = resource_file.WindowsResourceFile(
+            self._SYNTHETIC_WINDOWS_PATH
+        )
+        windows_resource_file.Open(self._large_synthetic_path)
+        windows_resource_file.GetString(
+            1000 + self._NUMBER_OF_LARGE_SYNTHETIC_STRINGS - 1
+        )
+        windows_resource_file.Close()
+
+    def benchmarkOpenMemoryMapped(self):
+        """Benchmarks opening a file that is memory mapped."""
+        windows_resource_file = resource_file.WindowsResourceFile(self._WINDOWS_PATH)
+        windows_resource_file.Open(self._path)
+        windows_resource_file.Close()
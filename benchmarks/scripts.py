@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Benchmarks for the start up time of the console scripts."""
+
+import os
+import subprocess
+import sys
+
+from benchmarks import benchmark_lib
+
+
+class ScriptStartUpBenchmark(benchmark_lib.BaseBenchmarkCase):
+    """Benchmarks for the start up time of the console scripts.
+
+    Every operation starts a new Python interpreter, so that the measured time
+    includes that of interpreter start up and of importing the modules. The
+    import time per module can be broken down by running the same command with
+    "python -X importtime".
+    """
+
+    def setUp(self):
+        """Sets up the needed objects used throughout the benchmark."""
+        self._environment = dict(os.environ)
+        self._environment["PYTHONPATH"] = benchmark_lib.PROJECT_PATH
+
+    def _RunPython(self, arguments):
+        """Runs a Python interpreter.
+
+        Args:
+          arguments (list[str]): arguments of the Python interpreter.
+        """
+        subprocess.run(
+            [sys.executable, *arguments],
+            check=True,
+            cwd=benchmark_lib.PROJECT_PATH,
+            env=self._environment,
+            stdout=subprocess.DEVNULL,
+        )
+
+    def benchmarkExtractHelp(self):
+        """Benchmarks running extract --help."""
+        self._RunPython(["-m", "winshlrc.scripts.extract", "--help"])
+
+    def benchmarkImportExtractor(self):
+        """Benchmarks importing the extractor and its back-ends."""
+        self._RunPython(["-c", "import winshlrc.extractor"])
+
+    def benchmarkImportGenerateDocs(self):
+        """Benchmarks importing the generate_docs script."""
+        self._RunPython(["-c", "import winshlrc.scripts.generate_docs"])
+
+    def benchmarkImportResources(self):
+        """Benchmarks importing the resources module."""
+        self._RunPython(["-c", "import winshlrc.resources"])
+
+    def benchmarkStartInterpreter(self):
+        """Benchmarks starting the Python interpreter, as a baseline."""
+        self._RunPython(["-c", "pass"])
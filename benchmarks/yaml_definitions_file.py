@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Benchmarks for the YAML-based Windows shell definitions files."""
+
+import os
+import shutil
+import tempfile
+
+from winshlrc import yaml_definitions_file
+
+from tests import synthetic_lib
+
+from benchmarks import benchmark_lib
+
+
+class YAMLDefinitionsFileBenchmark(benchmark_lib.BaseBenchmarkCase):
+    """Benchmarks for the YAML-based Windows shell definitions files."""
+
+    _NUMBER_OF_SYNTHETIC_DEFINITIONS = 2000
+
+    def setUp(self):
+        """Sets up the needed objects used throughout the benchmark."""
+        self._temporary_directory = tempfile.mkdtemp()
+        synthetic_lib.WriteDefinitionsFiles(
+            self._temporary_directory, self._NUMBER_OF_SYNTHETIC_DEFINITIONS
+        )
+
+    def tearDown(self):
+        """Cleans up the objects used throughout the benchmark."""
+        shutil.rmtree(self._temporary_directory, True)
+
+    def benchmarkReadControlPanelItemsDefinitions(self):
+        """Benchmarks reading the defined control panel items definitions."""
+        definitions_file = yaml_definitions_file.YAMLControlPanelItemsDefinitionsFile()
+        path = self._GetDataFilePath(["defined_controlpanel_items.yaml"])
+        list(definitions_file.ReadFromFile(path))
+
+    def benchmarkReadKnownFoldersDefinitions(self):
+        """Benchmarks reading the defined known folders definitions."""
+        definitions_file = yaml_definitions_file.YAMLKnownFoldersDefinitionsFile()
+        path = self._GetDataFilePath(["defined_knownfolders.yaml"])
+        list(definitions_file.ReadFromFile(path))
+
+    def benchmarkReadShellFoldersDefinitions(self):
+        """Benchmarks reading the observed shell folders definitions."""
+        definitions_file = yaml_definitions_file.YAMLShellFoldersDefinitionsFile()
+        path = self._GetDataFilePath(["observed_shellfolders.yaml"])
+        list(definitions_file.ReadFromFile(path))
+
+    def benchmarkReadSyntheticKnownFoldersDefinitions(self):
+        """Benchmarks reading 2000 synthetic known folders definitions."""
+        definitions_file = yaml_definitions_file.YAMLKnownFoldersDefinitionsFile()
+        path = os.path.join(self._temporary_directory, "defined_knownfolders.yaml")
+        list(definitions_file.ReadFromFile(path))
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Script to run the benchmarks."""
+
+import argparse
+import importlib
+import inspect
+import json
+import os
+import pkgutil
+import re
+import sys
+
+# Change PYTHONPATH to include winshlrc and benchmarks.
+sys.path.insert(0, ".")
+
+import benchmarks  # pylint: disable=wrong-import-position
+
+from benchmarks import benchmark_lib  # pylint: disable=wrong-import-position
+
+
+def GetBenchmarkCases():
+    """Retrieves the benchmark cases.
+
+    Returns:
+      list[type]: benchmark case classes.
+    """
+    benchmark_cases = []
+    for module_information in pkgutil.iter_modules(benchmarks.__path__):
+        if module_information.name == "benchmark_lib":
+            continue
+
+        module = importlib.import_module(f"benchmarks.{module_information.name:s}")
+        for _, member in inspect.getmembers(module, inspect.isclass):
+            if (
+                issubclass(member, benchmark_lib.BaseBenchmarkCase)
+                and member is not benchmark_lib.BaseBenchmarkCase
+                and member.__module__ == module.__name__
+            ):
+                benchmark_cases.append(member)
+
+    return sorted(benchmark_cases, key=lambda benchmark_case: benchmark_case.__name__)
+
+
+def Main():
+    """Entry point of console script to run the benchmarks.
+
+    Returns:
+      int: exit code that is provided to sys.exit().
+    """
+    argument_parser = argparse.ArgumentParser(
+        description="Runs the benchmarks of the extraction hot paths."
+    )
+
+    argument_parser.add_argument(
+        "--baseline",
+        dest="baseline",
+        action="store",
+        metavar="PATH",
+        default=None,
+        help=(
+            "path of a JSON file with results of a previous run to compare "
+            "the mean time per operation against."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--filter",
+        dest="filter",
+        action="store",
+        metavar="REGEX",
+        default=None,
+        help="regular expression that the names of the benchmarks must match.",
+    )
+
+    argument_parser.add_argument(
+        "--output",
+        dest="output",
+        action="store",
+        metavar="PATH",
+        default=None,
+        help="path of a JSON file to write the results to.",
+    )
+
+    options = argument_parser.parse_args()
+
+    baseline_results = {}
+    if options.baseline:
+        with open(options.baseline, "r", encoding="utf-8") as file_object:
+            baseline_results = {
+                result["name"]: result for result in json.load(file_object)
+            }
+
+    name_filter = re.compile(options.filter) if options.filter else None
+
+    print(
+        f"{'Benchmark':<80s} {'Mean':>12s} {'Minimum':>12s} {'Blocks/op':>10s} "
+        f"{'Peak/op':>10s}"
+    )
+
+    results = []
+    for benchmark_case in GetBenchmarkCases():
+        benchmark_object = benchmark_case()
+        for name in benchmark_object.GetBenchmarkNames():
+            qualified_name = f"{benchmark_case.__name__:s}.{name:s}"
+            if name_filter and not name_filter.search(qualified_name):
+                continue
+
+            result = benchmark_object.RunBenchmark(name)
+            results.append(result)
+
+            line = (
+                f"{result.name:<80s} {result.mean_time / 1000:>9.1f} us "
+                f"{result.minimum_time / 1000:>9.1f} us "
+                f"{result.allocated_blocks:>10.1f} {result.peak_memory:>8d} B"
+            )
+
+            baseline_result = baseline_results.get(result.name)
+            if baseline_result and baseline_result["mean_time"]:
+                ratio = result.mean_time / baseline_result["mean_time"]
+                line = f"{line:s} {ratio:>6.2f}x"
+
+            print(line)
+
+    if options.output:
+        output_directory = os.path.dirname(os.path.abspath(options.output))
+        os.makedirs(output_directory, exist_ok=True)
+
+        with open(options.output, "w", encoding="utf-8") as file_object:
+            json.dump(
+                [result.CopyToDict() for result in results], file_object, indent=2
+            )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(Main())
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Tests for the export of definitions and extraction results to Arrow."""
+
+import os
+import unittest
+import uuid
+
+from unittest import mock
+
+from winshlrc import arrow_export
+from winshlrc import knowledge_base
+from winshlrc import resources
+
+from tests import test_lib
+
+
+@unittest.skipIf(arrow_export.pyarrow is None, "missing pyarrow")
+class ArrowExporterTest(test_lib.BaseTestCase):
+    """Tests for the exporter of definitions and extraction results to Arrow."""
+
+    _MY_COMPUTER_IDENTIFIER = "20d04fe0-3aea-1069-a2d8-08002b30309d"
+
+    _PROGRAMS_IDENTIFIER = "a77f5d77-2e2b-44c3-a6a2-aba601054a51"
+
+    _OBSERVATIONS = [
+        (
+            "xp.raw",
+            "p1",
+            "Windows XP",
+            _MY_COMPUTER_IDENTIFIER,
+            "CLSID_MyComputer",
+            "My Computer",
+            None,
+        ),
+        (
+            "10.raw",
+            "p2",
+            "Windows 10",
+            _MY_COMPUTER_IDENTIFIER,
+            None,
+            "This PC",
+            "@shell32.dll,-9216",
+        ),
+        ("10.raw", "p2", "Windows 10", "{invalid}", None, None, None),
+    ]
+
+    def _CreateKnowledgeBase(self):
+        """Creates a knowledge base with known folder and shell folder definitions.
+
+        Returns:
+          WindowsShellKnowledgeBase: knowledge base.
+        """
+        test_knowledge_base = knowledge_base.WindowsShellKnowledgeBase()
+
+        definition = resources.KnownFolderDefinition()
+        definition.display_name = "Programs"
+        definition.identifier = self._PROGRAMS_IDENTIFIER
+        definition.name = "FOLDERID_Programs"
+        definition.windows_versions = ["Windows Vista", "Windows 10"]
+        test_knowledge_base.AddKnownFolderDefinition(definition)
+
+        definition = resources.ShellFolderDefinition()
+        definition.alternate_names = ["This PC"]
+        definition.class_name = "CLSID_MyComputer"
+        definition.identifier = self._MY_COMPUTER_IDENTIFIER
+        definition.name = "My Computer"
+        definition.windows_versions = ["Windows XP", "Windows 10"]
+        test_knowledge_base.AddShellFolderDefinition(definition)
+
+        return test_knowledge_base
+
+    def testGetDefinitionsTable(self):
+        """Tests the GetDefinitionsTable function."""
+        exporter = arrow_export.ArrowExporter(row_group_size=1)
+
+        table = exporter.GetDefinitionsTable(self._CreateKnowledgeBase())
+        self.assertEqual(table.column_names, exporter.DEFINITIONS_COLUMNS)
+        self.assertEqual(table.num_rows, 2)
+
+        self.assertEqual(table.schema.field("identifier").type.byte_width, 16)
+        self.assertEqual(
+            str(table.schema.field("name").type),
+            "dictionary<values=string, indices=int32, ordered=0>",
+        )
+
+        rows = table.to_pylist()
+        self.assertEqual(
+            rows[0]["identifier"], uuid.UUID(self._PROGRAMS_IDENTIFIER).bytes_le
+        )
+        self.assertEqual(rows[0]["resource_type"], "known_folder")
+        self.assertEqual(rows[0]["display_name"], "Programs")
+        self.assertIsNone(rows[0]["class_name"])
+
+        self.assertEqual(rows[1]["resource_type"], "shell_folder")
+        self.assertEqual(rows[1]["class_name"], "CLSID_MyComputer")
+        self.assertEqual(rows[1]["alternate_names"], ["This PC"])
+        self.assertEqual(rows[1]["windows_versions"], ["Windows XP", "Windows 10"])
+
+    def testGetObservationsTable(self):
+        """Tests the GetObservationsTable function."""
+        exporter = arrow_export.ArrowExporter()
+
+        table = exporter.GetObservationsTable(self._OBSERVATIONS)
+        self.assertEqual(table.column_names, exporter.OBSERVATIONS_COLUMNS)
+        self.assertEqual(table.num_rows, 3)
+
+        rows = table.to_pylist()
+        self.assertEqual(
+            rows[1]["identifier"], uuid.UUID(self._MY_COMPUTER_IDENTIFIER).bytes_le
+        )
+        self.assertEqual(rows[1]["localized_string"], "@shell32.dll,-9216")
+        self.assertEqual(rows[1]["windows_version"], "Windows 10")
+        self.assertIsNone(rows[2]["identifier"])
+
+        table = exporter.GetObservationsTable([])
+        self.assertEqual(table.num_rows, 0)
+
+    def testInitialize(self):
+        """Tests the __init__ function."""
+        with mock.patch.object(arrow_export, "pyarrow", None):
+            with self.assertRaises(RuntimeError):
+                arrow_export.ArrowExporter()
+
+    def testWriteDefinitionsAndObservations(self):
+        """Tests the WriteDefinitions and WriteObservations functions."""
+        pyarrow = arrow_export.pyarrow
+
+        exporter = arrow_export.ArrowExporter(row_group_size=2)
+
+        with test_lib.TempDirectory() as temporary_directory:
+            path = os.path.join(temporary_directory, "definitions.parquet")
+            number_of_rows = exporter.WriteDefinitions(
+                self._CreateKnowledgeBase(), path
+            )
+            self.assertEqual(number_of_rows, 2)
+
+            parquet_file = pyarrow.parquet.ParquetFile(path)
+            self.assertEqual(parquet_file.metadata.num_rows, 2)
+            self.assertEqual(parquet_file.metadata.num_row_groups, 1)
+
+            path = os.path.join(temporary_directory, "observations.parquet")
+            number_of_rows = exporter.WriteObservations(iter(self._OBSERVATIONS), path)
+            self.assertEqual(number_of_rows, 3)
+
+            parquet_file = pyarrow.parquet.ParquetFile(path)
+            self.assertEqual(parquet_file.metadata.num_rows, 3)
+            self.assertEqual(parquet_file.metadata.num_row_groups, 2)
+
+            table = parquet_file.read()
+            self.assertEqual(table.column("name").to_pylist()[0], "My Computer")
+
+
+if __name__ == "__main__":
+    unittest.main()
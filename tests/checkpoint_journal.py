@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Tests for the checkpoint journal of extraction runs."""
+
+import os
+import unittest
+
+from winshlrc import checkpoint_journal
+from winshlrc import extractor
+
+from tests import test_lib
+
+
+class CheckpointJournalTest(test_lib.BaseTestCase):
+    """Tests for the checkpoint journal of extraction runs."""
+
+    _MY_COMPUTER_IDENTIFIER = "20d04fe0-3aea-1069-a2d8-08002b30309d"
+
+    def _GetVolumeResults(self):
+        """Retrieves volume results.
+
+        Returns:
+          list[tuple[str, str, list[ShellFolder]]]: volume identifier, detected
+              Windows version and shell folders per Windows volume.
+        """
+        shell_folder = extractor.ShellFolder(
+            identifier=self._MY_COMPUTER_IDENTIFIER,
+            localized_string="@%SystemRoot%\\system32\\shell32.dll,-9216",
+        )
+        shell_folder.name = "This PC"
+
+        return [("p1", "Windows 10 (1809)", [shell_folder])]
+
+    def testAddAndGetCompletedSource(self):
+        """Tests the AddCompletedSource and GetCompletedSource functions."""
+        first_source_definition = {"source": "first.raw", "windows_version": None}
+        second_source_definition = {"source": "second.raw", "windows_version": None}
+
+        with test_lib.TempDirectory() as temporary_directory:
+            path = os.path.join(temporary_directory, "journal.jsonl")
+
+            test_journal = checkpoint_journal.CheckpointJournal(path)
+            test_journal.Open()
+
+            with self.assertRaises(OSError):
+                test_journal.Open()
+
+            test_journal.AddCompletedSource(
+                first_source_definition, self._GetVolumeResults()
+            )
+            test_journal.Close()
+
+            # A line that was only partially written, by an interrupted run.
+            with open(path, "a", encoding="utf-8") as file_object:
+                file_object.write('{"format_version": 1, "source": "{')
+
+            test_journal = checkpoint_journal.CheckpointJournal(path)
+            test_journal.Open(resume=True)
+
+            self.assertEqual(test_journal.number_of_completed_sources, 1)
+
+            volume_results = test_journal.GetCompletedSource(first_source_definition)
+            self.assertIsNotNone(volume_results)
+            self.assertEqual(len(volume_results), 1)
+
+            volume_identifier, windows_version, shell_folders = volume_results[0]
+            self.assertEqual(volume_identifier, "p1")
+            self.assertEqual(windows_version, "Windows 10 (1809)")
+            self.assertEqual(len(shell_folders), 1)
+            self.assertEqual(shell_folders[0].identifier, self._MY_COMPUTER_IDENTIFIER)
+            self.assertEqual(shell_folders[0].name, "This PC")
+
+            volume_results = test_journal.GetCompletedSource(second_source_definition)
+            self.assertIsNone(volume_results)
+
+            test_journal.AddCompletedSource(
+                second_source_definition, self._GetVolumeResults()
+            )
+            test_journal.Close()
+
+            test_journal = checkpoint_journal.CheckpointJournal(path)
+            test_journal.Open(resume=True)
+            self.assertEqual(test_journal.number_of_completed_sources, 2)
+            test_journal.Close()
+
+            # A run that is not resumed starts with an empty journal.
+            test_journal = checkpoint_journal.CheckpointJournal(path)
+            test_journal.Open()
+            self.assertEqual(test_journal.number_of_completed_sources, 0)
+            test_journal.Close()
+
+            test_journal = checkpoint_journal.CheckpointJournal(path)
+            test_journal.Open(resume=True)
+            self.assertEqual(test_journal.number_of_completed_sources, 0)
+            test_journal.Close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Tests for the shared functionality of the console scripts."""
+
+import contextlib
+import io
+import os
+import unittest
+
+from winshlrc.scripts import cli_tool
+
+from tests import test_lib
+
+
+class CLIToolTest(test_lib.BaseTestCase):
+    """Tests for the command line tool."""
+
+    # pylint: disable=protected-access
+
+    def testParseArguments(self):
+        """Tests the ParseArguments function."""
+        test_tool = cli_tool.CLITool("Test tool.")
+
+        options = test_tool.ParseArguments([])
+        self.assertIsNone(options.profile)
+        self.assertFalse(options.timing)
+        self.assertEqual(options.trace_memory, 0)
+
+        test_tool = cli_tool.CLITool("Test tool.")
+
+        options = test_tool.ParseArguments(["--trace_memory"])
+        test_tool.StopInstrumentation()
+        self.assertEqual(options.trace_memory, 10)
+
+        test_tool = cli_tool.CLITool("Test tool.")
+
+        options = test_tool.ParseArguments(["--trace-memory", "5"])
+        test_tool.StopInstrumentation()
+        self.assertEqual(options.trace_memory, 5)
+
+    def testStartPhase(self):
+        """Tests the StartPhase function."""
+        test_tool = cli_tool.CLITool("Test tool.")
+        test_tool.ParseArguments(["--timing"])
+
+        test_tool.StartPhase("first")
+        test_tool.StartPhase("second")
+        test_tool.StartPhase("first")
+
+        output_writer = io.StringIO()
+        with contextlib.redirect_stderr(output_writer):
+            test_tool.StopInstrumentation()
+
+        self.assertEqual(list(test_tool._phase_times), ["first", "second"])
+
+        output = output_writer.getvalue()
+        self.assertIn("Timing:", output)
+        self.assertIn("total", output)
+
+    def testStopInstrumentation(self):
+        """Tests the StopInstrumentation function."""
+        with test_lib.TempDirectory() as temporary_directory:
+            profile_path = os.path.join(temporary_directory, "profile")
+
+            test_tool = cli_tool.CLITool("Test tool.")
+            test_tool.ParseArguments(
+                ["--profile", profile_path, "--timing", "--trace_memory", "5"]
+            )
+
+            output_writer = io.StringIO()
+            with contextlib.redirect_stderr(output_writer):
+                test_tool.StopInstrumentation()
+                test_tool.StopInstrumentation()
+
+            self.assertTrue(os.path.isfile(profile_path))
+
+        output = output_writer.getvalue()
+        self.assertEqual(output.count("Profile written to:"), 1)
+        self.assertIn("Memory allocations:", output)
+        self.assertIn("Timing:", output)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,634 @@
+#!/usr/bin/env python3
+"""Tests for the Windows shell extractor."""
+
+import os
+import unittest
+
+from dfvfs.helpers import volume_scanner as dfvfs_volume_scanner
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as dfvfs_path_spec_factory
+
+from winshlrc import extractor
+from winshlrc import registry_cache
+from winshlrc import scan_cache
+from winshlrc import shell_folder_cache
+from winshlrc import statistics
+
+from tests import synthetic_lib
+from tests import test_lib
+
+
+class ShellFolderTest(test_lib.BaseTestCase):
+    """Tests for the Windows shell folder."""
+
+    _MY_COMPUTER_IDENTIFIER = "20d04fe0-3aea-1069-a2d8-08002b30309d"
+
+    def testCopyFromAndToValues(self):
+        """Tests the CopyFromValues and CopyToValues functions."""
+        shell_folder = extractor.ShellFolder(
+            identifier=self._MY_COMPUTER_IDENTIFIER,
+            localized_string="@%SystemRoot%\\system32\\shell32.dll,-9216",
+        )
+        shell_folder.alternate_names = ["My Computer"]
+        shell_folder.name = "This PC"
+
+        values = shell_folder.CopyToValues()
+        self.assertEqual(
+            values,
+            [
+                self._MY_COMPUTER_IDENTIFIER,
+                None,
+                "This PC",
+                "@%SystemRoot%\\system32\\shell32.dll,-9216",
+            ],
+        )
+
+        shell_folder = extractor.ShellFolder.CopyFromValues(values)
+        self.assertEqual(shell_folder.alternate_names, [])
+        self.assertIsNone(shell_folder.class_name)
+        self.assertEqual(shell_folder.identifier, self._MY_COMPUTER_IDENTIFIER)
+        self.assertEqual(shell_folder.name, "This PC")
+
+        with self.assertRaises(ValueError):
+            extractor.ShellFolder.CopyFromValues(values[1:])
+
+
+class WindowsShellExtractorTest(test_lib.BaseTestCase):
+    """Tests for the Windows shell extractor."""
+
+    # pylint: disable=protected-access
+
+    _NAMES = [
+        "@%SystemRoot%\\system32\\synthetic.dll,-1000",
+        "Shell folder",
+        None,
+    ]
+
+    def _CreateResourceFiles(self, path, flat_layout=False):
+        """Creates a language neutral and MUI resource file.
+
+        Args:
+          path (str): path of the directory to create the resource files in.
+          flat_layout (Optional[bool]): True if the MUI resource file should be
+              created next to the language neutral resource file instead of in
+              an en-US sub directory.
+        """
+        resource_file_writer = synthetic_lib.ResourceFileWriter()
+        resource_file_writer.AddMUIResource("en-US")
+        resource_file_writer.Write(os.path.join(path, "synthetic.dll"))
+
+        mui_path = path
+        if not flat_layout:
+            mui_path = os.path.join(path, "en-US")
+            os.mkdir(mui_path)
+
+        resource_file_writer = synthetic_lib.ResourceFileWriter()
+        for language_identifier in (0x0407, 0x0409):
+            resource_file_writer.AddStringTable(
+                language_identifier, synthetic_lib.GetStrings(32, language_identifier)
+            )
+        resource_file_writer.Write(os.path.join(mui_path, "synthetic.dll.mui"))
+
+    def _CreateDiskImage(self, path):
+        """Creates a disk image with a volume with snapshots and Windows volumes.
+
+        The first partition contains a volume with 2 Volume Shadow Snapshots
+        and the second and third partition contain the same Windows volume.
+
+        Args:
+          path (str): path of the disk image to create.
+        """
+        file_system_writer = synthetic_lib.FATFileSystemWriter()
+
+        with test_lib.TempDirectory() as temporary_directory:
+            synthetic_lib.WriteSoftwareRegistryFile(
+                os.path.join(temporary_directory, "SOFTWARE"), 30, names=self._NAMES
+            )
+            self._CreateResourceFiles(temporary_directory)
+
+            for windows_path, path_segments in (
+                ("Windows\\System32\\config\\SOFTWARE", ["SOFTWARE"]),
+                ("Windows\\System32\\synthetic.dll", ["synthetic.dll"]),
+                (
+                    "Windows\\System32\\en-US\\synthetic.dll.mui",
+                    ["en-US", "synthetic.dll.mui"],
+                ),
+            ):
+                file_path = os.path.join(temporary_directory, *path_segments)
+                with open(file_path, "rb") as file_object:
+                    file_system_writer.AddFile(windows_path, file_object.read())
+
+        file_system_data = file_system_writer.GetData()
+
+        synthetic_lib.WriteDiskImage(
+            path,
+            [
+                synthetic_lib.GetVolumeShadowSnapshotsVolumeData(2),
+                file_system_data,
+                file_system_data,
+            ],
+        )
+
+    def _GetVolumeScannerOptions(self, snapshots=None):
+        """Retrieves volume scanner options to scan all partitions.
+
+        Args:
+          snapshots (Optional[list[str]]): snapshot identifiers or None to scan
+              all snapshots.
+
+        Returns:
+          dfvfs.VolumeScannerOptions: volume scanner options.
+        """
+        options = dfvfs_volume_scanner.VolumeScannerOptions()
+        options.partitions = ["all"]
+        options.snapshots = snapshots or ["all"]
+        return options
+
+    def testCollectShellFolders(self):
+        """Tests the CollectShellFolders function."""
+        registry_file_cache = registry_cache.WindowsRegistryFileCache()
+
+        with test_lib.TempDirectory() as temporary_directory:
+            software_path = os.path.join(temporary_directory, "SOFTWARE")
+            expected_names = synthetic_lib.WriteSoftwareRegistryFile(
+                software_path, 300, names=self._NAMES
+            )
+
+            resources_path = os.path.join(temporary_directory, "resources")
+            os.mkdir(resources_path)
+            self._CreateResourceFiles(resources_path)
+
+            test_extractor = extractor.WindowsShellExtractor(
+                registry_file_cache=registry_file_cache
+            )
+            test_extractor.OpenRegistryFiles(
+                [software_path], resources_path=resources_path
+            )
+
+            try:
+                self.assertEqual(test_extractor.windows_version, "Windows 10 (1809)")
+
+                shell_folders = list(test_extractor.CollectShellFolders())
+
+            finally:
+                test_extractor.Close()
+
+        self.assertEqual(registry_file_cache.number_of_files, 0)
+
+        self.assertEqual(len(shell_folders), 150)
+
+        names = {
+            shell_folder.identifier: shell_folder.name for shell_folder in shell_folders
+        }
+        self.assertEqual(set(names), set(expected_names))
+
+        identifier = synthetic_lib.GetClassIdentifier(0)
+        self.assertEqual(names[identifier], "String 1000 (0409)")
+
+        identifier = synthetic_lib.GetClassIdentifier(2)
+        self.assertIsNone(names[identifier])
+
+        identifier = synthetic_lib.GetClassIdentifier(4)
+        self.assertEqual(names[identifier], "Shell folder")
+
+    def testCollectShellFoldersWithFlatResourcesLayout(self):
+        """Tests the CollectShellFolders function with a flat resources layout."""
+        with test_lib.TempDirectory() as temporary_directory:
+            software_path = os.path.join(temporary_directory, "SOFTWARE")
+            synthetic_lib.WriteSoftwareRegistryFile(
+                software_path, 10, names=self._NAMES
+            )
+
+            resources_path = os.path.join(temporary_directory, "resources")
+            os.mkdir(resources_path)
+            self._CreateResourceFiles(resources_path, flat_layout=True)
+
+            test_extractor = extractor.WindowsShellExtractor()
+            test_extractor.OpenRegistryFiles(
+                [software_path], resources_path=resources_path
+            )
+
+            try:
+                shell_folders = list(test_extractor.CollectShellFolders())
+
+            finally:
+                test_extractor.Close()
+
+        names = {
+            shell_folder.identifier: shell_folder.name for shell_folder in shell_folders
+        }
+
+        identifier = synthetic_lib.GetClassIdentifier(0)
+        self.assertEqual(names[identifier], "String 1000 (0409)")
+
+    def testCollectShellFoldersWithStatistics(self):
+        """Tests the CollectShellFolders function with statistics."""
+        test_statistics = statistics.ExtractionStatistics()
+
+        with test_lib.TempDirectory() as temporary_directory:
+            software_path = os.path.join(temporary_directory, "SOFTWARE")
+            synthetic_lib.WriteSoftwareRegistryFile(
+                software_path, 300, names=self._NAMES
+            )
+
+            self._CreateResourceFiles(temporary_directory)
+
+            test_extractor = extractor.WindowsShellExtractor(statistics=test_statistics)
+            test_extractor.OpenRegistryFiles(
+                [software_path], resources_path=temporary_directory
+            )
+
+            try:
+                list(test_extractor.CollectShellFolders())
+
+            finally:
+                test_extractor.Close()
+
+        self.assertIs(test_extractor.statistics, test_statistics)
+
+        counters = test_statistics.counters
+        self.assertEqual(counters["class_identifiers"], 300)
+        self.assertEqual(counters["mui_resource_files_found"], 1)
+        self.assertEqual(counters["registry_files_opened"], 1)
+        self.assertEqual(counters["resource_file_cache_misses"], 1)
+        # The language neutral and MUI resource file are opened once.
+        self.assertEqual(counters["resource_files_opened"], 2)
+        self.assertEqual(counters["shell_folders"], 150)
+        self.assertEqual(counters["string_cache_hits"], 49)
+        self.assertEqual(counters["string_cache_misses"], 1)
+        self.assertEqual(counters["string_tables_decoded"], 1)
+        self.assertEqual(counters["unresolved_references"], 0)
+
+        self.assertEqual(test_statistics.stage_calls["class_identifier_enumeration"], 1)
+        self.assertEqual(test_statistics.stage_calls["name_resolution"], 50)
+
+    def testCollectShellFoldersWithShellFolderCache(self):
+        """Tests the CollectShellFolders function with a shell folder cache."""
+        with test_lib.TempDirectory() as temporary_directory:
+            software_path = os.path.join(temporary_directory, "SOFTWARE")
+            synthetic_lib.WriteSoftwareRegistryFile(
+                software_path, 300, names=self._NAMES
+            )
+
+            resources_path = os.path.join(temporary_directory, "resources")
+            os.mkdir(resources_path)
+            self._CreateResourceFiles(resources_path)
+
+            test_cache = shell_folder_cache.ShellFolderResultCache(
+                os.path.join(temporary_directory, "shell_folder_cache.sqlite")
+            )
+            test_cache.Open()
+
+            results = []
+            for preferred_language_identifier in (0x0409, 0x0409, 0x0407):
+                test_statistics = statistics.ExtractionStatistics()
+
+                test_extractor = extractor.WindowsShellExtractor(
+                    shell_folder_cache=test_cache, statistics=test_statistics
+                )
+                test_extractor.preferred_language_identifier = (
+                    preferred_language_identifier
+                )
+                test_extractor.OpenRegistryFiles(
+                    [software_path], resources_path=resources_path
+                )
+
+                try:
+                    shell_folders = list(test_extractor.CollectShellFolders())
+
+                finally:
+                    test_extractor.Close()
+
+                names = {
+                    shell_folder.identifier: shell_folder.name
+                    for shell_folder in shell_folders
+                }
+                results.append((names, test_statistics.counters))
+
+            test_cache.Close()
+
+        identifier = synthetic_lib.GetClassIdentifier(0)
+
+        names, counters = results[0]
+        self.assertEqual(len(names), 150)
+        self.assertEqual(names[identifier], "String 1000 (0409)")
+        self.assertEqual(counters["shell_folder_result_cache_misses"], 1)
+        self.assertEqual(counters["class_identifiers"], 300)
+
+        # The second run with the same settings reuses the cached shell folders
+        # and does not read the class identifiers.
+        names, counters = results[1]
+        self.assertEqual(names, results[0][0])
+        self.assertEqual(counters["shell_folder_result_cache_hits"], 1)
+        self.assertEqual(counters["shell_folders"], 150)
+        self.assertNotIn("class_identifiers", counters)
+
+        # A different preferred language identifier is a different result.
+        names, counters = results[2]
+        self.assertEqual(names[identifier], "String 1000 (0407)")
+        self.assertEqual(counters["shell_folder_result_cache_misses"], 1)
+
+    def testGetPartitionAndSnapshotIdentifier(self):
+        """Tests the GetPartitionIdentifier and GetSnapshotIdentifier functions."""
+        path_spec = dfvfs_path_spec_factory.Factory.NewPathSpec(
+            dfvfs_definitions.TYPE_INDICATOR_OS, location="/tmp/image.raw"
+        )
+        path_spec = dfvfs_path_spec_factory.Factory.NewPathSpec(
+            dfvfs_definitions.TYPE_INDICATOR_RAW, parent=path_spec
+        )
+        partition_path_spec = dfvfs_path_spec_factory.Factory.NewPathSpec(
+            dfvfs_definitions.TYPE_INDICATOR_TSK_PARTITION,
+            location="/p1",
+            part_index=2,
+            parent=path_spec,
+        )
+        snapshot_path_spec = dfvfs_path_spec_factory.Factory.NewPathSpec(
+            dfvfs_definitions.TYPE_INDICATOR_VSHADOW,
+            location="/vss1",
+            store_index=0,
+            parent=partition_path_spec,
+        )
+
+        test_extractor = extractor.WindowsShellExtractor()
+
+        path_spec = dfvfs_path_spec_factory.Factory.NewPathSpec(
+            dfvfs_definitions.TYPE_INDICATOR_NTFS,
+            location="\\",
+            parent=snapshot_path_spec,
+        )
+        self.assertEqual(test_extractor.GetPartitionIdentifier(path_spec), "p1")
+        self.assertEqual(test_extractor.GetSnapshotIdentifier(path_spec), "vss1")
+
+        path_spec = dfvfs_path_spec_factory.Factory.NewPathSpec(
+            dfvfs_definitions.TYPE_INDICATOR_NTFS,
+            location="\\",
+            parent=partition_path_spec,
+        )
+        self.assertEqual(test_extractor.GetPartitionIdentifier(path_spec), "p1")
+        self.assertIsNone(test_extractor.GetSnapshotIdentifier(path_spec))
+
+    def testGetWindowsVolumePathSpecs(self):
+        """Tests the GetWindowsVolumePathSpecs function."""
+        with test_lib.TempDirectory() as temporary_directory:
+            image_path = os.path.join(temporary_directory, "image.raw")
+            self._CreateDiskImage(image_path)
+
+            test_cache = scan_cache.ScanResultCache(
+                os.path.join(temporary_directory, "scan_cache.json")
+            )
+
+            results = []
+            for _ in range(2):
+                test_statistics = statistics.ExtractionStatistics()
+
+                test_extractor = extractor.WindowsShellExtractor(
+                    scan_result_cache=test_cache, statistics=test_statistics
+                )
+                path_specs = test_extractor.GetWindowsVolumePathSpecs(
+                    image_path, options=self._GetVolumeScannerOptions()
+                )
+                results.append(path_specs)
+
+                self.assertEqual(test_statistics.stage_calls["volume_scanning"], 1)
+
+            scan_result = test_cache.GetScanResult(
+                image_path, self._GetVolumeScannerOptions()
+            )
+            self.assertIsNotNone(scan_result)
+
+            # A scan without snapshots is not read from the scan result cache.
+            path_specs = test_extractor.GetWindowsVolumePathSpecs(
+                image_path, options=self._GetVolumeScannerOptions(snapshots=["none"])
+            )
+            self.assertEqual(
+                [
+                    test_extractor.GetPartitionIdentifier(path_spec)
+                    for path_spec in path_specs
+                ],
+                ["p2", "p3"],
+            )
+
+        # The snapshots are enumerated starting with the most recent one and
+        # the second scan result, which is read from the scan result cache,
+        # contains the same volumes.
+        for path_specs in results:
+            identifiers = [
+                (
+                    path_spec.type_indicator,
+                    test_extractor.GetPartitionIdentifier(path_spec),
+                    test_extractor.GetSnapshotIdentifier(path_spec),
+                )
+                for path_spec in path_specs
+            ]
+            self.assertEqual(
+                identifiers,
+                [
+                    (dfvfs_definitions.TYPE_INDICATOR_NTFS, "p1", "vss2"),
+                    (dfvfs_definitions.TYPE_INDICATOR_NTFS, "p1", "vss1"),
+                    (dfvfs_definitions.TYPE_INDICATOR_FAT, "p2", None),
+                    (dfvfs_definitions.TYPE_INDICATOR_FAT, "p3", None),
+                ],
+            )
+
+    def testOpenWindowsVolume(self):
+        """Tests the OpenWindowsVolume function."""
+        registry_file_cache = registry_cache.WindowsRegistryFileCache()
+        test_statistics = statistics.ExtractionStatistics()
+
+        with test_lib.TempDirectory() as temporary_directory:
+            image_path = os.path.join(temporary_directory, "image.raw")
+            self._CreateDiskImage(image_path)
+
+            test_extractor = extractor.WindowsShellExtractor(
+                registry_file_cache=registry_file_cache, statistics=test_statistics
+            )
+            path_specs = test_extractor.GetWindowsVolumePathSpecs(
+                image_path, options=self._GetVolumeScannerOptions()
+            )
+
+            stat_object = os.stat(image_path)
+            source_identifier = (
+                f"{image_path:s}:{stat_object.st_size:d}:{stat_object.st_mtime_ns:d}"
+            )
+
+            results = []
+            try:
+                for path_spec in path_specs[2:]:
+                    result = test_extractor.OpenWindowsVolume(path_spec)
+                    self.assertTrue(result)
+
+                    # The volume identifier contains the path specification of
+                    # the root of the file system.
+                    file_entry = test_extractor._file_system.GetRootFileEntry()
+                    volume_identifier = test_extractor._GetVolumeIdentifier()
+                    self.assertEqual(
+                        volume_identifier,
+                        f"{source_identifier:s}:{file_entry.path_spec.comparable:s}",
+                    )
+
+                    shell_folders = list(test_extractor.CollectShellFolders())
+                    names = {
+                        shell_folder.identifier: shell_folder.name
+                        for shell_folder in shell_folders
+                    }
+                    results.append((test_extractor.windows_version, names))
+
+                self.assertEqual(len(test_extractor._windows_versions_per_volume), 2)
+
+            finally:
+                test_extractor.Close()
+
+        self.assertEqual(registry_file_cache.number_of_files, 0)
+
+        windows_version, names = results[0]
+        self.assertEqual(windows_version, "Windows 10 (1809)")
+        self.assertEqual(len(names), 15)
+
+        identifier = synthetic_lib.GetClassIdentifier(0)
+        self.assertEqual(names[identifier], "String 1000 (0409)")
+
+        # The second volume contains the same Windows Registry and resource files,
+        # which is detected by their fingerprints.
+        self.assertEqual(results[1], results[0])
+
+        counters = test_statistics.counters
+        self.assertEqual(counters["volumes_opened"], 2)
+        self.assertEqual(counters["resource_files_opened"], 2)
+        self.assertEqual(counters["shell_folder_cache_hits"], 1)
+        self.assertEqual(counters["shell_folder_cache_misses"], 1)
+        self.assertEqual(counters["string_tables_decoded"], 1)
+
+    def testStage(self):
+        """Tests the _Stage function."""
+        test_extractor = extractor.WindowsShellExtractor()
+
+        with test_extractor._Stage("volume_opening"):
+            pass
+
+        test_statistics = statistics.ExtractionStatistics()
+        test_extractor = extractor.WindowsShellExtractor(statistics=test_statistics)
+
+        with test_extractor._Stage("volume_opening"):
+            pass
+
+        # The stage is stopped when an exception is raised.
+        with self.assertRaises(RuntimeError):
+            with test_extractor._Stage("volume_opening"):
+                raise RuntimeError("Test.")
+
+        self.assertEqual(test_statistics.stage_calls["volume_opening"], 2)
+
+    def testGetMUIWindowsResourceFile(self):
+        """Tests the _GetMUIWindowsResourceFile function."""
+        test_statistics = statistics.ExtractionStatistics()
+
+        with test_lib.TempDirectory() as temporary_directory:
+            software_path = os.path.join(temporary_directory, "SOFTWARE")
+            synthetic_lib.WriteSoftwareRegistryFile(software_path, 1)
+
+            resource_file_writer = synthetic_lib.ResourceFileWriter()
+            resource_file_writer.AddMUIResource("en-US")
+            resource_file_writer.Write(
+                os.path.join(temporary_directory, "synthetic.dll")
+            )
+
+            test_extractor = extractor.WindowsShellExtractor(statistics=test_statistics)
+            test_extractor.OpenRegistryFiles(
+                [software_path], resources_path=temporary_directory
+            )
+
+            windows_path = "%SystemRoot%\\system32\\synthetic.dll"
+            windows_resource_file = test_extractor._OpenWindowsResourceFile(
+                windows_path
+            )
+            self.assertIsNotNone(windows_resource_file)
+
+            try:
+                # The absence of the MUI resource file is cached.
+                for _ in range(2):
+                    mui_windows_resource_file = (
+                        test_extractor._GetMUIWindowsResourceFile(
+                            windows_path, windows_resource_file
+                        )
+                    )
+                    self.assertIsNone(mui_windows_resource_file)
+
+            finally:
+                windows_resource_file.Close()
+                test_extractor.Close()
+
+        counters = test_statistics.counters
+        self.assertEqual(counters["mui_path_cache_hits"], 1)
+        self.assertEqual(counters["mui_path_cache_misses"], 1)
+        self.assertEqual(counters["mui_resource_files_found"], 0)
+
+        self.assertEqual(test_statistics.stage_calls["mui_probing"], 1)
+
+    def testGetMUIWindowsResourceFileWithCorruptCandidate(self):
+        """Tests the _GetMUIWindowsResourceFile function with a corrupt candidate."""
+        with test_lib.TempDirectory() as temporary_directory:
+            software_path = os.path.join(temporary_directory, "SOFTWARE")
+            synthetic_lib.WriteSoftwareRegistryFile(software_path, 1)
+
+            self._CreateResourceFiles(temporary_directory, flat_layout=True)
+
+            # The MUI resource file in the language directory cannot be opened.
+            mui_path = os.path.join(temporary_directory, "en-US")
+            os.mkdir(mui_path)
+            with open(os.path.join(mui_path, "synthetic.dll.mui"), "wb") as file_object:
+                file_object.write(b"\x00" * 512)
+
+            test_extractor = extractor.WindowsShellExtractor()
+            test_extractor.OpenRegistryFiles(
+                [software_path], resources_path=temporary_directory
+            )
+
+            try:
+                name = test_extractor._ResolveName(
+                    "@%SystemRoot%\\system32\\synthetic.dll,-1031"
+                )
+
+            finally:
+                test_extractor.Close()
+
+        self.assertEqual(name, "String 1031 (0409)")
+
+    def testResolveName(self):
+        """Tests the _ResolveName function."""
+        with test_lib.TempDirectory() as temporary_directory:
+            software_path = os.path.join(temporary_directory, "SOFTWARE")
+            synthetic_lib.WriteSoftwareRegistryFile(software_path, 1)
+
+            self._CreateResourceFiles(temporary_directory)
+
+            test_extractor = extractor.WindowsShellExtractor()
+            test_extractor.OpenRegistryFiles(
+                [software_path], resources_path=temporary_directory
+            )
+
+            try:
+                name = test_extractor._ResolveName(
+                    "@%SystemRoot%\\system32\\synthetic.dll,-1031"
+                )
+                self.assertEqual(name, "String 1031 (0409)")
+
+                name = test_extractor._ResolveName(
+                    "@%SystemRoot%\\system32\\synthetic.dll,-2000"
+                )
+                self.assertIsNone(name)
+
+                # A reference to a resource file that does not exist is kept.
+                name = test_extractor._ResolveName(
+                    "@%SystemRoot%\\system32\\bogus.dll,-1031"
+                )
+                self.assertEqual(name, "@%SystemRoot%\\system32\\bogus.dll,-1031")
+
+                name = test_extractor._ResolveName("Shell folder")
+                self.assertEqual(name, "Shell folder")
+
+            finally:
+                test_extractor.Close()
+
+
+if __name__ == "__main__":
+    unittest.main()
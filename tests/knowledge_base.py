@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""Tests for the Windows shell knowledge base."""
+
+import os
+import unittest
+import uuid
+
+from unittest import mock
+
+from winshlrc import knowledge_base
+from winshlrc import resources
+
+from tests import synthetic_lib
+from tests import test_lib
+
+
+class WindowsShellKnowledgeBaseTest(test_lib.BaseTestCase):
+    """Tests for the Windows shell knowledge base."""
+
+    # pylint: disable=protected-access
+
+    _IDENTIFIERS = b"".join(
+        [
+            uuid.UUID(synthetic_lib.GetClassIdentifier(1)).bytes_le,
+            bytes(16),
+            uuid.UUID(synthetic_lib.GetClassIdentifier(3)).bytes_le,
+            uuid.UUID(synthetic_lib.GetClassIdentifier(0)).bytes_le,
+        ]
+    )
+
+    def _CreateKnowledgeBase(self):
+        """Creates a knowledge base with synthetic definitions.
+
+        Returns:
+          WindowsShellKnowledgeBase: knowledge base.
+        """
+        test_knowledge_base = knowledge_base.WindowsShellKnowledgeBase()
+
+        with test_lib.TempDirectory() as temporary_directory:
+            synthetic_lib.WriteDefinitionsFiles(temporary_directory, 4)
+            synthetic_lib.WriteShellFoldersDefinitionsFile(
+                os.path.join(temporary_directory, "observed_shellfolders.yaml"), 2
+            )
+            test_knowledge_base.ReadFromDirectory(temporary_directory)
+
+        return test_knowledge_base
+
+    def _CheckResolvedIdentifiers(self, test_knowledge_base, results):
+        """Checks the resolved identifiers of _IDENTIFIERS.
+
+        Args:
+          test_knowledge_base (WindowsShellKnowledgeBase): knowledge base.
+          results (tuple[object, object, object]): resource types, name indexes
+              and known mask.
+        """
+        resource_types, name_indexes, known = results
+
+        self.assertEqual([bool(value) for value in known], [True, False, True, True])
+
+        all_resource_types = (
+            knowledge_base.RESOURCE_TYPE_CONTROL_PANEL_ITEM
+            | knowledge_base.RESOURCE_TYPE_KNOWN_FOLDER
+            | knowledge_base.RESOURCE_TYPE_SHELL_FOLDER
+        )
+        self.assertEqual(
+            list(resource_types),
+            [
+                all_resource_types,
+                knowledge_base.RESOURCE_TYPE_UNKNOWN,
+                all_resource_types & ~knowledge_base.RESOURCE_TYPE_SHELL_FOLDER,
+                all_resource_types,
+            ],
+        )
+
+        self.assertEqual(name_indexes[1], -1)
+
+        names = [test_knowledge_base.names[index] for index in name_indexes[2:]]
+        self.assertEqual(names, ["Synthetic folder 3", "Synthetic folder 0"])
+
+    def _CreateKnownFoldersKnowledgeBase(self):
+        """Creates a knowledge base with known folder definitions.
+
+        Returns:
+          WindowsShellKnowledgeBase: knowledge base.
+        """
+        test_knowledge_base = knowledge_base.WindowsShellKnowledgeBase()
+
+        for index, (name, display_name, legacy_display_name, csidl) in enumerate(
+            [
+                (
+                    "FOLDERID_ComputerFolder",
+                    "Computer",
+                    "My Computer",
+                    ["CSIDL_DRIVES"],
+                ),
+                ("FOLDERID_Programs", "Programs", None, ["CSIDL_PROGRAMS"]),
+                (
+                    "FOLDERID_CommonPrograms",
+                    "Programs",
+                    None,
+                    ["CSIDL_COMMON_PROGRAMS"],
+                ),
+                ("FOLDERID_Computer", "My  Computer", None, []),
+            ]
+        ):
+            definition = resources.KnownFolderDefinition()
+            definition.csidl = csidl
+            definition.display_name = display_name
+            definition.identifier = synthetic_lib.GetClassIdentifier(index)
+            definition.legacy_display_name = legacy_display_name
+            definition.name = name
+            test_knowledge_base.AddKnownFolderDefinition(definition)
+
+        return test_knowledge_base
+
+    def testGetKnownFolderByCSIDL(self):
+        """Tests the GetKnownFolderByCSIDL function."""
+        test_knowledge_base = self._CreateKnownFoldersKnowledgeBase()
+
+        definition = test_knowledge_base.GetKnownFolderByCSIDL(0x0011)
+        self.assertIsNotNone(definition)
+        self.assertEqual(definition.name, "FOLDERID_ComputerFolder")
+
+        # CSIDL value with CSIDL_FLAG_CREATE.
+        definition = test_knowledge_base.GetKnownFolderByCSIDL(0x8017)
+        self.assertIsNotNone(definition)
+        self.assertEqual(definition.name, "FOLDERID_CommonPrograms")
+
+        definition = test_knowledge_base.GetKnownFolderByCSIDL("csidl_programs")
+        self.assertIsNotNone(definition)
+        self.assertEqual(definition.name, "FOLDERID_Programs")
+
+        definition = test_knowledge_base.GetKnownFolderByCSIDL(0x0005)
+        self.assertIsNone(definition)
+
+        definition = test_knowledge_base.GetKnownFolderByCSIDL("CSIDL_BOGUS")
+        self.assertIsNone(definition)
+
+    def testGetKnownFolderByName(self):
+        """Tests the GetKnownFolderByName function."""
+        test_knowledge_base = self._CreateKnownFoldersKnowledgeBase()
+
+        definition = test_knowledge_base.GetKnownFolderByName("FOLDERID_Programs")
+        self.assertIsNotNone(definition)
+        self.assertEqual(definition.identifier, synthetic_lib.GetClassIdentifier(1))
+
+        definition = test_knowledge_base.GetKnownFolderByName("folderid_programs")
+        self.assertIsNotNone(definition)
+
+        definition = test_knowledge_base.GetKnownFolderByName("FOLDERID_Bogus")
+        self.assertIsNone(definition)
+
+    def testGetKnownFoldersByDisplayName(self):
+        """Tests the GetKnownFoldersByDisplayName function."""
+        test_knowledge_base = self._CreateKnownFoldersKnowledgeBase()
+
+        definitions = test_knowledge_base.GetKnownFoldersByDisplayName("PROGRAMS")
+        names = [definition.name for definition in definitions]
+        self.assertEqual(names, ["FOLDERID_Programs", "FOLDERID_CommonPrograms"])
+
+        # The display name matches before the legacy display name.
+        definitions = test_knowledge_base.GetKnownFoldersByDisplayName(" my computer ")
+        names = [definition.name for definition in definitions]
+        self.assertEqual(names, ["FOLDERID_Computer", "FOLDERID_ComputerFolder"])
+
+        definitions = test_knowledge_base.GetKnownFoldersByDisplayName("Bogus")
+        self.assertEqual(definitions, [])
+
+    def testGetKnownFolderDefinitions(self):
+        """Tests the GetKnownFolderDefinitions function."""
+        test_knowledge_base = self._CreateKnowledgeBase()
+
+        definitions = test_knowledge_base.GetKnownFolderDefinitions()
+        self.assertEqual(len(definitions), 4)
+
+    def testNames(self):
+        """Tests the names property."""
+        test_knowledge_base = self._CreateKnowledgeBase()
+
+        self.assertEqual(test_knowledge_base.number_of_identifiers, 4)
+        self.assertEqual(len(test_knowledge_base.names), 4)
+        self.assertEqual(test_knowledge_base.names[0], "Synthetic folder 0")
+
+    def testResolveIdentifier(self):
+        """Tests the ResolveIdentifier function."""
+        test_knowledge_base = self._CreateKnowledgeBase()
+
+        resource_types, name = test_knowledge_base.ResolveIdentifier(
+            self._IDENTIFIERS[32:48]
+        )
+        self.assertEqual(
+            resource_types,
+            knowledge_base.RESOURCE_TYPE_CONTROL_PANEL_ITEM
+            | knowledge_base.RESOURCE_TYPE_KNOWN_FOLDER,
+        )
+        self.assertEqual(name, "Synthetic folder 3")
+
+        resource_types, name = test_knowledge_base.ResolveIdentifier(bytes(16))
+        self.assertEqual(resource_types, knowledge_base.RESOURCE_TYPE_UNKNOWN)
+        self.assertIsNone(name)
+
+    def testResolveIdentifiers(self):
+        """Tests the ResolveIdentifiers function."""
+        test_knowledge_base = self._CreateKnowledgeBase()
+
+        results = test_knowledge_base.ResolveIdentifiers(self._IDENTIFIERS)
+        self._CheckResolvedIdentifiers(test_knowledge_base, results)
+
+        with self.assertRaises(ValueError):
+            test_knowledge_base.ResolveIdentifiers(self._IDENTIFIERS[:-1])
+
+        test_knowledge_base = knowledge_base.WindowsShellKnowledgeBase()
+
+        _, name_indexes, known = test_knowledge_base.ResolveIdentifiers(
+            self._IDENTIFIERS
+        )
+        self.assertEqual(list(name_indexes), [-1, -1, -1, -1])
+        self.assertFalse(any(known))
+
+    @unittest.skipIf(knowledge_base.numpy is None, "missing NumPy")
+    def testResolveIdentifiersWithArray(self):
+        """Tests the ResolveIdentifiers function with a NumPy array."""
+        numpy = knowledge_base.numpy
+
+        test_knowledge_base = self._CreateKnowledgeBase()
+
+        identifiers = numpy.frombuffer(self._IDENTIFIERS, dtype=numpy.uint8)
+        results = test_knowledge_base.ResolveIdentifiers(identifiers.reshape(-1, 16))
+        self._CheckResolvedIdentifiers(test_knowledge_base, results)
+
+        self.assertEqual(results[0].dtype, numpy.uint8)
+        self.assertEqual(results[1].dtype, numpy.int32)
+        self.assertEqual(results[2].dtype, numpy.bool_)
+
+    def testResolveIdentifiersWithoutNumPy(self):
+        """Tests the ResolveIdentifiers function without NumPy."""
+        test_knowledge_base = self._CreateKnowledgeBase()
+
+        with mock.patch.object(knowledge_base, "numpy", None):
+            results = test_knowledge_base.ResolveIdentifiers(self._IDENTIFIERS)
+        self._CheckResolvedIdentifiers(test_knowledge_base, results)
+
+        with self.assertRaises(ValueError):
+            test_knowledge_base._ResolveIdentifiersWithoutNumPy(self._IDENTIFIERS[:-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""Tests for the classifier of file paths by known folder."""
+
+import os
+import unittest
+
+from winshlrc import knowledge_base
+from winshlrc import known_folder_paths
+from winshlrc import resources
+
+from tests import test_lib
+
+
+class KnownFolderPathClassifierTest(test_lib.BaseTestCase):
+    """Tests for the classifier of file paths by known folder."""
+
+    # pylint: disable=protected-access
+
+    _KNOWN_FOLDERS = [
+        (
+            "3eb685db-65f9-4cf6-a03a-e3ef65729f3d",
+            "%APPDATA%",
+            "%USERPROFILE%\\Application Data",
+        ),
+        (
+            "008ca0b1-55b4-4c56-b8a8-4de4b299d3be",
+            "%APPDATA%\\Microsoft\\Windows\\AccountPictures",
+            None,
+        ),
+        (
+            "2a00375e-224c-49de-b8d1-440df7ef3ddc",
+            "%windir%\\resources\\%CODEPAGE%",
+            None,
+        ),
+        ("0762d272-c50a-4bb0-a382-697dcd729b80", "%SystemDrive%\\Users", None),
+        ("5e6c858f-0e22-4760-9afe-ea3317b67173", "%USERPROFILE%", None),
+        ("00000000-0000-4000-8000-000000000000", "%UNKNOWN%\\Folder", None),
+    ]
+
+    def _CreateClassifier(self):
+        """Creates a classifier with synthetic known folder definitions.
+
+        Returns:
+          KnownFolderPathClassifier: classifier.
+        """
+        classifier = known_folder_paths.KnownFolderPathClassifier()
+
+        for identifier, default_path, legacy_default_path in self._KNOWN_FOLDERS:
+            definition = resources.KnownFolderDefinition()
+            definition.default_path = default_path
+            definition.identifier = identifier
+            definition.legacy_default_path = legacy_default_path
+            classifier.AddKnownFolderDefinition(definition)
+
+        classifier.AddUserProfile("alice")
+        classifier.AddUserProfile(
+            "bob",
+            environment_variables={"USERPROFILE": "C:\\Documents and Settings\\bob"},
+        )
+
+        return classifier
+
+    def testExpandPath(self):
+        """Tests the _ExpandPath function."""
+        classifier = known_folder_paths.KnownFolderPathClassifier(
+            environment_variables={"SystemDrive": "D:"}
+        )
+
+        path = classifier._ExpandPath(
+            "%windir%\\resources\\%CODEPAGE%", classifier._environment_variables
+        )
+        self.assertEqual(path, "D:\\Windows\\resources\\%CODEPAGE%")
+
+        environment_variables = {"a": "%b%", "b": "%a%"}
+        path = classifier._ExpandPath("%a%", environment_variables)
+        self.assertIn(path, ("%a%", "%b%"))
+
+    def testClassifyPath(self):
+        """Tests the ClassifyPath function."""
+        classifier = self._CreateClassifier()
+
+        result = classifier.ClassifyPath(
+            "C:\\Users\\Alice\\AppData\\Roaming\\Microsoft\\Windows\\"
+            "AccountPictures\\image.jpg"
+        )
+        self.assertEqual(
+            result, ("008ca0b1-55b4-4c56-b8a8-4de4b299d3be", "image.jpg", "alice")
+        )
+
+        result = classifier.ClassifyPath(
+            "c:/users/alice/appdata/roaming/Microsoft/Edge/file.txt"
+        )
+        self.assertEqual(
+            result,
+            (
+                "3eb685db-65f9-4cf6-a03a-e3ef65729f3d",
+                "Microsoft\\Edge\\file.txt",
+                "alice",
+            ),
+        )
+
+        result = classifier.ClassifyPath(
+            "\\\\?\\C:\\Documents and Settings\\bob\\Application Data\\file.txt"
+        )
+        self.assertEqual(
+            result, ("3eb685db-65f9-4cf6-a03a-e3ef65729f3d", "file.txt", "bob")
+        )
+
+        result = classifier.ClassifyPath("C:\\Windows\\resources\\0409\\file.dll")
+        self.assertEqual(
+            result, ("2a00375e-224c-49de-b8d1-440df7ef3ddc", "file.dll", None)
+        )
+
+        result = classifier.ClassifyPath("C:\\Users\\carol\\Desktop")
+        self.assertEqual(
+            result, ("0762d272-c50a-4bb0-a382-697dcd729b80", "carol\\Desktop", None)
+        )
+
+        result = classifier.ClassifyPath("C:\\Users\\alice")
+        self.assertEqual(result, ("5e6c858f-0e22-4760-9afe-ea3317b67173", "", "alice"))
+
+        result = classifier.ClassifyPath("D:\\Users\\alice")
+        self.assertIsNone(result)
+
+        result = classifier.ClassifyPath("")
+        self.assertIsNone(result)
+
+    def testClassifyPathWithBundledDefinitions(self):
+        """Tests the ClassifyPath function with the bundled definitions."""
+        test_knowledge_base = knowledge_base.WindowsShellKnowledgeBase()
+        test_knowledge_base.ReadFromDirectory(
+            os.path.join(test_lib.PROJECT_PATH, "winshlrc", "data")
+        )
+
+        classifier = known_folder_paths.KnownFolderPathClassifier()
+        for definition in test_knowledge_base.GetKnownFolderDefinitions():
+            classifier.AddKnownFolderDefinition(definition)
+
+        classifier.AddUserProfile("alice")
+
+        # FOLDERID_ProgramFilesX86
+        result = classifier.ClassifyPath("C:\\Program Files (x86)\\Foo\\a.exe")
+        self.assertEqual(
+            result, ("7c5a40ef-a0fb-4bfc-874a-c0f2e0b9fa8e", "Foo\\a.exe", None)
+        )
+
+        # FOLDERID_RoamingAppData
+        result = classifier.ClassifyPath(
+            "C:\\Users\\alice\\AppData\\Roaming\\Foo\\a.txt"
+        )
+        self.assertEqual(
+            result, ("3eb685db-65f9-4cf6-a03a-e3ef65729f3d", "Foo\\a.txt", "alice")
+        )
+
+    def testClassifyPaths(self):
+        """Tests the ClassifyPaths function."""
+        classifier = self._CreateClassifier()
+
+        paths = ["C:\\Users\\alice\\file.txt", "D:\\file.txt"]
+        results = list(classifier.ClassifyPaths(paths))
+        self.assertEqual(
+            results,
+            [
+                (
+                    paths[0],
+                    ("5e6c858f-0e22-4760-9afe-ea3317b67173", "file.txt", "alice"),
+                ),
+                (paths[1], None),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
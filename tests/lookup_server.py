@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Tests for the lookup server of the Windows shell knowledge base."""
+
+import json
+import os
+import socket
+import threading
+import unittest
+
+from winshlrc import lookup_server
+
+from tests import synthetic_lib
+from tests import test_lib
+
+
+class LookupServiceTest(test_lib.BaseTestCase):
+    """Tests for the lookup service."""
+
+    def testHandleRequest(self):
+        """Tests the HandleRequest function."""
+        with test_lib.TempDirectory() as temporary_directory:
+            synthetic_lib.WriteDefinitionsFiles(temporary_directory, 4)
+
+            lookup_service = lookup_server.LookupService(
+                temporary_directory, reload_interval=0
+            )
+
+            response = lookup_service.HandleRequest(b'{"identifier": ""}')
+            self.assertEqual(
+                json.loads(response), {"error": "Knowledge base not loaded."}
+            )
+
+            result = lookup_service.Start()
+            self.assertTrue(result)
+
+        identifier = synthetic_lib.GetClassIdentifier(1)
+        response = lookup_service.HandleRequest(
+            json.dumps({"identifier": identifier}).encode("utf-8")
+        )
+        self.assertTrue(response.endswith(b"\n"))
+        self.assertEqual(
+            json.loads(response),
+            {
+                "identifier": identifier,
+                "known": True,
+                "name": "Synthetic folder 1",
+                "types": ["control_panel_item", "known_folder", "shell_folder"],
+            },
+        )
+
+        unknown_identifier = "00000000-0000-0000-0000-000000000000"
+        response = lookup_service.HandleRequest(
+            json.dumps({"id": 2, "identifiers": [identifier, unknown_identifier]})
+        )
+        response = json.loads(response)
+        self.assertEqual(response["id"], 2)
+        self.assertEqual(len(response["results"]), 2)
+        self.assertEqual(
+            response["results"][1],
+            {
+                "identifier": unknown_identifier,
+                "known": False,
+                "name": None,
+                "types": [],
+            },
+        )
+
+        for request in (b"bogus", b"[]", b"{}", b'{"identifier": 1}'):
+            response = json.loads(lookup_service.HandleRequest(request))
+            self.assertIn("error", response)
+
+    def testReloadIfChanged(self):
+        """Tests the ReloadIfChanged function."""
+        with test_lib.TempDirectory() as temporary_directory:
+            synthetic_lib.WriteDefinitionsFiles(temporary_directory, 4)
+
+            lookup_service = lookup_server.LookupService(
+                temporary_directory, reload_interval=0
+            )
+            lookup_service.Start()
+
+            knowledge_base = lookup_service.knowledge_base
+            self.assertEqual(knowledge_base.number_of_identifiers, 4)
+
+            result = lookup_service.ReloadIfChanged()
+            self.assertFalse(result)
+
+            path = os.path.join(temporary_directory, "observed_shellfolders.yaml")
+            synthetic_lib.WriteShellFoldersDefinitionsFile(path, 8)
+
+            result = lookup_service.ReloadIfChanged()
+            self.assertTrue(result)
+            self.assertIsNot(lookup_service.knowledge_base, knowledge_base)
+            self.assertEqual(lookup_service.knowledge_base.number_of_identifiers, 8)
+
+            # An invalid definitions file does not replace the knowledge base.
+            knowledge_base = lookup_service.knowledge_base
+            with open(path, "a", encoding="utf-8") as file_object:
+                file_object.write("---\nbogus: value\n")
+
+            result = lookup_service.ReloadIfChanged()
+            self.assertFalse(result)
+            self.assertIs(lookup_service.knowledge_base, knowledge_base)
+
+
+class TCPLookupServerTest(test_lib.BaseTestCase):
+    """Tests for the lookup server that listens on a localhost TCP port."""
+
+    def testPipelinedRequests(self):
+        """Tests pipelined requests."""
+        with test_lib.TempDirectory() as temporary_directory:
+            synthetic_lib.WriteDefinitionsFiles(temporary_directory, 4)
+
+            lookup_service = lookup_server.LookupService(
+                temporary_directory, reload_interval=0
+            )
+            lookup_service.Start()
+
+        server = lookup_server.TCPLookupServer(0, lookup_service)
+        server_thread = threading.Thread(target=server.serve_forever)
+        server_thread.start()
+
+        try:
+            with socket.create_connection(server.server_address) as client_socket:
+                requests = [
+                    json.dumps(
+                        {
+                            "id": index,
+                            "identifier": synthetic_lib.GetClassIdentifier(index),
+                        }
+                    )
+                    for index in range(8)
+                ]
+                client_socket.sendall("\n".join(requests).encode("utf-8") + b"\n")
+
+                with client_socket.makefile("rb") as file_object:
+                    responses = [json.loads(file_object.readline()) for _ in range(8)]
+
+        finally:
+            server.shutdown()
+            server.server_close()
+            server_thread.join()
+
+        self.assertEqual([response["id"] for response in responses], list(range(8)))
+        self.assertEqual(
+            [response["known"] for response in responses], [True] * 4 + [False] * 4
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Tests for the fuzzy search of definitions by name."""
+
+import unittest
+
+from unittest import mock
+
+from winshlrc import knowledge_base
+from winshlrc import name_search
+from winshlrc import resources
+
+from tests import test_lib
+
+
+class NameSearchIndexTest(test_lib.BaseTestCase):
+    """Tests for the fuzzy search index of definitions by name."""
+
+    # pylint: disable=protected-access
+
+    _ALL_TASKS_IDENTIFIER = "ed7ba470-8e54-465e-825c-99712043e01c"
+
+    _CONTROL_PANEL_IDENTIFIER = "21ec2020-3aea-1069-a2dd-08002b30309d"
+
+    _NETWORK_IDENTIFIER = "d20beec4-5ca8-4905-ae3b-bf251ea09b53"
+
+    def _CreateSearchIndex(self):
+        """Creates a search index with definitions.
+
+        Returns:
+          NameSearchIndex: search index.
+        """
+        search_index = name_search.NameSearchIndex()
+
+        definition = resources.ShellFolderDefinition()
+        definition.identifier = self._ALL_TASKS_IDENTIFIER
+        definition.name = "All Tasks"
+        search_index.AddShellFolderDefinition(definition)
+
+        definition = resources.ShellFolderDefinition()
+        definition.alternate_names = ["Control Panel (All Items)"]
+        definition.class_name = "CControlPanel"
+        definition.identifier = self._CONTROL_PANEL_IDENTIFIER
+        definition.name = "Control Panel"
+        search_index.AddShellFolderDefinition(definition)
+
+        definition = resources.ControlPanelItemDefinition()
+        definition.identifier = self._CONTROL_PANEL_IDENTIFIER.upper()
+        definition.module_name = "@shell32.dll,-4161"
+        search_index.AddControlPanelItemDefinition(definition)
+
+        definition = resources.KnownFolderDefinition()
+        definition.alternate_display_names = ["Netzwerkumgebung"]
+        definition.display_name = "Network"
+        definition.identifier = self._NETWORK_IDENTIFIER
+        definition.name = "FOLDERID_NetworkFolder"
+        search_index.AddKnownFolderDefinition(definition)
+
+        return search_index
+
+    def _TestSearch(self, search_index):
+        """Tests the Search function of a search index.
+
+        Args:
+          search_index (NameSearchIndex): search index.
+        """
+        results = search_index.Search("control panel")
+        self.assertEqual(len(results), 1)
+
+        score, identifier, resource_types, name = results[0]
+        self.assertEqual(score, 1.0)
+        self.assertEqual(identifier, self._CONTROL_PANEL_IDENTIFIER)
+        self.assertEqual(
+            resource_types,
+            knowledge_base.RESOURCE_TYPE_CONTROL_PANEL_ITEM
+            | knowledge_base.RESOURCE_TYPE_SHELL_FOLDER,
+        )
+        self.assertEqual(name, "Control Panel")
+
+        # The last path segment of a path is searched for as well.
+        results = search_index.Search("Control Panel\\All Tasks")
+        identifiers = [identifier for _, identifier, _, _ in results]
+        self.assertEqual(
+            identifiers, [self._ALL_TASKS_IDENTIFIER, self._CONTROL_PANEL_IDENTIFIER]
+        )
+
+        results = search_index.Search("Netzwerk")
+        self.assertEqual(len(results), 1)
+
+        score, identifier, resource_types, name = results[0]
+        self.assertLess(score, 1.0)
+        self.assertEqual(identifier, self._NETWORK_IDENTIFIER)
+        self.assertEqual(resource_types, knowledge_base.RESOURCE_TYPE_KNOWN_FOLDER)
+        self.assertEqual(name, "Netzwerkumgebung")
+
+        results = search_index.Search("Control Panel", maximum_number_of_results=0)
+        self.assertEqual(results, [])
+
+        results = search_index.Search("Bogus")
+        self.assertEqual(results, [])
+
+        results = search_index.Search(" ")
+        self.assertEqual(results, [])
+
+    def testGetTrigrams(self):
+        """Tests the _GetTrigrams function."""
+        search_index = name_search.NameSearchIndex()
+
+        trigrams = search_index._GetTrigrams("My  PC")
+        self.assertEqual(trigrams, {" my", "my ", "y p", " pc", "pc "})
+
+        trigrams = search_index._GetTrigrams("")
+        self.assertEqual(trigrams, set())
+
+    def testNumberOfNames(self):
+        """Tests the number_of_names property."""
+        search_index = self._CreateSearchIndex()
+
+        # Names that reference a string resource are not indexed.
+        self.assertEqual(search_index.number_of_names, 7)
+
+    @unittest.skipIf(name_search.numpy is None, "missing NumPy")
+    def testSearch(self):
+        """Tests the Search function."""
+        search_index = self._CreateSearchIndex()
+        self._TestSearch(search_index)
+
+    def testSearchWithoutNumPy(self):
+        """Tests the Search function without NumPy."""
+        search_index = self._CreateSearchIndex()
+
+        with mock.patch.object(name_search, "numpy", None):
+            self._TestSearch(search_index)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Tests for the Windows path resolver for a directory of resource files."""
+
+import os
+import unittest
+
+from winshlrc import path_resolver
+
+from tests import test_lib
+
+
+class ResourceDirectoryPathResolverTest(test_lib.BaseTestCase):
+    """Tests for the Windows path resolver for a directory of resource files."""
+
+    def testGetWindowsPath(self):
+        """Tests the GetWindowsPath function."""
+        with test_lib.TempDirectory() as temporary_directory:
+            os.mkdir(os.path.join(temporary_directory, "en-US"))
+            with open(
+                os.path.join(temporary_directory, "en-US", "shell32.dll.mui"), "wb"
+            ):
+                pass
+
+            test_resolver = path_resolver.ResourceDirectoryPathResolver(
+                temporary_directory
+            )
+
+            path_spec = test_resolver.ResolvePath(
+                "%SystemRoot%\\System32\\en-US\\shell32.dll.mui"
+            )
+            windows_path = test_resolver.GetWindowsPath(path_spec)
+            self.assertEqual(windows_path, "en-US\\shell32.dll.mui")
+
+    def testResolveDirectory(self):
+        """Tests the ResolveDirectory function."""
+        with test_lib.TempDirectory() as temporary_directory:
+            os.mkdir(os.path.join(temporary_directory, "en-US"))
+
+            test_resolver = path_resolver.ResourceDirectoryPathResolver(
+                temporary_directory
+            )
+
+            path_spec = test_resolver.ResolveDirectory("%SystemRoot%\\system32\\en-US")
+            self.assertIsNotNone(path_spec)
+            self.assertEqual(
+                path_spec.location, os.path.join(temporary_directory, "en-US")
+            )
+
+            path_spec = test_resolver.ResolveDirectory("%SystemRoot%\\system32")
+            self.assertIsNotNone(path_spec)
+            self.assertEqual(path_spec.location, temporary_directory)
+
+        test_resolver = path_resolver.ResourceDirectoryPathResolver(None)
+
+        path_spec = test_resolver.ResolveDirectory("%SystemRoot%\\system32")
+        self.assertIsNone(path_spec)
+
+    def testResolvePath(self):
+        """Tests the ResolvePath function."""
+        with test_lib.TempDirectory() as temporary_directory:
+            os.mkdir(os.path.join(temporary_directory, "en-US"))
+            for path_segments in (["SHELL32.dll"], ["en-US", "shell32.dll.mui"]):
+                with open(os.path.join(temporary_directory, *path_segments), "wb"):
+                    pass
+
+            test_resolver = path_resolver.ResourceDirectoryPathResolver(
+                temporary_directory
+            )
+
+            path_spec = test_resolver.ResolvePath("%SystemRoot%\\system32\\shell32.dll")
+            self.assertIsNotNone(path_spec)
+            self.assertEqual(
+                path_spec.location, os.path.join(temporary_directory, "SHELL32.dll")
+            )
+
+            path_spec = test_resolver.ResolvePath(
+                "C:\\Windows\\System32\\EN-US\\shell32.dll.mui"
+            )
+            self.assertIsNotNone(path_spec)
+            self.assertEqual(
+                path_spec.location,
+                os.path.join(temporary_directory, "en-US", "shell32.dll.mui"),
+            )
+
+            path_spec = test_resolver.ResolvePath("C:\\Windows\\System32\\en-US")
+            self.assertIsNotNone(path_spec)
+
+            path_spec = test_resolver.ResolvePath("C:\\Windows\\System32\\bogus.dll")
+            self.assertIsNone(path_spec)
+
+            path_spec = test_resolver.ResolvePath(
+                "C:\\Windows\\System32\\config\\SOFTWARE"
+            )
+            self.assertIsNone(path_spec)
+
+        test_resolver = path_resolver.ResourceDirectoryPathResolver(None)
+
+        path_spec = test_resolver.ResolvePath("%SystemRoot%\\system32\\shell32.dll")
+        self.assertIsNone(path_spec)
+
+    def testResolvePathWithFlatLayout(self):
+        """Tests the ResolvePath and ResolveDirectory functions with a flat layout."""
+        with test_lib.TempDirectory() as temporary_directory:
+            for name in ("shell32.dll", "shell32.dll.mui"):
+                with open(os.path.join(temporary_directory, name), "wb"):
+                    pass
+
+            test_resolver = path_resolver.ResourceDirectoryPathResolver(
+                temporary_directory
+            )
+
+            path_spec = test_resolver.ResolvePath("%SystemRoot%\\system32\\en-US")
+            self.assertIsNone(path_spec)
+
+            path_spec = test_resolver.ResolveDirectory("%SystemRoot%\\system32\\en-US")
+            self.assertIsNotNone(path_spec)
+            self.assertEqual(path_spec.location, temporary_directory)
+
+            path_spec = test_resolver.ResolvePath(
+                "%SystemRoot%\\system32\\en-US\\shell32.dll.mui"
+            )
+            self.assertIsNotNone(path_spec)
+            self.assertEqual(
+                path_spec.location,
+                os.path.join(temporary_directory, "shell32.dll.mui"),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Tests for the shared cache of Windows Registry files."""
+
+import unittest
+
+from winshlrc import registry_cache
+
+from tests import test_lib
+
+
+class TestWindowsRegistryFile:
+    """Windows Registry file for testing."""
+
+    def __init__(self):
+        """Initializes a Windows Registry file."""
+        super().__init__()
+        self.closed = False
+
+    def CloseShared(self):
+        """Closes the shared Windows Registry file."""
+        self.closed = True
+
+
+class TestUser:
+    """Windows Registry file user for testing."""
+
+
+class WindowsRegistryFileCacheTest(test_lib.BaseTestCase):
+    """Tests for the reference counted cache of Windows Registry files."""
+
+    def testAcquireAndReleaseFiles(self):
+        """Tests the AcquireFile, AddFile and ReleaseFiles functions."""
+        test_cache = registry_cache.WindowsRegistryFileCache()
+        cache_key = ("type: OS, location: /SOFTWARE", "cp1252")
+
+        first_user = TestUser()
+        second_user = TestUser()
+
+        registry_file = test_cache.AcquireFile(first_user, cache_key)
+        self.assertIsNone(registry_file)
+
+        test_registry_file = TestWindowsRegistryFile()
+        test_cache.AddFile(first_user, cache_key, test_registry_file)
+        self.assertEqual(test_cache.number_of_files, 1)
+
+        with self.assertRaises(KeyError):
+            test_cache.AddFile(second_user, cache_key, TestWindowsRegistryFile())
+
+        registry_file = test_cache.AcquireFile(second_user, cache_key)
+        self.assertIs(registry_file, test_registry_file)
+
+        # Acquiring a file more than once does not add another reference.
+        registry_file = test_cache.AcquireFile(second_user, cache_key)
+        self.assertIs(registry_file, test_registry_file)
+
+        test_cache.ReleaseFiles(first_user)
+        self.assertFalse(test_registry_file.closed)
+        self.assertEqual(test_cache.number_of_files, 1)
+
+        test_cache.ReleaseFiles(second_user)
+        self.assertTrue(test_registry_file.closed)
+        self.assertEqual(test_cache.number_of_files, 0)
+
+        # Releasing the files of an user without files does nothing.
+        test_cache.ReleaseFiles(second_user)
+
+        registry_file = test_cache.AcquireFile(first_user, cache_key)
+        self.assertIsNone(registry_file)
+
+
+if __name__ == "__main__":
+    unittest.main()
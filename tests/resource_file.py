@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
 """Tests for the Windows Resource (WRC) file class."""
 
+import io
+import os
 import unittest
 
 from winshlrc import resource_file
 
+from tests import synthetic_lib
 from tests import test_lib
 
 
@@ -955,6 +958,13 @@ class WindowsResourceFileTest(test_lib.BaseTestCase):
         self.assertIsNone(windows_resource_file.product_version)
 
         # Test with empty version information.
+        windows_resource_file = resource_file.WindowsResourceFile(
+            "C:\\Windows\\System32\\test.dll"
+        )
+
+        wrc_stream = TestWrcStream()
+        windows_resource_file._wrc_stream = wrc_stream
+
         wrc_resource = TestWrcResource()
         wrc_stream.resources[0x10] = wrc_resource
 
@@ -986,6 +996,138 @@ class WindowsResourceFileTest(test_lib.BaseTestCase):
 
             windows_resource_file.Close()
 
+    def testGetDecodedResource(self):
+        """Tests the _GetDecodedResource function."""
+        windows_resource_file = resource_file.WindowsResourceFile(
+            "C:\\Windows\\System32\\test.dll"
+        )
+
+        wrc_stream = TestWrcStream()
+        windows_resource_file._wrc_stream = wrc_stream
+
+        decoded_resource = windows_resource_file._GetDecodedResource(0x10)
+        self.assertIsNone(decoded_resource)
+
+        # Test that the missing resource is cached.
+        wrc_resource = TestWrcResource()
+        wrc_stream.resources[0x10] = wrc_resource
+
+        wrc_resource_item = TestWrcResourceItem(1)
+        wrc_resource.items.append(wrc_resource_item)
+
+        wrc_resource_sub_item = TestWrcResourceItem(0x409)
+        wrc_resource_item.sub_items.append(wrc_resource_sub_item)
+
+        wrc_resource_sub_item.resource_data = self._VERSION_INFORMATION_RESOURCE_DATA
+
+        decoded_resource = windows_resource_file._GetDecodedResource(0x10)
+        self.assertIsNone(decoded_resource)
+
+        # Test that the decoded resource is cached.
+        windows_resource_file = resource_file.WindowsResourceFile(
+            "C:\\Windows\\System32\\test.dll"
+        )
+        windows_resource_file._wrc_stream = wrc_stream
+
+        decoded_resource = windows_resource_file._GetDecodedResource(0x10)
+        self.assertIsNotNone(decoded_resource)
+
+        wrc_resource_sub_item.resource_data = None
+
+        cached_decoded_resource = windows_resource_file._GetDecodedResource(0x10)
+        self.assertIs(cached_decoded_resource, decoded_resource)
+
+    def testGetPreferredResourceSubItem(self):
+        """Tests the _GetPreferredResourceSubItem function."""
+        windows_resource_file = resource_file.WindowsResourceFile(
+            "C:\\Windows\\System32\\test.dll", preferred_language_identifier=0x413
+        )
+
+        wrc_stream = TestWrcStream()
+        windows_resource_file._wrc_stream = wrc_stream
+
+        wrc_resource = TestWrcResource()
+        wrc_stream.resources[0x06] = wrc_resource
+
+        wrc_resource_item1 = TestWrcResourceItem(1)
+        wrc_resource.items.append(wrc_resource_item1)
+
+        wrc_resource_sub_item1 = TestWrcResourceItem(0x409)
+        wrc_resource_item1.sub_items.append(wrc_resource_sub_item1)
+
+        wrc_resource_item2 = TestWrcResourceItem(2)
+        wrc_resource.items.append(wrc_resource_item2)
+
+        wrc_resource_sub_item2 = TestWrcResourceItem(0x409)
+        wrc_resource_item2.sub_items.append(wrc_resource_sub_item2)
+
+        wrc_resource_sub_item3 = TestWrcResourceItem(0x413)
+        wrc_resource_item2.sub_items.append(wrc_resource_sub_item3)
+
+        wrc_resource_sub_item = windows_resource_file._GetPreferredResourceSubItem(0x06)
+        self.assertIs(wrc_resource_sub_item, wrc_resource_sub_item3)
+
+        wrc_resource_sub_item = windows_resource_file._GetPreferredResourceSubItem(
+            0x06, item_identifier=1
+        )
+        self.assertIs(wrc_resource_sub_item, wrc_resource_sub_item1)
+
+        wrc_resource_sub_item = windows_resource_file._GetPreferredResourceSubItem(
+            0x06, item_identifier=3
+        )
+        self.assertIsNone(wrc_resource_sub_item)
+
+        wrc_resource_sub_item = windows_resource_file._GetPreferredResourceSubItem(
+            "MUI"
+        )
+        self.assertIsNone(wrc_resource_sub_item)
+
+    def testGetResourceSubItems(self):
+        """Tests the _GetResourceSubItems function."""
+        windows_resource_file = resource_file.WindowsResourceFile(
+            "C:\\Windows\\System32\\test.dll"
+        )
+
+        wrc_stream = TestWrcStream()
+        windows_resource_file._wrc_stream = wrc_stream
+
+        wrc_resource = TestWrcResource()
+        wrc_stream.resources[0x06] = wrc_resource
+
+        wrc_resource_item = TestWrcResourceItem(1)
+        wrc_resource.items.append(wrc_resource_item)
+
+        wrc_resource_sub_item = TestWrcResourceItem(0x409)
+        wrc_resource_item.sub_items.append(wrc_resource_sub_item)
+
+        resource_sub_items = windows_resource_file._GetResourceSubItems(0x06)
+        self.assertEqual(resource_sub_items, {1: {0x409: wrc_resource_sub_item}})
+
+        resource_sub_items = windows_resource_file._GetResourceSubItems(0x10)
+        self.assertEqual(resource_sub_items, {})
+
+    def testGetStringTable(self):
+        """Tests the _GetStringTable function."""
+        test_file_path = self._GetTestFilePath(["wrc_test.dll"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        windows_resource_file = resource_file.WindowsResourceFile(
+            "C:\\Windows\\System32\\wrc_test.dll"
+        )
+
+        with open(test_file_path, "rb") as file_object:
+            windows_resource_file.OpenFileObject(file_object)
+
+            try:
+                strings = windows_resource_file._GetStringTable(63)
+                self.assertEqual(strings, {1000: "My string"})
+
+                strings = windows_resource_file._GetStringTable(1)
+                self.assertEqual(strings, {})
+
+            finally:
+                windows_resource_file.Close()
+
     def testGetVersionInformationResourceNoWrc(self):
         """Tests the _GetVersionInformationResource function."""
         test_file_path = self._GetTestFilePath(["nowrc_test.dll"])
@@ -1042,8 +1184,178 @@ class WindowsResourceFileTest(test_lib.BaseTestCase):
 
             windows_resource_file.Close()
 
+    def testGetMUIResource(self):
+        """Tests the GetMUIResource function."""
+        test_file_path = self._GetTestFilePath(["wrc_test.dll"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        windows_resource_file = resource_file.WindowsResourceFile(
+            "C:\\Windows\\System32\\wrc_test.dll"
+        )
+
+        with open(test_file_path, "rb") as file_object:
+            windows_resource_file.OpenFileObject(file_object)
+
+            try:
+                mui_resource = windows_resource_file.GetMUIResource()
+                self.assertIsNone(mui_resource)
+
+            finally:
+                windows_resource_file.Close()
+
+    def testGetMUILanguage(self):
+        """Tests the GetMUILanguage function."""
+        resource_file_writer = synthetic_lib.ResourceFileWriter()
+        resource_file_writer.AddMUIResource("en-US")
+
+        with test_lib.TempDirectory() as temporary_directory:
+            test_file_path = os.path.join(temporary_directory, "synthetic.dll")
+            resource_file_writer.Write(test_file_path)
+
+            windows_resource_file = resource_file.WindowsResourceFile(
+                "C:\\Windows\\System32\\synthetic.dll"
+            )
+            windows_resource_file.Open(test_file_path)
+
+            try:
+                mui_language = windows_resource_file.GetMUILanguage()
+                self.assertEqual(mui_language, "en-US")
+
+                self.assertFalse(windows_resource_file.HasStringTableResource())
+
+            finally:
+                windows_resource_file.Close()
+
+    def testGetString(self):
+        """Tests the GetString function."""
+        test_file_path = self._GetTestFilePath(["wrc_test.dll"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        windows_resource_file = resource_file.WindowsResourceFile(
+            "C:\\Windows\\System32\\wrc_test.dll"
+        )
+
+        with open(test_file_path, "rb") as file_object:
+            windows_resource_file.OpenFileObject(file_object)
+
+            try:
+                string = windows_resource_file.GetString(1000)
+                self.assertEqual(string, "My string")
+
+                string = windows_resource_file.GetString(1111)
+                self.assertEqual(string, "My other string")
+
+                string = windows_resource_file.GetString(1001)
+                self.assertIsNone(string)
+
+                string = windows_resource_file.GetString(99999)
+                self.assertIsNone(string)
+
+            finally:
+                windows_resource_file.Close()
+
+    def testGetStringPreferredLanguage(self):
+        """Tests the GetString function with multiple languages."""
+        resource_file_writer = synthetic_lib.ResourceFileWriter()
+        for language_identifier in (0x0407, 0x0409, 0x040C):
+            resource_file_writer.AddStringTable(
+                language_identifier, synthetic_lib.GetStrings(100, language_identifier)
+            )
+
+        with test_lib.TempDirectory() as temporary_directory:
+            test_file_path = os.path.join(temporary_directory, "synthetic.dll.mui")
+            resource_file_writer.Write(test_file_path)
+
+            windows_resource_file = resource_file.WindowsResourceFile(
+                "C:\\Windows\\System32\\en-US\\synthetic.dll.mui"
+            )
+            windows_resource_file.Open(test_file_path)
+
+            try:
+                string = windows_resource_file.GetString(1000)
+                self.assertEqual(string, "String 1000 (0409)")
+
+                string = windows_resource_file.GetString(1099)
+                self.assertEqual(string, "String 1099 (0409)")
+
+                string = windows_resource_file.GetString(1100)
+                self.assertIsNone(string)
+
+            finally:
+                windows_resource_file.Close()
+
+            windows_resource_file = resource_file.WindowsResourceFile(
+                "C:\\Windows\\System32\\en-US\\synthetic.dll.mui",
+                preferred_language_identifier=0x040C,
+            )
+            windows_resource_file.Open(test_file_path)
+
+            try:
+                string = windows_resource_file.GetString(1050)
+                self.assertEqual(string, "String 1050 (040c)")
+
+            finally:
+                windows_resource_file.Close()
+
+    def testHasStringTableResource(self):
+        """Tests the HasStringTableResource function."""
+        test_file_path = self._GetTestFilePath(["wrc_test.dll"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        windows_resource_file = resource_file.WindowsResourceFile(
+            "C:\\Windows\\System32\\wrc_test.dll"
+        )
+
+        with open(test_file_path, "rb") as file_object:
+            windows_resource_file.OpenFileObject(file_object)
+
+            try:
+                self.assertTrue(windows_resource_file.HasStringTableResource())
+
+            finally:
+                windows_resource_file.Close()
+
+        test_file_path = self._GetTestFilePath(["nowrc_test.dll"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        windows_resource_file = resource_file.WindowsResourceFile(
+            "C:\\Windows\\System32\\nowrc_test.dll"
+        )
+
+        with open(test_file_path, "rb") as file_object:
+            windows_resource_file.OpenFileObject(file_object)
+
+            try:
+                self.assertFalse(windows_resource_file.HasStringTableResource())
+
+            finally:
+                windows_resource_file.Close()
+
     # TODO: add open/close test on non PE/COFF file.
 
+    def testOpenAndClose(self):
+        """Tests the Open and Close functions."""
+        test_file_path = self._GetTestFilePath(["wrc_test.dll"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        windows_resource_file = resource_file.WindowsResourceFile(
+            "C:\\Windows\\System32\\wrc_test.dll"
+        )
+
+        windows_resource_file.Open(test_file_path)
+
+        try:
+            with self.assertRaises(OSError):
+                windows_resource_file.Open(test_file_path)
+
+            self.assertEqual(windows_resource_file.GetString(1000), "My string")
+
+        finally:
+            windows_resource_file.Close()
+
+        with self.assertRaises(OSError):
+            windows_resource_file.Close()
+
     def testOpenFileObjectAndCloseNoWrc(self):
         """Tests the OpenFileObject and Close functions."""
         test_file_path = self._GetTestFilePath(["nowrc_test.dll"])
@@ -1061,6 +1373,46 @@ class WindowsResourceFileTest(test_lib.BaseTestCase):
 
             windows_resource_file.Close()
 
+    def testOpenFileObjectAndCloseReadAhead(self):
+        """Tests the OpenFileObject and Close functions with read-ahead."""
+        test_file_path = self._GetTestFilePath(["wrc_test.dll"])
+        self._SkipIfPathNotExists(test_file_path)
+
+        windows_resource_file = resource_file.WindowsResourceFile(
+            "C:\\Windows\\System32\\wrc_test.dll", read_ahead=True
+        )
+
+        with open(test_file_path, "rb") as file_object:
+            windows_resource_file.OpenFileObject(file_object)
+
+            try:
+                self.assertIsInstance(
+                    windows_resource_file._section_file_object, io.BytesIO
+                )
+                self.assertEqual(windows_resource_file.GetString(1000), "My string")
+
+            finally:
+                windows_resource_file.Close()
+
+        # Test with a resource section that exceeds the maximum read-ahead size.
+        windows_resource_file = resource_file.WindowsResourceFile(
+            "C:\\Windows\\System32\\wrc_test.dll",
+            maximum_read_ahead_size=16,
+            read_ahead=True,
+        )
+
+        with open(test_file_path, "rb") as file_object:
+            windows_resource_file.OpenFileObject(file_object)
+
+            try:
+                self.assertNotIsInstance(
+                    windows_resource_file._section_file_object, io.BytesIO
+                )
+                self.assertEqual(windows_resource_file.GetString(1000), "My string")
+
+            finally:
+                windows_resource_file.Close()
+
     def testOpenFileObjectAndCloseWrc(self):
         """Tests the OpenFileObject and Close functions."""
         test_file_path = self._GetTestFilePath(["wrc_test.dll"])
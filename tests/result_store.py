@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""Tests for the SQLite-based store of extraction results."""
+
+import os
+import sqlite3
+import unittest
+
+from winshlrc import extractor
+from winshlrc import result_store
+
+from tests import test_lib
+
+
+class ExtractionResultStoreTest(test_lib.BaseTestCase):
+    """Tests for the SQLite-based store of extraction results."""
+
+    _MY_COMPUTER_IDENTIFIER = "20d04fe0-3aea-1069-a2d8-08002b30309d"
+
+    _RECYCLE_BIN_IDENTIFIER = "645ff040-5081-101b-9f08-00aa002f954e"
+
+    def _CreateShellFolder(self, identifier, name, localized_string=None):
+        """Creates a shell folder.
+
+        Args:
+          identifier (str): identifier (GUID).
+          name (str): name.
+          localized_string (Optional[str]): localized string of the name.
+
+        Returns:
+          ShellFolder: shell folder.
+        """
+        shell_folder = extractor.ShellFolder(
+            identifier=identifier, localized_string=localized_string
+        )
+        shell_folder.name = name
+        return shell_folder
+
+    def testAddVolumeAndQueries(self):
+        """Tests the AddVolume function and querying the added volumes."""
+        with test_lib.TempDirectory() as temporary_directory:
+            path = os.path.join(temporary_directory, "results.sqlite")
+
+            test_store = result_store.ExtractionResultStore(path)
+            test_store.Open()
+
+            run_identifier = test_store.StartRun()
+            test_store.AddVolume(
+                run_identifier,
+                "xp.raw",
+                "p1",
+                [
+                    self._CreateShellFolder(
+                        self._MY_COMPUTER_IDENTIFIER, "My Computer"
+                    ),
+                    self._CreateShellFolder(
+                        self._RECYCLE_BIN_IDENTIFIER, "Recycle Bin"
+                    ),
+                ],
+                detected_windows_version="Windows XP",
+                windows_version="Windows XP",
+            )
+            test_store.Close()
+
+            # Results of a subsequent run are appended to the existing store.
+            test_store = result_store.ExtractionResultStore(path)
+            test_store.Open()
+
+            run_identifier = test_store.StartRun()
+            test_store.AddVolume(
+                run_identifier,
+                "10.raw",
+                "p2",
+                [
+                    self._CreateShellFolder(
+                        self._MY_COMPUTER_IDENTIFIER.upper(),
+                        "This PC",
+                        localized_string="@shell32.dll,-9216",
+                    )
+                ],
+                windows_version="Windows 10",
+            )
+
+            volumes = test_store.GetVolumesWithShellFolder(self._MY_COMPUTER_IDENTIFIER)
+            self.assertEqual(
+                volumes,
+                [("10.raw", "p2", "Windows 10"), ("xp.raw", "p1", "Windows XP")],
+            )
+
+            volumes = test_store.GetVolumesWithShellFolder(self._RECYCLE_BIN_IDENTIFIER)
+            self.assertEqual(volumes, [("xp.raw", "p1", "Windows XP")])
+
+            names_per_windows_version = test_store.GetNamesPerWindowsVersion(
+                self._MY_COMPUTER_IDENTIFIER
+            )
+            self.assertEqual(
+                names_per_windows_version,
+                {"Windows 10": ["This PC"], "Windows XP": ["My Computer"]},
+            )
+
+            shell_folders = list(test_store.GetShellFolders())
+            self.assertEqual(len(shell_folders), 3)
+            self.assertEqual(
+                shell_folders[2],
+                (
+                    "10.raw",
+                    "p2",
+                    "Windows 10",
+                    self._MY_COMPUTER_IDENTIFIER,
+                    None,
+                    "This PC",
+                    "@shell32.dll,-9216",
+                ),
+            )
+
+            test_store.Close()
+
+    def testOpen(self):
+        """Tests the Open function."""
+        with test_lib.TempDirectory() as temporary_directory:
+            path = os.path.join(temporary_directory, "results.sqlite")
+
+            test_store = result_store.ExtractionResultStore(path)
+            test_store.Open()
+
+            with self.assertRaises(OSError):
+                test_store.Open()
+
+            test_store.Close()
+
+            connection = sqlite3.connect(path)
+            with connection:
+                connection.execute(
+                    "UPDATE metadata SET value = '0' WHERE key = 'format_version'"
+                )
+            connection.close()
+
+            test_store = result_store.ExtractionResultStore(path)
+            with self.assertRaises(OSError):
+                test_store.Open()
+
+    def testOpenReadOnly(self):
+        """Tests the Open function in read-only mode."""
+        with test_lib.TempDirectory() as temporary_directory:
+            path = os.path.join(temporary_directory, "results.sqlite")
+
+            test_store = result_store.ExtractionResultStore(path)
+            with self.assertRaises(OSError):
+                test_store.Open(read_only=True)
+
+            self.assertFalse(os.path.exists(path))
+
+            test_store = result_store.ExtractionResultStore(path)
+            test_store.Open()
+
+            run_identifier = test_store.StartRun()
+            test_store.AddVolume(
+                run_identifier,
+                "10.raw",
+                "p1",
+                [self._CreateShellFolder(self._MY_COMPUTER_IDENTIFIER, "This PC")],
+            )
+            test_store.Close()
+
+            test_store = result_store.ExtractionResultStore(path)
+            test_store.Open(read_only=True)
+
+            try:
+                shell_folders = list(test_store.GetShellFolders())
+                self.assertEqual(len(shell_folders), 1)
+
+                with self.assertRaises(sqlite3.OperationalError):
+                    test_store.StartRun()
+
+            finally:
+                test_store.Close()
+
+            connection = sqlite3.connect(path)
+            with connection:
+                connection.execute("DELETE FROM metadata")
+            connection.close()
+
+            test_store = result_store.ExtractionResultStore(path)
+            with self.assertRaises(OSError):
+                test_store.Open(read_only=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""Tests for the persistent cache of volume scan results."""
+
+import os
+import unittest
+
+from dfvfs.helpers import volume_scanner as dfvfs_volume_scanner
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as dfvfs_path_spec_factory
+
+from winshlrc import scan_cache
+
+from tests import test_lib
+
+
+class ScanResultCacheTest(test_lib.BaseTestCase):
+    """Tests for the persistent cache of volume scan results."""
+
+    def _GetVolumeScannerOptions(self, snapshots):
+        """Retrieves volume scanner options.
+
+        Args:
+          snapshots (list[str]): snapshot identifiers.
+
+        Returns:
+          dfvfs.VolumeScannerOptions: volume scanner options.
+        """
+        options = dfvfs_volume_scanner.VolumeScannerOptions()
+        options.partitions = ["all"]
+        options.snapshots = snapshots
+        options.volumes = ["none"]
+        return options
+
+    def testGetAndSetScanResult(self):
+        """Tests the GetScanResult and SetScanResult functions."""
+        with test_lib.TempDirectory() as temporary_directory:
+            cache_path = os.path.join(temporary_directory, "scan_cache.json")
+            source_path = os.path.join(temporary_directory, "image.raw")
+
+            with open(source_path, "wb") as file_object:
+                file_object.write(b"\x00" * 512)
+
+            path_spec = dfvfs_path_spec_factory.Factory.NewPathSpec(
+                dfvfs_definitions.TYPE_INDICATOR_RAW,
+                parent=dfvfs_path_spec_factory.Factory.NewPathSpec(
+                    dfvfs_definitions.TYPE_INDICATOR_OS, location=source_path
+                ),
+            )
+            path_spec = dfvfs_path_spec_factory.Factory.NewPathSpec(
+                dfvfs_definitions.TYPE_INDICATOR_NTFS, location="\\", parent=path_spec
+            )
+
+            options = self._GetVolumeScannerOptions(["none"])
+
+            test_cache = scan_cache.ScanResultCache(cache_path)
+
+            scan_result = test_cache.GetScanResult(source_path, options)
+            self.assertIsNone(scan_result)
+
+            test_cache.SetScanResult(
+                source_path,
+                options,
+                dfvfs_definitions.SOURCE_TYPE_STORAGE_MEDIA_IMAGE,
+                [path_spec],
+            )
+
+            # Read the scan result with a new cache to test persistence.
+            test_cache = scan_cache.ScanResultCache(cache_path)
+
+            scan_result = test_cache.GetScanResult(source_path, options)
+            self.assertIsNotNone(scan_result)
+
+            source_type, path_specs = scan_result
+            self.assertEqual(
+                source_type, dfvfs_definitions.SOURCE_TYPE_STORAGE_MEDIA_IMAGE
+            )
+            self.assertEqual(len(path_specs), 1)
+            self.assertEqual(path_specs[0].comparable, path_spec.comparable)
+
+            # Test that a different selection of snapshots is a different scan
+            # result.
+            scan_result = test_cache.GetScanResult(
+                source_path, self._GetVolumeScannerOptions(["all"])
+            )
+            self.assertIsNone(scan_result)
+
+            # Test that a changed source invalidates the scan result.
+            with open(source_path, "ab") as file_object:
+                file_object.write(b"\x00" * 512)
+
+            scan_result = test_cache.GetScanResult(source_path, options)
+            self.assertIsNone(scan_result)
+
+            scan_result = test_cache.GetScanResult(
+                os.path.join(temporary_directory, "bogus.raw"), options
+            )
+            self.assertIsNone(scan_result)
+
+    def testSetScanResultWithEncryptedVolume(self):
+        """Tests the SetScanResult function with an encrypted volume."""
+        with test_lib.TempDirectory() as temporary_directory:
+            cache_path = os.path.join(temporary_directory, "scan_cache.json")
+            source_path = os.path.join(temporary_directory, "image.raw")
+
+            with open(source_path, "wb") as file_object:
+                file_object.write(b"\x00" * 512)
+
+            path_spec = dfvfs_path_spec_factory.Factory.NewPathSpec(
+                dfvfs_definitions.TYPE_INDICATOR_RAW,
+                parent=dfvfs_path_spec_factory.Factory.NewPathSpec(
+                    dfvfs_definitions.TYPE_INDICATOR_OS, location=source_path
+                ),
+            )
+            path_spec = dfvfs_path_spec_factory.Factory.NewPathSpec(
+                dfvfs_definitions.TYPE_INDICATOR_BDE, parent=path_spec
+            )
+            path_spec = dfvfs_path_spec_factory.Factory.NewPathSpec(
+                dfvfs_definitions.TYPE_INDICATOR_NTFS, location="\\", parent=path_spec
+            )
+
+            options = self._GetVolumeScannerOptions(["none"])
+
+            test_cache = scan_cache.ScanResultCache(cache_path)
+            test_cache.SetScanResult(
+                source_path,
+                options,
+                dfvfs_definitions.SOURCE_TYPE_STORAGE_MEDIA_IMAGE,
+                [path_spec],
+            )
+
+            # The volume is unlocked by the scan, hence it is not skipped.
+            scan_result = test_cache.GetScanResult(source_path, options)
+            self.assertIsNone(scan_result)
+            self.assertFalse(os.path.exists(cache_path))
+
+    def testGetScanResultWithInvalidCacheFile(self):
+        """Tests the GetScanResult function with an invalid cache file."""
+        with test_lib.TempDirectory() as temporary_directory:
+            cache_path = os.path.join(temporary_directory, "scan_cache.json")
+
+            with open(cache_path, "w", encoding="utf-8") as file_object:
+                file_object.write("{bogus")
+
+            test_cache = scan_cache.ScanResultCache(cache_path)
+
+            with self.assertLogs(level="WARNING"):
+                scan_result = test_cache.GetScanResult(
+                    temporary_directory, self._GetVolumeScannerOptions(["none"])
+                )
+
+            self.assertIsNone(scan_result)
+
+
+if __name__ == "__main__":
+    unittest.main()
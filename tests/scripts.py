@@ -0,0 +1,576 @@
+#!/usr/bin/env python3
+"""Tests for the console scripts."""
+
+import os
+import socket
+import subprocess
+import sys
+import unittest
+
+import yaml
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as dfvfs_path_spec_factory
+
+from winshlrc import arrow_export
+from winshlrc import checkpoint_journal
+from winshlrc import extractor
+from winshlrc import knowledge_base
+from winshlrc import result_store
+from winshlrc.scripts import lookup_server
+from winshlrc.scripts import shellbags
+
+from tests import synthetic_lib
+from tests import test_lib
+
+
+class ScriptImportsTest(test_lib.BaseTestCase):
+    """Tests for the modules imported by the console scripts."""
+
+    def _GetImportedModules(self, arguments):
+        """Retrieves the modules imported by a Python process.
+
+        Args:
+          arguments (list[str]): arguments of the Python interpreter, such as
+              ["-c", "import winshlrc.resources"].
+
+        Returns:
+          set[str]: names of the imported modules, as reported by -X importtime.
+        """
+        environment = dict(os.environ)
+        environment["PYTHONPATH"] = test_lib.PROJECT_PATH
+
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", *arguments],
+            capture_output=True,
+            check=False,
+            cwd=test_lib.PROJECT_PATH,
+            env=environment,
+            text=True,
+        )
+
+        module_names = set()
+        for line in process.stderr.splitlines():
+            if line.startswith("import time:") and line.count("|") == 2:
+                module_names.add(line.rsplit("|", maxsplit=1)[-1].strip())
+
+        return module_names
+
+    def testExtractHelp(self):
+        """Tests that extract --help does not import the extraction back-ends."""
+        module_names = self._GetImportedModules(
+            ["-m", "winshlrc.scripts.extract", "--help"]
+        )
+        self.assertIn("winshlrc.scripts.cli_tool", module_names)
+        self.assertNotIn("dfvfs", module_names)
+        self.assertNotIn("winshlrc.extractor", module_names)
+
+    def testExportParquetHelp(self):
+        """Tests that export_parquet --help does not import pyarrow."""
+        module_names = self._GetImportedModules(
+            ["-m", "winshlrc.scripts.export_parquet", "--help"]
+        )
+        self.assertIn("winshlrc.scripts.cli_tool", module_names)
+        self.assertNotIn("pyarrow", module_names)
+        self.assertNotIn("winshlrc.arrow_export", module_names)
+        self.assertNotIn("winshlrc.result_store", module_names)
+
+    def testGenerateDocsImports(self):
+        """Tests that generate_docs does not import dfvfs."""
+        module_names = self._GetImportedModules(
+            ["-c", "import winshlrc.scripts.generate_docs"]
+        )
+        self.assertIn("winshlrc.yaml_definitions_file", module_names)
+        self.assertNotIn("cProfile", module_names)
+        self.assertNotIn("dfvfs", module_names)
+
+    def testGenerateSourceImports(self):
+        """Tests that generate_source does not import dfvfs."""
+        module_names = self._GetImportedModules(
+            ["-c", "import winshlrc.scripts.generate_source"]
+        )
+        self.assertIn("winshlrc.yaml_definitions_file", module_names)
+        self.assertNotIn("dfvfs", module_names)
+
+    def testLookupServerHelp(self):
+        """Tests that lookup_server --help does not import the knowledge base."""
+        module_names = self._GetImportedModules(
+            ["-m", "winshlrc.scripts.lookup_server", "--help"]
+        )
+        self.assertIn("winshlrc.scripts.cli_tool", module_names)
+        self.assertNotIn("winshlrc.knowledge_base", module_names)
+        self.assertNotIn("winshlrc.lookup_server", module_names)
+        self.assertNotIn("yaml", module_names)
+
+    def testResourcesImports(self):
+        """Tests that winshlrc.resources does not import other modules."""
+        module_names = self._GetImportedModules(["-c", "import winshlrc.resources"])
+        self.assertIn("winshlrc.resources", module_names)
+        self.assertNotIn("yaml", module_names)
+
+    def testSearchHelp(self):
+        """Tests that search --help does not import numpy."""
+        module_names = self._GetImportedModules(
+            ["-m", "winshlrc.scripts.search", "--help"]
+        )
+        self.assertIn("winshlrc.scripts.cli_tool", module_names)
+        self.assertNotIn("numpy", module_names)
+        self.assertNotIn("winshlrc.name_search", module_names)
+
+
+@unittest.skipIf(arrow_export.pyarrow is None, "missing pyarrow")
+class ExportParquetScriptTest(test_lib.BaseTestCase):
+    """Tests for the export_parquet console script."""
+
+    def _RunExportParquet(self, arguments):
+        """Runs the export_parquet console script.
+
+        Args:
+          arguments (list[str]): command line arguments.
+
+        Returns:
+          subprocess.CompletedProcess: completed process.
+        """
+        environment = dict(os.environ)
+        environment["PYTHONPATH"] = test_lib.PROJECT_PATH
+
+        return subprocess.run(
+            [sys.executable, "-m", "winshlrc.scripts.export_parquet", *arguments],
+            capture_output=True,
+            check=False,
+            cwd=test_lib.PROJECT_PATH,
+            env=environment,
+            text=True,
+        )
+
+    def testExportWithResultStore(self):
+        """Tests exporting the shell folders of a result store."""
+        with test_lib.TempDirectory() as temporary_directory:
+            path = os.path.join(temporary_directory, "results.sqlite")
+            output_path = os.path.join(temporary_directory, "output")
+
+            process = self._RunExportParquet(["--result_store", path, output_path])
+            self.assertEqual(process.returncode, 1)
+            self.assertIn(f"No such result store: {path:s}", process.stdout)
+            self.assertFalse(os.path.exists(path))
+
+            shell_folder = extractor.ShellFolder(
+                identifier="20d04fe0-3aea-1069-a2d8-08002b30309d"
+            )
+            shell_folder.name = "This PC"
+
+            test_store = result_store.ExtractionResultStore(path)
+            test_store.Open()
+            test_store.AddVolume(test_store.StartRun(), "10.raw", "p1", [shell_folder])
+            test_store.Close()
+
+            process = self._RunExportParquet(["--result_store", path, output_path])
+            self.assertEqual(process.returncode, 0, process.stdout)
+            self.assertTrue(
+                os.path.isfile(os.path.join(output_path, "observations.parquet"))
+            )
+
+
+class ExtractScriptTest(test_lib.BaseTestCase):
+    """Tests for the extract console script."""
+
+    def _CreateDiskImage(self, path, number_of_partitions, names_per_partition=None):
+        """Creates a disk image with Windows volumes.
+
+        Args:
+          path (str): path of the disk image to create.
+          number_of_partitions (int): number of partitions, which all contain
+              a Windows volume.
+          names_per_partition (Optional[list[list[str]]]): names of the class
+              identifiers per partition, as used by WriteSoftwareRegistryFile(),
+              or None if all partitions contain the same Windows volume.
+
+        Returns:
+          dict[str, str]: names per identifier of the shell folders of the first
+              partition.
+        """
+        shell_folders = None
+        volumes_data = []
+
+        for partition_index in range(number_of_partitions):
+            names = None
+            if names_per_partition:
+                names = names_per_partition[partition_index]
+            elif volumes_data:
+                volumes_data.append(volumes_data[0])
+                continue
+
+            with test_lib.TempDirectory() as temporary_directory:
+                software_path = os.path.join(temporary_directory, "SOFTWARE")
+                partition_shell_folders = synthetic_lib.WriteSoftwareRegistryFile(
+                    software_path, 10, names=names
+                )
+
+                with open(software_path, "rb") as file_object:
+                    software_data = file_object.read()
+
+            if shell_folders is None:
+                shell_folders = partition_shell_folders
+
+            file_system_writer = synthetic_lib.FATFileSystemWriter()
+            file_system_writer.AddFile(
+                "Windows\\System32\\config\\SOFTWARE", software_data
+            )
+            volumes_data.append(file_system_writer.GetData())
+
+        synthetic_lib.WriteDiskImage(path, volumes_data)
+
+        return shell_folders
+
+    def _RunExtract(self, arguments):
+        """Runs the extract console script.
+
+        Args:
+          arguments (list[str]): command line arguments.
+
+        Returns:
+          subprocess.CompletedProcess: completed process.
+        """
+        environment = dict(os.environ)
+        environment["PYTHONPATH"] = test_lib.PROJECT_PATH
+
+        return subprocess.run(
+            [sys.executable, "-m", "winshlrc.scripts.extract", *arguments],
+            capture_output=True,
+            check=False,
+            cwd=test_lib.PROJECT_PATH,
+            env=environment,
+            text=True,
+        )
+
+    def _WriteSourcesFile(self, path, source_definitions):
+        """Writes a sources file.
+
+        Args:
+          path (str): path of the sources file to write.
+          source_definitions (list[dict[str, object]]): source definitions.
+        """
+        with open(path, "w", encoding="utf-8") as file_object:
+            yaml.safe_dump_all(source_definitions, file_object)
+
+    def testExtractWithContinueOnError(self):
+        """Tests extracting sources where a source cannot be extracted."""
+        with test_lib.TempDirectory() as temporary_directory:
+            missing_path = os.path.join(temporary_directory, "missing", "SOFTWARE")
+
+            software_path = os.path.join(temporary_directory, "SOFTWARE")
+            shell_folders = synthetic_lib.WriteSoftwareRegistryFile(software_path, 10)
+
+            sources_path = os.path.join(temporary_directory, "sources.yaml")
+            self._WriteSourcesFile(
+                sources_path,
+                [
+                    {"registry_files": [missing_path], "windows_version": None},
+                    {"registry_files": [software_path], "windows_version": None},
+                ],
+            )
+
+            process = self._RunExtract([sources_path])
+
+            self.assertEqual(process.returncode, 1)
+            for identifier in shell_folders:
+                self.assertNotIn(f"\t{identifier:s}\n", process.stdout)
+
+            process = self._RunExtract(["--continue_on_error", sources_path])
+
+        self.assertEqual(process.returncode, 1)
+
+        # The sources after the source that cannot be extracted are extracted.
+        for identifier in shell_folders:
+            self.assertIn(f"\t{identifier:s}\n", process.stdout)
+
+        self.assertIn(
+            f"Unable to extract sources:\n\t{missing_path:s}\n", process.stdout
+        )
+
+    def testExtractWithJournal(self):
+        """Tests that the journal contains the shell folders before merging."""
+        with test_lib.TempDirectory() as temporary_directory:
+            image_path = os.path.join(temporary_directory, "image.raw")
+            shell_folders = self._CreateDiskImage(
+                image_path, 2, names_per_partition=[[None], ["Shell folder"]]
+            )
+
+            journal_path = os.path.join(temporary_directory, "journal.jsonl")
+
+            process = self._RunExtract(
+                ["--journal", journal_path, "--workers", "1", image_path]
+            )
+            self.assertEqual(process.returncode, 0, msg=process.stderr)
+
+            journal = checkpoint_journal.CheckpointJournal(journal_path)
+            journal.Open(resume=True)
+
+            try:
+                volume_results = journal.GetCompletedSource(
+                    {"source": image_path, "windows_version": None}
+                )
+
+            finally:
+                journal.Close()
+
+        self.assertIsNotNone(volume_results)
+
+        names_per_volume = {
+            volume_identifier: {
+                shell_folder.identifier: shell_folder.name
+                for shell_folder in volume_shell_folders
+            }
+            for volume_identifier, _, volume_shell_folders in volume_results
+        }
+        self.assertEqual(
+            names_per_volume,
+            {
+                "p1": {identifier: None for identifier in shell_folders},
+                "p2": {identifier: "Shell folder" for identifier in shell_folders},
+            },
+        )
+
+    def testExtractWithJournalAndResume(self):
+        """Tests resuming an extraction run with a journal."""
+        with test_lib.TempDirectory() as temporary_directory:
+            source_definitions = []
+            for index, names in enumerate((None, ["Other name"])):
+                software_path = os.path.join(temporary_directory, f"SOFTWARE{index:d}")
+                synthetic_lib.WriteSoftwareRegistryFile(software_path, 10, names=names)
+
+                source_definitions.append(
+                    {"registry_files": [software_path], "windows_version": "Windows 10"}
+                )
+
+            sources_path = os.path.join(temporary_directory, "sources.yaml")
+            self._WriteSourcesFile(sources_path, source_definitions)
+
+            journal_path = os.path.join(temporary_directory, "journal.jsonl")
+            result_store_path = os.path.join(temporary_directory, "results.sqlite")
+
+            arguments = [
+                "--journal",
+                journal_path,
+                "--result_store",
+                result_store_path,
+                sources_path,
+            ]
+            process = self._RunExtract(arguments)
+            self.assertEqual(process.returncode, 0, msg=process.stderr)
+
+            expected_output = process.stdout
+
+            test_store = result_store.ExtractionResultStore(result_store_path)
+            test_store.Open(read_only=True)
+            expected_shell_folders = list(test_store.GetShellFolders())
+            test_store.Close()
+
+            process = self._RunExtract(["--resume", *arguments])
+            self.assertEqual(process.returncode, 0, msg=process.stderr)
+
+            test_store = result_store.ExtractionResultStore(result_store_path)
+            test_store.Open(read_only=True)
+            shell_folders = list(test_store.GetShellFolders())
+            test_store.Close()
+
+        self.assertEqual(len(expected_shell_folders), 10)
+
+        for source_definition in source_definitions:
+            registry_file_path = source_definition["registry_files"][0]
+            self.assertIn(
+                f"[INFO] Skipping completed: {registry_file_path:s}", process.stderr
+            )
+
+        self.assertIn("[INFO] Skipped 2 completed sources.", process.stderr)
+
+        # The results of the completed sources are reported but not stored again.
+        self.assertEqual(process.stdout, expected_output)
+        self.assertEqual(shell_folders, expected_shell_folders)
+
+    def testExtractWithWorkers(self):
+        """Tests extracting partitions in worker processes."""
+        with test_lib.TempDirectory() as temporary_directory:
+            image_path = os.path.join(temporary_directory, "image.raw")
+            shell_folders = self._CreateDiskImage(image_path, 2)
+
+            process = self._RunExtract(["--workers", "2", image_path])
+
+        self.assertEqual(process.returncode, 0, msg=process.stderr)
+
+        for identifier in shell_folders:
+            self.assertIn(f"\t{identifier:s}\n\t\tVolumes: p1, p2\n", process.stdout)
+
+        # The worker processes log the volumes they process.
+        self.assertIn("[INFO] Processing volume: p1", process.stderr)
+        self.assertIn("[INFO] Processing volume: p2", process.stderr)
+
+
+class LookupServerScriptTest(test_lib.BaseTestCase):
+    """Tests for the lookup_server console script."""
+
+    def _RunLookupServer(self, arguments):
+        """Runs the lookup_server console script.
+
+        Args:
+          arguments (list[str]): command line arguments.
+
+        Returns:
+          subprocess.CompletedProcess: completed process.
+        """
+        environment = dict(os.environ)
+        environment["PYTHONPATH"] = test_lib.PROJECT_PATH
+
+        return subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "winshlrc.scripts.lookup_server",
+                "--reload_interval",
+                "0",
+                *arguments,
+            ],
+            capture_output=True,
+            check=False,
+            cwd=test_lib.PROJECT_PATH,
+            env=environment,
+            text=True,
+            timeout=60,
+        )
+
+    def testMainWithPortInUse(self):
+        """Tests Main with a TCP port that is already in use."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server_socket:
+            server_socket.bind(("127.0.0.1", 0))
+            server_socket.listen()
+
+            _, port = server_socket.getsockname()
+
+            process = self._RunLookupServer(["--port", f"{port:d}"])
+
+        self.assertEqual(process.returncode, 1)
+        self.assertIn("Unable to listen with error:", process.stdout)
+
+    @unittest.skipUnless(hasattr(socket, "AF_UNIX"), "missing Unix domain sockets")
+    def testMainWithUnixSocketInUse(self):
+        """Tests Main with a Unix domain socket path that is already in use."""
+        with test_lib.TempDirectory() as temporary_directory:
+            path = os.path.join(temporary_directory, "lookup.sock")
+            with open(path, "wb"):
+                pass
+
+            process = self._RunLookupServer(["--unix_socket", path])
+
+            self.assertTrue(os.path.exists(path))
+
+        self.assertEqual(process.returncode, 1)
+        self.assertIn(
+            f"Unix domain socket: {path:s} is already in use.", process.stdout
+        )
+
+    @unittest.skipUnless(hasattr(socket, "AF_UNIX"), "missing Unix domain sockets")
+    def testRemoveStaleUnixSocket(self):
+        """Tests the RemoveStaleUnixSocket function."""
+        with test_lib.TempDirectory() as temporary_directory:
+            path = os.path.join(temporary_directory, "lookup.sock")
+
+            result = lookup_server.RemoveStaleUnixSocket(path)
+            self.assertTrue(result)
+
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server_socket:
+                server_socket.bind(path)
+                server_socket.listen()
+
+                result = lookup_server.RemoveStaleUnixSocket(path)
+                self.assertFalse(result)
+
+            # The socket is not removed when it is closed, like that of a server
+            # that was killed.
+            self.assertTrue(os.path.exists(path))
+
+            result = lookup_server.RemoveStaleUnixSocket(path)
+            self.assertTrue(result)
+            self.assertFalse(os.path.exists(path))
+
+            with open(path, "wb"):
+                pass
+
+            result = lookup_server.RemoveStaleUnixSocket(path)
+            self.assertFalse(result)
+
+
+class ShellbagsScriptTest(test_lib.BaseTestCase):
+    """Tests for the shellbags console script."""
+
+    _MY_COMPUTER_IDENTIFIER = "20d04fe0-3aea-1069-a2d8-08002b30309d"
+
+    def testResolveShellbagsInParallel(self):
+        """Tests the ResolveShellbagsInParallel function."""
+        shell_items = [
+            (
+                synthetic_lib.GetRootFolderShellItem(self._MY_COMPUTER_IDENTIFIER),
+                [
+                    (
+                        synthetic_lib.GetVolumeShellItem("C:\\"),
+                        [
+                            (synthetic_lib.GetFileEntryShellItem("Windows"), None),
+                            (synthetic_lib.GetFileEntryShellItem("Users"), None),
+                        ],
+                    ),
+                ],
+            ),
+        ]
+
+        test_knowledge_base = knowledge_base.WindowsShellKnowledgeBase()
+
+        with test_lib.TempDirectory() as temporary_directory:
+            path = os.path.join(temporary_directory, "observed_shellfolders.yaml")
+            with open(path, "w", encoding="utf-8") as file_object:
+                file_object.write(
+                    f"identifier: {self._MY_COMPUTER_IDENTIFIER:s}\n"
+                    "name: My Computer\n"
+                )
+
+            test_knowledge_base.ReadFromDirectory(temporary_directory)
+
+            path_specs_per_username = {}
+            for username in ("user1", "user2"):
+                path = os.path.join(temporary_directory, f"{username:s}.DAT")
+                synthetic_lib.WriteUserRegistryFile(
+                    path, "Software\\Microsoft\\Windows\\Shell\\BagMRU", shell_items
+                )
+
+                path_specs_per_username[username] = [
+                    dfvfs_path_spec_factory.Factory.NewPathSpec(
+                        dfvfs_definitions.TYPE_INDICATOR_OS, location=path
+                    )
+                ]
+
+            chunks = list(
+                shellbags.ResolveShellbagsInParallel(
+                    test_knowledge_base, path_specs_per_username, 2, chunk_size=3
+                )
+            )
+
+        self.assertEqual(len(chunks), 4)
+        for records in chunks:
+            self.assertLessEqual(len(records), 3)
+
+        paths_per_username = {}
+        for records in chunks:
+            for record in records:
+                paths_per_username.setdefault(record.username, []).append(record.path)
+
+        expected_paths = [
+            "My Computer",
+            "My Computer\\C:",
+            "My Computer\\C:\\Windows",
+            "My Computer\\C:\\Users",
+        ]
+        self.assertEqual(
+            paths_per_username, {"user1": expected_paths, "user2": expected_paths}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Tests for the persistent cache of extracted shell folders."""
+
+import os
+import sqlite3
+import unittest
+
+from winshlrc import extractor
+from winshlrc import shell_folder_cache
+
+from tests import test_lib
+
+
+class ShellFolderResultCacheTest(test_lib.BaseTestCase):
+    """Tests for the persistent cache of extracted shell folders."""
+
+    _MY_COMPUTER_IDENTIFIER = "20d04fe0-3aea-1069-a2d8-08002b30309d"
+
+    def testGetAndSetShellFolderResult(self):
+        """Tests the GetShellFolderResult and SetShellFolderResult functions."""
+        shell_folder = extractor.ShellFolder(
+            identifier=self._MY_COMPUTER_IDENTIFIER,
+            localized_string="@%SystemRoot%\\system32\\shell32.dll,-9216",
+        )
+        shell_folder.name = "This PC"
+
+        resource_fingerprints = {"%SystemRoot%\\system32\\shell32.dll": "0123abcd"}
+
+        with test_lib.TempDirectory() as temporary_directory:
+            path = os.path.join(temporary_directory, "shell_folder_cache.sqlite")
+
+            test_cache = shell_folder_cache.ShellFolderResultCache(path)
+            test_cache.Open()
+
+            result = test_cache.GetShellFolderResult("fingerprint")
+            self.assertIsNone(result)
+
+            test_cache.SetShellFolderResult(
+                "fingerprint", resource_fingerprints, [shell_folder]
+            )
+            test_cache.Close()
+
+            test_cache = shell_folder_cache.ShellFolderResultCache(path)
+            test_cache.Open()
+
+            result = test_cache.GetShellFolderResult("fingerprint")
+            self.assertEqual(
+                result,
+                (
+                    resource_fingerprints,
+                    [
+                        (
+                            self._MY_COMPUTER_IDENTIFIER,
+                            None,
+                            "This PC",
+                            "@%SystemRoot%\\system32\\shell32.dll,-9216",
+                        )
+                    ],
+                ),
+            )
+
+            result = test_cache.GetShellFolderResult("other")
+            self.assertIsNone(result)
+
+            test_cache.Close()
+
+    def testOpen(self):
+        """Tests the Open function."""
+        with test_lib.TempDirectory() as temporary_directory:
+            path = os.path.join(temporary_directory, "shell_folder_cache.sqlite")
+
+            test_cache = shell_folder_cache.ShellFolderResultCache(path)
+            test_cache.Open()
+
+            with self.assertRaises(OSError):
+                test_cache.Open()
+
+            test_cache.Close()
+
+            connection = sqlite3.connect(path)
+            with connection:
+                connection.execute(
+                    "UPDATE metadata SET value = '0' WHERE key = 'format_version'"
+                )
+            connection.close()
+
+            test_cache = shell_folder_cache.ShellFolderResultCache(path)
+            with self.assertRaises(OSError):
+                test_cache.Open()
+
+
+if __name__ == "__main__":
+    unittest.main()
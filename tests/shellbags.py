@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Tests for the Windows shellbags (BagMRU) resolver."""
+
+import os
+import unittest
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as dfvfs_path_spec_factory
+
+from winshlrc import knowledge_base
+from winshlrc import shellbags
+
+from tests import synthetic_lib
+from tests import test_lib
+
+
+class ShellbagResolverTest(test_lib.BaseTestCase):
+    """Tests for the Windows shellbags (BagMRU) resolver."""
+
+    _MY_COMPUTER_IDENTIFIER = "20d04fe0-3aea-1069-a2d8-08002b30309d"
+
+    _UNKNOWN_IDENTIFIER = "00000000-0000-4000-8000-00000000ffff"
+
+    def _CreateKnowledgeBase(self):
+        """Creates a knowledge base with the My Computer shell folder.
+
+        Returns:
+          WindowsShellKnowledgeBase: knowledge base.
+        """
+        test_knowledge_base = knowledge_base.WindowsShellKnowledgeBase()
+
+        with test_lib.TempDirectory() as temporary_directory:
+            path = os.path.join(temporary_directory, "observed_shellfolders.yaml")
+            with open(path, "w", encoding="utf-8") as file_object:
+                file_object.write(
+                    f"identifier: {self._MY_COMPUTER_IDENTIFIER:s}\n"
+                    "name: My Computer\n"
+                )
+
+            test_knowledge_base.ReadFromDirectory(temporary_directory)
+
+        return test_knowledge_base
+
+    def _WriteUserRegistryFile(self, path):
+        """Writes a user Windows Registry file with shellbags.
+
+        Args:
+          path (str): path of the file to write.
+        """
+        shell_items = [
+            (
+                synthetic_lib.GetRootFolderShellItem(self._MY_COMPUTER_IDENTIFIER),
+                [
+                    (
+                        synthetic_lib.GetVolumeShellItem("C:\\"),
+                        [
+                            (synthetic_lib.GetFileEntryShellItem("Windows"), None),
+                            (synthetic_lib.GetFileEntryShellItem("Users"), None),
+                        ],
+                    ),
+                ],
+            ),
+            (synthetic_lib.GetRootFolderShellItem(self._UNKNOWN_IDENTIFIER), None),
+            (b"\xff\xff", None),
+        ]
+        synthetic_lib.WriteUserRegistryFile(
+            path, "Software\\Microsoft\\Windows\\Shell\\BagMRU", shell_items
+        )
+
+    def testResolveRegistryFilePathSpec(self):
+        """Tests the ResolveRegistryFilePathSpec function."""
+        resolver = shellbags.ShellbagResolver(self._CreateKnowledgeBase())
+
+        with test_lib.TempDirectory() as temporary_directory:
+            path = os.path.join(temporary_directory, "NTUSER.DAT")
+            self._WriteUserRegistryFile(path)
+
+            path_spec = dfvfs_path_spec_factory.Factory.NewPathSpec(
+                dfvfs_definitions.TYPE_INDICATOR_OS, location=path
+            )
+            records = list(
+                resolver.ResolveRegistryFilePathSpec(path_spec, username="user")
+            )
+
+        paths = [record.path for record in records]
+        self.assertEqual(
+            paths,
+            [
+                "My Computer",
+                "My Computer\\C:",
+                "My Computer\\C:\\Windows",
+                "My Computer\\C:\\Users",
+                f"{{{self._UNKNOWN_IDENTIFIER:s}}}",
+                "<unknown>",
+            ],
+        )
+
+        record = records[0]
+        self.assertEqual(record.class_type, 0x1F)
+        self.assertEqual(record.identifier, self._MY_COMPUTER_IDENTIFIER)
+        self.assertEqual(
+            record.key_path, "\\Software\\Microsoft\\Windows\\Shell\\BagMRU"
+        )
+        self.assertEqual(record.name, "My Computer")
+        self.assertEqual(
+            record.resource_types, knowledge_base.RESOURCE_TYPE_SHELL_FOLDER
+        )
+        self.assertEqual(record.username, "user")
+        self.assertEqual(record.value_name, "0")
+
+        record = records[2]
+        self.assertEqual(
+            record.key_path, "\\Software\\Microsoft\\Windows\\Shell\\BagMRU\\0\\0"
+        )
+        self.assertIsNone(record.identifier)
+        self.assertEqual(record.value_name, "0")
+
+        record = records[4]
+        self.assertEqual(record.identifier, self._UNKNOWN_IDENTIFIER)
+        self.assertIsNone(record.name)
+        self.assertEqual(record.resource_types, 0)
+
+    def testResolveRegistryFilePathSpecWithoutBagMRU(self):
+        """Tests the ResolveRegistryFilePathSpec function without BagMRU keys."""
+        resolver = shellbags.ShellbagResolver(self._CreateKnowledgeBase())
+
+        with test_lib.TempDirectory() as temporary_directory:
+            path = os.path.join(temporary_directory, "SOFTWARE")
+            synthetic_lib.WriteSoftwareRegistryFile(path, 1)
+
+            path_spec = dfvfs_path_spec_factory.Factory.NewPathSpec(
+                dfvfs_definitions.TYPE_INDICATOR_OS, location=path
+            )
+            records = list(resolver.ResolveRegistryFilePathSpec(path_spec))
+
+        self.assertEqual(records, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Tests for the SQLite-based store."""
+
+import os
+import sqlite3
+import unittest
+
+from winshlrc import sqlite_store
+
+from tests import test_lib
+
+
+class SQLiteStoreTest(test_lib.BaseTestCase):
+    """Tests for the SQLite-based store."""
+
+    def testOpen(self):
+        """Tests the Open function."""
+        with test_lib.TempDirectory() as temporary_directory:
+            path = os.path.join(temporary_directory, "store.sqlite")
+
+            test_store = sqlite_store.SQLiteStore(path)
+            test_store.Open()
+
+            with self.assertRaises(OSError):
+                test_store.Open()
+
+            test_store.Close()
+
+            connection = sqlite3.connect(path)
+            with connection:
+                connection.execute(
+                    "UPDATE metadata SET value = '0' WHERE key = 'format_version'"
+                )
+            connection.close()
+
+            test_store = sqlite_store.SQLiteStore(path)
+            with self.assertRaises(OSError):
+                test_store.Open()
+
+    def testOpenReadOnly(self):
+        """Tests the Open function in read-only mode."""
+        with test_lib.TempDirectory() as temporary_directory:
+            path = os.path.join(temporary_directory, "store.sqlite")
+
+            test_store = sqlite_store.SQLiteStore(path)
+            with self.assertRaises(OSError):
+                test_store.Open(read_only=True)
+
+            self.assertFalse(os.path.exists(path))
+
+            test_store.Open()
+            test_store.Close()
+
+            test_store.Open(read_only=True)
+            test_store.Close()
+
+            connection = sqlite3.connect(path)
+            with connection:
+                connection.execute("DELETE FROM metadata")
+            connection.close()
+
+            with self.assertRaises(OSError):
+                test_store.Open(read_only=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
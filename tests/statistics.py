@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Tests for the extraction statistics."""
+
+import unittest
+
+from winshlrc import statistics
+
+from tests import test_lib
+
+
+class ExtractionStatisticsTest(test_lib.BaseTestCase):
+    """Tests for the extraction statistics."""
+
+    def testCopyToDict(self):
+        """Tests the CopyToDict function."""
+        test_statistics = statistics.ExtractionStatistics()
+        test_statistics.IncrementCounter("resource_files_opened")
+
+        statistics_dict = test_statistics.CopyToDict()
+        self.assertEqual(
+            statistics_dict,
+            {
+                "counters": {"resource_files_opened": 1},
+                "stage_calls": {},
+                "stage_times": {},
+            },
+        )
+
+    def testIncrementCounter(self):
+        """Tests the IncrementCounter function."""
+        test_statistics = statistics.ExtractionStatistics()
+
+        test_statistics.IncrementCounter("resource_files_opened")
+        test_statistics.IncrementCounter("resource_files_opened", value=2)
+        self.assertEqual(test_statistics.counters["resource_files_opened"], 3)
+
+    def testMerge(self):
+        """Tests the Merge function."""
+        test_statistics = statistics.ExtractionStatistics()
+        test_statistics.IncrementCounter("resource_files_opened")
+
+        other_statistics = statistics.ExtractionStatistics()
+        other_statistics.IncrementCounter("resource_files_opened", value=2)
+        other_statistics.StartStage("volume_scanning")
+        other_statistics.StopStage("volume_scanning")
+
+        test_statistics.Merge(other_statistics)
+
+        self.assertEqual(test_statistics.counters["resource_files_opened"], 3)
+        self.assertEqual(test_statistics.stage_calls["volume_scanning"], 1)
+
+    def testStartAndStopStage(self):
+        """Tests the StartStage and StopStage functions."""
+        test_statistics = statistics.ExtractionStatistics()
+
+        test_statistics.StartStage("name_resolution")
+        test_statistics.StartStage("resource_file_opening")
+        test_statistics.StartStage("name_resolution")
+        test_statistics.StopStage("name_resolution")
+        test_statistics.StopStage("resource_file_opening")
+        test_statistics.StopStage("name_resolution")
+
+        self.assertEqual(test_statistics.stage_calls["name_resolution"], 1)
+        self.assertEqual(test_statistics.stage_calls["resource_file_opening"], 1)
+        self.assertGreaterEqual(
+            test_statistics.stage_times["name_resolution"],
+            test_statistics.stage_times["resource_file_opening"],
+        )
+
+        with self.assertRaises(RuntimeError):
+            test_statistics.StopStage("name_resolution")
+
+
+if __name__ == "__main__":
+    unittest.main()
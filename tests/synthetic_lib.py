@@ -0,0 +1,1529 @@
+"""Generators of synthetic test data.
+
+The generators create Windows Registry files, PE/COFF resource files, disk
+images and YAML definitions files of arbitrary size, so that tests and
+benchmarks can exercise realistic volumes of data without disk images of
+Windows installations.
+"""
+
+import os
+import struct
+import uuid
+
+# Windows Registry value data types.
+REG_SZ = 1
+REG_BINARY = 3
+
+# Windows versions used in synthetic definitions.
+WINDOWS_VERSIONS = [
+    "Windows 7",
+    "Windows 8.1",
+    "Windows 10 (1809)",
+    "Windows 11 (21H2)",
+]
+
+
+def GetClassIdentifier(index):
+    """Retrieves a synthetic class identifier.
+
+    Args:
+      index (int): index of the class identifier.
+
+    Returns:
+      str: class identifier (GUID) in lower case without curly braces.
+    """
+    return str(uuid.UUID(int=index, version=4))
+
+
+def GetFileEntryShellItem(name):
+    """Retrieves a synthetic directory file entry shell item.
+
+    Args:
+      name (str): name of the directory, which must consist of ASCII characters.
+
+    Returns:
+      bytes: shell item data.
+    """
+    name_data = name.encode("ascii") + b"\x00"
+    if len(name_data) % 2:
+        name_data += b"\x00"
+
+    # The shell item consists of: size, class type, unknown, file size, FAT
+    # date and time, file attribute flags (FILE_ATTRIBUTE_DIRECTORY) and name.
+    shell_item_data = struct.pack("<BBIIH", 0x31, 0, 0, 0, 0x0010) + name_data
+    return struct.pack("<H", len(shell_item_data) + 2) + shell_item_data
+
+
+def GetRootFolderShellItem(identifier):
+    """Retrieves a synthetic root folder shell item.
+
+    Args:
+      identifier (str): shell folder identifier (GUID) of the root folder.
+
+    Returns:
+      bytes: shell item data.
+    """
+    # The shell item consists of: size, class type, sort index and shell folder
+    # identifier.
+    return struct.pack("<HBB", 20, 0x1F, 0x50) + uuid.UUID(identifier).bytes_le
+
+
+def GetVolumeShellItem(name):
+    """Retrieves a synthetic volume shell item.
+
+    Args:
+      name (str): name of the volume, such as "C:\\".
+
+    Returns:
+      bytes: shell item data.
+    """
+    # The shell item consists of: size, class type and name.
+    return struct.pack("<HB", 25, 0x2F) + name.encode("ascii").ljust(22, b"\x00")
+
+
+def GetStrings(number_of_strings, language_identifier, first_string_identifier=1000):
+    """Retrieves synthetic strings of a string table.
+
+    Args:
+      number_of_strings (int): number of strings.
+      language_identifier (int): language identifier (LCID) of the strings, which
+          is part of the string so that strings of different languages differ.
+      first_string_identifier (Optional[int]): identifier of the first string.
+
+    Returns:
+      dict[int, str]: strings per string identifier.
+    """
+    return {
+        string_identifier: f"String {string_identifier:d} ({language_identifier:04x})"
+        for string_identifier in range(
+            first_string_identifier, first_string_identifier + number_of_strings
+        )
+    }
+
+
+class FATFileSystemWriter:
+    """Writer of synthetic FAT-16 file systems.
+
+    Files are stored in contiguous clusters of a single sector. Names that are
+    not a valid upper case 8.3 name are stored as long file names. Sectors that
+    are reserved, in front of the file allocation tables, are left empty so
+    that they can contain a Volume Shadow Snapshot (VSS) volume header.
+    """
+
+    _BYTES_PER_SECTOR = 512
+
+    # A FAT-16 file system requires at least 4085 clusters.
+    _MINIMUM_NUMBER_OF_CLUSTERS = 4096
+
+    _NUMBER_OF_RESERVED_SECTORS = 32
+
+    _NUMBER_OF_ROOT_DIRECTORY_ENTRIES = 512
+
+    # Date and time of 2020-01-01 12:00:00 in FAT date and time format.
+    _DATE = ((2020 - 1980) << 9) | (1 << 5) | 1
+    _TIME = 12 << 11
+
+    def __init__(self):
+        """Initializes a writer of synthetic FAT-16 file systems."""
+        super().__init__()
+        self._clusters_data = {}
+        self._file_allocation_table = [0xFFF8, 0xFFFF]
+        self._root_directory = {}
+
+    def _AllocateClusters(self, data):
+        """Allocates contiguous clusters.
+
+        Args:
+          data (bytes): data to store in the clusters.
+
+        Returns:
+          int: first cluster or 0 if the data is empty.
+        """
+        if not data:
+            return 0
+
+        number_of_clusters = (
+            len(data) + self._BYTES_PER_SECTOR - 1
+        ) // self._BYTES_PER_SECTOR
+
+        first_cluster = len(self._file_allocation_table)
+        for cluster in range(first_cluster, first_cluster + number_of_clusters - 1):
+            self._file_allocation_table.append(cluster + 1)
+
+        # End of the cluster chain.
+        self._file_allocation_table.append(0xFFFF)
+
+        self._clusters_data[first_cluster] = data
+
+        return first_cluster
+
+    def _GetDirectoryData(self, directory, cluster=0, parent_cluster=0):
+        """Retrieves the data of a directory.
+
+        The clusters of the files and sub directories are allocated before
+        the data of the directory is determined.
+
+        Args:
+          directory (dict[str, object]): data of the files and sub directories
+              per name.
+          cluster (Optional[int]): first cluster of the directory or 0 if
+              the directory is the root directory.
+          parent_cluster (Optional[int]): first cluster of the parent directory
+              or 0 if the parent directory is the root directory.
+
+        Returns:
+          bytes: directory data.
+        """
+        directory_data = bytearray()
+        if cluster:
+            directory_data.extend(self._GetDirectoryEntry(b".", 0x10, cluster, 0))
+            directory_data.extend(
+                self._GetDirectoryEntry(b"..", 0x10, parent_cluster, 0)
+            )
+
+        for index, (name, data) in enumerate(sorted(directory.items())):
+            short_name = self._GetShortName(name, index)
+
+            if isinstance(data, dict):
+                sub_directory_cluster = self._AllocateClusters(
+                    b"\x00" * self._GetDirectorySize(data)
+                )
+                self._clusters_data[sub_directory_cluster] = self._GetDirectoryData(
+                    data, cluster=sub_directory_cluster, parent_cluster=cluster
+                )
+                entry_data = self._GetDirectoryEntry(
+                    short_name, 0x10, sub_directory_cluster, 0
+                )
+
+            else:
+                entry_data = self._GetDirectoryEntry(
+                    short_name, 0x20, self._AllocateClusters(data), len(data)
+                )
+
+            if not self._IsShortName(name):
+                directory_data.extend(self._GetLongNameEntries(name, short_name))
+
+            directory_data.extend(entry_data)
+
+        return bytes(directory_data)
+
+    def _GetDirectoryEntry(self, short_name, attribute_flags, cluster, size):
+        """Retrieves a directory entry.
+
+        Args:
+          short_name (bytes): 8.3 name, such as b"SOFTWARE" or b"KERNEL32DLL".
+          attribute_flags (int): attribute flags, such as 0x10 for a directory.
+          cluster (int): first cluster of the data.
+          size (int): size of the data.
+
+        Returns:
+          bytes: directory entry data.
+        """
+        return struct.pack(
+            "<11sBBBHHHHHHHI",
+            short_name.ljust(11, b" "),
+            attribute_flags,
+            0,
+            0,
+            self._TIME,
+            self._DATE,
+            self._DATE,
+            0,
+            self._TIME,
+            self._DATE,
+            cluster,
+            size,
+        )
+
+    def _GetDirectorySize(self, directory):
+        """Retrieves the size of the data of a directory.
+
+        Args:
+          directory (dict[str, object]): data of the files and sub directories
+              per name.
+
+        Returns:
+          int: size of the data of the directory, which includes the "." and
+              ".." entries and the long name entries.
+        """
+        number_of_entries = 2
+        for name in directory:
+            # Every long name entry contains 13 characters.
+            number_of_entries += 1 + (len(name) + 12) // 13
+
+        return number_of_entries * 32
+
+    def _GetLongNameEntries(self, name, short_name):
+        """Retrieves the long name entries of a directory entry.
+
+        Args:
+          name (str): name.
+          short_name (bytes): 8.3 name, of 11 bytes, of the directory entry.
+
+        Returns:
+          bytes: long name entries data.
+        """
+        checksum = 0
+        for byte_value in short_name:
+            checksum = (((checksum & 1) << 7) + (checksum >> 1) + byte_value) & 0xFF
+
+        name_data = name.encode("utf-16-le") + b"\x00\x00"
+        number_of_entries = (len(name_data) + 25) // 26
+        name_data = name_data.ljust(number_of_entries * 26, b"\xff")
+
+        entries_data = []
+        for entry_index in range(number_of_entries):
+            entry_name_data = name_data[entry_index * 26 : (entry_index + 1) * 26]
+
+            sequence_number = entry_index + 1
+            if sequence_number == number_of_entries:
+                sequence_number |= 0x40
+
+            entries_data.append(
+                struct.pack(
+                    "<B10sBBB12sH4s",
+                    sequence_number,
+                    entry_name_data[:10],
+                    0x0F,
+                    0,
+                    checksum,
+                    entry_name_data[10:22],
+                    0,
+                    entry_name_data[22:],
+                )
+            )
+
+        # The long name entries are stored in reverse order.
+        return b"".join(reversed(entries_data))
+
+    def _GetShortName(self, name, index):
+        """Retrieves the 8.3 name of a directory entry.
+
+        Args:
+          name (str): name.
+          index (int): index of the entry in the directory, used to make
+              the 8.3 name unique.
+
+        Returns:
+          bytes: 8.3 name, of 11 bytes, such as b"SOFTWARE   ".
+        """
+        base_name, _, extension = name.rpartition(".")
+        if not base_name:
+            base_name, extension = extension, ""
+
+        if not self._IsShortName(name):
+            base_name = base_name.replace(".", "").upper()
+            base_name = f"{base_name[:4]:s}~{index:03d}"
+            extension = extension.upper()[:3]
+
+        return f"{base_name:<8s}{extension:<3s}".encode("ascii")
+
+    def _IsShortName(self, name):
+        """Determines if a name is a valid upper case 8.3 name.
+
+        Args:
+          name (str): name.
+
+        Returns:
+          bool: True if the name is a valid upper case 8.3 name.
+        """
+        base_name, _, extension = name.partition(".")
+        return (
+            name == name.upper()
+            and name.isascii()
+            and 0 < len(base_name) <= 8
+            and "." not in extension
+            and len(extension) <= 3
+        )
+
+    def AddFile(self, path, data):
+        """Adds a file.
+
+        Args:
+          path (str): path of the file, with a backslash as path segment
+              separator, such as "Windows\\System32\\config\\SOFTWARE".
+          data (bytes): data of the file.
+        """
+        path_segments = path.split("\\")
+
+        directory = self._root_directory
+        for path_segment in path_segments[:-1]:
+            directory = directory.setdefault(path_segment, {})
+
+        directory[path_segments[-1]] = data
+
+    def GetData(self):
+        """Retrieves the data of the file system.
+
+        Returns:
+          bytes: file system data.
+        """
+        self._clusters_data = {}
+        self._file_allocation_table = [0xFFF8, 0xFFFF]
+
+        root_directory_data = self._GetDirectoryData(self._root_directory)
+
+        number_of_clusters = max(
+            len(self._file_allocation_table) - 2, self._MINIMUM_NUMBER_OF_CLUSTERS
+        )
+        number_of_file_allocation_table_sectors = (
+            (number_of_clusters + 2) * 2 + self._BYTES_PER_SECTOR - 1
+        ) // self._BYTES_PER_SECTOR
+        number_of_root_directory_sectors = (
+            self._NUMBER_OF_ROOT_DIRECTORY_ENTRIES * 32 // self._BYTES_PER_SECTOR
+        )
+        first_data_sector = (
+            self._NUMBER_OF_RESERVED_SECTORS
+            + (2 * number_of_file_allocation_table_sectors)
+            + number_of_root_directory_sectors
+        )
+        number_of_sectors = first_data_sector + number_of_clusters
+
+        file_system_data = bytearray(number_of_sectors * self._BYTES_PER_SECTOR)
+
+        struct.pack_into(
+            "<3s8sHBHBHHBHHHII",
+            file_system_data,
+            0,
+            b"\xeb\x3c\x90",
+            b"MSWIN4.1",
+            self._BYTES_PER_SECTOR,
+            1,
+            self._NUMBER_OF_RESERVED_SECTORS,
+            2,
+            self._NUMBER_OF_ROOT_DIRECTORY_ENTRIES,
+            number_of_sectors if number_of_sectors < 0x10000 else 0,
+            0xF8,
+            number_of_file_allocation_table_sectors,
+            63,
+            255,
+            0,
+            number_of_sectors if number_of_sectors >= 0x10000 else 0,
+        )
+        struct.pack_into(
+            "<BBBI11s8s",
+            file_system_data,
+            36,
+            0x80,
+            0,
+            0x29,
+            0x12345678,
+            b"SYNTHETIC  ",
+            b"FAT16   ",
+        )
+        file_system_data[510:512] = b"\x55\xaa"
+
+        file_allocation_table_data = b"".join(
+            struct.pack("<H", value) for value in self._file_allocation_table
+        )
+        for table_index in range(2):
+            offset = (
+                self._NUMBER_OF_RESERVED_SECTORS
+                + (table_index * number_of_file_allocation_table_sectors)
+            ) * self._BYTES_PER_SECTOR
+            file_system_data[offset : offset + len(file_allocation_table_data)] = (
+                file_allocation_table_data
+            )
+
+        offset = (
+            self._NUMBER_OF_RESERVED_SECTORS
+            + (2 * number_of_file_allocation_table_sectors)
+        ) * self._BYTES_PER_SECTOR
+        file_system_data[offset : offset + len(root_directory_data)] = (
+            root_directory_data
+        )
+
+        for cluster, data in self._clusters_data.items():
+            offset = (first_data_sector + cluster - 2) * self._BYTES_PER_SECTOR
+            file_system_data[offset : offset + len(data)] = data
+
+        return bytes(file_system_data)
+
+
+class REGFFileWriter:
+    """Writer of synthetic Windows NT Registry (REGF) files.
+
+    Keys and values are added bottom-up, where adding a key or value returns
+    the offset of its cell, which is used to reference it from its parent key.
+    Cells are stored in hive bins of 4096 bytes, like Windows does, unless
+    a cell requires a larger hive bin.
+    """
+
+    _FILE_HEADER_SIZE = 4096
+
+    _HIVE_BIN_HEADER_SIZE = 32
+
+    _HIVE_BIN_SIZE = 4096
+
+    def __init__(self):
+        """Initializes a writer of synthetic Windows NT Registry files."""
+        super().__init__()
+        self._hive_bin_unallocated_size = 0
+        self._hive_bins_data = bytearray()
+
+    def _AddCell(self, cell_data):
+        """Adds a cell.
+
+        Args:
+          cell_data (bytes): cell data.
+
+        Returns:
+          int: offset of the cell relative to the start of the hive bins data.
+        """
+        # The cell size includes the size value and is a multiple of 8, where
+        # a negative size indicates an allocated cell.
+        cell_size = (len(cell_data) + 4 + 7) & ~7
+
+        if cell_size > self._hive_bin_unallocated_size:
+            self._CloseHiveBin()
+            self._OpenHiveBin(cell_size)
+
+        cell_offset = len(self._hive_bins_data)
+
+        self._hive_bins_data.extend(struct.pack("<i", -cell_size))
+        self._hive_bins_data.extend(cell_data)
+        self._hive_bins_data.extend(b"\x00" * (cell_size - 4 - len(cell_data)))
+
+        self._hive_bin_unallocated_size -= cell_size
+
+        return cell_offset
+
+    def _CloseHiveBin(self):
+        """Closes the current hive bin by adding an unallocated cell."""
+        if self._hive_bin_unallocated_size:
+            self._hive_bins_data.extend(
+                struct.pack("<i", self._hive_bin_unallocated_size)
+            )
+            self._hive_bins_data.extend(b"\x00" * (self._hive_bin_unallocated_size - 4))
+
+            self._hive_bin_unallocated_size = 0
+
+    def _OpenHiveBin(self, cell_size):
+        """Opens a new hive bin.
+
+        Args:
+          cell_size (int): size of the cell that needs to fit in the hive bin.
+        """
+        hive_bin_size = (
+            cell_size + self._HIVE_BIN_HEADER_SIZE + self._HIVE_BIN_SIZE - 1
+        ) & ~(self._HIVE_BIN_SIZE - 1)
+
+        self._hive_bins_data.extend(b"hbin")
+        self._hive_bins_data.extend(
+            struct.pack("<IIQQI", len(self._hive_bins_data) - 4, hive_bin_size, 0, 0, 0)
+        )
+
+        self._hive_bin_unallocated_size = hive_bin_size - self._HIVE_BIN_HEADER_SIZE
+
+    def AddKey(self, name, subkey_offsets=None, value_offsets=None, is_root=False):
+        """Adds a key.
+
+        Args:
+          name (str): name of the key, which must consist of ASCII characters.
+          subkey_offsets (Optional[list[int]]): offsets of the cells of the sub
+              keys, which should be sorted by upper case name.
+          value_offsets (Optional[list[int]]): offsets of the cells of the values.
+          is_root (Optional[bool]): True if the key is the root key.
+
+        Returns:
+          int: offset of the key cell.
+        """
+        subkey_offsets = subkey_offsets or []
+        value_offsets = value_offsets or []
+
+        subkeys_list_offset = 0xFFFFFFFF
+        if subkey_offsets:
+            subkeys_list_offset = self._AddCell(
+                b"".join(
+                    [b"li", struct.pack("<H", len(subkey_offsets))]
+                    + [struct.pack("<I", offset) for offset in subkey_offsets]
+                )
+            )
+
+        values_list_offset = 0xFFFFFFFF
+        if value_offsets:
+            values_list_offset = self._AddCell(
+                b"".join(struct.pack("<I", offset) for offset in value_offsets)
+            )
+
+        # 0x0020 represents a key name stored as an ASCII string and 0x002c
+        # represents a root key.
+        flags = 0x0020
+        if is_root:
+            flags |= 0x002C
+
+        name_data = name.encode("ascii")
+        key_data = b"".join(
+            [
+                b"nk",
+                struct.pack(
+                    "<HQIIIIIIIIIIIIIIIHH",
+                    flags,
+                    0,
+                    0,
+                    0,
+                    len(subkey_offsets),
+                    0,
+                    subkeys_list_offset,
+                    0xFFFFFFFF,
+                    len(value_offsets),
+                    values_list_offset,
+                    0xFFFFFFFF,
+                    0xFFFFFFFF,
+                    0,
+                    0,
+                    0,
+                    0,
+                    0,
+                    len(name_data),
+                    0,
+                ),
+                name_data,
+            ]
+        )
+        return self._AddCell(key_data)
+
+    def AddValue(self, name, data, data_type):
+        """Adds a value.
+
+        Args:
+          name (str): name of the value, which must consist of ASCII characters,
+              where an empty string represents the default value.
+          data (bytes): value data.
+          data_type (int): value data type, such as REG_SZ.
+
+        Returns:
+          int: offset of the value cell.
+        """
+        if len(data) <= 4:
+            # Value data of 4 bytes or less is stored in the data offset.
+            data_size = len(data) | 0x80000000
+            (data_offset,) = struct.unpack("<I", data.ljust(4, b"\x00"))
+        else:
+            data_size = len(data)
+            data_offset = self._AddCell(data)
+
+        name_data = name.encode("ascii")
+        value_data = b"".join(
+            [
+                b"vk",
+                struct.pack(
+                    "<HIIIHH",
+                    len(name_data),
+                    data_size,
+                    data_offset,
+                    data_type,
+                    0x0001 if name_data else 0x0000,
+                    0,
+                ),
+                name_data,
+            ]
+        )
+        return self._AddCell(value_data)
+
+    def AddStringValue(self, name, string, data_type=REG_SZ):
+        """Adds a string value.
+
+        Args:
+          name (str): name of the value.
+          string (str): value string.
+          data_type (Optional[int]): value data type, such as REG_SZ.
+
+        Returns:
+          int: offset of the value cell.
+        """
+        return self.AddValue(name, f"{string:s}\x00".encode("utf-16-le"), data_type)
+
+    def Write(self, path, root_key_offset):
+        """Writes the Windows NT Registry file.
+
+        Args:
+          path (str): path of the file to write.
+          root_key_offset (int): offset of the cell of the root key.
+        """
+        self._CloseHiveBin()
+
+        file_header_data = bytearray(self._FILE_HEADER_SIZE)
+        struct.pack_into(
+            "<4sIIQIIIIIII",
+            file_header_data,
+            0,
+            b"regf",
+            1,
+            1,
+            0,
+            1,
+            5,
+            0,
+            1,
+            root_key_offset,
+            len(self._hive_bins_data),
+            1,
+        )
+
+        checksum = 0
+        for (value_32bit,) in struct.iter_unpack("<I", file_header_data[:508]):
+            checksum ^= value_32bit
+
+        struct.pack_into("<I", file_header_data, 508, checksum)
+
+        with open(path, "wb") as file_object:
+            file_object.write(file_header_data)
+            file_object.write(self._hive_bins_data)
+
+
+class ResourceFileWriter:
+    """Writer of synthetic PE/COFF resource files.
+
+    The resource file is a 32-bit dynamic link library (DLL) that only contains
+    a resource (.rsrc) section.
+    """
+
+    _FILE_ALIGNMENT = 0x200
+
+    _SECTION_ALIGNMENT = 0x1000
+
+    _SECTION_VIRTUAL_ADDRESS = 0x1000
+
+    _MUI_RESOURCE_NAME = "MUI"
+
+    _STRING_TABLE_RESOURCE_IDENTIFIER = 6
+
+    def __init__(self):
+        """Initializes a writer of synthetic PE/COFF resource files."""
+        super().__init__()
+        self._resources = {}
+
+    def _GetAlignedSize(self, size, alignment):
+        """Retrieves a size aligned to a boundary.
+
+        Args:
+          size (int): size.
+          alignment (int): alignment.
+
+        Returns:
+          int: aligned size.
+        """
+        return (size + alignment - 1) & ~(alignment - 1)
+
+    def _GetMUIResourceData(self, language):
+        """Retrieves the data of a MUI resource.
+
+        Args:
+          language (str): language of the MUI resource, such as "en-US".
+
+        Returns:
+          bytes: MUI resource data.
+        """
+        language_data = f"{language:s}\x00".encode("utf-16-le")
+        language_data_size = len(language_data)
+        aligned_language_data_size = self._GetAlignedSize(language_data_size, 8)
+
+        # The MUI resource header is 84 bytes, followed by 6 pairs of data offset
+        # and size of: main name, main identifier, MUI name, MUI identifier,
+        # language and fallback language.
+        values_offset = 0x84
+        data_size = values_offset + (2 * aligned_language_data_size)
+
+        header_data = struct.pack(
+            "<4sIIIIII16s16s24s",
+            b"\xcd\xfe\xcd\xfe",
+            data_size,
+            0x00010000,
+            0,
+            0x00000011,
+            0x00000100,
+            1,
+            b"",
+            b"",
+            b"",
+        )
+        values_data = struct.pack(
+            "<12I",
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            values_offset,
+            language_data_size,
+            values_offset + aligned_language_data_size,
+            language_data_size,
+        )
+        language_data = language_data.ljust(aligned_language_data_size, b"\x00")
+
+        return b"".join([header_data, values_data, language_data, language_data])
+
+    def _GetResourceEntryKeys(self, entries):
+        """Retrieves the keys of resource directory entries in storage order.
+
+        Args:
+          entries (dict[int|str, object]): resource directory entries per
+              identifier or name.
+
+        Returns:
+          list[int|str]: keys of the entries, where named entries are stored
+              before entries with an identifier.
+        """
+        names = sorted(key for key in entries if isinstance(key, str))
+        identifiers = sorted(key for key in entries if isinstance(key, int))
+        return names + identifiers
+
+    def _GetResourceSectionData(self):
+        """Retrieves the data of the resource section.
+
+        The resource section consists of a 3 level directory of resource type,
+        resource item and language, followed by the resource data entries,
+        the names of named entries and the resource data.
+
+        Returns:
+          bytes: resource section data.
+        """
+        directory_paths = [()]
+        for type_key in self._GetResourceEntryKeys(self._resources):
+            directory_paths.append((type_key,))
+        for type_key in self._GetResourceEntryKeys(self._resources):
+            resource_items = self._resources[type_key]
+            for item_key in self._GetResourceEntryKeys(resource_items):
+                directory_paths.append((type_key, item_key))
+
+        directories = {}
+        directory_offsets = {}
+        offset = 0
+        for directory_path in directory_paths:
+            directory = self._resources
+            for key in directory_path:
+                directory = directory[key]
+
+            directories[directory_path] = directory
+            directory_offsets[directory_path] = offset
+            offset += 16 + (8 * len(directory))
+
+        data_entry_offsets = {}
+        for directory_path in directory_paths[1 + len(self._resources) :]:
+            for language_identifier in self._GetResourceEntryKeys(
+                directories[directory_path]
+            ):
+                data_entry_offsets[directory_path + (language_identifier,)] = offset
+                offset += 16
+
+        name_offsets = {}
+        for directory in directories.values():
+            for key in directory:
+                if isinstance(key, str) and key not in name_offsets:
+                    name_offsets[key] = offset
+                    offset += 2 + (2 * len(key))
+
+        offset = self._GetAlignedSize(offset, 8)
+
+        data_offsets = {}
+        for data_path in data_entry_offsets:
+            data_offsets[data_path] = offset
+            offset += self._GetAlignedSize(len(self._GetResourceData(data_path)), 8)
+
+        section_data = bytearray(offset)
+
+        for directory_path, directory in directories.items():
+            directory_offset = directory_offsets[directory_path]
+            keys = self._GetResourceEntryKeys(directory)
+            number_of_names = sum(1 for key in keys if isinstance(key, str))
+
+            struct.pack_into(
+                "<IIHHHH",
+                section_data,
+                directory_offset,
+                0,
+                0,
+                0,
+                0,
+                number_of_names,
+                len(keys) - number_of_names,
+            )
+
+            entry_offset = directory_offset + 16
+            for key in keys:
+                if isinstance(key, str):
+                    name_value = 0x80000000 | name_offsets[key]
+                else:
+                    name_value = key
+
+                entry_path = directory_path + (key,)
+                if len(directory_path) < 2:
+                    offset_value = 0x80000000 | directory_offsets[entry_path]
+                else:
+                    offset_value = data_entry_offsets[entry_path]
+
+                struct.pack_into(
+                    "<II", section_data, entry_offset, name_value, offset_value
+                )
+                entry_offset += 8
+
+        for data_path, data_entry_offset in data_entry_offsets.items():
+            data = self._GetResourceData(data_path)
+            data_offset = data_offsets[data_path]
+
+            struct.pack_into(
+                "<IIII",
+                section_data,
+                data_entry_offset,
+                self._SECTION_VIRTUAL_ADDRESS + data_offset,
+                len(data),
+                0,
+                0,
+            )
+            section_data[data_offset : data_offset + len(data)] = data
+
+        for name, name_offset in name_offsets.items():
+            name_data = name.encode("utf-16-le")
+            struct.pack_into("<H", section_data, name_offset, len(name))
+            section_data[name_offset + 2 : name_offset + 2 + len(name_data)] = name_data
+
+        return bytes(section_data)
+
+    def _GetResourceData(self, data_path):
+        """Retrieves resource data.
+
+        Args:
+          data_path (tuple[int|str, int|str, int]): resource type, resource item
+              and language identifier of the resource data.
+
+        Returns:
+          bytes: resource data.
+        """
+        type_key, item_key, language_identifier = data_path
+        return self._resources[type_key][item_key][language_identifier]
+
+    def _GetStringTableResourceData(self, item_identifier, strings):
+        """Retrieves the data of a string table resource item.
+
+        Args:
+          item_identifier (int): identifier of the string table resource item.
+          strings (dict[int, str]): strings per string identifier.
+
+        Returns:
+          bytes: string table resource data.
+        """
+        # A string table resource item contains 16 strings, each stored as a
+        # 16-bit number of characters followed by an UTF-16 little-endian string.
+        first_string_identifier = (item_identifier - 1) * 16
+
+        string_table_data = []
+        for string_identifier in range(
+            first_string_identifier, first_string_identifier + 16
+        ):
+            string = strings.get(string_identifier, "")
+            string_data = string.encode("utf-16-le")
+            string_table_data.append(struct.pack("<H", len(string_data) // 2))
+            string_table_data.append(string_data)
+
+        return b"".join(string_table_data)
+
+    def AddMUIResource(self, language, language_identifier=0x0409):
+        """Adds a MUI resource.
+
+        Args:
+          language (str): language of the MUI resource, such as "en-US".
+          language_identifier (Optional[int]): language identifier (LCID) of
+              the resource.
+        """
+        resource_items = self._resources.setdefault(self._MUI_RESOURCE_NAME, {})
+        resource_items.setdefault(1, {})[language_identifier] = (
+            self._GetMUIResourceData(language)
+        )
+
+    def AddStringTable(self, language_identifier, strings):
+        """Adds a string table.
+
+        Args:
+          language_identifier (int): language identifier (LCID) of the strings.
+          strings (dict[int, str]): strings per string identifier.
+        """
+        strings_per_item = {}
+        for string_identifier, string in strings.items():
+            item_identifier = (string_identifier // 16) + 1
+            strings_per_item.setdefault(item_identifier, {})[string_identifier] = string
+
+        resource_items = self._resources.setdefault(
+            self._STRING_TABLE_RESOURCE_IDENTIFIER, {}
+        )
+        for item_identifier, item_strings in strings_per_item.items():
+            resource_items.setdefault(item_identifier, {})[language_identifier] = (
+                self._GetStringTableResourceData(item_identifier, item_strings)
+            )
+
+    def Write(self, path):
+        """Writes the resource file.
+
+        Args:
+          path (str): path of the file to write.
+        """
+        section_data = self._GetResourceSectionData()
+        section_virtual_size = len(section_data)
+        section_data_size = self._GetAlignedSize(
+            section_virtual_size, self._FILE_ALIGNMENT
+        )
+        image_size = self._SECTION_VIRTUAL_ADDRESS + self._GetAlignedSize(
+            section_virtual_size, self._SECTION_ALIGNMENT
+        )
+
+        # MS-DOS executable (MZ) header with the offset of the PE/COFF header,
+        # which is only used if the relocation table offset is 64 or more.
+        dos_header_data = bytearray(64)
+        dos_header_data[0:2] = b"MZ"
+        struct.pack_into("<H", dos_header_data, 24, 64)
+        struct.pack_into("<I", dos_header_data, 60, 64)
+
+        # COFF header of an i386 DLL with 1 section.
+        coff_header_data = struct.pack(
+            "<4sHHIIIHH", b"PE\x00\x00", 0x014C, 1, 0, 0, 0, 224, 0x2102
+        )
+
+        data_directories = [(0, 0)] * 16
+        data_directories[2] = (self._SECTION_VIRTUAL_ADDRESS, section_virtual_size)
+
+        optional_header_data = struct.pack(
+            "<HBBIIIIIIIIIHHHHHHIIIIHHIIIIII",
+            0x010B,
+            14,
+            0,
+            0,
+            section_data_size,
+            0,
+            0,
+            self._SECTION_VIRTUAL_ADDRESS,
+            self._SECTION_VIRTUAL_ADDRESS,
+            0x10000000,
+            self._SECTION_ALIGNMENT,
+            self._FILE_ALIGNMENT,
+            6,
+            0,
+            0,
+            0,
+            6,
+            0,
+            0,
+            image_size,
+            self._FILE_ALIGNMENT,
+            0,
+            2,
+            0x0140,
+            0x00100000,
+            0x00001000,
+            0x00100000,
+            0x00001000,
+            0,
+            16,
+        ) + b"".join(
+            struct.pack("<II", virtual_address, size)
+            for virtual_address, size in data_directories
+        )
+
+        section_header_data = struct.pack(
+            "<8sIIIIIIHHI",
+            b".rsrc",
+            section_virtual_size,
+            self._SECTION_VIRTUAL_ADDRESS,
+            section_data_size,
+            self._FILE_ALIGNMENT,
+            0,
+            0,
+            0,
+            0,
+            0x40000040,
+        )
+
+        headers_data = b"".join(
+            [
+                dos_header_data,
+                coff_header_data,
+                optional_header_data,
+                section_header_data,
+            ]
+        )
+
+        with open(path, "wb") as file_object:
+            file_object.write(headers_data.ljust(self._FILE_ALIGNMENT, b"\x00"))
+            file_object.write(section_data.ljust(section_data_size, b"\x00"))
+
+
+def WriteControlPanelItemsDefinitionsFile(path, number_of_definitions):
+    """Writes a synthetic control panel items definitions file.
+
+    Args:
+      path (str): path of the YAML file to write.
+      number_of_definitions (int): number of control panel item definitions.
+    """
+    with open(path, "w", encoding="utf-8") as file_object:
+        file_object.write("# winshl-kb controlpanel item definitions (synthetic).\n")
+        for index in range(number_of_definitions):
+            windows_versions = ", ".join(
+                f'"{windows_version:s}"'
+                for windows_version in WINDOWS_VERSIONS[: (index % 4) + 1]
+            )
+            file_object.write(
+                "".join(
+                    [
+                        "---\n",
+                        f'name: "Synthetic.ControlPanelItem{index:d}"\n',
+                        f"identifier: {GetClassIdentifier(index):s}\n",
+                        f"windows_versions: [{windows_versions:s}]\n",
+                        (
+                            f'module_name: "@%SystemRoot%\\\\System32\\\\'
+                            f'synthetic{index:d}.dll,-1"\n'
+                        ),
+                    ]
+                )
+            )
+
+
+def WriteKnownFoldersDefinitionsFile(path, number_of_definitions):
+    """Writes a synthetic known folders definitions file.
+
+    Args:
+      path (str): path of the YAML file to write.
+      number_of_definitions (int): number of known folder definitions.
+    """
+    with open(path, "w", encoding="utf-8") as file_object:
+        file_object.write("# winshl-kb knownfolder definitions (synthetic).\n")
+        for index in range(number_of_definitions):
+            lines = [
+                "---\n",
+                f"name: FOLDERID_Synthetic{index:d}\n",
+                f"identifier: {GetClassIdentifier(index):s}\n",
+                f'display_name: "Synthetic folder {index:d}"\n',
+                (
+                    f'default_path: "%USERPROFILE%\\\\Synthetic\\\\'
+                    f'Folder{index:d}"\n'
+                ),
+            ]
+            # Only a quarter of the known folders have a legacy CSIDL equivalent.
+            if index % 4 == 0:
+                lines.extend(
+                    [
+                        f"csidl: [CSIDL_SYNTHETIC_{index:d}]\n",
+                        f'legacy_display_name: "Synthetic folder {index:d}"\n',
+                        (
+                            f'legacy_default_path: "%USERPROFILE%\\\\Synthetic '
+                            f'Folder {index:d}"\n'
+                        ),
+                    ]
+                )
+
+            file_object.write("".join(lines))
+
+
+def WriteShellFoldersDefinitionsFile(path, number_of_definitions):
+    """Writes a synthetic shell folders definitions file.
+
+    Args:
+      path (str): path of the YAML file to write.
+      number_of_definitions (int): number of shell folder definitions.
+    """
+    with open(path, "w", encoding="utf-8") as file_object:
+        file_object.write("# winshl-kb shellfolder definitions (synthetic).\n")
+        for index in range(number_of_definitions):
+            windows_versions = ", ".join(
+                f'"{windows_version:s}"'
+                for windows_version in WINDOWS_VERSIONS[: (index % 4) + 1]
+            )
+            file_object.write(
+                "".join(
+                    [
+                        "---\n",
+                        f"identifier: {GetClassIdentifier(index):s}\n",
+                        f'name: "Shell folder {index:d}"\n',
+                        f"windows_versions: [{windows_versions:s}]\n",
+                    ]
+                )
+            )
+
+
+def WriteDefinitionsFiles(path, number_of_definitions):
+    """Writes a directory of synthetic definitions files.
+
+    The files are named after the definitions files in winshlrc/data so that
+    the directory can be used as data directory of the scripts.
+
+    Args:
+      path (str): path of the directory to write the YAML files to.
+      number_of_definitions (int): number of definitions per file.
+    """
+    for filename in (
+        "defined_controlpanel_items.yaml",
+        "observed_controlpanel_items.yaml",
+    ):
+        WriteControlPanelItemsDefinitionsFile(
+            os.path.join(path, filename), number_of_definitions
+        )
+
+    for filename in ("defined_knownfolders.yaml", "observed_knownfolders.yaml"):
+        WriteKnownFoldersDefinitionsFile(
+            os.path.join(path, filename), number_of_definitions
+        )
+
+    WriteShellFoldersDefinitionsFile(
+        os.path.join(path, "observed_shellfolders.yaml"), number_of_definitions
+    )
+
+
+def GetVolumeShadowSnapshotsVolumeData(number_of_snapshots):
+    """Retrieves the data of a synthetic volume with Volume Shadow Snapshots.
+
+    The volume consists of the NTFS volume headers, without a file system, and
+    the Volume Shadow Snapshot (VSS) volume header, catalog and stores. The
+    stores contain no changed blocks, hence the snapshots contain the data of
+    the current volume.
+
+    Args:
+      number_of_snapshots (int): number of snapshots (stores).
+
+    Returns:
+      bytes: volume data.
+    """
+    vss_identifier = uuid.UUID("3808876b-c176-4e48-b7ae-04046e6cc752").bytes_le
+    block_size = 16384
+
+    def _GetBlockHeader(record_type, offset, information_size=0):
+        """Retrieves a VSS catalog or store block header.
+
+        Args:
+          record_type (int): record type, such as 2 for a catalog block.
+          offset (int): offset of the block relative to the start of the volume.
+          information_size (Optional[int]): size of the store information, which
+              follows the header of a store header block.
+
+        Returns:
+          bytes: block header data, of 128 bytes.
+        """
+        block_header_data = struct.pack(
+            "<16sIIQQQQ", vss_identifier, 1, record_type, 0, offset, 0, information_size
+        )
+        return block_header_data.ljust(128, b"\x00")
+
+    # The first 256 KiB contain the NTFS volume header and the VSS volume header,
+    # which are followed by the catalog block and for every store the header,
+    # block list, block range list and bitmap blocks.
+    catalog_offset = 16 * block_size
+    volume_size = catalog_offset + ((1 + (4 * number_of_snapshots)) * block_size)
+
+    # The backup NTFS volume header is stored in the last sector.
+    volume_data = bytearray(volume_size + 512)
+    number_of_sectors = len(volume_data) // 512
+
+    struct.pack_into("<3s8sHB", volume_data, 0, b"\xeb\x52\x90", b"NTFS    ", 512, 8)
+    volume_data[21] = 0xF8
+    struct.pack_into(
+        "<QQQbxxxbxxxQ",
+        volume_data,
+        40,
+        number_of_sectors - 1,
+        4,
+        number_of_sectors // 16,
+        -10,
+        1,
+        0x12345678,
+    )
+    volume_data[510:512] = b"\x55\xaa"
+    volume_data[-512:] = volume_data[:512]
+
+    volume_identifier = uuid.UUID(int=1).bytes_le
+    struct.pack_into(
+        "<16sIIQQQQQ16s16s",
+        volume_data,
+        0x1E00,
+        vss_identifier,
+        1,
+        1,
+        0x1E00,
+        0,
+        0,
+        catalog_offset,
+        0,
+        volume_identifier,
+        volume_identifier,
+    )
+
+    volume_data[catalog_offset : catalog_offset + 128] = _GetBlockHeader(
+        2, catalog_offset
+    )
+
+    for store_index in range(number_of_snapshots):
+        store_identifier = uuid.UUID(int=0x100 + store_index).bytes_le
+        store_header_offset = catalog_offset + ((1 + (4 * store_index)) * block_size)
+        store_block_list_offset = store_header_offset + block_size
+        store_block_range_list_offset = store_block_list_offset + block_size
+        store_bitmap_offset = store_block_range_list_offset + block_size
+
+        # The snapshots are created a day apart, starting 2020-01-01 00:00:00.
+        creation_time = 132223104000000000 + (store_index * 864000000000)
+
+        catalog_entry_offset = catalog_offset + 128 + (store_index * 256)
+        struct.pack_into(
+            "<QQ16sQQQ",
+            volume_data,
+            catalog_entry_offset,
+            2,
+            volume_size,
+            store_identifier,
+            store_index + 1,
+            0x40,
+            creation_time,
+        )
+        struct.pack_into(
+            "<QQ16sQQQQQ",
+            volume_data,
+            catalog_entry_offset + 128,
+            3,
+            store_block_list_offset,
+            store_identifier,
+            store_header_offset,
+            store_block_range_list_offset,
+            store_bitmap_offset,
+            0,
+            4 * block_size,
+        )
+
+        machine_name_data = "SYNTHETIC".encode("utf-16-le")
+        machine_name_data = (
+            struct.pack("<H", len(machine_name_data)) + machine_name_data
+        )
+        store_information_data = b"".join(
+            [
+                struct.pack(
+                    "<16s16s16sIIII",
+                    uuid.UUID(int=0x200 + store_index).bytes_le,
+                    uuid.UUID(int=0x300 + store_index).bytes_le,
+                    uuid.UUID(int=0x400).bytes_le,
+                    0,
+                    1,
+                    0x0042000D,
+                    0,
+                ),
+                machine_name_data,
+                machine_name_data,
+            ]
+        )
+        volume_data[store_header_offset : store_header_offset + 128] = _GetBlockHeader(
+            4, store_header_offset, len(store_information_data)
+        )
+        offset = store_header_offset + 128
+        volume_data[offset : offset + len(store_information_data)] = (
+            store_information_data
+        )
+
+        for record_type, offset in (
+            (3, store_block_list_offset),
+            (5, store_block_range_list_offset),
+            (6, store_bitmap_offset),
+        ):
+            volume_data[offset : offset + 128] = _GetBlockHeader(record_type, offset)
+
+    return bytes(volume_data)
+
+
+def _AddBagMRUKey(writer, name, shell_items):
+    """Adds a BagMRU key and its sub keys.
+
+    Args:
+      writer (REGFFileWriter): Windows Registry file writer.
+      name (str): name of the key.
+      shell_items (list[tuple[bytes, list[object]]]): shell item data and child
+          shell items of the shell items in the key.
+
+    Returns:
+      int: offset of the key cell.
+    """
+    subkeys = []
+    value_offsets = []
+    for index, (shell_item_data, child_shell_items) in enumerate(shell_items):
+        # The shell item is stored as a shell item list with a single item.
+        value_offsets.append(
+            writer.AddValue(f"{index:d}", shell_item_data + b"\x00\x00", REG_BINARY)
+        )
+        if child_shell_items:
+            subkeys.append(
+                (
+                    f"{index:d}",
+                    _AddBagMRUKey(writer, f"{index:d}", child_shell_items),
+                )
+            )
+
+    mru_list_data = b"".join(
+        struct.pack("<I", index) for index in range(len(shell_items))
+    )
+    value_offsets.append(
+        writer.AddValue("MRUListEx", mru_list_data + b"\xff\xff\xff\xff", REG_BINARY)
+    )
+
+    return writer.AddKey(
+        name,
+        subkey_offsets=[key_offset for _, key_offset in sorted(subkeys)],
+        value_offsets=value_offsets,
+    )
+
+
+def WriteUserRegistryFile(path, bag_mru_key_path, shell_items):
+    """Writes a synthetic user Windows Registry file with shellbags.
+
+    Args:
+      path (str): path of the file to write.
+      bag_mru_key_path (str): path of the BagMRU key relative to the root key,
+          such as "Software\\Microsoft\\Windows\\Shell\\BagMRU" for
+          NTUSER.DAT.
+      shell_items (list[tuple[bytes, list[object]]]): shell item data and child
+          shell items, in the same format, of the shell items in the BagMRU key.
+    """
+    writer = REGFFileWriter()
+
+    key_names = bag_mru_key_path.split("\\")
+
+    key_offset = _AddBagMRUKey(writer, key_names.pop(), shell_items)
+    while key_names:
+        key_offset = writer.AddKey(key_names.pop(), subkey_offsets=[key_offset])
+
+    root_key_offset = writer.AddKey("ROOT", subkey_offsets=[key_offset], is_root=True)
+    writer.Write(path, root_key_offset)
+
+
+def WriteSoftwareRegistryFile(
+    path, number_of_class_identifiers, names=None, current_build_number="17763"
+):
+    """Writes a synthetic SOFTWARE Windows Registry file.
+
+    The Windows Registry file contains the class identifiers in
+    "Classes\\CLSID", where every other class identifier has a "ShellFolder"
+    sub key, and the Windows version in "Microsoft\\Windows NT\\CurrentVersion".
+    It also contains the "Microsoft\\Windows\\CurrentVersion\\App Paths" key,
+    which identifies a SOFTWARE Windows Registry file of a Windows volume.
+
+    Args:
+      path (str): path of the file to write.
+      number_of_class_identifiers (int): number of class identifier keys.
+      names (Optional[list[str]]): names of the class identifiers, which are
+          used in turn and where None represents a class identifier without
+          a name. If not set, the name is "Shell folder" followed by the index
+          of the class identifier.
+      current_build_number (Optional[str]): current build number of Windows,
+          such as "17763" for Windows 10 (1809).
+
+    Returns:
+      dict[str, str]: names per identifier of the class identifiers that have
+          a "ShellFolder" sub key.
+    """
+    writer = REGFFileWriter()
+
+    shell_folders = {}
+    class_identifier_keys = []
+    for index in range(number_of_class_identifiers):
+        identifier = GetClassIdentifier(index)
+
+        if names:
+            name = names[index % len(names)]
+        else:
+            name = f"Shell folder {index:d}"
+
+        value_offsets = []
+        if name:
+            value_offsets.append(writer.AddStringValue("", name))
+
+        subkey_offsets = []
+        if index % 2 == 0:
+            subkey_offsets.append(writer.AddKey("ShellFolder"))
+            shell_folders[identifier] = name
+
+        key_name = f"{{{identifier:s}}}"
+        key_offset = writer.AddKey(
+            key_name, subkey_offsets=subkey_offsets, value_offsets=value_offsets
+        )
+        class_identifier_keys.append((key_name.upper(), key_offset))
+
+    class_identifiers_key_offset = writer.AddKey(
+        "CLSID",
+        subkey_offsets=[key_offset for _, key_offset in sorted(class_identifier_keys)],
+    )
+    classes_key_offset = writer.AddKey(
+        "Classes", subkey_offsets=[class_identifiers_key_offset]
+    )
+
+    current_version_key_offset = writer.AddKey(
+        "CurrentVersion",
+        value_offsets=[
+            writer.AddStringValue("CurrentBuildNumber", current_build_number),
+            writer.AddStringValue("ProductName", "Windows 10 Pro"),
+        ],
+    )
+    windows_nt_key_offset = writer.AddKey(
+        "Windows NT", subkey_offsets=[current_version_key_offset]
+    )
+
+    app_paths_key_offset = writer.AddKey("App Paths")
+    current_version_key_offset = writer.AddKey(
+        "CurrentVersion", subkey_offsets=[app_paths_key_offset]
+    )
+    windows_key_offset = writer.AddKey(
+        "Windows", subkey_offsets=[current_version_key_offset]
+    )
+
+    microsoft_key_offset = writer.AddKey(
+        "Microsoft", subkey_offsets=[windows_key_offset, windows_nt_key_offset]
+    )
+
+    root_key_offset = writer.AddKey(
+        "ROOT", subkey_offsets=[classes_key_offset, microsoft_key_offset], is_root=True
+    )
+    writer.Write(path, root_key_offset)
+
+    return shell_folders
+
+
+def WriteDiskImage(path, volumes_data):
+    """Writes a synthetic disk image with a Master Boot Record (MBR).
+
+    Args:
+      path (str): path of the file to write.
+      volumes_data (list[bytes]): data of the volumes, such as FAT file systems,
+          that are stored in consecutive primary partitions.
+
+    Raises:
+      ValueError: if there are more than 4 volumes.
+    """
+    if len(volumes_data) > 4:
+        raise ValueError("Unsupported number of volumes.")
+
+    master_boot_record = bytearray(512)
+
+    # The partitions are aligned on 64 KiB.
+    alignment = 128
+
+    partitions_data = []
+    first_sector = alignment
+    for index, volume_data in enumerate(volumes_data):
+        number_of_sectors = (len(volume_data) + 511) // 512
+        struct.pack_into(
+            "<B3sB3sII",
+            master_boot_record,
+            446 + (index * 16),
+            0,
+            b"\xfe\xff\xff",
+            0x0E,
+            b"\xfe\xff\xff",
+            first_sector,
+            number_of_sectors,
+        )
+        partitions_data.append((first_sector, volume_data))
+
+        first_sector += (number_of_sectors + alignment - 1) & ~(alignment - 1)
+
+    master_boot_record[510:512] = b"\x55\xaa"
+
+    with open(path, "wb") as file_object:
+        file_object.write(master_boot_record)
+
+        for partition_first_sector, volume_data in partitions_data:
+            file_object.seek(partition_first_sector * 512)
+            file_object.write(volume_data)
+
+        file_object.truncate(first_sector * 512)
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Tests for the Windows versions."""
+
+import unittest
+
+from winshlrc import versions
+
+from tests import test_lib
+
+
+class WindowsVersionsTest(test_lib.BaseTestCase):
+    """Tests for the Windows versions."""
+
+    def testGetVersionByBuildNumber(self):
+        """Tests the GetVersionByBuildNumber function."""
+        windows_version = versions.WindowsVersions.GetVersionByBuildNumber(17763)
+        self.assertEqual(windows_version, "Windows 10 (1809)")
+
+        windows_version = versions.WindowsVersions.GetVersionByBuildNumber(
+            17763, product_name="Windows Server 2019 Standard"
+        )
+        self.assertEqual(windows_version, "Windows 2019")
+
+        windows_version = versions.WindowsVersions.GetVersionByBuildNumber(
+            3790, product_name="Microsoft Windows Server 2003 R2"
+        )
+        self.assertEqual(windows_version, "Windows 2003 R2")
+
+        windows_version = versions.WindowsVersions.GetVersionByBuildNumber(
+            22000, product_name="Windows 10 Pro", release="21H2"
+        )
+        self.assertEqual(windows_version, "Windows 11 (21H2)")
+
+        windows_version = versions.WindowsVersions.GetVersionByBuildNumber(
+            19999, release="25H1"
+        )
+        self.assertEqual(windows_version, "Windows 10 (25H1)")
+
+        windows_version = versions.WindowsVersions.GetVersionByBuildNumber(99999)
+        self.assertIsNone(windows_version)
+
+    def testGetVersionByFileVersion(self):
+        """Tests the GetVersionByFileVersion function."""
+        windows_version = versions.WindowsVersions.GetVersionByFileVersion(
+            "10.0.17763.1"
+        )
+        self.assertEqual(windows_version, "Windows 10 (1809)")
+
+        windows_version = versions.WindowsVersions.GetVersionByFileVersion(
+            "6.1.7601.17514", product_name="Windows Server 2008 R2 Enterprise"
+        )
+        self.assertEqual(windows_version, "Windows 2008 R2")
+
+        windows_version = versions.WindowsVersions.GetVersionByFileVersion("4.10.2222")
+        self.assertEqual(windows_version, "Windows 98")
+
+        windows_version = versions.WindowsVersions.GetVersionByFileVersion("4.0.1381.1")
+        self.assertEqual(windows_version, "Windows NT4")
+
+        windows_version = versions.WindowsVersions.GetVersionByFileVersion("bogus")
+        self.assertIsNone(windows_version)
+
+        windows_version = versions.WindowsVersions.GetVersionByFileVersion("10.0")
+        self.assertIsNone(windows_version)
+
+    def testKeyFunction(self):
+        """Tests the KeyFunction function."""
+        sort_key = versions.WindowsVersions.KeyFunction("Windows 7")
+        self.assertEqual(sort_key, (2009, "Windows 7"))
+
+        sort_key = versions.WindowsVersions.KeyFunction("Windows 10 (1809)")
+        self.assertEqual(sort_key, (9999, "Windows 10 (1809)"))
+
+
+if __name__ == "__main__":
+    unittest.main()
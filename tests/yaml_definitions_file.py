@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 """Tests for the YAML-based Windows shell definitions files."""
 
+import os
 import unittest
 
 from winshlrc import yaml_definitions_file
 
+from tests import synthetic_lib
 from tests import test_lib
 
 
@@ -94,7 +96,11 @@ class YAMLKnownFoldersDefinitionsFileTest(test_lib.BaseTestCase):
     # pylint: disable=protected-access
 
     _TEST_YAML = {
+        "csidl": ["CSIDL_PROFILES"],
+        "default_path": "%SystemDrive%\\Users",
         "identifier": "0762d272-c50a-4bb0-a382-697dcd729b80",
+        "legacy_default_path": "%SystemDrive%\\Documents and Settings",
+        "legacy_display_name": "Profiles",
         "name": "UserProfiles",
         "windows_versions": ["Windows XP 32-bit", "Windows 10 (1511)"],
     }
@@ -106,7 +112,13 @@ class YAMLKnownFoldersDefinitionsFileTest(test_lib.BaseTestCase):
         definitions = test_definitions_file._ReadKnownFolderDefinition(self._TEST_YAML)
 
         self.assertIsNotNone(definitions)
+        self.assertEqual(definitions.csidl, ["CSIDL_PROFILES"])
+        self.assertEqual(definitions.default_path, "%SystemDrive%\\Users")
         self.assertEqual(definitions.identifier, "0762d272-c50a-4bb0-a382-697dcd729b80")
+        self.assertEqual(
+            definitions.legacy_default_path, "%SystemDrive%\\Documents and Settings"
+        )
+        self.assertEqual(definitions.legacy_display_name, "Profiles")
         self.assertEqual(definitions.name, "UserProfiles")
         self.assertEqual(
             definitions.windows_versions, ["Windows XP 32-bit", "Windows 10 (1511)"]
@@ -156,6 +168,24 @@ class YAMLKnownFoldersDefinitionsFileTest(test_lib.BaseTestCase):
             definitions[1].identifier, "2f8b40c2-83ed-48ee-b383-a1f157ec6f9a"
         )
 
+    def testReadFromFileSynthetic(self):
+        """Tests the ReadFromFile function with a synthetic definitions file."""
+        test_definitions_file = yaml_definitions_file.YAMLKnownFoldersDefinitionsFile()
+
+        with test_lib.TempDirectory() as temporary_directory:
+            test_file_path = os.path.join(temporary_directory, "knownfolders.yaml")
+            synthetic_lib.WriteKnownFoldersDefinitionsFile(test_file_path, 100)
+
+            definitions = list(test_definitions_file.ReadFromFile(test_file_path))
+
+        self.assertEqual(len(definitions), 100)
+
+        self.assertEqual(definitions[0].identifier, synthetic_lib.GetClassIdentifier(0))
+        self.assertEqual(definitions[0].name, "FOLDERID_Synthetic0")
+        self.assertEqual(
+            definitions[99].default_path, "%USERPROFILE%\\Synthetic\\Folder99"
+        )
+
 
 class YAMLShellFoldersDefinitionsFileTest(test_lib.BaseTestCase):
     """Tests for the YAML-based shell folder definitions file."""
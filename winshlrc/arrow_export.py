@@ -0,0 +1,301 @@
+"""Export of definitions and extraction results to Apache Arrow and Parquet."""
+
+import itertools
+import uuid
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+from winshlrc import knowledge_base as knowledge_base_module
+
+
+class ArrowExporter:
+    """Exporter of definitions and extraction results to Apache Arrow and Parquet.
+
+    Identifiers are stored as 16-byte little endian GUIDs, in the same format as
+    the identifiers passed to WindowsShellKnowledgeBase.ResolveIdentifiers(),
+    and strings that repeat often, such as names and Windows versions, are
+    dictionary encoded.
+
+    Parquet files are written one row group at a time, hence the rows of
+    a row group are the only rows that are kept in memory.
+    """
+
+    DEFINITIONS_COLUMNS = [
+        "identifier",
+        "resource_type",
+        "name",
+        "class_name",
+        "display_name",
+        "module_name",
+        "alternate_names",
+        "windows_versions",
+    ]
+
+    OBSERVATIONS_COLUMNS = [
+        "source",
+        "volume_identifier",
+        "windows_version",
+        "identifier",
+        "class_name",
+        "name",
+        "localized_string",
+    ]
+
+    def __init__(self, row_group_size=65536):
+        """Initializes an exporter to Apache Arrow and Parquet.
+
+        Args:
+          row_group_size (Optional[int]): maximum number of rows per Parquet row
+              group.
+
+        Raises:
+          RuntimeError: if pyarrow is not available.
+        """
+        if not pyarrow:
+            raise RuntimeError("Missing pyarrow.")
+
+        super().__init__()
+        self._row_group_size = row_group_size
+
+        identifier_type = pyarrow.binary(16)
+        string_type = pyarrow.dictionary(pyarrow.int32(), pyarrow.string())
+        string_list_type = pyarrow.list_(string_type)
+
+        self._definitions_schema = pyarrow.schema(
+            [
+                ("identifier", identifier_type),
+                ("resource_type", string_type),
+                ("name", string_type),
+                ("class_name", string_type),
+                ("display_name", string_type),
+                ("module_name", string_type),
+                ("alternate_names", string_list_type),
+                ("windows_versions", string_list_type),
+            ]
+        )
+        self._observations_schema = pyarrow.schema(
+            [
+                ("source", string_type),
+                ("volume_identifier", string_type),
+                ("windows_version", string_type),
+                ("identifier", identifier_type),
+                ("class_name", string_type),
+                ("name", string_type),
+                ("localized_string", string_type),
+            ]
+        )
+
+    def _GetDefinitionRows(self, knowledge_base):
+        """Retrieves the rows of the definitions of a knowledge base.
+
+        Args:
+          knowledge_base (WindowsShellKnowledgeBase): knowledge base.
+
+        Yields:
+          tuple[bytes, str, str, str, str, str, list[str], list[str]]: values of
+              the columns in DEFINITIONS_COLUMNS.
+        """
+        resource_type_names = knowledge_base_module.RESOURCE_TYPE_NAMES
+
+        resource_type = resource_type_names[
+            knowledge_base_module.RESOURCE_TYPE_CONTROL_PANEL_ITEM
+        ]
+        for definition in knowledge_base.GetControlPanelItemDefinitions():
+            yield (
+                self._GetIdentifier(definition.identifier),
+                resource_type,
+                definition.name,
+                None,
+                None,
+                definition.module_name,
+                list(definition.alternate_module_names or []),
+                list(definition.windows_versions or []),
+            )
+
+        resource_type = resource_type_names[
+            knowledge_base_module.RESOURCE_TYPE_KNOWN_FOLDER
+        ]
+        for definition in knowledge_base.GetKnownFolderDefinitions():
+            yield (
+                self._GetIdentifier(definition.identifier),
+                resource_type,
+                definition.name,
+                None,
+                definition.display_name,
+                None,
+                list(definition.alternate_display_names or []),
+                list(definition.windows_versions or []),
+            )
+
+        resource_type = resource_type_names[
+            knowledge_base_module.RESOURCE_TYPE_SHELL_FOLDER
+        ]
+        for definition in knowledge_base.GetShellFolderDefinitions():
+            yield (
+                self._GetIdentifier(definition.identifier),
+                resource_type,
+                definition.name,
+                definition.class_name,
+                None,
+                None,
+                list(definition.alternate_names or []),
+                list(definition.windows_versions or []),
+            )
+
+    def _GetIdentifier(self, identifier):
+        """Retrieves the binary representation of an identifier.
+
+        Args:
+          identifier (str): identifier (GUID), such as
+              "20d04fe0-3aea-1069-a2d8-08002b30309d".
+
+        Returns:
+          bytes: 16-byte little endian GUID or None if the identifier is not
+              a GUID.
+        """
+        try:
+            return uuid.UUID(identifier).bytes_le
+        except (AttributeError, TypeError, ValueError):
+            return None
+
+    def _GetObservationRows(self, observations):
+        """Retrieves the rows of observations.
+
+        Args:
+          observations (iterable[tuple[str, str, str, str, str, str, str]]):
+              values of the columns in OBSERVATIONS_COLUMNS, such as returned by
+              ExtractionResultStore.GetShellFolders(), where the identifier is
+              a string.
+
+        Yields:
+          tuple[str, str, str, bytes, str, str, str]: values of the columns in
+              OBSERVATIONS_COLUMNS, where the identifier is a 16-byte little
+              endian GUID.
+        """
+        for (
+            source,
+            volume_identifier,
+            windows_version,
+            identifier,
+            class_name,
+            name,
+            localized_string,
+        ) in observations:
+            yield (
+                source,
+                volume_identifier,
+                windows_version,
+                self._GetIdentifier(identifier),
+                class_name,
+                name,
+                localized_string,
+            )
+
+    def _GetRecordBatches(self, schema, rows):
+        """Retrieves record batches of rows.
+
+        Args:
+          schema (pyarrow.Schema): schema of the rows.
+          rows (iterable[tuple[object]]): rows.
+
+        Yields:
+          pyarrow.RecordBatch: record batch of at most the row group size rows.
+        """
+        rows = iter(rows)
+        while True:
+            batch_rows = list(itertools.islice(rows, self._row_group_size))
+            if not batch_rows:
+                break
+
+            columns = [
+                pyarrow.array(values, type=field.type)
+                for values, field in zip(zip(*batch_rows), schema)
+            ]
+            yield pyarrow.RecordBatch.from_arrays(columns, schema=schema)
+
+    def _WriteParquetFile(self, schema, rows, path):
+        """Writes rows to a Parquet file.
+
+        Args:
+          schema (pyarrow.Schema): schema of the rows.
+          rows (iterable[tuple[object]]): rows.
+          path (str): path of the Parquet file.
+
+        Returns:
+          int: number of rows written.
+        """
+        number_of_rows = 0
+        with pyarrow.parquet.ParquetWriter(path, schema) as parquet_writer:
+            for record_batch in self._GetRecordBatches(schema, rows):
+                parquet_writer.write_batch(record_batch)
+                number_of_rows += record_batch.num_rows
+
+        return number_of_rows
+
+    def GetDefinitionsTable(self, knowledge_base):
+        """Retrieves the definitions of a knowledge base as an Arrow table.
+
+        Args:
+          knowledge_base (WindowsShellKnowledgeBase): knowledge base.
+
+        Returns:
+          pyarrow.Table: definitions, with the columns in DEFINITIONS_COLUMNS.
+        """
+        return pyarrow.Table.from_batches(
+            self._GetRecordBatches(
+                self._definitions_schema, self._GetDefinitionRows(knowledge_base)
+            ),
+            schema=self._definitions_schema,
+        )
+
+    def GetObservationsTable(self, observations):
+        """Retrieves observations as an Arrow table.
+
+        Args:
+          observations (iterable[tuple[str, str, str, str, str, str, str]]):
+              values of the columns in OBSERVATIONS_COLUMNS, such as returned by
+              ExtractionResultStore.GetShellFolders().
+
+        Returns:
+          pyarrow.Table: observations, with the columns in OBSERVATIONS_COLUMNS.
+        """
+        return pyarrow.Table.from_batches(
+            self._GetRecordBatches(
+                self._observations_schema, self._GetObservationRows(observations)
+            ),
+            schema=self._observations_schema,
+        )
+
+    def WriteDefinitions(self, knowledge_base, path):
+        """Writes the definitions of a knowledge base to a Parquet file.
+
+        Args:
+          knowledge_base (WindowsShellKnowledgeBase): knowledge base.
+          path (str): path of the Parquet file.
+
+        Returns:
+          int: number of definitions written.
+        """
+        return self._WriteParquetFile(
+            self._definitions_schema, self._GetDefinitionRows(knowledge_base), path
+        )
+
+    def WriteObservations(self, observations, path):
+        """Writes observations to a Parquet file.
+
+        Args:
+          observations (iterable[tuple[str, str, str, str, str, str, str]]):
+              values of the columns in OBSERVATIONS_COLUMNS, such as returned by
+              ExtractionResultStore.GetShellFolders().
+          path (str): path of the Parquet file.
+
+        Returns:
+          int: number of observations written.
+        """
+        return self._WriteParquetFile(
+            self._observations_schema, self._GetObservationRows(observations), path
+        )
@@ -0,0 +1,188 @@
+"""Checkpoint journal of extraction runs."""
+
+import json
+import logging
+import os
+
+from winshlrc import extractor
+
+
+class CheckpointJournal:
+    """Checkpoint journal of extraction runs.
+
+    The journal contains the results of every source, such as a storage media
+    image, whose extraction completed, so that an interrupted run can be
+    resumed without extracting these sources again. Every source is appended
+    to the journal as a single JSON line, which is flushed to storage before
+    the next source is extracted. A line that was only partially written, when
+    the run was interrupted, is ignored when the journal is read.
+    """
+
+    _FORMAT_VERSION = 1
+
+    # Values of a source definition that identify a source.
+    _SOURCE_KEYS = ("registry_files", "resources", "source", "windows_version")
+
+    def __init__(self, path):
+        """Initializes a checkpoint journal.
+
+        Args:
+          path (str): path of the journal file.
+        """
+        super().__init__()
+        self._completed_sources = {}
+        self._file_object = None
+        self._path = path
+
+    @property
+    def number_of_completed_sources(self):
+        """int: number of sources whose extraction completed in a previous run."""
+        return len(self._completed_sources)
+
+    def _GetSourceKey(self, source_definition):
+        """Retrieves the key that identifies a source.
+
+        Args:
+          source_definition (dict[str, object]): source definition.
+
+        Returns:
+          str: key that identifies the source.
+        """
+        return json.dumps(
+            {key: source_definition.get(key) for key in self._SOURCE_KEYS},
+            sort_keys=True,
+        )
+
+    def _ReadCompletedSources(self):
+        """Reads the results of the sources whose extraction completed.
+
+        Returns:
+          dict[str, list[tuple[str, str, list[ShellFolder]]]]: volume identifier,
+              detected Windows version and shell folders per Windows volume, per
+              key that identifies the source.
+        """
+        completed_sources = {}
+
+        try:
+            with open(self._path, "r", encoding="utf-8") as file_object:
+                lines = list(file_object)
+
+        except FileNotFoundError:
+            return completed_sources
+
+        except (OSError, UnicodeDecodeError) as exception:
+            logging.warning(
+                f"Unable to read checkpoint journal: {self._path:s} with error: "
+                f"{exception!s}"
+            )
+            return completed_sources
+
+        for line in lines:
+            try:
+                json_dict = json.loads(line)
+
+                if json_dict.get("format_version") != self._FORMAT_VERSION:
+                    continue
+
+                volume_results = []
+                for volume_identifier, windows_version, values in json_dict[
+                    "volume_results"
+                ]:
+                    shell_folders = [
+                        extractor.ShellFolder.CopyFromValues(shell_folder_values)
+                        for shell_folder_values in values
+                    ]
+                    volume_results.append(
+                        (volume_identifier, windows_version, shell_folders)
+                    )
+
+                completed_sources[json_dict["source"]] = volume_results
+
+            except (AttributeError, KeyError, TypeError, ValueError):
+                # A line that was only partially written is not valid JSON.
+                continue
+
+        return completed_sources
+
+    def AddCompletedSource(self, source_definition, volume_results):
+        """Adds the results of a source whose extraction completed.
+
+        Args:
+          source_definition (dict[str, object]): source definition.
+          volume_results (list[tuple[str, str, list[ShellFolder]]]): volume
+              identifier, detected Windows version and shell folders per Windows
+              volume.
+        """
+        json_dict = {
+            "format_version": self._FORMAT_VERSION,
+            "source": self._GetSourceKey(source_definition),
+            "volume_results": [
+                [
+                    volume_identifier,
+                    windows_version,
+                    [shell_folder.CopyToValues() for shell_folder in shell_folders],
+                ]
+                for volume_identifier, windows_version, shell_folders in volume_results
+            ],
+        }
+
+        self._file_object.write(json.dumps(json_dict))
+        self._file_object.write("\n")
+        self._file_object.flush()
+        os.fsync(self._file_object.fileno())
+
+    def Close(self):
+        """Closes the journal."""
+        if self._file_object:
+            self._file_object.close()
+            self._file_object = None
+
+    def GetCompletedSource(self, source_definition):
+        """Retrieves the results of a source whose extraction completed.
+
+        Only sources in the journal when it was opened to resume a run are
+        considered.
+
+        Args:
+          source_definition (dict[str, object]): source definition.
+
+        Returns:
+          list[tuple[str, str, list[ShellFolder]]]: volume identifier, detected
+              Windows version and shell folders per Windows volume or None if
+              the extraction of the source did not complete.
+        """
+        return self._completed_sources.get(self._GetSourceKey(source_definition))
+
+    def Open(self, resume=False):
+        """Opens the journal.
+
+        Args:
+          resume (Optional[bool]): True if the results in an existing journal
+              should be kept, False if the journal should be truncated.
+
+        Raises:
+          OSError: if the journal is already open or cannot be opened.
+        """
+        if self._file_object:
+            raise OSError("Already open.")
+
+        self._completed_sources = {}
+        if resume:
+            self._completed_sources = self._ReadCompletedSources()
+
+        directory_name = os.path.dirname(os.path.abspath(self._path))
+        os.makedirs(directory_name, exist_ok=True)
+
+        # pylint: disable=consider-using-with
+        self._file_object = open(self._path, "a" if resume else "w", encoding="utf-8")
+
+        # A line that was only partially written is terminated, so that it does
+        # not corrupt the line of the next source.
+        if self._file_object.tell() > 0:
+            with open(self._path, "rb") as file_object:
+                file_object.seek(-1, os.SEEK_END)
+                last_byte = file_object.read(1)
+
+            if last_byte != b"\n":
+                self._file_object.write("\n")
+                self._file_object.flush()
@@ -1,17 +1,19 @@
 """Windows shell extractor."""
 
+import contextlib
+import hashlib
 import logging
+import os
 
-import pywrc
-
-from dfimagetools import windows_registry
-
-from dfvfs.helpers import volume_scanner as dfvfs_volume_scanner
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as dfvfs_path_spec_factory
 from dfvfs.resolver import resolver as dfvfs_resolver
 
-from dfwinreg import registry as dfwinreg_registry
-
+from winshlrc import path_resolver
+from winshlrc import registry_cache
 from winshlrc import resource_file
+from winshlrc import versions
+from winshlrc import volume_scanner
 
 
 class ShellFolder:
@@ -39,8 +41,41 @@ class ShellFolder:
         self.localized_string = localized_string
         self.name = None
 
+    @classmethod
+    def CopyFromValues(cls, values):
+        """Creates a shell folder from values, such as read from a cache.
+
+        Args:
+          values (list[str]): identifier, class name, name and localized string
+              of the shell folder, as returned by CopyToValues().
+
+        Returns:
+          ShellFolder: shell folder.
+
+        Raises:
+          ValueError: if the number of values is not supported.
+        """
+        identifier, class_name, name, localized_string = values
+
+        shell_folder = cls(identifier=identifier, localized_string=localized_string)
+        shell_folder.class_name = class_name
+        shell_folder.name = name
+        return shell_folder
+
+    def CopyToValues(self):
+        """Copies the shell folder to values, such as to store in a cache.
+
+        Alternate names are not included, since they are only determined when
+        merging the shell folders of multiple volumes.
+
+        Returns:
+          list[str]: identifier, class name, name and localized string of
+              the shell folder.
+        """
+        return [self.identifier, self.class_name, self.name, self.localized_string]
 
-class WindowsShellExtractor(dfvfs_volume_scanner.WindowsVolumeScanner):
+
+class WindowsShellExtractor(volume_scanner.WindowsVolumeScanner):
     """Windows shell extractor.
 
     Attributes:
@@ -50,33 +85,127 @@ class WindowsShellExtractor(dfvfs_volume_scanner.WindowsVolumeScanner):
 
     _CLASS_IDENTIFIERS_KEY_PATH = "HKEY_LOCAL_MACHINE\\Software\\Classes\\CLSID"
 
-    def __init__(self, debug=False, mediator=None):
+    # Class identifiers key paths per key path prefix of a standalone Windows
+    # Registry file, where HKEY_LOCAL_MACHINE is the Windows 9x SYSTEM.DAT file.
+    _CLASS_IDENTIFIERS_KEY_PATH_PER_KEY_PATH_PREFIX = {
+        "HKEY_CURRENT_USER\\SOFTWARE\\CLASSES": (
+            "HKEY_CURRENT_USER\\Software\\Classes\\CLSID"
+        ),
+        "HKEY_LOCAL_MACHINE": _CLASS_IDENTIFIERS_KEY_PATH,
+        "HKEY_LOCAL_MACHINE\\SOFTWARE": _CLASS_IDENTIFIERS_KEY_PATH,
+    }
+
+    # Key path prefixes per lower case name of a standalone Windows Registry file,
+    # used when the key path prefix cannot be determined from the content of
+    # the file.
+    _KEY_PATH_PREFIX_PER_FILENAME = {
+        "software": "HKEY_LOCAL_MACHINE\\Software",
+        "usrclass.dat": "HKEY_CURRENT_USER\\Software\\Classes",
+    }
+
+    _CURRENT_VERSION_KEY_PATH = (
+        "HKEY_LOCAL_MACHINE\\Software\\Microsoft\\Windows NT\\CurrentVersion"
+    )
+
+    _WINDOWS_9X_CURRENT_VERSION_KEY_PATH = (
+        "HKEY_LOCAL_MACHINE\\Software\\Microsoft\\Windows\\CurrentVersion"
+    )
+
+    # Size of the data at the start of a file that is used for its fingerprint.
+    _FINGERPRINT_DATA_SIZE = 4096
+
+    # Size of the data that is read at once to hash a Windows Registry file.
+    _REGISTRY_FILE_HASH_READ_SIZE = 1024 * 1024
+
+    _SNAPSHOT_TYPE_INDICATORS = frozenset([dfvfs_definitions.TYPE_INDICATOR_VSHADOW])
+
+    _SOFTWARE_HIVE_PATH = "%SystemRoot%\\System32\\config\\SOFTWARE"
+
+    def __init__(
+        self,
+        debug=False,
+        mediator=None,
+        registry_file_cache=None,
+        scan_result_cache=None,
+        shell_folder_cache=None,
+        statistics=None,
+    ):
         """Initializes a Windows shell extractor.
 
         Args:
           debug (Optional[bool]): True if debug information should be printed.
           mediator (dfvfs.VolumeScannerMediator): a volume scanner mediator or None.
+          registry_file_cache (Optional[WindowsRegistryFileCache]): cache of
+              Windows Registry files or None to use the default cache, which is
+              shared with the Windows Registry volume scanner.
+          scan_result_cache (Optional[ScanResultCache]): cache of volume scan results
+              or None if scan results should not be cached.
+          shell_folder_cache (Optional[ShellFolderResultCache]): persistent cache
+              of extracted shell folders or None if shell folders should not be
+              cached between runs.
+          statistics (Optional[ExtractionStatistics]): extraction statistics to
+              update or None if statistics should not be collected.
         """
-        super().__init__(mediator=mediator)
+        super().__init__(mediator=mediator, scan_result_cache=scan_result_cache)
+        self._class_identifiers_key_paths = None
         self._debug = debug
+        self._directory_entry_names_cache = {}
         self._format_scanner = None
+        self._mui_language_cache = {}
+        self._mui_languages_per_fingerprint = {}
+        self._mui_windows_path_cache = {}
         self._registry = None
+        self._registry_file_cache = (
+            registry_file_cache or registry_cache.DEFAULT_REGISTRY_FILE_CACHE
+        )
+        self._shell_folder_cache = shell_folder_cache
+        self._shell_folder_values_per_fingerprint = {}
+        self._statistics = statistics
+        self._string_resource_files = {}
+        self._string_resource_fingerprints = {}
+        self._strings_per_fingerprint = {}
         self._windows_version = None
+        self._windows_version_determined = False
+        self._windows_versions_per_volume = {}
 
         self.ascii_codepage = "cp1252"
         self.preferred_language_identifier = 0x0409
 
+    @property
+    def statistics(self):
+        """ExtractionStatistics: extraction statistics or None if not collected."""
+        return self._statistics
+
     @property
     def windows_version(self):
         """The Windows version (getter)."""
-        if self._windows_version is None:
-            self._windows_version = self._GetWindowsVersion()
+        if not self._windows_version_determined:
+            with self._Stage("windows_version_detection"):
+                self._windows_version = self._GetWindowsVersion()
+
+            self._windows_version_determined = True
+
         return self._windows_version
 
     @windows_version.setter
     def windows_version(self, value):
         """The Windows version (setter)."""
         self._windows_version = value
+        self._windows_version_determined = True
+
+    def _CloseRegistry(self):
+        """Closes the Windows Registry of the Windows volume."""
+        if self._registry:
+            self._registry.Close()
+            self._registry = None
+
+    def _CloseStringResourceFiles(self):
+        """Closes the cached string resource files."""
+        for windows_resource_file in self._string_resource_files.values():
+            if windows_resource_file:
+                windows_resource_file.Close()
+
+        self._string_resource_files = {}
 
     def _CollectShellFoldersFromKey(self, class_identifiers_key):
         """Retrieves shell folders from a Windows Registry key.
@@ -88,58 +217,155 @@ class WindowsShellExtractor(dfvfs_volume_scanner.WindowsVolumeScanner):
         Yields:
           ShellFolder: shell folder.
         """
-        for class_identifier_key in class_identifiers_key.GetSubkeys():
-            shell_folder_identifier = class_identifier_key.name.lower()
-            if shell_folder_identifier[0] == "{" and shell_folder_identifier[-1] == "}":
-                shell_folder_identifier = shell_folder_identifier[1:-1]
+        for shell_folder_values in self._GetShellFolderValues(class_identifiers_key):
+            yield self._GetShellFolder(*shell_folder_values)
 
-            shell_folder_key = class_identifier_key.GetSubkeyByName("ShellFolder")
-            if shell_folder_key:
-                name = self._GetShellFolderName(class_identifier_key)
+    def _GetDirectoryEntryNames(self, windows_path):
+        """Retrieves the names of the entries in a directory.
 
-                if name and name[0] == "@" and ",-" in name:
-                    path, string_identifier = name[1:].rsplit(",-", maxsplit=1)
-                    if ";" in string_identifier:
-                        string_identifier, _ = string_identifier.rsplit(";", maxsplit=1)
-                    elif "#" in string_identifier:
-                        string_identifier, _ = string_identifier.rsplit("#", maxsplit=1)
-                    elif "@" in string_identifier:
-                        string_identifier, _ = string_identifier.rsplit("@", maxsplit=1)
-
-                    windows_resource_file = self._GetStringResourceFile(path)
-                    if windows_resource_file:
-                        try:
-                            string_identifier = int(string_identifier, 10)
-                            name = self._GetString(
-                                windows_resource_file, string_identifier
-                            )
-
-                        except ValueError:
-                            pass
+        The names are cached per directory so that probing for multiple files in
+        the same directory only requires the directory to be read once.
 
-                value = class_identifier_key.GetValueByName("LocalizedString")
-                if value:
-                    # The value data type does not have to be a string therefore try to
-                    # decode the data as an UTF-16 little-endian string and strip
-                    # the trailing end-of-string character
-                    localized_string = value.data.decode("utf-16-le").rstrip("\x00")
-                else:
-                    localized_string = None
+        Args:
+          windows_path (str): Windows path of the directory.
 
-                shell_folder = ShellFolder(
-                    identifier=shell_folder_identifier,
-                    localized_string=localized_string,
-                )
-                if name and name.startswith("CLSID_"):
-                    shell_folder.class_name = name
-                else:
-                    shell_folder.name = name
+        Returns:
+          set[str]: lower case names of the directory entries, which is empty if
+              the directory does not exist.
+        """
+        lookup_key = windows_path.lower()
+        entry_names = self._directory_entry_names_cache.get(lookup_key)
+        if entry_names is None:
+            entry_names = set()
+
+            # A directory of resource files can store the MUI resource files in
+            # a flat layout, in which case language directories resolve to
+            # the directory itself.
+            resolve_directory = getattr(
+                self._path_resolver, "ResolveDirectory", self._path_resolver.ResolvePath
+            )
+
+            path_spec = resolve_directory(windows_path)
+            if path_spec:
+                file_entry = dfvfs_resolver.Resolver.OpenFileEntry(path_spec)
+                if file_entry and file_entry.IsDirectory():
+                    entry_names = {
+                        sub_file_entry.name.lower()
+                        for sub_file_entry in file_entry.sub_file_entries
+                    }
+
+            self._directory_entry_names_cache[lookup_key] = entry_names
+
+        return entry_names
 
-                yield shell_folder
+    def _GetFileFingerprint(self, path_spec):
+        """Determines a fingerprint of the content of a file.
+
+        The fingerprint is a SHA-256 of the size of the file and the data at the
+        start of the file. For Windows Registry files this data contains the
+        sequence numbers and last written time and for PE/COFF files the time
+        stamp, checksum and section headers, which change when the file changes.
+
+        Args:
+          path_spec (dfvfs.PathSpec): path specification of the file.
+
+        Returns:
+          str: fingerprint of the content of the file or None if not available.
+        """
+        try:
+            file_object = dfvfs_resolver.Resolver.OpenFileObject(path_spec)
+        except OSError:
+            file_object = None
+
+        if file_object is None:
+            return None
+
+        # The file object can be shared with an open resource file, hence
+        # the data is read from the start of the file.
+        file_object.seek(0, os.SEEK_SET)
+
+        file_size = file_object.get_size()
+        data = file_object.read(self._FINGERPRINT_DATA_SIZE)
+
+        hash_context = hashlib.sha256()
+        hash_context.update(file_size.to_bytes(8, "little"))
+        hash_context.update(data)
+
+        return hash_context.hexdigest()
+
+    def _GetRegistryFileFingerprint(self, path_spec):
+        """Determines a fingerprint of the entire content of a Windows Registry file.
+
+        The fingerprint consists of the primary and secondary sequence numbers
+        in the header of a REGF Windows Registry file and a SHA-256 of the content
+        of the file. Unlike the fingerprint of _GetFileFingerprint() it is used to
+        identify a file between runs, hence it covers the entire content.
+
+        Args:
+          path_spec (dfvfs.PathSpec): path specification of the Windows Registry
+              file.
+
+        Returns:
+          str: fingerprint of the content of the Windows Registry file or None if
+              not available.
+        """
+        try:
+            file_object = dfvfs_resolver.Resolver.OpenFileObject(path_spec)
+        except OSError:
+            file_object = None
+
+        if file_object is None:
+            return None
+
+        hash_context = hashlib.sha256()
+
+        file_object.seek(0, os.SEEK_SET)
+
+        data = file_object.read(self._FINGERPRINT_DATA_SIZE)
+        header_values = ""
+        if data[:4] == b"regf" and len(data) >= 12:
+            primary_sequence_number = int.from_bytes(data[4:8], "little")
+            secondary_sequence_number = int.from_bytes(data[8:12], "little")
+            header_values = (
+                f"{primary_sequence_number:d}:{secondary_sequence_number:d}:"
+            )
+
+        while data:
+            hash_context.update(data)
+            data = file_object.read(self._REGISTRY_FILE_HASH_READ_SIZE)
+
+        return f"{header_values:s}{hash_context.hexdigest():s}"
+
+    def _GetMUIWindowsPaths(self, windows_path, mui_language):
+        """Determines the Windows paths of the MUI resource file candidates.
+
+        A MUI resource file is stored in a sub directory named after the MUI
+        language or, in a flat layout, next to the language neutral resource
+        file.
+
+        Args:
+          windows_path (str): Windows path of the language neutral resource file.
+          mui_language (str): MUI language.
+
+        Returns:
+          list[str]: Windows paths of the MUI resource files that exist, in order
+              of preference.
+        """
+        path, _, name = windows_path.rpartition("\\")
+        mui_name = f"{name:s}.mui"
+
+        return [
+            "\\".join([directory_path, mui_name])
+            for directory_path in ("\\".join([path, mui_language]), path)
+            if mui_name.lower() in self._GetDirectoryEntryNames(directory_path)
+        ]
 
     def _GetMUIWindowsResourceFile(self, windows_path, windows_resource_file):
         """Retrieves a MUI resource file.
 
+        The Windows path of the MUI resource file that could be opened, or its
+        absence, is cached per language neutral resource file.
+
         Args:
           windows_path (str): Windows path of the language neutral resource file.
           windows_resource_file (WindowsResourceFile): language neutral resource
@@ -148,29 +374,77 @@ class WindowsShellExtractor(dfvfs_volume_scanner.WindowsVolumeScanner):
         Returns:
           WindowsResourceFile: MUI resource file or None if not available.
         """
-        mui_language = windows_resource_file.GetMUILanguage()
-        if not mui_language:
-            return None
+        lookup_key = windows_path.lower()
+        if lookup_key in self._mui_windows_path_cache:
+            self._IncrementCounter("mui_path_cache_hits")
 
-        path, _, name = windows_path.rpartition("\\")
+            mui_windows_path = self._mui_windows_path_cache[lookup_key]
+            if not mui_windows_path:
+                return None
 
-        mui_windows_path = "\\".join([path, mui_language, f"{name:s}.mui"])
-        mui_windows_resource_file = self._OpenWindowsResourceFile(mui_windows_path)
+            return self._OpenWindowsResourceFile(mui_windows_path)
 
-        if not mui_windows_resource_file:
-            mui_windows_path = "\\".join([path, f"{name:s}.mui"])
-            mui_windows_resource_file = self._OpenWindowsResourceFile(mui_windows_path)
+        self._IncrementCounter("mui_path_cache_misses")
+
+        with self._Stage("mui_probing"):
+            mui_windows_paths = []
+
+            mui_language = windows_resource_file.GetMUILanguage()
+            if mui_language:
+                mui_windows_paths = self._GetMUIWindowsPaths(windows_path, mui_language)
+
+            self._mui_language_cache[lookup_key] = mui_language
+
+        mui_windows_path = None
+        mui_windows_resource_file = None
+
+        # Fall back to the next candidate if a MUI resource file cannot be opened.
+        for candidate_windows_path in mui_windows_paths:
+            mui_windows_resource_file = self._OpenWindowsResourceFile(
+                candidate_windows_path
+            )
+            if mui_windows_resource_file:
+                mui_windows_path = candidate_windows_path
+                break
 
-        if mui_windows_resource_file:
+        self._mui_windows_path_cache[lookup_key] = mui_windows_path
+
+        if mui_windows_path:
             logging.info(
                 (
-                    f"Resource file: {windows_path:s} references MUI resource file: "
-                    f"{mui_windows_path:s}"
+                    f"Resource file: {windows_path:s} references MUI resource "
+                    f"file: {mui_windows_path:s}"
                 )
             )
 
+            self._IncrementCounter("mui_resource_files_found")
+
         return mui_windows_resource_file
 
+    def _GetShellFolder(self, identifier, name, localized_string):
+        """Retrieves a shell folder.
+
+        Args:
+          identifier (str): identifier (GUID) of the shell folder.
+          name (str): name of the shell folder, which can be a reference to
+              a string resource.
+          localized_string (str): localized string of the name.
+
+        Returns:
+          ShellFolder: shell folder.
+        """
+        name = self._ResolveName(name)
+
+        shell_folder = ShellFolder(
+            identifier=identifier, localized_string=localized_string
+        )
+        if name and name.startswith("CLSID_"):
+            shell_folder.class_name = name
+        else:
+            shell_folder.name = name
+
+        return shell_folder
+
     def _GetShellFolderName(self, class_identifier_key):
         """Retrieves the shell folder name.
 
@@ -201,6 +475,38 @@ class WindowsShellExtractor(dfvfs_volume_scanner.WindowsVolumeScanner):
 
         return None
 
+    def _GetShellFolderValues(self, class_identifiers_key):
+        """Retrieves shell folder values from a Windows Registry key.
+
+        Args:
+          class_identifiers_key (dfwinreg.RegistryKey): class identifiers Windows
+              Registry key.
+
+        Yields:
+          tuple[str, str, str]: identifier (GUID), name and localized string of
+              the shell folder, where the name can be a reference to a string
+              resource.
+        """
+        for class_identifier_key in class_identifiers_key.GetSubkeys():
+            shell_folder_identifier = class_identifier_key.name.lower()
+            if shell_folder_identifier[0] == "{" and shell_folder_identifier[-1] == "}":
+                shell_folder_identifier = shell_folder_identifier[1:-1]
+
+            shell_folder_key = class_identifier_key.GetSubkeyByName("ShellFolder")
+            if shell_folder_key:
+                name = self._GetShellFolderName(class_identifier_key)
+
+                value = class_identifier_key.GetValueByName("LocalizedString")
+                if value:
+                    # The value data type does not have to be a string therefore try to
+                    # decode the data as an UTF-16 little-endian string and strip
+                    # the trailing end-of-string character
+                    localized_string = value.data.decode("utf-16-le").rstrip("\x00")
+                else:
+                    localized_string = None
+
+                yield shell_folder_identifier, name, localized_string
+
     def _GetString(self, windows_resource_file, string_identifier):
         """Retrieves a string from a Windows resource file.
 
@@ -211,73 +517,123 @@ class WindowsShellExtractor(dfvfs_volume_scanner.WindowsVolumeScanner):
         Returns:
           str: string or None if not available.
         """
-        wrc_resource = windows_resource_file.GetStringTableResource()
-        if not wrc_resource:
-            return None
+        number_of_string_tables = windows_resource_file.number_of_decoded_string_tables
 
-        for wrc_resource_item in wrc_resource.items:
-            base_string_identifier = wrc_resource_item.identifier * 16
-            if string_identifier <= base_string_identifier + 16:
-                wrc_resource_sub_item = wrc_resource_item.sub_items[0]
-                resource_data = wrc_resource_sub_item.read()
+        with self._Stage("string_decoding"):
+            string = windows_resource_file.GetString(string_identifier)
 
-                string_table_resource = pywrc.string_table_resource()
-                string_table_resource.copy_from_byte_stream(
-                    resource_data, wrc_resource_item.identifier
-                )
+        self._IncrementCounter(
+            "string_tables_decoded",
+            windows_resource_file.number_of_decoded_string_tables
+            - number_of_string_tables,
+        )
+        return string
 
-                for index in range(string_table_resource.number_of_strings):
-                    stored_string_identifier = (
-                        string_table_resource.get_string_identifier(index)
-                    )
-                    if string_identifier == stored_string_identifier:
-                        return string_table_resource.get_string(index)
+    def _GetStringResourceReference(self, name):
+        """Retrieves the string resource a name references.
 
-        return None
+        Args:
+          name (str): name, such as "@%SystemRoot%\\system32\\shell32.dll,-9227".
+
+        Returns:
+          tuple[str, int]: Windows path of the Windows resource file and string
+              identifier, or None for both if the name does not reference
+              a string resource.
+        """
+        if not name or name[0] != "@" or ",-" not in name:
+            return None, None
+
+        path, string_identifier = name[1:].rsplit(",-", maxsplit=1)
+        if ";" in string_identifier:
+            string_identifier, _ = string_identifier.rsplit(";", maxsplit=1)
+        elif "#" in string_identifier:
+            string_identifier, _ = string_identifier.rsplit("#", maxsplit=1)
+        elif "@" in string_identifier:
+            string_identifier, _ = string_identifier.rsplit("@", maxsplit=1)
+
+        try:
+            string_identifier = int(string_identifier, 10)
+        except ValueError:
+            return None, None
+
+        return path, string_identifier
 
     def _GetStringResourceFile(self, windows_path):
         """Retrieves a string resource.
 
+        String resource files are cached per Windows volume.
+
         Args:
           windows_path (str): Windows path of the Windows resource file.
 
         Returns:
           WindowsResourceFile: string resource file or None if not available.
         """
-        windows_resource_file = None
+        lookup_key = windows_path.lower()
+        if lookup_key in self._string_resource_files:
+            self._IncrementCounter("resource_file_cache_hits")
+
+            return self._string_resource_files[lookup_key]
+
+        self._IncrementCounter("resource_file_cache_misses")
+
+        windows_resource_file = self._OpenStringResourceFile(windows_path)
+        self._string_resource_files[lookup_key] = windows_resource_file
+
+        return windows_resource_file
+
+    def _GetStringResourceFingerprint(self, windows_path):
+        """Determines a fingerprint of a string resource.
+
+        The fingerprint consists of the fingerprints of the language neutral
+        resource file and the MUI resource file candidates it references, if any.
+
+        Args:
+          windows_path (str): Windows path of the Windows resource file.
+
+        Returns:
+          str: fingerprint of the string resource or None if not available.
+        """
+        lookup_key = windows_path.lower()
+        if lookup_key in self._string_resource_fingerprints:
+            return self._string_resource_fingerprints[lookup_key]
+
+        fingerprint = None
 
         path_spec = self._path_resolver.ResolvePath(windows_path)
         if path_spec:
-            windows_resource_file = self._OpenWindowsResourceFileByPathSpec(path_spec)
+            fingerprint = self._GetFileFingerprint(path_spec)
 
-        if not windows_resource_file:
-            logging.warning(f"Missing resource file: {windows_path:s}")
-            return None
+        if fingerprint:
+            if fingerprint not in self._mui_languages_per_fingerprint:
+                # Retrieving the string resource file, which is cached for name
+                # resolution, determines the MUI language of a language neutral
+                # resource file without a string table.
+                self._GetStringResourceFile(windows_path)
 
-        if not windows_resource_file.HasStringTableResource():
-            # Windows Vista and later use a MUI resource to redirect to
-            # a language specific resource file.
-            mui_windows_resource_file = self._GetMUIWindowsResourceFile(
-                windows_path, windows_resource_file
-            )
-            if mui_windows_resource_file:
-                windows_resource_file.Close()
+                self._mui_languages_per_fingerprint[fingerprint] = (
+                    self._mui_language_cache.get(lookup_key)
+                )
 
-                windows_resource_file = mui_windows_resource_file
+            mui_language = self._mui_languages_per_fingerprint[fingerprint]
+            if mui_language:
+                mui_fingerprints = []
+                for mui_windows_path in self._GetMUIWindowsPaths(
+                    windows_path, mui_language
+                ):
+                    mui_fingerprint = None
 
-        if not windows_resource_file.HasStringTableResource():
-            logging.warning(
-                (
-                    f"String table resource missing from resource file: "
-                    f"{windows_path:s}"
-                )
-            )
+                    mui_path_spec = self._path_resolver.ResolvePath(mui_windows_path)
+                    if mui_path_spec:
+                        mui_fingerprint = self._GetFileFingerprint(mui_path_spec)
 
-            windows_resource_file.Close()
+                    mui_fingerprints.append(mui_fingerprint or "")
 
-            return None
+                fingerprint = ":".join([fingerprint, *mui_fingerprints])
 
-        return windows_resource_file
+        self._string_resource_fingerprints[lookup_key] = fingerprint
+
+        return fingerprint
 
     def _GetSystemRoot(self):
         """Determines the value of %SystemRoot%.
@@ -286,54 +642,269 @@ class WindowsShellExtractor(dfvfs_volume_scanner.WindowsVolumeScanner):
           str: value of SystemRoot or None if the value cannot be determined.
         """
         current_version_key = self._registry.GetKeyByPath(
-            "HKEY_LOCAL_MACHINE\\Software\\Microsoft\\Windows NT\\CurrentVersion"
+            self._CURRENT_VERSION_KEY_PATH
         )
 
         system_root = None
         if current_version_key:
-            system_root_value = current_version_key.GetValueByName("SystemRoot")
-            if system_root_value:
-                system_root = system_root_value.GetDataAsObject()
+            system_root = self._GetValueString(current_version_key, "SystemRoot")
 
         if not system_root:
             system_root = self._windows_directory
 
         return system_root
 
+    def _GetValueString(self, registry_key, value_name):
+        """Retrieves the string data of a Windows Registry value.
+
+        Args:
+          registry_key (dfwinreg.WinRegistryKey): Windows Registry key.
+          value_name (str): name of the value.
+
+        Returns:
+          str: string data of the value or None if not available.
+        """
+        registry_value = registry_key.GetValueByName(value_name)
+        if not registry_value or not registry_value.DataIsString():
+            return None
+
+        return registry_value.GetDataAsObject()
+
+    def _GetPathSpecLocation(self, path_spec, type_indicators):
+        """Retrieves the location of a specific type in a path specification.
+
+        Args:
+          path_spec (dfvfs.PathSpec): path specification.
+          type_indicators (set[str]): dfVFS type indicators.
+
+        Returns:
+          str: location, without leading path segment separator, of the first path
+              specification, of one of the types, in the chain of path
+              specifications or None if not available.
+        """
+        while path_spec:
+            if path_spec.type_indicator in type_indicators:
+                location = getattr(path_spec, "location", None)
+                if location:
+                    return location.lstrip("/")
+
+            path_spec = path_spec.parent
+
+        return None
+
+    def _GetVolumeIdentifier(self):
+        """Determines an identifier of the Windows volume.
+
+        The identifier consists of the source path, the size and modification
+        time of the source and the path specification of the Windows volume
+        file system.
+
+        For standalone Windows Registry files the identifier consists of the
+        fingerprints of the files.
+
+        Returns:
+          str: identifier of the Windows volume.
+        """
+        if self._class_identifiers_key_paths is not None:
+            return ":".join(
+                fingerprint or ""
+                for _, fingerprint, _ in self._class_identifiers_key_paths
+            )
+
+        file_entry = self._file_system.GetRootFileEntry()
+        path_spec = file_entry.path_spec
+
+        source_path_spec = path_spec
+        while source_path_spec.parent:
+            source_path_spec = source_path_spec.parent
+
+        source_path = os.path.abspath(source_path_spec.location)
+        try:
+            stat_object = os.stat(source_path)
+            source_identifier = (
+                f"{source_path:s}:{stat_object.st_size:d}:{stat_object.st_mtime_ns:d}"
+            )
+        except OSError:
+            source_identifier = source_path
+
+        return f"{source_identifier:s}:{path_spec.comparable:s}"
+
     def _GetWindowsVersion(self):
+        """Determines the Windows version.
+
+        The Windows version is first determined from the Windows Registry and
+        otherwise from the version of the kernel executable file. The Windows
+        version is cached per Windows volume.
+
+        Returns:
+          str: Windows version, such as "Windows 10 (1809)", or None otherwise.
+        """
+        volume_identifier = self._GetVolumeIdentifier()
+        if volume_identifier in self._windows_versions_per_volume:
+            return self._windows_versions_per_volume[volume_identifier]
+
+        product_name = None
+
+        current_version_key = self._registry.GetKeyByPath(
+            self._CURRENT_VERSION_KEY_PATH
+        )
+        if current_version_key:
+            product_name = self._GetValueString(current_version_key, "ProductName")
+
+        windows_version = self._GetWindowsVersionFromRegistry()
+        if not windows_version:
+            windows_version = self._GetWindowsVersionFromKernelExecutable(
+                product_name=product_name
+            )
+
+        self._windows_versions_per_volume[volume_identifier] = windows_version
+
+        return windows_version
+
+    def _GetWindowsVersionFromKernelExecutable(self, product_name=None):
         """Determines the Windows version from kernel executable file.
 
+        Args:
+          product_name (Optional[str]): product name, such as "Windows Server 2019
+              Standard", used to distinguish server from client versions.
+
         Returns:
           str: Windows version or None otherwise.
         """
         system_root = self._GetSystemRoot()
 
-        # Windows NT variants.
-        kernel_executable_path = "\\".join([system_root, "System32", "ntoskrnl.exe"])
-        windows_resource_file = self._OpenWindowsResourceFile(kernel_executable_path)
-
-        if not windows_resource_file:
+        kernel_executable_paths = [
+            # Windows NT variants.
+            "\\".join([system_root, "System32", "ntoskrnl.exe"]),
             # Windows 9x variants.
-            kernel_executable_path = "\\".join(
-                [system_root, "System32", "\\kernel32.dll"]
-            )
+            "\\".join([system_root, "System32", "kernel32.dll"]),
+            # Windows Me variant.
+            "\\".join([system_root, "System", "kernel32.dll"]),
+        ]
+
+        for kernel_executable_path in kernel_executable_paths:
             windows_resource_file = self._OpenWindowsResourceFile(
                 kernel_executable_path
             )
+            if windows_resource_file:
+                try:
+                    file_version = windows_resource_file.file_version
+                finally:
+                    windows_resource_file.Close()
+
+                if file_version:
+                    return versions.WindowsVersions.GetVersionByFileVersion(
+                        file_version, product_name=product_name
+                    )
+
+        return None
+
+    def _GetWindowsVersionFromRegistry(self):
+        """Determines the Windows version from the Windows Registry.
+
+        Returns:
+          str: Windows version or None otherwise.
+        """
+        current_version_key = self._registry.GetKeyByPath(
+            self._CURRENT_VERSION_KEY_PATH
+        )
+        if current_version_key:
+            build_number = self._GetValueString(
+                current_version_key, "CurrentBuildNumber"
+            ) or self._GetValueString(current_version_key, "CurrentBuild")
+
+            try:
+                build_number = int(build_number, 10)
+            except (TypeError, ValueError):
+                build_number = None
+
+            if build_number:
+                product_name = self._GetValueString(current_version_key, "ProductName")
+                release = self._GetValueString(
+                    current_version_key, "DisplayVersion"
+                ) or self._GetValueString(current_version_key, "ReleaseId")
+
+                return versions.WindowsVersions.GetVersionByBuildNumber(
+                    build_number, product_name=product_name, release=release
+                )
+
+        current_version_key = self._registry.GetKeyByPath(
+            self._WINDOWS_9X_CURRENT_VERSION_KEY_PATH
+        )
+        if current_version_key:
+            version_number = self._GetValueString(current_version_key, "VersionNumber")
+            if version_number:
+                return versions.WindowsVersions.GetVersionByFileVersion(version_number)
+
+        return None
+
+    def _IncrementCounter(self, name, value=1):
+        """Increments a counter of the extraction statistics, if collected.
+
+        Args:
+          name (str): name of the counter.
+          value (Optional[int]): value to increment the counter with.
+        """
+        if self._statistics:
+            self._statistics.IncrementCounter(name, value=value)
+
+    def _OpenRegistry(self):
+        """Opens the Windows Registry of the Windows volume."""
+        self._CloseRegistry()
+
+        registry_file_reader = registry_cache.CachedWindowsRegistryFileReader(
+            self._file_system, self._path_resolver, self._registry_file_cache
+        )
+        self._registry = registry_cache.CachedWinRegistry(
+            registry_file_reader=registry_file_reader
+        )
+
+    def _OpenStringResourceFile(self, windows_path):
+        """Opens a string resource file.
+
+        Args:
+          windows_path (str): Windows path of the Windows resource file.
+
+        Returns:
+          WindowsResourceFile: string resource file or None if not available.
+        """
+        windows_resource_file = None
+
+        path_spec = self._path_resolver.ResolvePath(windows_path)
+        if path_spec:
+            windows_resource_file = self._OpenWindowsResourceFileByPathSpec(path_spec)
 
         if not windows_resource_file:
-            # Windows Me variant.
-            kernel_executable_path = "\\".join(
-                [system_root, "System", "\\kernel32.dll"]
+            logging.warning(f"Missing resource file: {windows_path:s}")
+
+            self._IncrementCounter("resource_files_missing")
+
+            return None
+
+        if not windows_resource_file.HasStringTableResource():
+            # Windows Vista and later use a MUI resource to redirect to
+            # a language specific resource file.
+            mui_windows_resource_file = self._GetMUIWindowsResourceFile(
+                windows_path, windows_resource_file
             )
-            windows_resource_file = self._OpenWindowsResourceFile(
-                kernel_executable_path
+            if mui_windows_resource_file:
+                windows_resource_file.Close()
+
+                windows_resource_file = mui_windows_resource_file
+
+        if not windows_resource_file.HasStringTableResource():
+            logging.warning(
+                (
+                    f"String table resource missing from resource file: "
+                    f"{windows_path:s}"
+                )
             )
 
-        if not windows_resource_file:
+            windows_resource_file.Close()
+
             return None
 
-        return windows_resource_file.file_version
+        return windows_resource_file
 
     def _OpenWindowsResourceFile(self, windows_path):
         """Opens the Windows resource file specified by the Windows path.
@@ -359,46 +930,324 @@ class WindowsShellExtractor(dfvfs_volume_scanner.WindowsVolumeScanner):
         Returns:
           WindowsResourceFile: Windows resource file or None.
         """
-        windows_path = self._path_resolver.GetWindowsPath(path_spec)
-        if windows_path is None:
-            logging.warning("Unable to retrieve Windows path.")
+        with self._Stage("resource_file_opening"):
+            windows_path = self._path_resolver.GetWindowsPath(path_spec)
+            if windows_path is None:
+                logging.warning("Unable to retrieve Windows path.")
+
+            is_os_file = path_spec.type_indicator == dfvfs_definitions.TYPE_INDICATOR_OS
+
+            # The resource section of files in a storage media image is read at once
+            # since reading from the image can be expensive, for example when the
+            # image is compressed.
+            windows_resource_file = resource_file.WindowsResourceFile(
+                windows_path,
+                ascii_codepage=self.ascii_codepage,
+                preferred_language_identifier=self.preferred_language_identifier,
+                read_ahead=not is_os_file,
+            )
+
+            # Files stored in the operating system, such as those of a mounted
+            # volume, are memory mapped instead of accessed using dfVFS.
+            if is_os_file:
+                try:
+                    windows_resource_file.Open(path_spec.location)
+
+                except OSError as exception:
+                    logging.warning(
+                        f"Unable to open: {path_spec.location:s} with error: "
+                        f"{exception!s}"
+                    )
+                    windows_resource_file = None
+
+            else:
+                try:
+                    file_object = dfvfs_resolver.Resolver.OpenFileObject(path_spec)
+                except OSError as exception:
+                    logging.warning(
+                        f"Unable to open: {path_spec.comparable:s} with error: "
+                        f"{exception!s}"
+                    )
+                    file_object = None
+
+                if file_object is None:
+                    windows_resource_file = None
+                else:
+                    windows_resource_file.OpenFileObject(file_object)
+
+        if windows_resource_file:
+            self._IncrementCounter("resource_files_opened")
+
+        return windows_resource_file
+
+    def _ResolveName(self, name):
+        """Resolves a name that references a string resource.
 
+        Resolved names are cached per fingerprint of the string resource so that
+        unchanged resource files, for example in different snapshots, are only
+        read once.
+
+        Args:
+          name (str): name, such as "@%SystemRoot%\\system32\\shell32.dll,-9227".
+
+        Returns:
+          str: resolved name, the name if it does not reference a string resource
+              or the resource file is not available, or None if the string is
+              not available.
+        """
+        path, string_identifier = self._GetStringResourceReference(name)
+        if not path:
+            return name
+
+        with self._Stage("name_resolution"):
+            fingerprint = self._GetStringResourceFingerprint(path)
+
+            lookup_key = (fingerprint, string_identifier)
+            if fingerprint and lookup_key in self._strings_per_fingerprint:
+                name = self._strings_per_fingerprint[lookup_key]
+
+                self._IncrementCounter("string_cache_hits")
+
+            else:
+                self._IncrementCounter("string_cache_misses")
+
+                windows_resource_file = self._GetStringResourceFile(path)
+                if not windows_resource_file:
+                    # Without the resource file the reference is kept as name.
+                    self._IncrementCounter("unresolved_references")
+
+                    return name
+
+                name = self._GetString(windows_resource_file, string_identifier)
+
+                if fingerprint:
+                    self._strings_per_fingerprint[lookup_key] = name
+
+        if name is None:
+            self._IncrementCounter("unresolved_references")
+
+        return name
+
+    @contextlib.contextmanager
+    def _Stage(self, name):
+        """Times a stage of the extraction statistics, if collected.
+
+        The stage is stopped when the block of the with statement is left, also
+        when an exception is raised.
+
+        Args:
+          name (str): name of the stage.
+
+        Yields:
+          None: control is yielded to the block of the with statement.
+        """
+        if not self._statistics:
+            yield
+            return
+
+        self._statistics.StartStage(name)
         try:
-            file_object = dfvfs_resolver.Resolver.OpenFileObject(path_spec)
-        except OSError as exception:
-            logging.warning(
-                f"Unable to open: {path_spec.comparable:s} with error: {exception!s}"
-            )
-            file_object = None
+            yield
 
-        if file_object is None:
+        finally:
+            self._statistics.StopStage(name)
+
+    def Close(self):
+        """Closes the Windows volume or standalone Windows Registry files.
+
+        State that is specific to the Windows volume, such as open resource
+        files, is cleared. The Windows Registry files are released to the Windows
+        Registry file cache. Cached values that are identified by a fingerprint
+        are retained.
+        """
+        self._CloseRegistry()
+        self._CloseStringResourceFiles()
+
+        self._class_identifiers_key_paths = None
+        self._directory_entry_names_cache = {}
+        self._mui_language_cache = {}
+        self._mui_windows_path_cache = {}
+        self._string_resource_fingerprints = {}
+        self._windows_directory = None
+        self._windows_version = None
+        self._windows_version_determined = False
+
+    def _GetCachedShellFolders(self, fingerprint):
+        """Retrieves shell folders from the persistent shell folder cache.
+
+        Args:
+          fingerprint (str): fingerprint of the Windows Registry file and
+              the settings used to resolve the names.
+
+        Returns:
+          list[ShellFolder]: shell folders or None if no shell folders are cached
+              or a string resource the names were resolved from has changed.
+        """
+        result = self._shell_folder_cache.GetShellFolderResult(fingerprint)
+        if not result:
             return None
 
-        windows_resource_file = resource_file.WindowsResourceFile(
-            windows_path,
-            ascii_codepage=self.ascii_codepage,
-            preferred_language_identifier=self.preferred_language_identifier,
-        )
-        windows_resource_file.OpenFileObject(file_object)
+        resource_fingerprints, shell_folder_values = result
+        for windows_path, resource_fingerprint in resource_fingerprints.items():
+            if self._GetStringResourceFingerprint(windows_path) != resource_fingerprint:
+                return None
 
-        return windows_resource_file
+        return [ShellFolder.CopyFromValues(values) for values in shell_folder_values]
+
+    def _SetCachedShellFolders(self, fingerprint, shell_folder_values, shell_folders):
+        """Stores shell folders in the persistent shell folder cache.
+
+        Args:
+          fingerprint (str): fingerprint of the Windows Registry file and
+              the settings used to resolve the names.
+          shell_folder_values (list[tuple[str, str, str]]): identifier (GUID),
+              name and localized string of the shell folders, where the name can
+              be a reference to a string resource.
+          shell_folders (list[ShellFolder]): shell folders with resolved names.
+        """
+        resource_fingerprints = {}
+        for _, name, _ in shell_folder_values:
+            windows_path, _ = self._GetStringResourceReference(name)
+            if windows_path and windows_path not in resource_fingerprints:
+                resource_fingerprints[windows_path] = (
+                    self._GetStringResourceFingerprint(windows_path)
+                )
+
+        self._shell_folder_cache.SetShellFolderResult(
+            fingerprint, resource_fingerprints, shell_folders
+        )
 
     def CollectShellFolders(self):
         """Retrieves shell folders.
 
+        The shell folder values read from the SOFTWARE, or standalone, Windows
+        Registry file are cached per fingerprint of the file so that an unchanged
+        file, for example in different snapshots, is only read once.
+
+        If a persistent shell folder cache is used, the shell folders with
+        resolved names are cached per fingerprint of the entire Windows Registry
+        file, the ASCII codepage and the preferred language identifier, so that
+        a subsequent run over unchanged files does not read the Windows Registry
+        file and resource files again.
+
         Yields:
           ShellFolder: shell folder.
         """
-        class_identifiers_key = self._registry.GetKeyByPath(
-            self._CLASS_IDENTIFIERS_KEY_PATH
-        )
-        if class_identifiers_key:
-            yield from self._CollectShellFoldersFromKey(class_identifiers_key)
+        class_identifiers_key_paths = self._class_identifiers_key_paths
+        if class_identifiers_key_paths is None:
+            fingerprint = None
+
+            path_spec = self._path_resolver.ResolvePath(self._SOFTWARE_HIVE_PATH)
+            if path_spec:
+                fingerprint = self._GetFileFingerprint(path_spec)
+
+            class_identifiers_key_paths = [
+                (self._CLASS_IDENTIFIERS_KEY_PATH, fingerprint, path_spec)
+            ]
+
+        for key_path, fingerprint, path_spec in class_identifiers_key_paths:
+            result_fingerprint = None
+            if self._shell_folder_cache and path_spec:
+                with self._Stage("registry_file_hashing"):
+                    registry_file_fingerprint = self._GetRegistryFileFingerprint(
+                        path_spec
+                    )
+
+                if registry_file_fingerprint:
+                    result_fingerprint = ":".join(
+                        [
+                            registry_file_fingerprint,
+                            key_path,
+                            self.ascii_codepage,
+                            f"0x{self.preferred_language_identifier:04x}",
+                        ]
+                    )
+
+            if result_fingerprint:
+                shell_folders = self._GetCachedShellFolders(result_fingerprint)
+                if shell_folders is not None:
+                    self._IncrementCounter("shell_folder_result_cache_hits")
+                    self._IncrementCounter("shell_folders", len(shell_folders))
+
+                    yield from shell_folders
+                    continue
+
+                self._IncrementCounter("shell_folder_result_cache_misses")
+
+            shell_folder_values = self._shell_folder_values_per_fingerprint.get(
+                fingerprint
+            )
+            if shell_folder_values is not None:
+                self._IncrementCounter("shell_folder_cache_hits")
+
+            else:
+                shell_folder_values = []
+
+                self._IncrementCounter("shell_folder_cache_misses")
+
+                with self._Stage("registry_loading"):
+                    class_identifiers_key = self._registry.GetKeyByPath(key_path)
+
+                if class_identifiers_key:
+                    self._IncrementCounter(
+                        "class_identifiers", class_identifiers_key.number_of_subkeys
+                    )
+
+                    with self._Stage("class_identifier_enumeration"):
+                        shell_folder_values = list(
+                            self._GetShellFolderValues(class_identifiers_key)
+                        )
+
+                if fingerprint:
+                    self._shell_folder_values_per_fingerprint[fingerprint] = (
+                        shell_folder_values
+                    )
+
+            self._IncrementCounter("shell_folders", len(shell_folder_values))
+
+            if result_fingerprint:
+                shell_folders = [
+                    self._GetShellFolder(*values) for values in shell_folder_values
+                ]
+                self._SetCachedShellFolders(
+                    result_fingerprint, shell_folder_values, shell_folders
+                )
+                yield from shell_folders
+
+            else:
+                for values in shell_folder_values:
+                    yield self._GetShellFolder(*values)
 
         # TODO: Add support for per-user shell folders
 
-    def ScanForWindowsVolume(self, source_path, options=None):
-        """Scans for a Windows volume.
+    def GetPartitionIdentifier(self, path_spec):
+        """Retrieves the partition identifier of a volume.
+
+        Args:
+          path_spec (dfvfs.PathSpec): file system path specification of the volume.
+
+        Returns:
+          str: partition identifier, such as "p1", or None if the volume is not
+              stored in a partition.
+        """
+        return self._GetPathSpecLocation(
+            path_spec, dfvfs_definitions.PARTITION_TABLE_TYPE_INDICATORS
+        )
+
+    def GetSnapshotIdentifier(self, path_spec):
+        """Retrieves the snapshot identifier of a volume.
+
+        Args:
+          path_spec (dfvfs.PathSpec): file system path specification of the volume.
+
+        Returns:
+          str: snapshot identifier, such as "vss1", or None if the volume is not
+              a snapshot.
+        """
+        return self._GetPathSpecLocation(path_spec, self._SNAPSHOT_TYPE_INDICATORS)
+
+    def GetWindowsVolumePathSpecs(self, source_path, options=None):
+        """Scans a source for volumes that can contain a Windows directory.
 
         Args:
           source_path (str): source path.
@@ -407,24 +1256,143 @@ class WindowsShellExtractor(dfvfs_volume_scanner.WindowsVolumeScanner):
               VolumeScannerOptions class.
 
         Returns:
-          bool: True if a Windows volume was found.
+          list[dfvfs.PathSpec]: file system path specifications of the volumes.
 
         Raises:
           ScannerError: if the source path does not exists, or if the source path
               is not a file or directory, or if the format of or within
               the source file is not supported.
         """
-        result = super().ScanForWindowsVolume(source_path, options=options)
-        if not result:
-            return False
+        with self._Stage("volume_scanning"):
+            return super().GetWindowsVolumePathSpecs(source_path, options=options)
 
-        registry_file_reader = (
-            windows_registry.StorageMediaImageWindowsRegistryFileReader(
-                self._file_system, self._path_resolver
-            )
+    def OpenRegistryFiles(self, paths, resources_path=None):
+        """Opens standalone Windows Registry files.
+
+        Shell folders are extracted from standalone Windows Registry files, such
+        as SOFTWARE and UsrClass.dat, for example of a triage collection, instead
+        of a Windows volume.
+
+        Args:
+          paths (list[str]): paths of the Windows Registry files.
+          resources_path (Optional[str]): path of a directory with resource files,
+              such as shell32.dll and en-US/shell32.dll.mui, used to resolve
+              localized strings or None if not available.
+
+        Returns:
+          bool: True if a Windows Registry file with class identifiers was opened.
+        """
+        self.Close()
+
+        os_path_spec = dfvfs_path_spec_factory.Factory.NewPathSpec(
+            dfvfs_definitions.TYPE_INDICATOR_OS, location=os.path.sep
         )
-        self._registry = dfwinreg_registry.WinRegistry(
+        self._file_system = dfvfs_resolver.Resolver.OpenFileSystem(os_path_spec)
+
+        self._path_resolver = path_resolver.ResourceDirectoryPathResolver(
+            resources_path
+        )
+        self._windows_directory = "C:\\Windows"
+
+        registry_file_reader = registry_cache.CachedWindowsRegistryFileReader(
+            self._file_system, None, self._registry_file_cache
+        )
+        self._registry = registry_cache.CachedWinRegistry(
             registry_file_reader=registry_file_reader
         )
 
+        self._class_identifiers_key_paths = []
+        for path in paths:
+            registry_file = None
+
+            path_spec = dfvfs_path_spec_factory.Factory.NewPathSpec(
+                dfvfs_definitions.TYPE_INDICATOR_OS, location=os.path.abspath(path)
+            )
+            if os.path.isfile(path):
+                with self._Stage("registry_loading"):
+                    registry_file = registry_file_reader.OpenPathSpec(
+                        path_spec, ascii_codepage=self.ascii_codepage
+                    )
+
+                if registry_file:
+                    self._IncrementCounter("registry_files_opened")
+
+            if not registry_file:
+                logging.warning(f"Unable to open Windows Registry file: {path:s}")
+                continue
+
+            try:
+                key_path_prefix = self._registry.GetRegistryFileMapping(registry_file)
+            except RuntimeError:
+                key_path_prefix = ""
+
+            if not key_path_prefix:
+                filename = os.path.basename(path).lower()
+                key_path_prefix = self._KEY_PATH_PREFIX_PER_FILENAME.get(filename, "")
+
+            key_path = self._CLASS_IDENTIFIERS_KEY_PATH_PER_KEY_PATH_PREFIX.get(
+                key_path_prefix.upper()
+            )
+            if not key_path:
+                logging.warning(
+                    f"Unsupported Windows Registry file: {path:s} without class "
+                    f"identifiers"
+                )
+                continue
+
+            self._registry.MapFile(key_path_prefix, registry_file)
+
+            fingerprint = self._GetFileFingerprint(path_spec)
+            self._class_identifiers_key_paths.append((key_path, fingerprint, path_spec))
+
+        return bool(self._class_identifiers_key_paths)
+
+    def OpenWindowsVolume(self, path_spec):
+        """Opens a Windows volume.
+
+        State that is specific to the previous Windows volume, such as open
+        resource files, is cleared. Cached values that are identified by
+        a fingerprint are retained.
+
+        Args:
+          path_spec (dfvfs.PathSpec): file system path specification of the volume.
+
+        Returns:
+          bool: True if the volume contains a Windows directory.
+        """
+        self.Close()
+
+        with self._Stage("volume_opening"):
+            result = self._OpenWindowsVolume(path_spec)
+
+        if not result:
+            return False
+
+        self._IncrementCounter("volumes_opened")
+
+        self._OpenRegistry()
+
         return True
+
+    def ScanForWindowsVolume(self, source_path, options=None):
+        """Scans for a Windows volume.
+
+        Args:
+          source_path (str): source path.
+          options (Optional[VolumeScannerOptions]): volume scanner options. If None
+              the default volume scanner options are used, which are defined in the
+              VolumeScannerOptions class.
+
+        Returns:
+          bool: True if a Windows volume was found.
+
+        Raises:
+          ScannerError: if the source path does not exists, or if the source path
+              is not a file or directory, or if the format of or within
+              the source file is not supported.
+        """
+        base_path_specs = self.GetWindowsVolumePathSpecs(source_path, options=options)
+        if not base_path_specs:
+            return False
+
+        return self.OpenWindowsVolume(base_path_specs[0])
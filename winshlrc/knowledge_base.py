@@ -0,0 +1,584 @@
+"""Windows shell knowledge base."""
+
+import array
+import os
+import uuid
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from winshlrc import yaml_definitions_file
+
+# Resource type flags, where an identifier can be defined as multiple types.
+RESOURCE_TYPE_UNKNOWN = 0
+RESOURCE_TYPE_CONTROL_PANEL_ITEM = 1
+RESOURCE_TYPE_KNOWN_FOLDER = 2
+RESOURCE_TYPE_SHELL_FOLDER = 4
+
+# Names of the resource type flags.
+RESOURCE_TYPE_NAMES = {
+    RESOURCE_TYPE_CONTROL_PANEL_ITEM: "control_panel_item",
+    RESOURCE_TYPE_KNOWN_FOLDER: "known_folder",
+    RESOURCE_TYPE_SHELL_FOLDER: "shell_folder",
+}
+
+
+class WindowsShellKnowledgeBase:
+    """Windows shell knowledge base.
+
+    The knowledge base contains the control panel item, known folder and shell
+    folder definitions and resolves identifiers, such as the 16-byte little
+    endian GUIDs stored in shell items, in batches.
+
+    If NumPy is available identifiers are resolved with a binary search over
+    a sorted array of 64-bit hashes of the defined identifiers, without creating
+    a Python object per identifier. The identifier found by the search is
+    compared in full, hence the result is exact. Otherwise identifiers are
+    resolved with a dictionary lookup per identifier.
+
+    Known folders can also be looked up by CSIDL, name and display name, with
+    reverse indexes that are built together with the index of the identifiers.
+    """
+
+    # Values of the CSIDL names, as defined in shlobj.h.
+    _CSIDL_VALUES = {
+        "CSIDL_ADMINTOOLS": 0x0030,
+        "CSIDL_ALTSTARTUP": 0x001D,
+        "CSIDL_APPDATA": 0x001A,
+        "CSIDL_BITBUCKET": 0x000A,
+        "CSIDL_CDBURN_AREA": 0x003B,
+        "CSIDL_COMMON_ADMINTOOLS": 0x002F,
+        "CSIDL_COMMON_ALTSTARTUP": 0x001E,
+        "CSIDL_COMMON_APPDATA": 0x0023,
+        "CSIDL_COMMON_DESKTOPDIRECTORY": 0x0019,
+        "CSIDL_COMMON_DOCUMENTS": 0x002E,
+        "CSIDL_COMMON_FAVORITES": 0x001F,
+        "CSIDL_COMMON_MUSIC": 0x0035,
+        "CSIDL_COMMON_OEM_LINKS": 0x003A,
+        "CSIDL_COMMON_PICTURES": 0x0036,
+        "CSIDL_COMMON_PROGRAMS": 0x0017,
+        "CSIDL_COMMON_STARTMENU": 0x0016,
+        "CSIDL_COMMON_STARTUP": 0x0018,
+        "CSIDL_COMMON_TEMPLATES": 0x002D,
+        "CSIDL_COMMON_VIDEO": 0x0037,
+        "CSIDL_COMPUTERSNEARME": 0x003D,
+        "CSIDL_CONNECTIONS": 0x0031,
+        "CSIDL_CONTROLS": 0x0003,
+        "CSIDL_COOKIES": 0x0021,
+        "CSIDL_DESKTOP": 0x0000,
+        "CSIDL_DESKTOPDIRECTORY": 0x0010,
+        "CSIDL_DRIVES": 0x0011,
+        "CSIDL_FAVORITES": 0x0006,
+        "CSIDL_FONTS": 0x0014,
+        "CSIDL_HISTORY": 0x0022,
+        "CSIDL_INTERNET": 0x0001,
+        "CSIDL_INTERNET_CACHE": 0x0020,
+        "CSIDL_LOCAL_APPDATA": 0x001C,
+        "CSIDL_MYDOCUMENTS": 0x0005,
+        "CSIDL_MYMUSIC": 0x000D,
+        "CSIDL_MYPICTURES": 0x0027,
+        "CSIDL_MYVIDEO": 0x000E,
+        "CSIDL_NETHOOD": 0x0013,
+        "CSIDL_NETWORK": 0x0012,
+        "CSIDL_PERSONAL": 0x0005,
+        "CSIDL_PRINTERS": 0x0004,
+        "CSIDL_PRINTHOOD": 0x001B,
+        "CSIDL_PROFILE": 0x0028,
+        "CSIDL_PROFILES": 0x003E,
+        "CSIDL_PROGRAM_FILES": 0x0026,
+        "CSIDL_PROGRAM_FILES_COMMON": 0x002B,
+        "CSIDL_PROGRAM_FILES_COMMONX86": 0x002C,
+        "CSIDL_PROGRAM_FILESX86": 0x002A,
+        "CSIDL_PROGRAMS": 0x0002,
+        "CSIDL_RECENT": 0x0008,
+        "CSIDL_RESOURCES": 0x0038,
+        "CSIDL_RESOURCES_LOCALIZED": 0x0039,
+        "CSIDL_SENDTO": 0x0009,
+        "CSIDL_STARTMENU": 0x000B,
+        "CSIDL_STARTUP": 0x0007,
+        "CSIDL_SYSTEM": 0x0025,
+        "CSIDL_SYSTEMX86": 0x0029,
+        "CSIDL_TEMPLATES": 0x0015,
+        "CSIDL_WINDOWS": 0x0024,
+    }
+
+    # Mask of the CSIDL flags, such as CSIDL_FLAG_CREATE, that can be combined
+    # with a CSIDL value.
+    _CSIDL_FLAG_MASK = 0xFF00
+
+    # Multipliers of the hash of an identifier, where the next multiplier is
+    # used in the unlikely case that the hashes of defined identifiers collide.
+    _HASH_MULTIPLIERS = (0x9E3779B97F4A7C15, 0xBF58476D1CE4E5B9, 0x94D049BB133111EB)
+
+    def __init__(self):
+        """Initializes a Windows shell knowledge base."""
+        super().__init__()
+        self._control_panel_items = {}
+        self._hash_multiplier = None
+        self._index = None
+        self._index_hashes = None
+        self._index_lower = None
+        self._index_name_indexes = None
+        self._index_resource_types = None
+        self._index_upper = None
+        self._known_folders = {}
+        self._known_folders_per_csidl = None
+        self._known_folders_per_display_name = None
+        self._known_folders_per_name = None
+        self._names = []
+        self._shell_folders = {}
+
+    @property
+    def names(self):
+        """list[str]: names, where the name index of an identifier refers to."""
+        if self._index is None:
+            self._BuildIndex()
+        return self._names
+
+    @property
+    def number_of_identifiers(self):
+        """int: number of defined identifiers."""
+        if self._index is None:
+            self._BuildIndex()
+        return len(self._index)
+
+    def _BuildIndex(self):
+        """Builds the index of the defined identifiers.
+
+        Raises:
+          RuntimeError: if the hashes of the defined identifiers collide.
+        """
+        names = []
+        name_indexes_per_name = {}
+        values_per_key = {}
+
+        # The name of the first resource type takes precedence over the others.
+        for resource_type, definitions in (
+            (RESOURCE_TYPE_KNOWN_FOLDER, self._known_folders),
+            (RESOURCE_TYPE_SHELL_FOLDER, self._shell_folders),
+            (RESOURCE_TYPE_CONTROL_PANEL_ITEM, self._control_panel_items),
+        ):
+            for identifier, definition in definitions.items():
+                key = uuid.UUID(identifier).bytes_le
+                resource_types, name_index = values_per_key.get(key, (0, -1))
+
+                name = self._GetDefinitionName(resource_type, definition)
+                if name and name_index == -1:
+                    name_index = name_indexes_per_name.get(name, None)
+                    if name_index is None:
+                        name_index = len(names)
+                        name_indexes_per_name[name] = name_index
+                        names.append(name)
+
+                values_per_key[key] = (resource_types | resource_type, name_index)
+
+        self._index = values_per_key
+        self._names = names
+
+        self._BuildKnownFolderIndexes()
+
+        if numpy and values_per_key:
+            keys = list(values_per_key)
+            upper, lower = self._GetIdentifierHalves(b"".join(keys))
+
+            for hash_multiplier in self._HASH_MULTIPLIERS:
+                hashes = upper ^ (lower * numpy.uint64(hash_multiplier))
+                if numpy.unique(hashes).size == hashes.size:
+                    break
+            else:
+                raise RuntimeError("Unable to build index of identifiers.")
+
+            order = numpy.argsort(hashes)
+
+            self._hash_multiplier = numpy.uint64(hash_multiplier)
+            self._index_hashes = hashes[order]
+            self._index_lower = lower[order]
+            self._index_name_indexes = numpy.array(
+                [values_per_key[key][1] for key in keys], dtype=numpy.int32
+            )[order]
+            self._index_resource_types = numpy.array(
+                [values_per_key[key][0] for key in keys], dtype=numpy.uint8
+            )[order]
+            self._index_upper = upper[order]
+
+    def _BuildKnownFolderIndexes(self):
+        """Builds the reverse indexes of the known folders."""
+        known_folders_per_csidl = {}
+        known_folders_per_display_name = {}
+        known_folders_per_name = {}
+
+        for definition in self._known_folders.values():
+            for csidl in definition.csidl:
+                csidl_value = self._CSIDL_VALUES.get(csidl.upper(), None)
+                if csidl_value is not None:
+                    known_folders_per_csidl.setdefault(csidl_value, definition)
+
+            if definition.name:
+                known_folders_per_name.setdefault(definition.name.lower(), definition)
+
+        # Known folders of which the display name matches come before those of
+        # which the legacy or an alternate display name matches.
+        for attribute_name in (
+            "display_name",
+            "legacy_display_name",
+            "alternate_display_names",
+        ):
+            for definition in self._known_folders.values():
+                display_names = getattr(definition, attribute_name, None) or []
+                if isinstance(display_names, str):
+                    display_names = [display_names]
+
+                for display_name in display_names:
+                    if not display_name or display_name[0] == "@":
+                        continue
+
+                    candidates = known_folders_per_display_name.setdefault(
+                        self._NormalizeDisplayName(display_name), []
+                    )
+                    if definition not in candidates:
+                        candidates.append(definition)
+
+        self._known_folders_per_csidl = known_folders_per_csidl
+        self._known_folders_per_display_name = known_folders_per_display_name
+        self._known_folders_per_name = known_folders_per_name
+
+    def _GetDefinitionName(self, resource_type, definition):
+        """Retrieves the name of a definition.
+
+        Args:
+          resource_type (int): resource type of the definition.
+          definition (ControlPanelItemDefinition|KnownFolderDefinition|
+              ShellFolderDefinition): definition.
+
+        Returns:
+          str: name of the definition or None if not available.
+        """
+        if resource_type == RESOURCE_TYPE_CONTROL_PANEL_ITEM:
+            name = definition.module_name
+        elif resource_type == RESOURCE_TYPE_KNOWN_FOLDER:
+            name = definition.display_name
+        else:
+            name = definition.name
+
+        # Names that reference a string resource, such as "@shell32.dll,-1",
+        # are not meaningful without the resource file.
+        if not name or name[0] == "@":
+            name = getattr(definition, "name", None)
+
+        if not name or name[0] == "@":
+            return None
+
+        return name
+
+    def _GetIdentifierHalves(self, identifiers):
+        """Retrieves the upper and lower 64-bit halves of identifiers.
+
+        Args:
+          identifiers (bytes|numpy.ndarray): contiguous buffer of 16-byte little
+              endian GUIDs.
+
+        Returns:
+          tuple[numpy.ndarray, numpy.ndarray]: upper and lower 64-bit halves of
+              the identifiers.
+
+        Raises:
+          ValueError: if the size of the buffer is not a multiple of 16.
+        """
+        if isinstance(identifiers, numpy.ndarray):
+            byte_values = numpy.ascontiguousarray(identifiers).reshape(-1)
+            byte_values = byte_values.view(numpy.uint8)
+        else:
+            byte_values = numpy.frombuffer(identifiers, dtype=numpy.uint8)
+
+        if byte_values.size % 16:
+            raise ValueError("Identifiers buffer size is not a multiple of 16.")
+
+        halves = byte_values.view(numpy.uint64).reshape(-1, 2)
+
+        return halves[:, 0].copy(), halves[:, 1].copy()
+
+    def _NormalizeDisplayName(self, display_name):
+        """Normalizes a display name.
+
+        Args:
+          display_name (str): display name, such as "My  Computer".
+
+        Returns:
+          str: normalized display name, such as "my computer".
+        """
+        return " ".join(display_name.split()).casefold()
+
+    def _ResolveIdentifiersWithoutNumPy(self, identifiers):
+        """Resolves identifiers with a dictionary lookup per identifier.
+
+        Args:
+          identifiers (bytes): contiguous buffer of 16-byte little endian GUIDs.
+
+        Returns:
+          tuple[array.array, array.array, array.array]: resource type flags,
+              name index or -1 if not available and known flag per identifier.
+
+        Raises:
+          ValueError: if the size of the buffer is not a multiple of 16.
+        """
+        byte_values = memoryview(identifiers).cast("B")
+        if byte_values.nbytes % 16:
+            raise ValueError("Identifiers buffer size is not a multiple of 16.")
+
+        number_of_identifiers = byte_values.nbytes // 16
+
+        known = array.array("B", bytes(number_of_identifiers))
+        name_indexes = array.array("i", [-1]) * number_of_identifiers
+        resource_types = array.array("B", bytes(number_of_identifiers))
+
+        for index in range(number_of_identifiers):
+            offset = index * 16
+            values = self._index.get(byte_values[offset : offset + 16].tobytes())
+            if values:
+                known[index] = 1
+                name_indexes[index] = values[1]
+                resource_types[index] = values[0]
+
+        return resource_types, name_indexes, known
+
+    def AddControlPanelItemDefinition(self, definition):
+        """Adds a control panel item definition.
+
+        The first definition of an identifier takes precedence.
+
+        Args:
+          definition (ControlPanelItemDefinition): control panel item definition.
+        """
+        identifier = definition.identifier.lower()
+        if identifier not in self._control_panel_items:
+            self._control_panel_items[identifier] = definition
+            self._index = None
+
+    def AddKnownFolderDefinition(self, definition):
+        """Adds a known folder definition.
+
+        Definitions of the same identifier are merged.
+
+        Args:
+          definition (KnownFolderDefinition): known folder definition.
+
+        Raises:
+          ValueError: if the definition cannot be merged with an existing
+              definition of the same identifier.
+        """
+        identifier = definition.identifier.lower()
+        existing_definition = self._known_folders.get(identifier, None)
+        if existing_definition:
+            existing_definition.Merge(definition)
+        else:
+            self._known_folders[identifier] = definition
+        self._index = None
+
+    def AddShellFolderDefinition(self, definition):
+        """Adds a shell folder definition.
+
+        The first definition of an identifier takes precedence.
+
+        Args:
+          definition (ShellFolderDefinition): shell folder definition.
+        """
+        identifier = definition.identifier.lower()
+        if identifier not in self._shell_folders:
+            self._shell_folders[identifier] = definition
+            self._index = None
+
+    def GetControlPanelItemDefinitions(self):
+        """Retrieves the control panel item definitions.
+
+        Returns:
+          list[ControlPanelItemDefinition]: control panel item definitions.
+        """
+        return list(self._control_panel_items.values())
+
+    def GetKnownFolderByCSIDL(self, csidl):
+        """Retrieves a known folder by CSIDL.
+
+        Args:
+          csidl (int|str): CSIDL value, such as 0x0011, which can be combined with
+              CSIDL flags, or CSIDL name, such as "CSIDL_DRIVES".
+
+        Returns:
+          KnownFolderDefinition: known folder definition or None if not available.
+        """
+        if self._index is None:
+            self._BuildIndex()
+
+        if isinstance(csidl, str):
+            csidl = self._CSIDL_VALUES.get(csidl.upper(), None)
+            if csidl is None:
+                return None
+
+        return self._known_folders_per_csidl.get(csidl & ~self._CSIDL_FLAG_MASK, None)
+
+    def GetKnownFolderByName(self, name):
+        """Retrieves a known folder by name.
+
+        Args:
+          name (str): name of the known folder, such as "FOLDERID_Desktop",
+              which is case-insensitive.
+
+        Returns:
+          KnownFolderDefinition: known folder definition or None if not available.
+        """
+        if self._index is None:
+            self._BuildIndex()
+
+        return self._known_folders_per_name.get(name.lower(), None)
+
+    def GetKnownFoldersByDisplayName(self, display_name):
+        """Retrieves known folders by display name.
+
+        The display name is compared case-insensitive and with consecutive white
+        space collapsed, to the display name, legacy display name and alternate
+        display names of the known folders.
+
+        Args:
+          display_name (str): display name, such as "My Computer".
+
+        Returns:
+          list[KnownFolderDefinition]: known folder definitions, where those of
+              which the display name matches come before those of which the
+              legacy or an alternate display name matches.
+        """
+        if self._index is None:
+            self._BuildIndex()
+
+        candidates = self._known_folders_per_display_name.get(
+            self._NormalizeDisplayName(display_name), []
+        )
+        return list(candidates)
+
+    def GetKnownFolderDefinitions(self):
+        """Retrieves the known folder definitions.
+
+        Returns:
+          list[KnownFolderDefinition]: known folder definitions.
+        """
+        return list(self._known_folders.values())
+
+    def GetShellFolderDefinitions(self):
+        """Retrieves the shell folder definitions.
+
+        Returns:
+          list[ShellFolderDefinition]: shell folder definitions.
+        """
+        return list(self._shell_folders.values())
+
+    def ReadFromDirectory(self, path):
+        """Reads the definitions files from a directory, such as winshlrc/data.
+
+        Definitions files that are not present in the directory are ignored.
+
+        Args:
+          path (str): path of the directory with the definitions files.
+        """
+        for filename, definitions_file, add_function in (
+            (
+                "defined_controlpanel_items.yaml",
+                yaml_definitions_file.YAMLControlPanelItemsDefinitionsFile(),
+                self.AddControlPanelItemDefinition,
+            ),
+            (
+                "observed_controlpanel_items.yaml",
+                yaml_definitions_file.YAMLControlPanelItemsDefinitionsFile(),
+                self.AddControlPanelItemDefinition,
+            ),
+            (
+                "legacy_controlpanel_items.yaml",
+                yaml_definitions_file.YAMLControlPanelItemsDefinitionsFile(),
+                self.AddControlPanelItemDefinition,
+            ),
+            (
+                "defined_knownfolders.yaml",
+                yaml_definitions_file.YAMLKnownFoldersDefinitionsFile(),
+                self.AddKnownFolderDefinition,
+            ),
+            (
+                "observed_knownfolders.yaml",
+                yaml_definitions_file.YAMLKnownFoldersDefinitionsFile(),
+                self.AddKnownFolderDefinition,
+            ),
+            (
+                "observed_shellfolders.yaml",
+                yaml_definitions_file.YAMLShellFoldersDefinitionsFile(),
+                self.AddShellFolderDefinition,
+            ),
+        ):
+            definitions_path = os.path.join(path, filename)
+            if os.path.exists(definitions_path):
+                for definition in definitions_file.ReadFromFile(definitions_path):
+                    add_function(definition)
+
+    def ResolveIdentifier(self, identifier):
+        """Resolves a single identifier.
+
+        Args:
+          identifier (bytes): 16-byte little endian GUID.
+
+        Returns:
+          tuple[int, str]: resource type flags and name or None if not available.
+        """
+        if self._index is None:
+            self._BuildIndex()
+
+        resource_types, name_index = self._index.get(identifier, (0, -1))
+        if name_index == -1:
+            return resource_types, None
+
+        return resource_types, self._names[name_index]
+
+    def ResolveIdentifiers(self, identifiers):
+        """Resolves identifiers.
+
+        Args:
+          identifiers (bytes|numpy.ndarray): contiguous buffer of 16-byte little
+              endian GUIDs, such as a bytes object or a NumPy array of N x 16
+              bytes.
+
+        Returns:
+          tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: resource type
+              flags, name index, where -1 represents no name, and known mask per
+              identifier. The arrays are of type array.array instead if NumPy is
+              not available.
+
+        Raises:
+          ValueError: if the size of the buffer is not a multiple of 16.
+        """
+        if self._index is None:
+            self._BuildIndex()
+
+        if not numpy:
+            return self._ResolveIdentifiersWithoutNumPy(identifiers)
+
+        upper, lower = self._GetIdentifierHalves(identifiers)
+
+        if not self._index:
+            return (
+                numpy.zeros(upper.size, dtype=numpy.uint8),
+                numpy.full(upper.size, -1, dtype=numpy.int32),
+                numpy.zeros(upper.size, dtype=numpy.bool_),
+            )
+
+        hashes = upper ^ (lower * self._hash_multiplier)
+
+        positions = numpy.searchsorted(self._index_hashes, hashes)
+        numpy.minimum(positions, self._index_hashes.size - 1, out=positions)
+
+        known = (self._index_upper[positions] == upper) & (
+            self._index_lower[positions] == lower
+        )
+        name_indexes = numpy.where(known, self._index_name_indexes[positions], -1)
+        resource_types = numpy.where(known, self._index_resource_types[positions], 0)
+
+        return (
+            resource_types.astype(numpy.uint8, copy=False),
+            name_indexes.astype(numpy.int32, copy=False),
+            known,
+        )
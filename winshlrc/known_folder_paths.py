@@ -0,0 +1,292 @@
+"""Classifier of file paths by known folder."""
+
+import re
+
+
+class KnownFolderPathClassifier:
+    """Classifier of file paths by known folder.
+
+    The classifier expands the default paths of known folders, such as
+    "%APPDATA%\\Microsoft\\Windows\\AccountPictures", with the environment
+    variables of the system and of every user profile, and stores the expanded
+    paths in a trie of case-insensitive path segments. A file path is classified
+    by walking the trie along its path segments, where the deepest known folder
+    on the way is the longest matching prefix, hence the cost of classifying
+    a path depends on its number of path segments and not on the number of
+    known folders.
+
+    An environment variable that cannot be expanded and makes up a whole path
+    segment, such as "%CODEPAGE%" in "%windir%\\resources\\%CODEPAGE%", matches
+    any path segment, where a path segment that matches exactly takes
+    precedence. Paths with other unexpanded environment variables are ignored.
+    """
+
+    # Default environment variables of the system, as of Windows Vista.
+    _SYSTEM_ENVIRONMENT_VARIABLES = {
+        "ALLUSERSPROFILE": "%SystemDrive%\\ProgramData",
+        "ProgramData": "%SystemDrive%\\ProgramData",
+        "ProgramFiles": "%SystemDrive%\\Program Files",
+        "ProgramFiles(x86)": "%SystemDrive%\\Program Files (x86)",
+        "PUBLIC": "%SystemDrive%\\Users\\Public",
+        "SystemDrive": "C:",
+        "SystemRoot": "%SystemDrive%\\Windows",
+        "windir": "%SystemDrive%\\Windows",
+    }
+
+    # Default environment variables of a user profile, as of Windows Vista.
+    _USER_ENVIRONMENT_VARIABLES = {
+        "APPDATA": "%USERPROFILE%\\AppData\\Roaming",
+        "LOCALAPPDATA": "%USERPROFILE%\\AppData\\Local",
+        "USERPROFILE": "%SystemDrive%\\Users\\%USERNAME%",
+    }
+
+    _ENVIRONMENT_VARIABLE_RE = re.compile(r"%([^%\\]+)%")
+
+    # Maximum number of times environment variables are expanded, to prevent
+    # environment variables that refer to each other from looping forever.
+    _MAXIMUM_EXPANSION_DEPTH = 8
+
+    # Key of the values of a known folder in a trie node, which cannot be a path
+    # segment since empty path segments are ignored.
+    _VALUES_KEY = ""
+
+    # Key of a path segment that matches any path segment, which cannot be
+    # a Windows path segment since "*" is not allowed in file names.
+    _WILDCARD_KEY = "*"
+
+    def __init__(self, environment_variables=None):
+        """Initializes a classifier of file paths by known folder.
+
+        Args:
+          environment_variables (Optional[dict[str, str]]): environment variables
+              of the system, such as {"SystemDrive": "D:"}, which override
+              the default environment variables of the system.
+        """
+        super().__init__()
+        self._environment_variables = self._GetEnvironmentVariables(
+            self._SYSTEM_ENVIRONMENT_VARIABLES, environment_variables
+        )
+        self._known_folders = []
+        self._trie = None
+        self._user_profiles = []
+
+    def _AddPath(self, trie, path, values):
+        """Adds an expanded path of a known folder to a trie.
+
+        A path that was added before keeps its values.
+
+        Args:
+          trie (dict[str, object]): root node of the trie.
+          path (str): expanded path of the known folder.
+          values (tuple[str, str]): identifier of the known folder and username
+              of the user profile or None if not specific to a user profile.
+        """
+        node = trie
+        for path_segment in self._GetPathSegments(path):
+            if self._ENVIRONMENT_VARIABLE_RE.fullmatch(path_segment):
+                path_segment = self._WILDCARD_KEY
+            else:
+                path_segment = path_segment.lower()
+
+            node = node.setdefault(path_segment, {})
+
+        if node is not trie:
+            node.setdefault(self._VALUES_KEY, values)
+
+    def _BuildTrie(self):
+        """Builds the trie of the expanded known folder paths."""
+        trie = {}
+
+        # Default paths take precedence over legacy default paths, which are
+        # therefore added afterwards.
+        for attribute_name in ("default_path", "legacy_default_path"):
+            for definition in self._known_folders:
+                path = getattr(definition, attribute_name, None)
+                if not path:
+                    continue
+
+                # A path that contains the environment variables of a user
+                # profile is added per user profile, otherwise only once.
+                expanded_path = self._ExpandPath(path, self._environment_variables)
+                if self._IsExpanded(expanded_path):
+                    self._AddPath(trie, expanded_path, (definition.identifier, None))
+                    continue
+
+                for username, environment_variables in self._user_profiles:
+                    expanded_path = self._ExpandPath(path, environment_variables)
+                    if self._IsExpanded(expanded_path):
+                        self._AddPath(
+                            trie, expanded_path, (definition.identifier, username)
+                        )
+
+        self._trie = trie
+
+    def _ExpandPath(self, path, environment_variables):
+        """Expands the environment variables in a path.
+
+        Args:
+          path (str): path with environment variables, such as
+              "%APPDATA%\\Microsoft".
+          environment_variables (dict[str, str]): environment variables, where
+              the names are in lower case.
+
+        Returns:
+          str: path where the known environment variables are expanded.
+        """
+        for _ in range(self._MAXIMUM_EXPANSION_DEPTH):
+            expanded_path = self._ENVIRONMENT_VARIABLE_RE.sub(
+                lambda match: environment_variables.get(
+                    match.group(1).lower(), match.group(0)
+                ),
+                path,
+            )
+            if expanded_path == path:
+                break
+            path = expanded_path
+
+        return path
+
+    def _GetEnvironmentVariables(self, *environment_variables_sets):
+        """Retrieves environment variables with names in lower case.
+
+        Args:
+          environment_variables_sets (list[dict[str, str]]): environment
+              variables, where variables of a later set override those of
+              an earlier set with the same name. A set can be None.
+
+        Returns:
+          dict[str, str]: environment variables, where the names are in lower
+              case.
+        """
+        environment_variables = {}
+        for environment_variables_set in environment_variables_sets:
+            for name, value in (environment_variables_set or {}).items():
+                environment_variables[name.lower()] = value
+
+        return environment_variables
+
+    def _GetPathSegments(self, path):
+        """Retrieves the path segments of a path.
+
+        Args:
+          path (str): path, such as "C:\\Users\\Public".
+
+        Returns:
+          list[str]: path segments, without empty path segments and the "\\\\?\\"
+              prefix of long paths.
+        """
+        path_segments = [
+            path_segment
+            for path_segment in path.replace("/", "\\").split("\\")
+            if path_segment
+        ]
+        if path_segments and path_segments[0] == "?":
+            path_segments.pop(0)
+
+        return path_segments
+
+    def _IsExpanded(self, path):
+        """Determines if a path can be added to the trie.
+
+        Args:
+          path (str): path with expanded environment variables.
+
+        Returns:
+          bool: True if every environment variable that was not expanded makes
+              up a whole path segment.
+        """
+        for path_segment in self._GetPathSegments(path):
+            if "%" in path_segment and not self._ENVIRONMENT_VARIABLE_RE.fullmatch(
+                path_segment
+            ):
+                return False
+
+        # A path that starts with an environment variable that was not expanded,
+        # such as %USERPROFILE%, would match too many paths.
+        return not path.startswith("%")
+
+    def AddKnownFolderDefinition(self, definition):
+        """Adds a known folder definition.
+
+        Args:
+          definition (KnownFolderDefinition): known folder definition.
+        """
+        self._known_folders.append(definition)
+        self._trie = None
+
+    def AddUserProfile(self, username, environment_variables=None):
+        """Adds a user profile.
+
+        Args:
+          username (str): username of the user profile.
+          environment_variables (Optional[dict[str, str]]): environment variables
+              of the user profile, such as {"USERPROFILE": "C:\\Documents and
+              Settings\\username"}, which override the default environment
+              variables of a user profile.
+        """
+        environment_variables = self._GetEnvironmentVariables(
+            self._environment_variables,
+            self._USER_ENVIRONMENT_VARIABLES,
+            {"USERNAME": username},
+            environment_variables,
+        )
+        self._user_profiles.append((username, environment_variables))
+        self._trie = None
+
+    def ClassifyPath(self, path):
+        """Classifies a file path by known folder.
+
+        Args:
+          path (str): file path, such as "C:\\Users\\username\\AppData\\Roaming\\
+              Microsoft\\Windows\\AccountPictures\\image.jpg".
+
+        Returns:
+          tuple[str, str, str]: identifier of the known folder, the remainder of
+              the path relative to the known folder and username of the user
+              profile or None if not specific to a user profile, or None if
+              the path is not in a known folder.
+        """
+        if self._trie is None:
+            self._BuildTrie()
+
+        path_segments = self._GetPathSegments(path)
+
+        node = self._trie
+        values = None
+        values_depth = 0
+
+        for depth, path_segment in enumerate(path_segments):
+            next_node = node.get(path_segment.lower(), None)
+            if next_node is None:
+                next_node = node.get(self._WILDCARD_KEY, None)
+                if next_node is None:
+                    break
+
+            node = next_node
+            if self._VALUES_KEY in node:
+                values = node[self._VALUES_KEY]
+                values_depth = depth + 1
+
+        if not values:
+            return None
+
+        identifier, username = values
+        return identifier, "\\".join(path_segments[values_depth:]), username
+
+    def ClassifyPaths(self, paths):
+        """Classifies file paths by known folder.
+
+        Args:
+          paths (iterable[str]): file paths.
+
+        Yields:
+          tuple[str, tuple[str, str, str]]: file path and the identifier of
+              the known folder, the remainder of the path relative to the known
+              folder and username of the user profile or None if not specific to
+              a user profile, or None if the path is not in a known folder.
+        """
+        if self._trie is None:
+            self._BuildTrie()
+
+        for path in paths:
+            yield path, self.ClassifyPath(path)
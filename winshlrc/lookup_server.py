@@ -0,0 +1,312 @@
+"""Lookup server of the Windows shell knowledge base."""
+
+import json
+import logging
+import os
+import socketserver
+import threading
+import uuid
+
+import yaml
+
+from winshlrc import knowledge_base as knowledge_base_module
+
+
+class LookupService:
+    """Lookup service of the Windows shell knowledge base.
+
+    The lookup service answers requests that consist of a single JSON object,
+    such as:
+
+    {"identifier": "20d04fe0-3aea-1069-a2d8-08002b30309d"}
+    {"id": 2, "identifiers": ["20d04fe0-3aea-1069-a2d8-08002b30309d", ...]}
+
+    Where:
+    * id, optional value that is copied to the response, to correlate pipelined
+      requests and responses;
+    * identifier, defines a single GUID to look up;
+    * identifiers, defines a batch of GUIDs to look up.
+
+    The response of a single GUID is a JSON object with the keys "identifier",
+    "known", "name" and "types", and that of a batch of GUIDs a JSON object
+    with a "results" key that contains such an object per GUID. The response
+    of an invalid request is a JSON object with an "error" key.
+
+    The knowledge base is read from the definitions files in a directory and
+    is reloaded when these files change. A reloaded knowledge base replaces the
+    previous one only after it has been read and indexed, hence a request is
+    always answered by a complete knowledge base.
+    """
+
+    # Names of the resource type flags.
+    RESOURCE_TYPE_NAMES = knowledge_base_module.RESOURCE_TYPE_NAMES
+
+    def __init__(self, path, reload_interval=5.0):
+        """Initializes a lookup service.
+
+        Args:
+          path (str): path of the directory with the definitions files.
+          reload_interval (Optional[float]): interval, in seconds, to check the
+              definitions files for changes.
+        """
+        super().__init__()
+        self._files_fingerprint = None
+        self._knowledge_base = None
+        self._path = path
+        self._reload_interval = reload_interval
+        self._reload_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._watcher_thread = None
+
+    @property
+    def knowledge_base(self):
+        """WindowsShellKnowledgeBase: knowledge base or None if not loaded."""
+        return self._knowledge_base
+
+    def _GetFilesFingerprint(self):
+        """Retrieves a fingerprint of the definitions files.
+
+        Returns:
+          tuple[tuple[str, int, int], ...]: name, size and modification time of
+              the definitions files.
+        """
+        fingerprint = []
+        with os.scandir(self._path) as directory_entries:
+            for directory_entry in directory_entries:
+                if directory_entry.name.endswith(".yaml"):
+                    stat_object = directory_entry.stat()
+                    fingerprint.append(
+                        (
+                            directory_entry.name,
+                            stat_object.st_size,
+                            stat_object.st_mtime_ns,
+                        )
+                    )
+
+        return tuple(sorted(fingerprint))
+
+    def _GetIdentifierResult(self, current_knowledge_base, identifier):
+        """Retrieves the result of looking up an identifier.
+
+        Args:
+          current_knowledge_base (WindowsShellKnowledgeBase): knowledge base.
+          identifier (str): identifier, such as a GUID string.
+
+        Returns:
+          dict[str, object]: result of the look up.
+
+        Raises:
+          ValueError: if the identifier is not a GUID string.
+        """
+        if not isinstance(identifier, str):
+            raise ValueError("Unsupported identifier type.")
+
+        identifier_bytes = uuid.UUID(identifier).bytes_le
+        resource_types, name = current_knowledge_base.ResolveIdentifier(
+            identifier_bytes
+        )
+
+        type_names = [
+            type_name
+            for resource_type, type_name in self.RESOURCE_TYPE_NAMES.items()
+            if resource_types & resource_type
+        ]
+
+        return {
+            "identifier": identifier,
+            "known": bool(resource_types),
+            "name": name,
+            "types": type_names,
+        }
+
+    def _WatchFiles(self):
+        """Reloads the knowledge base when the definitions files change."""
+        while not self._stop_event.wait(self._reload_interval):
+            self.ReloadIfChanged()
+
+    def HandleRequest(self, request):
+        """Handles a request.
+
+        Args:
+          request (bytes): request, which consists of a single JSON object.
+
+        Returns:
+          bytes: response, which consists of a single JSON object followed by
+              a line feed.
+        """
+        # Requests that arrive during a reload are answered by the knowledge base
+        # that was current at the start of the request.
+        current_knowledge_base = self._knowledge_base
+
+        response = {}
+        try:
+            if not current_knowledge_base:
+                raise ValueError("Knowledge base not loaded.")
+
+            request = json.loads(request)
+            if not isinstance(request, dict):
+                raise ValueError("Unsupported request type.")
+
+            if "id" in request:
+                response["id"] = request["id"]
+
+            if "identifier" in request:
+                response.update(
+                    self._GetIdentifierResult(
+                        current_knowledge_base, request["identifier"]
+                    )
+                )
+
+            elif isinstance(request.get("identifiers"), list):
+                response["results"] = [
+                    self._GetIdentifierResult(current_knowledge_base, identifier)
+                    for identifier in request["identifiers"]
+                ]
+
+            else:
+                raise ValueError("Missing identifier or identifiers.")
+
+        except ValueError as exception:
+            # Note that json.JSONDecodeError is a subclass of ValueError.
+            response["error"] = str(exception)
+
+        return json.dumps(response).encode("utf-8") + b"\n"
+
+    def Reload(self):
+        """Reloads the knowledge base from the definitions files.
+
+        Returns:
+          bool: True if the knowledge base was reloaded, False if the definitions
+              files could not be read, in which case the current knowledge base
+              remains in use.
+        """
+        with self._reload_lock:
+            files_fingerprint = None
+            try:
+                files_fingerprint = self._GetFilesFingerprint()
+
+                new_knowledge_base = knowledge_base_module.WindowsShellKnowledgeBase()
+                new_knowledge_base.ReadFromDirectory(self._path)
+
+                # Note that number_of_identifiers builds the index, so that the
+                # index does not need to be built by the first request.
+                number_of_identifiers = new_knowledge_base.number_of_identifiers
+
+            except (OSError, RuntimeError, ValueError, yaml.YAMLError) as exception:
+                logging.error(
+                    f"Unable to read definitions files from: {self._path:s} with "
+                    f"error: {exception!s}"
+                )
+                # The definitions files are not read again until they change.
+                if files_fingerprint:
+                    self._files_fingerprint = files_fingerprint
+                return False
+
+            self._files_fingerprint = files_fingerprint
+            self._knowledge_base = new_knowledge_base
+
+        logging.info(
+            f"Loaded {number_of_identifiers:d} identifiers from: {self._path:s}"
+        )
+        return True
+
+    def ReloadIfChanged(self):
+        """Reloads the knowledge base if the definitions files have changed.
+
+        Returns:
+          bool: True if the knowledge base was reloaded.
+        """
+        try:
+            files_fingerprint = self._GetFilesFingerprint()
+        except OSError:
+            return False
+
+        if files_fingerprint == self._files_fingerprint:
+            return False
+
+        return self.Reload()
+
+    def Start(self):
+        """Loads the knowledge base and starts watching the definitions files.
+
+        Returns:
+          bool: True if the knowledge base was loaded.
+        """
+        if not self.Reload():
+            return False
+
+        if self._reload_interval and not self._watcher_thread:
+            self._stop_event.clear()
+            self._watcher_thread = threading.Thread(
+                target=self._WatchFiles, name="definitions-watcher", daemon=True
+            )
+            self._watcher_thread.start()
+
+        return True
+
+    def Stop(self):
+        """Stops watching the definitions files."""
+        self._stop_event.set()
+        if self._watcher_thread:
+            self._watcher_thread.join()
+            self._watcher_thread = None
+
+
+class LookupRequestHandler(socketserver.StreamRequestHandler):
+    """Lookup request handler.
+
+    A connection carries a sequence of requests, one per line, and the responses
+    are written in the same order, hence a client can send multiple requests
+    without waiting for the responses.
+    """
+
+    def handle(self):
+        """Handles the requests of a connection."""
+        lookup_service = self.server.lookup_service
+        for line in self.rfile:
+            if line.strip():
+                self.wfile.write(lookup_service.HandleRequest(line))
+
+
+class TCPLookupServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    """Lookup server that listens on a localhost TCP port.
+
+    Attributes:
+      lookup_service (LookupService): lookup service.
+    """
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, port, lookup_service):
+        """Initializes a lookup server.
+
+        Args:
+          port (int): TCP port to listen on, where 0 represents a port chosen by
+              the operating system.
+          lookup_service (LookupService): lookup service.
+        """
+        super().__init__(("127.0.0.1", port), LookupRequestHandler)
+        self.lookup_service = lookup_service
+
+
+if hasattr(socketserver, "UnixStreamServer"):
+
+    class UnixLookupServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        """Lookup server that listens on a Unix domain socket.
+
+        Attributes:
+          lookup_service (LookupService): lookup service.
+        """
+
+        daemon_threads = True
+
+        def __init__(self, path, lookup_service):
+            """Initializes a lookup server.
+
+            Args:
+              path (str): path of the Unix domain socket.
+              lookup_service (LookupService): lookup service.
+            """
+            super().__init__(path, LookupRequestHandler)
+            self.lookup_service = lookup_service
@@ -0,0 +1,318 @@
+"""Fuzzy search of definitions by name."""
+
+import array
+import collections
+import heapq
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from winshlrc import knowledge_base as knowledge_base_module
+
+
+class NameSearchIndex:
+    """Fuzzy search index of definitions by name.
+
+    The index contains the names of control panel item, known folder and shell
+    folder definitions, such as the module name of a control panel item and
+    the display name of a known folder, and maps every trigram, a sequence of
+    3 characters, of a name to the names that contain it. A query is answered
+    by counting the trigrams every name has in common with the query, hence
+    only names that share at least one trigram with the query are considered.
+
+    Names are ranked by the Dice coefficient of their trigrams and those of
+    the query, which is 1.0 for identical names, and is tolerant of truncated,
+    misspelled or partially localized names.
+
+    If NumPy is available the common trigrams are counted in an array of
+    counters, one per name, and the scores are computed for all names at once.
+    Otherwise they are counted with a dictionary.
+    """
+
+    def __init__(self):
+        """Initializes a fuzzy search index of definitions by name."""
+        super().__init__()
+        self._entries = set()
+        self._entry_identifiers = []
+        self._entry_names = []
+        self._entry_number_of_trigrams = array.array("I")
+        self._maximum_number_of_names_per_identifier = 0
+        self._number_of_names_per_identifier = {}
+        self._numpy_entry_number_of_trigrams = None
+        self._numpy_trigrams = None
+        self._resource_types_per_identifier = {}
+        self._trigrams = {}
+
+    @property
+    def number_of_names(self):
+        """int: number of names in the index."""
+        return len(self._entry_names)
+
+    def _AddName(self, identifier, resource_type, name):
+        """Adds a name of a definition.
+
+        Args:
+          identifier (str): identifier of the definition.
+          resource_type (int): resource type of the definition.
+          name (str): name of the definition or None if not available.
+        """
+        identifier = identifier.lower()
+        self._resource_types_per_identifier[identifier] = (
+            self._resource_types_per_identifier.get(identifier, 0) | resource_type
+        )
+
+        # Names that reference a string resource, such as "@shell32.dll,-1",
+        # are not meaningful without the resource file.
+        if not name or name[0] == "@":
+            return
+
+        trigrams = self._GetTrigrams(name)
+        if not trigrams or (identifier, name) in self._entries:
+            return
+
+        self._entries.add((identifier, name))
+        self._numpy_trigrams = None
+
+        number_of_names = self._number_of_names_per_identifier.get(identifier, 0) + 1
+        self._number_of_names_per_identifier[identifier] = number_of_names
+        self._maximum_number_of_names_per_identifier = max(
+            self._maximum_number_of_names_per_identifier, number_of_names
+        )
+
+        entry_index = len(self._entry_names)
+        self._entry_identifiers.append(identifier)
+        self._entry_names.append(name)
+        self._entry_number_of_trigrams.append(len(trigrams))
+
+        for trigram in trigrams:
+            postings = self._trigrams.get(trigram, None)
+            if postings is None:
+                postings = array.array("I")
+                self._trigrams[trigram] = postings
+            postings.append(entry_index)
+
+    def _GetEntryScores(self, name, minimum_score, maximum_number_of_entries):
+        """Retrieves the scores of the names that are most similar to a name.
+
+        Args:
+          name (str): name to search for.
+          minimum_score (float): minimum score of a name.
+          maximum_number_of_entries (int): maximum number of names.
+
+        Returns:
+          list[tuple[float, int]]: score and index of the names with the highest
+              scores, of at least the minimum score.
+        """
+        query_trigrams = self._GetTrigrams(name)
+        if not query_trigrams:
+            return []
+
+        if numpy:
+            return self._GetEntryScoresWithNumPy(
+                query_trigrams, minimum_score, maximum_number_of_entries
+            )
+
+        counts = collections.Counter()
+        for trigram in query_trigrams:
+            postings = self._trigrams.get(trigram, None)
+            if postings:
+                counts.update(postings)
+
+        number_of_query_trigrams = len(query_trigrams)
+
+        entry_scores = []
+        for entry_index, number_of_common_trigrams in counts.items():
+            score = (2.0 * number_of_common_trigrams) / (
+                number_of_query_trigrams + self._entry_number_of_trigrams[entry_index]
+            )
+            if score >= minimum_score:
+                entry_scores.append((score, entry_index))
+
+        if len(entry_scores) > maximum_number_of_entries:
+            entry_scores = heapq.nlargest(maximum_number_of_entries, entry_scores)
+
+        return entry_scores
+
+    def _GetEntryScoresWithNumPy(
+        self, query_trigrams, minimum_score, maximum_number_of_entries
+    ):
+        """Retrieves the scores of the names that are most similar to a query.
+
+        Args:
+          query_trigrams (set[str]): trigrams of the query.
+          minimum_score (float): minimum score of a name.
+          maximum_number_of_entries (int): maximum number of names.
+
+        Returns:
+          list[tuple[float, int]]: score and index of the names with the highest
+              scores, of at least the minimum score.
+        """
+        if self._numpy_trigrams is None:
+            self._numpy_entry_number_of_trigrams = numpy.array(
+                self._entry_number_of_trigrams, dtype=numpy.float64
+            )
+            self._numpy_trigrams = {
+                trigram: numpy.array(postings, dtype=numpy.intp)
+                for trigram, postings in self._trigrams.items()
+            }
+
+        counts = numpy.zeros(len(self._entry_names), dtype=numpy.float64)
+        for trigram in query_trigrams:
+            postings = self._numpy_trigrams.get(trigram, None)
+            if postings is not None:
+                # A name contains a trigram only once, hence postings does not
+                # contain duplicate indexes.
+                counts[postings] += 1.0
+
+        scores = (2.0 * counts) / (
+            len(query_trigrams) + self._numpy_entry_number_of_trigrams
+        )
+        entry_indexes = numpy.flatnonzero(scores >= minimum_score)
+        if entry_indexes.size > maximum_number_of_entries:
+            highest_scores = numpy.argpartition(
+                -scores[entry_indexes], maximum_number_of_entries - 1
+            )
+            entry_indexes = entry_indexes[highest_scores[:maximum_number_of_entries]]
+
+        return list(zip(scores[entry_indexes].tolist(), entry_indexes.tolist()))
+
+    def _GetTrigrams(self, name):
+        """Retrieves the trigrams of a name.
+
+        The name is normalized, by case folding and collapsing consecutive white
+        space, and padded with a space on both sides, so that the start and end
+        of a word are trigrams as well.
+
+        Args:
+          name (str): name.
+
+        Returns:
+          set[str]: trigrams of the name.
+        """
+        normalized_name = " ".join(name.split()).casefold()
+        if not normalized_name:
+            return set()
+
+        padded_name = f" {normalized_name:s} "
+        return {padded_name[index : index + 3] for index in range(len(padded_name) - 2)}
+
+    def AddControlPanelItemDefinition(self, definition):
+        """Adds the names of a control panel item definition.
+
+        Args:
+          definition (ControlPanelItemDefinition): control panel item definition.
+        """
+        resource_type = knowledge_base_module.RESOURCE_TYPE_CONTROL_PANEL_ITEM
+        for name in [definition.name, definition.module_name] + list(
+            definition.alternate_module_names or []
+        ):
+            self._AddName(definition.identifier, resource_type, name)
+
+    def AddKnownFolderDefinition(self, definition):
+        """Adds the names of a known folder definition.
+
+        Args:
+          definition (KnownFolderDefinition): known folder definition.
+        """
+        resource_type = knowledge_base_module.RESOURCE_TYPE_KNOWN_FOLDER
+        for name in [
+            definition.name,
+            definition.display_name,
+            definition.legacy_display_name,
+        ] + list(definition.alternate_display_names or []):
+            self._AddName(definition.identifier, resource_type, name)
+
+    def AddShellFolderDefinition(self, definition):
+        """Adds the names of a shell folder definition.
+
+        Args:
+          definition (ShellFolderDefinition): shell folder definition.
+        """
+        resource_type = knowledge_base_module.RESOURCE_TYPE_SHELL_FOLDER
+        for name in [definition.name, definition.class_name] + list(
+            definition.alternate_names or []
+        ):
+            self._AddName(definition.identifier, resource_type, name)
+
+    def AddKnowledgeBase(self, knowledge_base):
+        """Adds the names of the definitions of a knowledge base.
+
+        Args:
+          knowledge_base (WindowsShellKnowledgeBase): knowledge base.
+        """
+        for definition in knowledge_base.GetControlPanelItemDefinitions():
+            self.AddControlPanelItemDefinition(definition)
+
+        for definition in knowledge_base.GetKnownFolderDefinitions():
+            self.AddKnownFolderDefinition(definition)
+
+        for definition in knowledge_base.GetShellFolderDefinitions():
+            self.AddShellFolderDefinition(definition)
+
+    def Search(self, query, maximum_number_of_results=10, minimum_score=0.3):
+        """Searches the index for definitions with a name similar to the query.
+
+        If the query is a path, such as "Control Panel\\All Tasks", the last path
+        segment of the query is searched for as well.
+
+        Args:
+          query (str): name to search for.
+          maximum_number_of_results (Optional[int]): maximum number of results.
+          minimum_score (Optional[float]): minimum score of a result, where 1.0
+              represents an identical name.
+
+        Returns:
+          list[tuple[float, str, int, str]]: score, identifier, resource type
+              flags and most similar name per definition, from the highest score
+              to the lowest.
+        """
+        if maximum_number_of_results <= 0:
+            return []
+
+        # The names with the highest scores contain those of the definitions
+        # with the highest scores, when every definition has all its names
+        # among them.
+        maximum_number_of_entries = maximum_number_of_results * max(
+            self._maximum_number_of_names_per_identifier, 1
+        )
+
+        entry_scores = self._GetEntryScores(
+            query, minimum_score, maximum_number_of_entries
+        )
+
+        _, _, last_path_segment = query.rstrip("\\").rpartition("\\")
+        if last_path_segment and last_path_segment != query:
+            entry_scores.extend(
+                self._GetEntryScores(
+                    last_path_segment, minimum_score, maximum_number_of_entries
+                )
+            )
+
+        # The names are sorted by score, so that the first name of an identifier
+        # has its highest score and the search can stop as soon as enough
+        # identifiers have been found.
+        entry_scores.sort(key=lambda entry_score: (-entry_score[0], entry_score[1]))
+
+        results = []
+        identifiers = set()
+        for score, entry_index in entry_scores:
+            identifier = self._entry_identifiers[entry_index]
+            if identifier in identifiers:
+                continue
+
+            if len(results) >= maximum_number_of_results:
+                break
+
+            identifiers.add(identifier)
+            results.append(
+                (
+                    score,
+                    identifier,
+                    self._resource_types_per_identifier[identifier],
+                    self._entry_names[entry_index],
+                )
+            )
+
+        return results
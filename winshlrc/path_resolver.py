@@ -0,0 +1,138 @@
+"""Windows path resolver for a directory of resource files."""
+
+import os
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as dfvfs_path_spec_factory
+
+
+class ResourceDirectoryPathResolver:
+    """Windows path resolver for a directory of resource files.
+
+    Triage collections commonly contain resource files, such as shell32.dll,
+    without the directory structure of the Windows volume they were extracted
+    from. A Windows path is resolved by matching the longest trailing part of
+    the path, case-insensitive, to a path relative to the directory. For
+    example "%SystemRoot%\\System32\\en-US\\shell32.dll.mui" resolves to
+    "en-US/shell32.dll.mui" in the directory.
+    """
+
+    def __init__(self, path):
+        """Initializes a Windows path resolver.
+
+        Args:
+          path (str): path of the directory with resource files or None if
+              no resource files are available.
+        """
+        super().__init__()
+        self._entry_names_per_directory = {}
+        self._path = os.path.abspath(path) if path else None
+
+    def _GetEntryNames(self, path):
+        """Retrieves the names of the entries in a directory.
+
+        Args:
+          path (str): path of the directory.
+
+        Returns:
+          dict[str, str]: names of the directory entries per lower case name,
+              which is empty if the directory does not exist.
+        """
+        entry_names = self._entry_names_per_directory.get(path)
+        if entry_names is None:
+            try:
+                entry_names = {name.lower(): name for name in os.listdir(path)}
+            except OSError:
+                entry_names = {}
+
+            self._entry_names_per_directory[path] = entry_names
+
+        return entry_names
+
+    def _ResolvePathSegments(self, path_segments):
+        """Resolves path segments relative to the directory.
+
+        Args:
+          path_segments (list[str]): path segments.
+
+        Returns:
+          str: path of the corresponding file or directory or None if not
+              available.
+        """
+        path = self._path
+        for path_segment in path_segments:
+            name = self._GetEntryNames(path).get(path_segment.lower())
+            if not name:
+                return None
+
+            path = os.path.join(path, name)
+
+        return path
+
+    def GetWindowsPath(self, path_spec):
+        """Returns the Windows path based on a resolved path specification.
+
+        Args:
+          path_spec (dfvfs.PathSpec): path specification.
+
+        Returns:
+          str: Windows path relative to the directory or None if the path
+              specification is not within the directory.
+        """
+        location = getattr(path_spec, "location", None)
+        if not self._path or not location:
+            return None
+
+        relative_path = os.path.relpath(location, self._path)
+        if relative_path.startswith(os.pardir):
+            return None
+
+        return "\\".join(relative_path.split(os.sep))
+
+    def ResolveDirectory(self, path):
+        """Resolves the Windows path of a directory.
+
+        A directory of which no trailing part can be resolved, such as
+        "%SystemRoot%\\System32\\en-US" when the resource files are stored
+        directly in the directory, resolves to the directory itself.
+
+        Args:
+          path (str): Windows path to resolve.
+
+        Returns:
+          dfvfs.PathSpec: path specification of the directory or None if no
+              resource files are available.
+        """
+        path_spec = self.ResolvePath(path)
+        if not path_spec and self._path:
+            path_spec = dfvfs_path_spec_factory.Factory.NewPathSpec(
+                dfvfs_definitions.TYPE_INDICATOR_OS, location=self._path
+            )
+
+        return path_spec
+
+    def ResolvePath(self, path):
+        """Resolves a Windows path to a file in the directory.
+
+        Args:
+          path (str): Windows path to resolve.
+
+        Returns:
+          dfvfs.PathSpec: path specification of the file or directory or None
+              if the path cannot be resolved.
+        """
+        if not self._path:
+            return None
+
+        path_segments = [
+            path_segment for path_segment in path.split("\\") if path_segment
+        ]
+
+        for index in range(len(path_segments)):
+            location = self._ResolvePathSegments(path_segments[index:])
+            if location:
+                return dfvfs_path_spec_factory.Factory.NewPathSpec(
+                    dfvfs_definitions.TYPE_INDICATOR_OS, location=location
+                )
+
+        return None
@@ -0,0 +1,232 @@
+"""Shared cache of Windows Registry files."""
+
+from dfimagetools import windows_registry
+
+from dfwinreg import registry as dfwinreg_registry
+
+
+class SharedCREGWindowsRegistryFile(windows_registry.CREGWindowsRegistryFile):
+    """Windows 9x/Me Registry file (CREG) that is shared by means of a cache."""
+
+    def Close(self):
+        """Closes the Windows Registry file.
+
+        A shared Windows Registry file is closed by the cache when it is no
+        longer used, hence this method does nothing.
+        """
+
+    def CloseShared(self):
+        """Closes the shared Windows Registry file."""
+        super().Close()
+
+
+class SharedREGFWindowsRegistryFile(windows_registry.REGFWindowsRegistryFile):
+    """Windows NT Registry file (REGF) that is shared by means of a cache."""
+
+    def Close(self):
+        """Closes the Windows Registry file.
+
+        A shared Windows Registry file is closed by the cache when it is no
+        longer used, hence this method does nothing.
+        """
+
+    def CloseShared(self):
+        """Closes the shared Windows Registry file."""
+        super().Close()
+
+
+class WindowsRegistryFileCache:
+    """Reference counted cache of Windows Registry files.
+
+    A Windows Registry file is identified by the path specification of the file,
+    which includes the file system it is stored in, and the ASCII codepage it
+    was opened with. A Windows Registry file is referenced once per user, such
+    as a Windows Registry file reader, and closed when the last user releases
+    it.
+    """
+
+    def __init__(self):
+        """Initializes a Windows Registry file cache."""
+        super().__init__()
+        self._cache_keys_per_user = {}
+        self._registry_files = {}
+        self._users_per_cache_key = {}
+
+    @property
+    def number_of_files(self):
+        """int: number of open Windows Registry files in the cache."""
+        return len(self._registry_files)
+
+    def AcquireFile(self, user, cache_key):
+        """Acquires a cached Windows Registry file.
+
+        Args:
+          user (object): user of the Windows Registry file.
+          cache_key (tuple[str, str]): comparable of the path specification and
+              ASCII codepage of the Windows Registry file.
+
+        Returns:
+          dfwinreg.WinRegistryFile: Windows Registry file or None if not cached.
+        """
+        registry_file = self._registry_files.get(cache_key)
+        if registry_file:
+            self._cache_keys_per_user.setdefault(id(user), set()).add(cache_key)
+            self._users_per_cache_key[cache_key].add(id(user))
+
+        return registry_file
+
+    def AddFile(self, user, cache_key, registry_file):
+        """Adds a Windows Registry file to the cache.
+
+        Args:
+          user (object): user of the Windows Registry file.
+          cache_key (tuple[str, str]): comparable of the path specification and
+              ASCII codepage of the Windows Registry file.
+          registry_file (dfwinreg.WinRegistryFile): shared Windows Registry file
+              that provides a CloseShared() method.
+
+        Raises:
+          KeyError: if the cache already contains a Windows Registry file with
+              the same cache key.
+        """
+        if cache_key in self._registry_files:
+            raise KeyError("Windows Registry file already cached.")
+
+        self._registry_files[cache_key] = registry_file
+        self._users_per_cache_key[cache_key] = set()
+
+        self.AcquireFile(user, cache_key)
+
+    def ReleaseFiles(self, user):
+        """Releases the Windows Registry files of a user.
+
+        Windows Registry files that are no longer used are closed.
+
+        Args:
+          user (object): user of the Windows Registry files.
+        """
+        for cache_key in self._cache_keys_per_user.pop(id(user), []):
+            users = self._users_per_cache_key[cache_key]
+            users.discard(id(user))
+            if not users:
+                del self._users_per_cache_key[cache_key]
+
+                registry_file = self._registry_files.pop(cache_key)
+                registry_file.CloseShared()
+
+
+class CachedWindowsRegistryFileReader(
+    windows_registry.StorageMediaImageWindowsRegistryFileReader
+):
+    """Storage media image Windows Registry file reader that uses a cache."""
+
+    def __init__(self, file_system, path_resolver, registry_file_cache):
+        """Initializes a storage media Windows Registry file reader.
+
+        Args:
+          file_system (dfvfs.FileSystem): file system that contains the Windows
+              directory.
+          path_resolver (dfvfs.WindowsPathResolver): Windows path resolver or None
+              if Windows Registry files can only be opened by path specification.
+          registry_file_cache (WindowsRegistryFileCache): Windows Registry file
+              cache.
+        """
+        super().__init__(file_system, path_resolver)
+        self._registry_file_cache = registry_file_cache
+
+    def Close(self):
+        """Releases the Windows Registry files opened by the reader."""
+        self._registry_file_cache.ReleaseFiles(self)
+
+    def Open(self, path, ascii_codepage="cp1252"):
+        """Opens the Windows Registry file specified by the path.
+
+        Args:
+          path (str): path of the Windows Registry file. The path is a Windows path
+              relative to the root of the file system that contains the specific
+              Windows Registry file. E.g. C:\\Windows\\System32\\config\\SYSTEM
+          ascii_codepage (Optional[str]): ASCII string codepage.
+
+        Returns:
+          dfwinreg.WinRegistryFile: Windows Registry file or None if the file cannot
+              be opened.
+        """
+        if not self._path_resolver:
+            return None
+
+        path_spec = self._path_resolver.ResolvePath(path)
+        if path_spec is None:
+            return None
+
+        return self.OpenPathSpec(path_spec, ascii_codepage=ascii_codepage)
+
+    def OpenPathSpec(self, path_spec, ascii_codepage="cp1252"):
+        """Opens the Windows Registry file specified by the path specification.
+
+        Args:
+          path_spec (dfvfs.PathSpec): path specification of the Windows Registry
+              file.
+          ascii_codepage (Optional[str]): ASCII string codepage.
+
+        Returns:
+          dfwinreg.WinRegistryFile: Windows Registry file or None if the file cannot
+              be opened.
+        """
+        cache_key = (path_spec.comparable, ascii_codepage)
+
+        registry_file = self._registry_file_cache.AcquireFile(self, cache_key)
+        if registry_file:
+            return registry_file
+
+        file_object = self._file_system.GetFileObjectByPathSpec(path_spec)
+        if file_object is None:
+            return None
+
+        try:
+            signature = file_object.read(4)
+
+            if signature == b"regf":
+                registry_file = SharedREGFWindowsRegistryFile(
+                    ascii_codepage=ascii_codepage
+                )
+            else:
+                registry_file = SharedCREGWindowsRegistryFile(
+                    ascii_codepage=ascii_codepage
+                )
+
+            # Note that registry_file takes over management of file_object.
+            registry_file.Open(file_object)
+
+        except OSError:
+            file_object.close()
+            return None
+
+        self._registry_file_cache.AddFile(self, cache_key, registry_file)
+
+        return registry_file
+
+
+class CachedWinRegistry(dfwinreg_registry.WinRegistry):
+    """Windows Registry that shares its files by means of a cache.
+
+    The Windows Registry files are released to the cache of the Windows Registry
+    file reader when the Windows Registry is closed.
+    """
+
+    def __del__(self):
+        """Cleans up the Windows Registry object."""
+        self.Close()
+
+    def Close(self):
+        """Closes the Windows Registry."""
+        self._registry_files = {}
+        self._root_key = None
+        self._user_registry_files = {}
+
+        if self._registry_file_reader:
+            self._registry_file_reader.Close()
+
+
+# Windows Registry files cache that is shared by the Windows Registry volume
+# scanner and Windows shell extractor by default.
+DEFAULT_REGISTRY_FILE_CACHE = WindowsRegistryFileCache()
@@ -1,6 +1,8 @@
 """Windows Resource file."""
 
+import io
 import logging
+import mmap
 
 import pyexe
 import pywrc
@@ -13,40 +15,227 @@ class WindowsResourceFile:
       windows_path (str): Windows path of the resource file.
     """
 
+    # The maximum size of a resource section that is read into memory.
+    _MAXIMUM_READ_AHEAD_SIZE = 32 * 1024 * 1024
+
+    _MUI_RESOURCE_NAME = "MUI"
     _STRING_TABLE_RESOURCE_IDENTIFIER = 0x06
     _VERSION_INFORMATION_RESOURCE_IDENTIFIER = 0x10
 
+    _RESOURCE_CLASSES = {
+        _MUI_RESOURCE_NAME: pywrc.mui_resource,
+        _STRING_TABLE_RESOURCE_IDENTIFIER: pywrc.string_table_resource,
+        _VERSION_INFORMATION_RESOURCE_IDENTIFIER: pywrc.version_information_resource,
+    }
+
     def __init__(
         self,
         windows_path,
         ascii_codepage="cp1252",
+        maximum_read_ahead_size=_MAXIMUM_READ_AHEAD_SIZE,
         preferred_language_identifier=0x0409,
+        read_ahead=False,
     ):
         """Initializes the Windows Resource file.
 
         Args:
           windows_path (str): normalized version of the Windows path.
           ascii_codepage (Optional[str]): ASCII string codepage.
+          maximum_read_ahead_size (Optional[int]): maximum size of the resource
+              section that is read into memory, where larger resource sections
+              are read on demand.
           preferred_language_identifier (Optional[int]): preferred language
               identifier (LCID).
+          read_ahead (Optional[bool]): True if the resource section should be read
+              into memory when the file is opened.
         """
         super().__init__()
         self._ascii_codepage = ascii_codepage
+        self._decoded_resources = {}
         self._exe_file = pyexe.file()
         self._exe_file.set_ascii_codepage(self._ascii_codepage)
         self._exe_section = None
         self._file_object = None
         self._file_version = None
         self._is_open = False
+        self._mapped_file_object = None
+        self._maximum_read_ahead_size = maximum_read_ahead_size
         self._preferred_language_identifier = preferred_language_identifier
         self._product_version = None
+        self._read_ahead = read_ahead
+        self._resource_sub_items = {}
+        self._section_file_object = None
+        self._string_tables = {}
+        self._version_information_read = False
         # TODO: wrc stream set codepage?
         self._wrc_stream = pywrc.stream()
 
         self.windows_path = windows_path
 
+    def _GetDecodedResource(self, resource_identifier, item_identifier=None):
+        """Retrieves a decoded resource.
+
+        Decoded resources, including resources that could not be decoded, are
+        cached.
+
+        Args:
+          resource_identifier (int|str): identifier or name of the resource type.
+          item_identifier (Optional[int]): identifier of the resource item, where
+              None represents any resource item.
+
+        Returns:
+          object: decoded resource, such as pywrc.mui_resource, or None if not
+              available.
+        """
+        lookup_key = (resource_identifier, item_identifier)
+        if lookup_key in self._decoded_resources:
+            return self._decoded_resources[lookup_key]
+
+        decoded_resource = None
+
+        wrc_resource_sub_item = self._GetPreferredResourceSubItem(
+            resource_identifier, item_identifier=item_identifier
+        )
+        if wrc_resource_sub_item:
+            resource_data = wrc_resource_sub_item.read()
+
+            decoded_resource = self._RESOURCE_CLASSES[resource_identifier]()
+            try:
+                if item_identifier is None:
+                    decoded_resource.copy_from_byte_stream(resource_data)
+                else:
+                    decoded_resource.copy_from_byte_stream(
+                        resource_data, item_identifier
+                    )
+
+            except OSError as exception:
+                logging.warning(
+                    f"Unable to decode resource: {resource_identifier!s} in resource "
+                    f"file: {self.windows_path:s} with error: {exception!s}"
+                )
+                decoded_resource = None
+
+        self._decoded_resources[lookup_key] = decoded_resource
+
+        return decoded_resource
+
+    def _GetPreferredResourceSubItem(self, resource_identifier, item_identifier=None):
+        """Retrieves the resource sub item of the preferred language.
+
+        Args:
+          resource_identifier (int|str): identifier or name of the resource type.
+          item_identifier (Optional[int]): identifier of the resource item, where
+              None represents any resource item.
+
+        Returns:
+          pywrc.resource_item: resource sub item of the preferred language, the
+              first resource sub item if the preferred language is not available
+              or None if not available.
+        """
+        first_wrc_resource_sub_item = None
+
+        resource_sub_items = self._GetResourceSubItems(resource_identifier)
+        if item_identifier is not None:
+            sub_items_per_language = resource_sub_items.get(item_identifier, {})
+            resource_sub_items = {item_identifier: sub_items_per_language}
+
+        for sub_items_per_language in resource_sub_items.values():
+            wrc_resource_sub_item = sub_items_per_language.get(
+                self._preferred_language_identifier
+            )
+            if wrc_resource_sub_item:
+                return wrc_resource_sub_item
+
+            if not first_wrc_resource_sub_item and sub_items_per_language:
+                first_wrc_resource_sub_item = next(
+                    iter(sub_items_per_language.values())
+                )
+
+        return first_wrc_resource_sub_item
+
+    def _GetResource(self, resource_identifier):
+        """Retrieves a resource.
+
+        Args:
+          resource_identifier (int|str): identifier or name of the resource type.
+
+        Returns:
+          pywrc.resource: resource or None if not available.
+        """
+        if not self._wrc_stream:
+            return None
+
+        try:
+            if isinstance(resource_identifier, str):
+                return self._wrc_stream.get_resource_by_name(resource_identifier)
+
+            return self._wrc_stream.get_resource_by_identifier(resource_identifier)
+
+        except OSError:
+            return None
+
+    def _GetResourceSubItems(self, resource_identifier):
+        """Retrieves the resource sub items of a resource.
+
+        The resource sub items are indexed once per resource type.
+
+        Args:
+          resource_identifier (int|str): identifier or name of the resource type.
+
+        Returns:
+          dict[int, dict[int, pywrc.resource_item]]: resource sub items per
+              language identifier (LCID) per resource item identifier.
+        """
+        resource_sub_items = self._resource_sub_items.get(resource_identifier)
+        if resource_sub_items is None:
+            resource_sub_items = {}
+
+            wrc_resource = self._GetResource(resource_identifier)
+            if wrc_resource:
+                for wrc_resource_item in wrc_resource.items:
+                    sub_items_per_language = resource_sub_items.setdefault(
+                        wrc_resource_item.identifier, {}
+                    )
+                    for wrc_resource_sub_item in wrc_resource_item.sub_items:
+                        sub_items_per_language.setdefault(
+                            wrc_resource_sub_item.identifier, wrc_resource_sub_item
+                        )
+
+            self._resource_sub_items[resource_identifier] = resource_sub_items
+
+        return resource_sub_items
+
+    def _GetStringTable(self, item_identifier):
+        """Retrieves the strings of a string table resource item.
+
+        Args:
+          item_identifier (int): identifier of the string table resource item.
+
+        Returns:
+          dict[int, str]: strings per string identifier.
+        """
+        strings = self._string_tables.get(item_identifier)
+        if strings is None:
+            strings = {}
+
+            string_table_resource = self._GetDecodedResource(
+                self._STRING_TABLE_RESOURCE_IDENTIFIER, item_identifier=item_identifier
+            )
+            if string_table_resource:
+                for index in range(string_table_resource.number_of_strings):
+                    string_identifier = string_table_resource.get_string_identifier(
+                        index
+                    )
+                    strings[string_identifier] = string_table_resource.get_string(index)
+
+            self._string_tables[item_identifier] = strings
+
+        return strings
+
     def _GetVersionInformation(self):
         """Determines the file and product version."""
+        self._version_information_read = True
+
         version_information_resource = self._GetVersionInformationResource()
         if not version_information_resource:
             return
@@ -87,47 +276,24 @@ class WindowsResourceFile:
           pywrc.version_information_resource: version information resource or None
               if not available.
         """
-        preferred_wrc_resource_sub_item = None
-
-        wrc_resource = self._wrc_stream.get_resource_by_identifier(
-            self._VERSION_INFORMATION_RESOURCE_IDENTIFIER
-        )
-        if wrc_resource:
-            first_wrc_resource_sub_item = None
-            for wrc_resource_item in wrc_resource.items:
-                for wrc_resource_sub_item in wrc_resource_item.sub_items:
-                    if not first_wrc_resource_sub_item:
-                        first_wrc_resource_sub_item = wrc_resource_sub_item
-
-                    language_identifier = wrc_resource_sub_item.identifier
-                    if language_identifier == self._preferred_language_identifier:
-                        if not preferred_wrc_resource_sub_item:
-                            preferred_wrc_resource_sub_item = wrc_resource_sub_item
-
-            if not preferred_wrc_resource_sub_item:
-                preferred_wrc_resource_sub_item = first_wrc_resource_sub_item
-
-        if not preferred_wrc_resource_sub_item:
-            return None
-
-        resource_data = preferred_wrc_resource_sub_item.read()
-
-        version_information_resource = pywrc.version_information_resource()
-        version_information_resource.copy_from_byte_stream(resource_data)
-
-        return version_information_resource
+        return self._GetDecodedResource(self._VERSION_INFORMATION_RESOURCE_IDENTIFIER)
 
     @property
     def file_version(self):
         """str: the file version."""
-        if self._file_version is None:
+        if not self._version_information_read:
             self._GetVersionInformation()
         return self._file_version
 
+    @property
+    def number_of_decoded_string_tables(self):
+        """int: number of string table resource items that have been decoded."""
+        return len(self._string_tables)
+
     @property
     def product_version(self):
         """str: the product version."""
-        if self._product_version is None:
+        if not self._version_information_read:
             self._GetVersionInformation()
         return self._product_version
 
@@ -143,10 +309,20 @@ class WindowsResourceFile:
         if self._exe_section:
             self._wrc_stream.close()
 
+        self._section_file_object = None
+
         self._exe_file.close()
+        self._decoded_resources = {}
         self._file_object = None
         self._is_open = False
 
+        if self._mapped_file_object:
+            self._mapped_file_object.close()
+            self._mapped_file_object = None
+
+        self._resource_sub_items = {}
+        self._string_tables = {}
+
     def GetMUILanguage(self):
         """Retrieves the MUI language.
 
@@ -165,33 +341,23 @@ class WindowsResourceFile:
         Returns:
           pywrc.mui_resource: MUI resource or None if not available.
         """
-        preferred_wrc_resource_sub_item = None
-
-        wrc_resource = self._wrc_stream.get_resource_by_name("MUI")
-        if wrc_resource:
-            first_wrc_resource_sub_item = None
-            for wrc_resource_item in wrc_resource.items:
-                for wrc_resource_sub_item in wrc_resource_item.sub_items:
-                    if not first_wrc_resource_sub_item:
-                        first_wrc_resource_sub_item = wrc_resource_sub_item
-
-                    language_identifier = wrc_resource_sub_item.identifier
-                    if language_identifier == self._preferred_language_identifier:
-                        if not preferred_wrc_resource_sub_item:
-                            preferred_wrc_resource_sub_item = wrc_resource_sub_item
+        return self._GetDecodedResource(self._MUI_RESOURCE_NAME)
 
-            if not preferred_wrc_resource_sub_item:
-                preferred_wrc_resource_sub_item = first_wrc_resource_sub_item
+    def GetString(self, string_identifier):
+        """Retrieves a string from the string table resource.
 
-        if not preferred_wrc_resource_sub_item:
-            return None
-
-        resource_data = preferred_wrc_resource_sub_item.read()
+        Args:
+          string_identifier (int): string identifier.
 
-        mui_resource = pywrc.mui_resource()
-        mui_resource.copy_from_byte_stream(resource_data)
+        Returns:
+          str: string or None if not available.
+        """
+        # A string table resource item contains 16 strings where the item
+        # identifier is 1 more than the string identifier divided by 16.
+        item_identifier = (string_identifier // 16) + 1
 
-        return mui_resource
+        strings = self._GetStringTable(item_identifier)
+        return strings.get(string_identifier)
 
     def GetStringTableResource(self):
         """Retrieves the string table resource.
@@ -200,9 +366,7 @@ class WindowsResourceFile:
           pywrc.resource: resource containing the string table resource or None
               if not available.
         """
-        return self._wrc_stream.get_resource_by_identifier(
-            self._STRING_TABLE_RESOURCE_IDENTIFIER
-        )
+        return self._GetResource(self._STRING_TABLE_RESOURCE_IDENTIFIER)
 
     def HasStringTableResource(self):
         """Determines if the resource file as a string table resource.
@@ -210,16 +374,40 @@ class WindowsResourceFile:
         Returns:
           bool: True if the resource file as a string table resource.
         """
-        wrc_resource = None
-        if self._wrc_stream:
+        return bool(self._GetResourceSubItems(self._STRING_TABLE_RESOURCE_IDENTIFIER))
+
+    def Open(self, path):
+        """Opens the Windows Resource file using a path.
+
+        The file is memory mapped so that reads of the PE/COFF headers and
+        resource section do not require a system call each.
+
+        Args:
+          path (str): path of the file in the operating system.
+
+        Raises:
+          OSError: if already open or the file cannot be opened.
+        """
+        if self._is_open:
+            raise OSError("Already open.")
+
+        with open(path, "rb") as file_object:
             try:
-                wrc_resource = self._wrc_stream.get_resource_by_identifier(
-                    self._STRING_TABLE_RESOURCE_IDENTIFIER
+                mapped_file_object = mmap.mmap(
+                    file_object.fileno(), 0, access=mmap.ACCESS_READ
                 )
-            except OSError:
-                pass
+            except ValueError as exception:
+                raise OSError(
+                    f"Unable to map file: {path:s} with error: {exception!s}"
+                ) from exception
+
+        try:
+            self.OpenFileObject(mapped_file_object)
+        except OSError:
+            mapped_file_object.close()
+            raise
 
-        return bool(wrc_resource)
+        self._mapped_file_object = mapped_file_object
 
     def OpenFileObject(self, file_object):
         """Opens the Windows Resource file using a file-like object.
@@ -237,8 +425,20 @@ class WindowsResourceFile:
         self._exe_section = self._exe_file.get_section_by_name(".rsrc")
 
         if self._exe_section:
+            section_file_object = self._exe_section
+
+            # Reading the resource section at once prevents the resource data from
+            # being read with many small reads, which can be expensive for
+            # compressed storage media image formats.
+            section_size = self._exe_section.size
+            if self._read_ahead and section_size <= self._maximum_read_ahead_size:
+                section_data = self._exe_section.read_buffer_at_offset(section_size, 0)
+                section_file_object = io.BytesIO(section_data)
+
             self._wrc_stream.set_virtual_address(self._exe_section.virtual_address)
-            self._wrc_stream.open_file_object(self._exe_section)
+            self._wrc_stream.open_file_object(section_file_object)
+
+            self._section_file_object = section_file_object
 
         self._file_object = file_object
         self._is_open = True
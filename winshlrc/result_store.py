@@ -0,0 +1,214 @@
+"""SQLite-based store of extraction results."""
+
+import time
+
+from winshlrc import sqlite_store
+
+
+class ExtractionResultStore(sqlite_store.SQLiteStore):
+    """SQLite-based store of extraction results.
+
+    The store contains the shell folders extracted per volume of a source, such
+    as a storage media image, together with the Windows version of the volume
+    and the localized string the name of a shell folder was resolved from.
+    Every extraction run is appended to the store, hence results of earlier
+    runs remain available.
+
+    The shell folders of a volume are written in a single transaction and
+    the tables are indexed by shell folder identifier and Windows version, so
+    that questions such as "which sources contain shell folder X" do not
+    require scanning the store.
+    """
+
+    _DESCRIPTION = "result store"
+
+    _FORMAT_VERSION = 1
+
+    # Write-ahead logging allows the store to be queried while an extraction
+    # run appends to it.
+    _PRAGMAS = [
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA foreign_keys=ON",
+    ]
+
+    _SCHEMA = [
+        (
+            "CREATE TABLE IF NOT EXISTS metadata ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        ),
+        (
+            "CREATE TABLE IF NOT EXISTS runs ("
+            "run_identifier INTEGER PRIMARY KEY, start_time REAL NOT NULL)"
+        ),
+        (
+            "CREATE TABLE IF NOT EXISTS volumes ("
+            "volume_row INTEGER PRIMARY KEY, "
+            "run_identifier INTEGER NOT NULL REFERENCES runs(run_identifier), "
+            "source TEXT NOT NULL, "
+            "volume_identifier TEXT NOT NULL, "
+            "detected_windows_version TEXT, "
+            "windows_version TEXT)"
+        ),
+        (
+            "CREATE TABLE IF NOT EXISTS shell_folders ("
+            "volume_row INTEGER NOT NULL REFERENCES volumes(volume_row), "
+            "identifier TEXT NOT NULL, "
+            "class_name TEXT, "
+            "name TEXT, "
+            "localized_string TEXT)"
+        ),
+        (
+            "CREATE INDEX IF NOT EXISTS shell_folders_identifier "
+            "ON shell_folders(identifier, volume_row)"
+        ),
+        (
+            "CREATE INDEX IF NOT EXISTS shell_folders_volume_row "
+            "ON shell_folders(volume_row)"
+        ),
+        "CREATE INDEX IF NOT EXISTS volumes_source ON volumes(source)",
+        (
+            "CREATE INDEX IF NOT EXISTS volumes_windows_version "
+            "ON volumes(windows_version)"
+        ),
+    ]
+
+    def AddVolume(
+        self,
+        run_identifier,
+        source,
+        volume_identifier,
+        shell_folders,
+        detected_windows_version=None,
+        windows_version=None,
+    ):
+        """Adds the shell folders extracted from a volume.
+
+        Args:
+          run_identifier (int): identifier of the extraction run.
+          source (str): source, such as the path of a storage media image.
+          volume_identifier (str): identifier of the volume within the source,
+              such as "p1/vss2", or an empty string if not available.
+          shell_folders (list[ShellFolder]): shell folders extracted from
+              the volume.
+          detected_windows_version (Optional[str]): Windows version detected on
+              the volume.
+          windows_version (Optional[str]): Windows version of the volume, which
+              can differ from the detected Windows version if it was provided
+              by the user.
+
+        Returns:
+          int: row of the volume in the store.
+        """
+        rows = []
+        for shell_folder in shell_folders:
+            identifier, *values = shell_folder.CopyToValues()
+            rows.append((identifier.lower(), *values))
+
+        with self._connection:
+            cursor = self._connection.execute(
+                (
+                    "INSERT INTO volumes (run_identifier, source, volume_identifier, "
+                    "detected_windows_version, windows_version) "
+                    "VALUES (?, ?, ?, ?, ?)"
+                ),
+                (
+                    run_identifier,
+                    source,
+                    volume_identifier or "",
+                    detected_windows_version,
+                    windows_version,
+                ),
+            )
+            volume_row = cursor.lastrowid
+
+            self._connection.executemany(
+                (
+                    "INSERT INTO shell_folders (volume_row, identifier, class_name, "
+                    "name, localized_string) VALUES (?, ?, ?, ?, ?)"
+                ),
+                [(volume_row, *row) for row in rows],
+            )
+
+        return volume_row
+
+    def GetNamesPerWindowsVersion(self, identifier):
+        """Retrieves the names of a shell folder per Windows version.
+
+        Args:
+          identifier (str): identifier (GUID) of the shell folder.
+
+        Returns:
+          dict[str, list[str]]: names of the shell folder per Windows version,
+              where the Windows version is an empty string if not available.
+        """
+        names_per_windows_version = {}
+
+        for windows_version, name in self._connection.execute(
+            (
+                "SELECT DISTINCT volumes.windows_version, shell_folders.name "
+                "FROM shell_folders "
+                "JOIN volumes ON volumes.volume_row = shell_folders.volume_row "
+                "WHERE shell_folders.identifier = ? AND shell_folders.name IS NOT NULL "
+                "ORDER BY volumes.windows_version, shell_folders.name"
+            ),
+            (identifier.lower(),),
+        ):
+            names_per_windows_version.setdefault(windows_version or "", []).append(name)
+
+        return names_per_windows_version
+
+    def GetShellFolders(self):
+        """Retrieves the shell folders of all the volumes in the store.
+
+        Yields:
+          tuple[str, str, str, str, str, str, str]: source, volume identifier,
+              Windows version, identifier, class name, name and localized string
+              of the shell folder.
+        """
+        yield from self._connection.execute(
+            (
+                "SELECT volumes.source, volumes.volume_identifier, "
+                "volumes.windows_version, shell_folders.identifier, "
+                "shell_folders.class_name, shell_folders.name, "
+                "shell_folders.localized_string "
+                "FROM shell_folders "
+                "JOIN volumes ON volumes.volume_row = shell_folders.volume_row "
+                "ORDER BY shell_folders.volume_row"
+            )
+        )
+
+    def GetVolumesWithShellFolder(self, identifier):
+        """Retrieves the volumes that contain a shell folder.
+
+        Args:
+          identifier (str): identifier (GUID) of the shell folder.
+
+        Returns:
+          list[tuple[str, str, str]]: source, volume identifier and Windows
+              version of the volumes.
+        """
+        return self._connection.execute(
+            (
+                "SELECT DISTINCT volumes.source, volumes.volume_identifier, "
+                "volumes.windows_version "
+                "FROM shell_folders "
+                "JOIN volumes ON volumes.volume_row = shell_folders.volume_row "
+                "WHERE shell_folders.identifier = ? "
+                "ORDER BY volumes.source, volumes.volume_identifier"
+            ),
+            (identifier.lower(),),
+        ).fetchall()
+
+    def StartRun(self):
+        """Starts an extraction run.
+
+        Returns:
+          int: identifier of the extraction run.
+        """
+        with self._connection:
+            cursor = self._connection.execute(
+                "INSERT INTO runs (start_time) VALUES (?)", (time.time(),)
+            )
+
+        return cursor.lastrowid
@@ -0,0 +1,251 @@
+"""Persistent cache of volume scan results."""
+
+import json
+import logging
+import os
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.resolver import resolver as dfvfs_resolver
+from dfvfs.serializer import json_serializer as dfvfs_json_serializer
+
+
+class ScanResultCache:
+    """Persistent cache of volume scan results.
+
+    The cache stores the source type and the resolved file system path
+    specifications of a source, such as a storage media image, so that
+    subsequent runs over the same source can skip the dfVFS source scan.
+    A cached scan result is identified by the absolute path, size and
+    modification time of the source and the volume scanner options that
+    select the partitions, snapshots and volumes, so that it is invalidated
+    when the source or the selection changes.
+
+    Scan results with an encrypted volume are not cached, since the scan
+    unlocks the volume, for example by prompting for a password.
+    """
+
+    _FORMAT_VERSION = 1
+
+    # Names of the volume scanner options that determine the scan result.
+    _SCAN_OPTION_NAMES = ("partitions", "scan_mode", "snapshots", "volumes")
+
+    def __init__(self, path):
+        """Initializes a scan result cache.
+
+        Args:
+          path (str): path of the cache file.
+        """
+        super().__init__()
+        self._path = path
+        self._scan_results = None
+
+    def _GetSourceValues(self, source_path):
+        """Retrieves the values that identify a source.
+
+        Args:
+          source_path (str): source path.
+
+        Returns:
+          tuple[str, int, int]: absolute source path, size and modification time
+              in nanoseconds or None if the source does not exist.
+        """
+        try:
+            stat_object = os.stat(source_path)
+        except OSError:
+            return None
+
+        return (
+            os.path.abspath(source_path),
+            stat_object.st_size,
+            stat_object.st_mtime_ns,
+        )
+
+    def _GetScanOptions(self, options):
+        """Retrieves the volume scanner options that determine a scan result.
+
+        Args:
+          options (dfvfs.VolumeScannerOptions): volume scanner options.
+
+        Returns:
+          dict[str, object]: values of the volume scanner options, as stored in
+              the cache file, per name.
+        """
+        scan_options = {
+            name: getattr(options, name, None) for name in self._SCAN_OPTION_NAMES
+        }
+        # Convert the values, such as tuples, to their JSON equivalent.
+        return json.loads(json.dumps(scan_options))
+
+    def _HasEncryptedVolume(self, path_specs):
+        """Determines if path specifications contain an encrypted volume.
+
+        Args:
+          path_specs (list[dfvfs.PathSpec]): path specifications.
+
+        Returns:
+          bool: True if one of the path specifications contains a volume that
+              can be encrypted.
+        """
+        for path_spec in path_specs:
+            while path_spec:
+                if (
+                    path_spec.type_indicator
+                    in dfvfs_definitions.TYPE_INDICATORS_WITH_ENCRYPTION_SUPPORT
+                ):
+                    return True
+
+                path_spec = path_spec.parent
+
+        return False
+
+    def _ReadScanResults(self):
+        """Reads the scan results from the cache file.
+
+        Returns:
+          dict[str, dict[str, object]]: scan result values per absolute source path.
+        """
+        if self._scan_results is None:
+            self._scan_results = {}
+
+            try:
+                with open(self._path, "r", encoding="utf-8") as file_object:
+                    json_dict = json.load(file_object)
+
+            except FileNotFoundError:
+                json_dict = None
+
+            except (OSError, ValueError) as exception:
+                logging.warning(
+                    f"Unable to read scan result cache: {self._path:s} with error: "
+                    f"{exception!s}"
+                )
+                json_dict = None
+
+            if (
+                isinstance(json_dict, dict)
+                and json_dict.get("format_version") == self._FORMAT_VERSION
+            ):
+                self._scan_results = json_dict.get("scan_results") or {}
+
+        return self._scan_results
+
+    def _WriteScanResults(self):
+        """Writes the scan results to the cache file.
+
+        The cache file is replaced atomically so that concurrent readers never
+        observe a partially written file.
+        """
+        json_dict = {
+            "format_version": self._FORMAT_VERSION,
+            "scan_results": self._scan_results,
+        }
+
+        directory_name = os.path.dirname(os.path.abspath(self._path))
+        temporary_path = f"{self._path:s}.{os.getpid():d}.tmp"
+
+        try:
+            os.makedirs(directory_name, exist_ok=True)
+
+            with open(temporary_path, "w", encoding="utf-8") as file_object:
+                json.dump(json_dict, file_object, indent=2, sort_keys=True)
+
+            os.replace(temporary_path, self._path)
+
+        except OSError as exception:
+            logging.warning(
+                f"Unable to write scan result cache: {self._path:s} with error: "
+                f"{exception!s}"
+            )
+
+    def GetScanResult(self, source_path, options):
+        """Retrieves a cached scan result.
+
+        Args:
+          source_path (str): source path.
+          options (dfvfs.VolumeScannerOptions): volume scanner options.
+
+        Returns:
+          tuple[str, list[dfvfs.PathSpec]]: source type and file system path
+              specifications of the volumes or None if no valid scan result is
+              cached for the source.
+        """
+        source_values = self._GetSourceValues(source_path)
+        if not source_values:
+            return None
+
+        absolute_path, size, modification_time = source_values
+
+        scan_result = self._ReadScanResults().get(absolute_path)
+        if (
+            not scan_result
+            or scan_result.get("size") != size
+            or scan_result.get("modification_time") != modification_time
+            or scan_result.get("scan_options") != self._GetScanOptions(options)
+        ):
+            return None
+
+        try:
+            path_specs = [
+                dfvfs_json_serializer.JsonPathSpecSerializer.ReadSerialized(json_string)
+                for json_string in scan_result.get("path_specs") or []
+            ]
+        except (TypeError, ValueError):
+            return None
+
+        return scan_result.get("source_type"), path_specs
+
+    def SetScanResult(self, source_path, options, source_type, path_specs):
+        """Caches a scan result.
+
+        Args:
+          source_path (str): source path.
+          options (dfvfs.VolumeScannerOptions): volume scanner options.
+          source_type (str): dfVFS source type.
+          path_specs (list[dfvfs.PathSpec]): file system path specifications
+              of the volumes.
+        """
+        if self._HasEncryptedVolume(path_specs):
+            return
+
+        source_values = self._GetSourceValues(source_path)
+        if not source_values:
+            return
+
+        absolute_path, size, modification_time = source_values
+
+        self._ReadScanResults()[absolute_path] = {
+            "modification_time": modification_time,
+            "path_specs": [
+                dfvfs_json_serializer.JsonPathSpecSerializer.WriteSerialized(path_spec)
+                for path_spec in path_specs
+            ],
+            "scan_options": self._GetScanOptions(options),
+            "size": size,
+            "source_type": source_type,
+        }
+        self._WriteScanResults()
+
+
+def GetKeyChainCredentials(path_specs):
+    """Retrieves the credentials set on the key chain of path specifications.
+
+    The credentials are used to unlock encrypted volumes in a worker process,
+    which does not share the key chain of the parent process.
+
+    Args:
+      path_specs (list[dfvfs.PathSpec]): path specifications.
+
+    Returns:
+      list[tuple[dfvfs.PathSpec, str, object]]: path specification, credential
+          identifier and credential data.
+    """
+    key_chain = dfvfs_resolver.Resolver.key_chain
+
+    credentials = []
+    for path_spec in path_specs:
+        while path_spec:
+            for identifier, data in key_chain.GetCredentials(path_spec).items():
+                credentials.append((path_spec, identifier, data))
+            path_spec = path_spec.parent
+
+    return credentials
@@ -0,0 +1,233 @@
+"""Shared functionality of the console scripts."""
+
+import argparse
+import atexit
+import logging
+import sys
+import time
+
+
+def ConfigureLogging():
+    """Configures logging of a console script.
+
+    This function is also used to configure logging in a worker process, which
+    does not inherit the logging configuration of the parent process when it is
+    started with the "spawn" start method.
+    """
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+
+
+class CLITool:
+    """Command line tool.
+
+    The command line tool provides the argument parser and logging
+    configuration shared by the console scripts, and the options:
+
+    * --profile, to write a cProfile profile of the script to a file;
+    * --trace_memory, to print the top memory allocations at exit;
+    * --timing, to print the wall-clock time per phase at exit.
+
+    A script divides its work into phases by calling StartPhase, where a phase
+    ends when the next phase starts or when the tool is stopped. The tool is
+    stopped at exit or by calling StopInstrumentation.
+
+    The profiling and memory tracing modules are only imported when the
+    corresponding option is used, to keep the start up time of the scripts low.
+
+    Attributes:
+      argument_parser (argparse.ArgumentParser): argument parser.
+    """
+
+    # Number of functions printed of the profile.
+    _NUMBER_OF_PROFILED_FUNCTIONS = 20
+
+    def __init__(self, description):
+        """Initializes a command line tool.
+
+        Args:
+          description (str): description of the tool.
+        """
+        super().__init__()
+        self._phase_name = None
+        self._phase_start_time = None
+        self._phase_times = {}
+        self._profile = None
+        self._profile_path = None
+        self._start_time = None
+        self._stopped = False
+        self._timing = False
+        self._trace_memory = 0
+
+        self.argument_parser = argparse.ArgumentParser(description=description)
+
+        self._AddInstrumentationOptions()
+
+    def _AddInstrumentationOptions(self):
+        """Adds the instrumentation options to the argument parser."""
+        argument_group = self.argument_parser.add_argument_group(
+            "instrumentation arguments"
+        )
+
+        argument_group.add_argument(
+            "--profile",
+            dest="profile",
+            action="store",
+            metavar="PATH",
+            default=None,
+            help=(
+                "path of a file to write a cProfile profile of the script to, "
+                "which can be read with the Python pstats module. Note that "
+                "worker processes are not profiled."
+            ),
+        )
+
+        argument_group.add_argument(
+            "--timing",
+            dest="timing",
+            action="store_true",
+            default=False,
+            help="print the wall-clock time per phase of the script at exit.",
+        )
+
+        argument_group.add_argument(
+            "--trace_memory",
+            "--trace-memory",
+            dest="trace_memory",
+            action="store",
+            type=int,
+            nargs="?",
+            metavar="NUMBER",
+            const=10,
+            default=0,
+            help=(
+                "trace memory allocations and print the source lines with the "
+                "most allocated memory at exit, by default the top 10."
+            ),
+        )
+
+    def _PrintMemoryAllocations(self):
+        """Prints the source lines with the most allocated memory."""
+        import tracemalloc  # pylint: disable=import-outside-toplevel
+
+        snapshot = tracemalloc.take_snapshot()
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        snapshot = snapshot.filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            ]
+        )
+
+        print("Memory allocations:", file=sys.stderr)
+        print(f"\tPeak traced memory: {peak_memory:d} bytes", file=sys.stderr)
+        for statistic in snapshot.statistics("lineno")[: self._trace_memory]:
+            frame = statistic.traceback[0]
+            print(
+                (
+                    f"\t{statistic.size:d} bytes in {statistic.count:d} blocks: "
+                    f"{frame.filename:s}:{frame.lineno:d}"
+                ),
+                file=sys.stderr,
+            )
+
+        print("", file=sys.stderr)
+
+    def _PrintPhaseTimes(self):
+        """Prints the wall-clock time per phase."""
+        total_time = time.perf_counter() - self._start_time
+
+        print("Timing:", file=sys.stderr)
+        for name, phase_time in self._phase_times.items():
+            print(f"\t{name:<40s} {phase_time:>10.3f} seconds", file=sys.stderr)
+
+        print(f"\t{'total':<40s} {total_time:>10.3f} seconds", file=sys.stderr)
+        print("", file=sys.stderr)
+
+    def _StopPhase(self):
+        """Stops the current phase."""
+        if self._phase_name:
+            phase_time = time.perf_counter() - self._phase_start_time
+            self._phase_times[self._phase_name] = (
+                self._phase_times.get(self._phase_name, 0.0) + phase_time
+            )
+
+        self._phase_name = None
+        self._phase_start_time = None
+
+    def ParseArguments(self, arguments=None):
+        """Parses the command line arguments and starts the instrumentation.
+
+        Args:
+          arguments (Optional[list[str]]): command line arguments or None to use
+              the arguments of the process.
+
+        Returns:
+          argparse.Namespace: parsed command line arguments.
+        """
+        options = self.argument_parser.parse_args(arguments)
+
+        ConfigureLogging()
+
+        self._profile_path = options.profile
+        self._timing = options.timing
+        self._trace_memory = options.trace_memory
+
+        self._start_time = time.perf_counter()
+
+        # pylint: disable=import-outside-toplevel
+        if self._trace_memory:
+            import tracemalloc
+
+            tracemalloc.start()
+
+        if self._profile_path:
+            import cProfile
+
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+
+        if self._profile or self._timing or self._trace_memory:
+            atexit.register(self.StopInstrumentation)
+
+        return options
+
+    def StartPhase(self, name):
+        """Starts a phase, which stops the current phase.
+
+        Args:
+          name (str): name of the phase, such as "reading definitions".
+        """
+        if self._timing:
+            self._StopPhase()
+
+            self._phase_name = name
+            self._phase_start_time = time.perf_counter()
+
+    def StopInstrumentation(self):
+        """Stops the instrumentation and prints or writes the results."""
+        if self._stopped or self._start_time is None:
+            return
+
+        self._stopped = True
+        atexit.unregister(self.StopInstrumentation)
+
+        if self._profile:
+            import pstats  # pylint: disable=import-outside-toplevel
+
+            self._profile.disable()
+
+            self._profile.dump_stats(self._profile_path)
+
+            print(f"Profile written to: {self._profile_path:s}", file=sys.stderr)
+            stats = pstats.Stats(self._profile, stream=sys.stderr)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE)
+            stats.print_stats(self._NUMBER_OF_PROFILED_FUNCTIONS)
+
+        if self._trace_memory:
+            self._PrintMemoryAllocations()
+
+        if self._timing:
+            self._StopPhase()
+            self._PrintPhaseTimes()
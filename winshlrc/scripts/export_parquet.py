@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Script to export definitions and extraction results to Parquet."""
+
+import logging
+import os
+import sys
+
+import winshlrc
+
+from winshlrc.scripts import cli_tool
+
+
+def Main():
+    """Entry point of console script to export to Parquet.
+
+    Returns:
+      int: exit code that is provided to sys.exit().
+    """
+    tool = cli_tool.CLITool(
+        "Exports the Windows shell knowledge base definitions and the shell "
+        "folders in a result store of extract.py to Parquet files."
+    )
+    argument_parser = tool.argument_parser
+
+    argument_parser.add_argument(
+        "--data",
+        dest="data",
+        action="store",
+        metavar="PATH",
+        default=os.path.join(os.path.dirname(winshlrc.__file__), "data"),
+        help="path of a directory with winshl-kb YAML files.",
+    )
+
+    argument_parser.add_argument(
+        "--result_store",
+        "--result-store",
+        dest="result_store",
+        action="store",
+        metavar="PATH",
+        default=None,
+        help=(
+            "path of a SQLite database, written by the --result_store option of "
+            "extract.py, with the shell folders to export."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--row_group_size",
+        "--row-group-size",
+        dest="row_group_size",
+        action="store",
+        type=int,
+        metavar="NUMBER",
+        default=65536,
+        help="maximum number of rows per Parquet row group.",
+    )
+
+    argument_parser.add_argument(
+        "output",
+        action="store",
+        metavar="PATH",
+        help=(
+            "path of the directory to write definitions.parquet and, if a result "
+            "store is provided, observations.parquet to."
+        ),
+    )
+
+    options = tool.ParseArguments()
+
+    # pylint: disable=import-outside-toplevel
+    from winshlrc import arrow_export
+    from winshlrc import knowledge_base as knowledge_base_module
+    from winshlrc import result_store
+
+    if not arrow_export.pyarrow:
+        print("Missing pyarrow.")
+        print("")
+        return 1
+
+    if options.row_group_size <= 0:
+        print(f"Unsupported row group size: {options.row_group_size:d}")
+        print("")
+        return 1
+
+    if options.result_store and not os.path.isfile(options.result_store):
+        print(f"No such result store: {options.result_store:s}")
+        print("")
+        return 1
+
+    os.makedirs(options.output, exist_ok=True)
+
+    exporter = arrow_export.ArrowExporter(row_group_size=options.row_group_size)
+
+    tool.StartPhase("reading definitions")
+
+    knowledge_base = knowledge_base_module.WindowsShellKnowledgeBase()
+    knowledge_base.ReadFromDirectory(options.data)
+
+    tool.StartPhase("exporting")
+
+    path = os.path.join(options.output, "definitions.parquet")
+    number_of_rows = exporter.WriteDefinitions(knowledge_base, path)
+    logging.info(f"Exported {number_of_rows:d} definitions to: {path:s}")
+
+    if options.result_store:
+        extraction_result_store = result_store.ExtractionResultStore(
+            options.result_store
+        )
+
+        try:
+            extraction_result_store.Open(read_only=True)
+        except OSError as exception:
+            print(f"{exception!s}")
+            print("")
+            return 1
+
+        try:
+            path = os.path.join(options.output, "observations.parquet")
+            number_of_rows = exporter.WriteObservations(
+                extraction_result_store.GetShellFolders(), path
+            )
+        finally:
+            extraction_result_store.Close()
+
+        logging.info(f"Exported {number_of_rows:d} observations to: {path:s}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(Main())
@@ -1,20 +1,324 @@
 #!/usr/bin/env python3
 """Script to extract Windows shell information."""
 
-import argparse
 import logging
 import os
 import sys
+import time
 import yaml
 
-from dfvfs.helpers import command_line as dfvfs_command_line
-from dfvfs.helpers import volume_scanner as dfvfs_volume_scanner
-from dfvfs.lib import errors as dfvfs_errors
-
 import winshlrc
 
-from winshlrc import extractor
+from winshlrc import statistics as statistics_module
 from winshlrc import yaml_definitions_file
+from winshlrc.scripts import cli_tool
+
+
+def ExtractShellFolders(
+    volume_path_specs,
+    collect_statistics=False,
+    credentials=None,
+    debug=False,
+    shell_folder_cache_path=None,
+):
+    """Extracts shell folders from Windows volumes.
+
+    This function is also used to extract shell folders in a worker process.
+
+    Args:
+      volume_path_specs (list[dfvfs.PathSpec]): file system path specifications
+          of the Windows volumes.
+      collect_statistics (Optional[bool]): True if extraction statistics should
+          be collected.
+      credentials (Optional[list[tuple[dfvfs.PathSpec, str, object]]]): path
+          specification, credential identifier and credential data, used to
+          unlock encrypted volumes.
+      debug (Optional[bool]): True if debug information should be printed.
+      shell_folder_cache_path (Optional[str]): path of the persistent shell
+          folder cache or None if shell folders should not be cached between
+          runs.
+
+    Returns:
+      tuple[list[tuple[str, str, list[ShellFolder]]], ExtractionStatistics]:
+          volume identifier, detected Windows version and shell folders per
+          Windows volume and extraction statistics or None if not collected.
+    """
+    # pylint: disable=import-outside-toplevel
+    from dfvfs.resolver import resolver as dfvfs_resolver
+
+    from winshlrc import extractor
+
+    for path_spec, identifier, data in credentials or []:
+        dfvfs_resolver.Resolver.key_chain.SetCredential(path_spec, identifier, data)
+
+    statistics = None
+    if collect_statistics:
+        statistics = statistics_module.ExtractionStatistics()
+
+    shell_folder_cache = OpenShellFolderCache(shell_folder_cache_path)
+
+    extractor_object = extractor.WindowsShellExtractor(
+        debug=debug, shell_folder_cache=shell_folder_cache, statistics=statistics
+    )
+
+    results = []
+    for volume_path_spec in volume_path_specs:
+        if not extractor_object.OpenWindowsVolume(volume_path_spec):
+            continue
+
+        volume_identifier = "/".join(
+            [
+                identifier
+                for identifier in (
+                    extractor_object.GetPartitionIdentifier(volume_path_spec),
+                    extractor_object.GetSnapshotIdentifier(volume_path_spec),
+                )
+                if identifier
+            ]
+        )
+        logging.info(f"Processing volume: {volume_identifier or 'N/A':s}")
+
+        shell_folders = list(extractor_object.CollectShellFolders())
+        results.append(
+            (volume_identifier, extractor_object.windows_version, shell_folders)
+        )
+
+    extractor_object.Close()
+
+    if shell_folder_cache:
+        shell_folder_cache.Close()
+
+    return results, statistics
+
+
+def ExtractShellFoldersFromRegistryFiles(
+    paths,
+    collect_statistics=False,
+    debug=False,
+    resources_path=None,
+    shell_folder_cache_path=None,
+):
+    """Extracts shell folders from standalone Windows Registry files.
+
+    Args:
+      paths (list[str]): paths of the Windows Registry files.
+      collect_statistics (Optional[bool]): True if extraction statistics should
+          be collected.
+      debug (Optional[bool]): True if debug information should be printed.
+      resources_path (Optional[str]): path of a directory with resource files
+          used to resolve localized strings or None if not available.
+      shell_folder_cache_path (Optional[str]): path of the persistent shell
+          folder cache or None if shell folders should not be cached between
+          runs.
+
+    Returns:
+      tuple[list[tuple[str, str, list[ShellFolder]]], ExtractionStatistics]:
+          volume identifier, which is empty, detected Windows version and shell
+          folders, or an empty list if no Windows Registry file with class
+          identifiers could be opened, and extraction statistics or None if not
+          collected.
+    """
+    # pylint: disable=import-outside-toplevel
+    from winshlrc import extractor
+
+    statistics = None
+    if collect_statistics:
+        statistics = statistics_module.ExtractionStatistics()
+
+    shell_folder_cache = OpenShellFolderCache(shell_folder_cache_path)
+
+    extractor_object = extractor.WindowsShellExtractor(
+        debug=debug, shell_folder_cache=shell_folder_cache, statistics=statistics
+    )
+
+    results = []
+    if extractor_object.OpenRegistryFiles(paths, resources_path=resources_path):
+        shell_folders = list(extractor_object.CollectShellFolders())
+        results.append(("", extractor_object.windows_version, shell_folders))
+
+    extractor_object.Close()
+
+    if shell_folder_cache:
+        shell_folder_cache.Close()
+
+    return results, statistics
+
+
+def ExtractSource(
+    source_definition,
+    options,
+    mediator,
+    volume_scanner_options,
+    scan_result_cache=None,
+    statistics=None,
+):
+    """Extracts shell folders from a source.
+
+    Args:
+      source_definition (dict[str, object]): source definition.
+      options (argparse.Namespace): command line arguments.
+      mediator (dfvfs.VolumeScannerMediator): a volume scanner mediator.
+      volume_scanner_options (dfvfs.VolumeScannerOptions): volume scanner
+          options.
+      scan_result_cache (Optional[ScanResultCache]): cache of volume scan results
+          or None if scan results should not be cached.
+      statistics (Optional[ExtractionStatistics]): extraction statistics to
+          update or None if statistics should not be collected.
+
+    Returns:
+      list[tuple[str, str, list[ShellFolder]]]: volume identifier, detected
+          Windows version and shell folders per Windows volume, or an empty list
+          if no Windows volume or Windows Registry file with class identifiers
+          was found.
+    """
+    # pylint: disable=import-outside-toplevel
+    import concurrent.futures
+    import multiprocessing
+
+    from dfvfs.lib import errors as dfvfs_errors
+
+    from winshlrc import extractor
+    from winshlrc import scan_cache
+
+    registry_files = source_definition.get("registry_files")
+    if registry_files:
+        volume_results, volume_statistics = ExtractShellFoldersFromRegistryFiles(
+            registry_files,
+            collect_statistics=options.stats,
+            debug=options.debug,
+            resources_path=source_definition.get("resources"),
+            shell_folder_cache_path=options.shell_folder_cache,
+        )
+        if statistics:
+            statistics.Merge(volume_statistics)
+
+    else:
+        extractor_object = extractor.WindowsShellExtractor(
+            debug=options.debug,
+            mediator=mediator,
+            scan_result_cache=scan_result_cache,
+            statistics=statistics,
+        )
+
+        try:
+            volume_path_specs = extractor_object.GetWindowsVolumePathSpecs(
+                source_definition["source"], options=volume_scanner_options
+            )
+        except dfvfs_errors.ScannerError:
+            volume_path_specs = []
+
+        # The volumes of a partition are extracted by the same extractor so that
+        # the snapshots of a volume can share cached values.
+        path_specs_per_partition = {}
+        for volume_path_spec in volume_path_specs:
+            partition_identifier = extractor_object.GetPartitionIdentifier(
+                volume_path_spec
+            )
+            path_specs_per_partition.setdefault(partition_identifier, []).append(
+                volume_path_spec
+            )
+
+        if options.workers > 1 and len(path_specs_per_partition) > 1:
+            # Note that the "spawn" start method is used since the worker process
+            # should not share open file objects with the parent process.
+            mp_context = multiprocessing.get_context("spawn")
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=options.workers,
+                mp_context=mp_context,
+                initializer=cli_tool.ConfigureLogging,
+            ) as executor:
+                futures = []
+                for path_specs in path_specs_per_partition.values():
+                    credentials = scan_cache.GetKeyChainCredentials(path_specs)
+                    futures.append(
+                        executor.submit(
+                            ExtractShellFolders,
+                            path_specs,
+                            collect_statistics=options.stats,
+                            credentials=credentials,
+                            debug=options.debug,
+                            shell_folder_cache_path=options.shell_folder_cache,
+                        )
+                    )
+
+                volume_results = []
+                for future in futures:
+                    partition_results, volume_statistics = future.result()
+                    volume_results.extend(partition_results)
+                    if statistics:
+                        statistics.Merge(volume_statistics)
+
+        else:
+            volume_results, volume_statistics = ExtractShellFolders(
+                [
+                    volume_path_spec
+                    for path_specs in path_specs_per_partition.values()
+                    for volume_path_spec in path_specs
+                ],
+                collect_statistics=options.stats,
+                debug=options.debug,
+                shell_folder_cache_path=options.shell_folder_cache,
+            )
+            if statistics:
+                statistics.Merge(volume_statistics)
+
+    return volume_results
+
+
+def OpenShellFolderCache(path):
+    """Opens a persistent shell folder cache.
+
+    Args:
+      path (str): path of the persistent shell folder cache or None.
+
+    Returns:
+      ShellFolderResultCache: shell folder cache or None if not available.
+    """
+    if not path:
+        return None
+
+    # pylint: disable=import-outside-toplevel
+    from winshlrc import shell_folder_cache as shell_folder_cache_module
+
+    shell_folder_cache = shell_folder_cache_module.ShellFolderResultCache(path)
+
+    try:
+        shell_folder_cache.Open()
+    except OSError as exception:
+        logging.warning(f"{exception!s}")
+        return None
+
+    return shell_folder_cache
+
+
+def PrintStatistics(statistics, elapsed_time):
+    """Prints extraction statistics.
+
+    Args:
+      statistics (ExtractionStatistics): extraction statistics.
+      elapsed_time (float): elapsed time of the extraction in seconds.
+    """
+    print("Statistics:")
+    print(f"\t{'Elapsed time (seconds)':<52s} {elapsed_time:>12.3f}")
+    print("")
+
+    print(f"\t{'Stage':<52s} {'Calls':>12s} {'Time (seconds)':>16s}")
+    for name, description in sorted(
+        statistics.STAGE_DESCRIPTIONS.items(), key=lambda item: item[1]
+    ):
+        stage_calls = statistics.stage_calls.get(name, 0)
+        stage_time = statistics.stage_times.get(name, 0.0)
+        print(f"\t{description:<52s} {stage_calls:>12d} {stage_time:>16.3f}")
+
+    print("")
+
+    print(f"\t{'Counter':<52s} {'Value':>12s}")
+    for name, description in sorted(
+        statistics.COUNTER_DESCRIPTIONS.items(), key=lambda item: item[1]
+    ):
+        print(f"\t{description:<52s} {statistics.counters.get(name, 0):>12d}")
+
+    print("")
 
 
 def Main():
@@ -23,8 +327,19 @@ def Main():
     Returns:
       int: exit code that is provided to sys.exit().
     """
-    argument_parser = argparse.ArgumentParser(
-        description=("Extract Windows shell information.")
+    tool = cli_tool.CLITool("Extract Windows shell information.")
+    argument_parser = tool.argument_parser
+
+    argument_parser.add_argument(
+        "--continue_on_error",
+        "--continue-on-error",
+        dest="continue_on_error",
+        action="store_true",
+        default=False,
+        help=(
+            "continue with the next source if a source cannot be extracted, "
+            "instead of stopping at the first source that cannot be extracted."
+        ),
     )
 
     argument_parser.add_argument(
@@ -36,6 +351,132 @@ def Main():
         help="enable debug output.",
     )
 
+    argument_parser.add_argument(
+        "--journal",
+        dest="journal",
+        action="store",
+        metavar="PATH",
+        default=None,
+        help=(
+            "path of a checkpoint journal file to write the results of every "
+            "source to, once its extraction has completed."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--registry_file",
+        "--registry-file",
+        dest="registry_files",
+        action="append",
+        metavar="PATH",
+        default=None,
+        help=(
+            "path of a standalone Windows Registry file, such as SOFTWARE or "
+            "UsrClass.dat, to extract instead of a source. This option can be "
+            "used multiple times."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--resources",
+        dest="resources",
+        action="store",
+        metavar="PATH",
+        default=None,
+        help=(
+            "path of a directory with resource files, such as shell32.dll and "
+            "en-US/shell32.dll.mui, used to resolve localized strings of "
+            "standalone Windows Registry files."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--result_store",
+        "--result-store",
+        dest="result_store",
+        action="store",
+        metavar="PATH",
+        default=None,
+        help=(
+            "path of a SQLite database to store the extracted shell folders in, "
+            "where the results are appended if the database already exists."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--resume",
+        dest="resume",
+        action="store_true",
+        default=False,
+        help=(
+            "resume an interrupted run, where the sources in the checkpoint "
+            "journal are not extracted again."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--scan_cache",
+        "--scan-cache",
+        dest="scan_cache",
+        action="store",
+        metavar="PATH",
+        default=None,
+        help=(
+            "path of a file to cache the volume scan results in, so that "
+            "subsequent runs over an unchanged source skip the source scan."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--shell_folder_cache",
+        "--shell-folder-cache",
+        dest="shell_folder_cache",
+        action="store",
+        metavar="PATH",
+        default=None,
+        help=(
+            "path of a SQLite database to cache the extracted shell folders in, "
+            "so that subsequent runs over an unchanged SOFTWARE Windows Registry "
+            "file and resource files reuse them."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--stats",
+        dest="stats",
+        action="store_true",
+        default=False,
+        help=(
+            "print statistics of the extraction, such as the time spent per "
+            "stage and the number of resource files opened."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--snapshots",
+        dest="snapshots",
+        action="store",
+        choices=["all", "none"],
+        default="none",
+        help=(
+            "snapshots, such as Volume Shadow Snapshots (VSS), to process, where "
+            '"all" processes the Windows volume and all of its snapshots.'
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--workers",
+        dest="workers",
+        action="store",
+        type=int,
+        metavar="NUMBER",
+        default=os.cpu_count(),
+        help=(
+            "maximum number of worker processes used to extract Windows "
+            "installations on different partitions in parallel."
+        ),
+    )
+
     argument_parser.add_argument(
         "-w",
         "--windows_version",
@@ -59,25 +500,57 @@ def Main():
         ),
     )
 
-    options = argument_parser.parse_args()
+    options = tool.ParseArguments()
 
-    if not options.source:
+    if not options.source and not options.registry_files:
         print("Source value is missing.")
         print("")
         argument_parser.print_help()
         print("")
         return 1
 
-    try:
-        with open(options.source, "r", encoding="utf-8") as file_object:
-            source_definitions = list(yaml.safe_load_all(file_object))
+    if options.resume and not options.journal:
+        print("Checkpoint journal value is missing.")
+        print("")
+        return 1
+
+    # The extraction back-ends, such as dfvfs, are imported after the arguments
+    # have been parsed, since importing them takes most of the start up time.
+    # pylint: disable=import-outside-toplevel
+    from dfvfs.helpers import command_line as dfvfs_command_line
+    from dfvfs.helpers import volume_scanner as dfvfs_volume_scanner
+    from dfvfs.lib import errors as dfvfs_errors
+
+    from winshlrc import checkpoint_journal
+    from winshlrc import extractor
+    from winshlrc import result_store
+    from winshlrc import scan_cache
 
-    except (SyntaxError, UnicodeDecodeError, yaml.parser.ParserError):
+    if options.registry_files:
         source_definitions = [
-            {"source": options.source, "windows_version": options.windows_version}
+            {
+                "registry_files": options.registry_files,
+                "resources": options.resources,
+                "windows_version": options.windows_version,
+            }
         ]
 
-    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+    else:
+        try:
+            with open(options.source, "r", encoding="utf-8") as file_object:
+                source_definitions = list(yaml.safe_load_all(file_object))
+
+        except (
+            IsADirectoryError,
+            SyntaxError,
+            UnicodeDecodeError,
+            yaml.parser.ParserError,
+        ):
+            source_definitions = [
+                {"source": options.source, "windows_version": options.windows_version}
+            ]
+
+    tool.StartPhase("reading definitions")
 
     data_path = os.path.join(os.path.dirname(winshlrc.__file__), "data")
 
@@ -93,81 +566,228 @@ def Main():
 
     volume_scanner_options = dfvfs_volume_scanner.VolumeScannerOptions()
     volume_scanner_options.partitions = ["all"]
-    volume_scanner_options.snapshots = ["none"]
+    volume_scanner_options.snapshots = [options.snapshots]
     volume_scanner_options.volumes = ["none"]
 
+    scan_result_cache = None
+    if options.scan_cache:
+        scan_result_cache = scan_cache.ScanResultCache(options.scan_cache)
+
+    extraction_result_store = None
+    run_identifier = None
+    if options.result_store:
+        extraction_result_store = result_store.ExtractionResultStore(
+            options.result_store
+        )
+
+        try:
+            extraction_result_store.Open()
+        except OSError as exception:
+            print(f"{exception!s}")
+            print("")
+            return 1
+
+        run_identifier = extraction_result_store.StartRun()
+
+    journal = None
+    if options.journal:
+        journal = checkpoint_journal.CheckpointJournal(options.journal)
+
+        try:
+            journal.Open(resume=options.resume)
+        except OSError as exception:
+            print(f"Unable to open checkpoint journal with error: {exception!s}")
+            print("")
+            if extraction_result_store:
+                extraction_result_store.Close()
+            return 1
+
+        if options.resume:
+            logging.info(
+                f"Resuming with {journal.number_of_completed_sources:d} completed "
+                f"sources from: {options.journal:s}"
+            )
+
+    statistics = None
+    if options.stats:
+        statistics = statistics_module.ExtractionStatistics()
+
+    start_time = time.perf_counter()
+
+    tool.StartPhase("extracting")
+
     shell_folders = {}
     observed_shell_folders = {}
     unknown_shell_folders = {}
+    volumes_per_shell_folder = {}
     windows_versions_per_shell_folder = {}
 
+    completed_sources = 0
+    failed_sources = []
+
     for source_definition in source_definitions:
-        source_path = source_definition["source"]
-        logging.info(f"Processing: {source_path:s}")
+        registry_files = source_definition.get("registry_files")
+        if registry_files:
+            source_path = ", ".join(registry_files)
+        else:
+            source_path = source_definition["source"]
 
-        extractor_object = extractor.WindowsShellExtractor(
-            debug=options.debug, mediator=mediator
-        )
+        volume_results = None
+        if journal:
+            volume_results = journal.GetCompletedSource(source_definition)
 
-        try:
-            result = extractor_object.ScanForWindowsVolume(
-                source_path, options=volume_scanner_options
-            )
-        except dfvfs_errors.ScannerError:
-            result = False
+        resumed = volume_results is not None
+        if resumed:
+            logging.info(f"Skipping completed: {source_path:s}")
+            completed_sources += 1
 
-        if not result:
-            print(
-                (
-                    f"Unable to retrieve the volume with the Windows directory "
-                    f"from: {source_path:s}."
+        else:
+            logging.info(f"Processing: {source_path:s}")
+
+            try:
+                volume_results = ExtractSource(
+                    source_definition,
+                    options,
+                    mediator,
+                    volume_scanner_options,
+                    scan_result_cache=scan_result_cache,
+                    statistics=statistics,
+                )
+
+            except (
+                OSError,
+                RuntimeError,
+                ValueError,
+                dfvfs_errors.Error,
+            ) as exception:
+                if not options.continue_on_error:
+                    raise
+
+                logging.error(
+                    f"Unable to extract: {source_path:s} with error: {exception!s}"
+                )
+                volume_results = []
+
+        if not volume_results:
+            if registry_files:
+                print(
+                    (
+                        f"Unable to retrieve class identifiers from Windows Registry "
+                        f"files: {source_path:s}."
+                    )
+                )
+            else:
+                print(
+                    (
+                        f"Unable to retrieve the volume with the Windows directory "
+                        f"from: {source_path:s}."
+                    )
                 )
-            )
             print("")
+
+            if options.continue_on_error:
+                failed_sources.append(source_path)
+                continue
+
+            if extraction_result_store:
+                extraction_result_store.Close()
+            if journal:
+                journal.Close()
             return 1
 
-        if extractor_object.windows_version:
-            windows_version = extractor_object.windows_version
-            logging.info(f"Detected Windows version: {windows_version:s}")
+        for (
+            volume_identifier,
+            detected_windows_version,
+            volume_shell_folders,
+        ) in volume_results:
+            if detected_windows_version:
+                logging.info(
+                    f"Detected Windows version: {detected_windows_version:s} on "
+                    f"volume: {volume_identifier or 'N/A':s}"
+                )
+
+                windows_version = (
+                    source_definition["windows_version"] or detected_windows_version
+                )
+
+            else:
+                print("Unable to determine Windows version.")
 
-            if source_definition["windows_version"]:
                 windows_version = source_definition["windows_version"]
 
-        else:
-            print("Unable to determine Windows version.")
-
-            windows_version = source_definition["windows_version"]
-
-        for shell_folder in extractor_object.CollectShellFolders():
-            existing_shell_folder = shell_folders.get(shell_folder.identifier)
-
-            if not existing_shell_folder:
-                shell_folders[shell_folder.identifier] = shell_folder
-            elif not existing_shell_folder.name:
-                existing_shell_folder.name = shell_folder.name
-            elif (
-                shell_folder.name
-                and shell_folder.name != existing_shell_folder.name
-                and shell_folder.name not in existing_shell_folder.alternate_names
-            ):
-                existing_shell_folder.alternate_names.append(shell_folder.name)
-
-            if windows_version:
-                if shell_folder.identifier not in windows_versions_per_shell_folder:
-                    windows_versions_per_shell_folder[shell_folder.identifier] = []
-
-                windows_versions_per_shell_folder[shell_folder.identifier].append(
-                    windows_version
+            # The shell folders of a completed source were stored by the run
+            # that extracted them.
+            if extraction_result_store and not resumed:
+                extraction_result_store.AddVolume(
+                    run_identifier,
+                    source_path,
+                    volume_identifier,
+                    volume_shell_folders,
+                    detected_windows_version=detected_windows_version,
+                    windows_version=windows_version,
                 )
 
-            shell_folder_definition = observed_shell_folder_definitions.get(
-                shell_folder.identifier, None
-            )
-            if shell_folder_definition:
-                observed_shell_folders[shell_folder.identifier] = shell_folder
-                continue
+            for shell_folder in volume_shell_folders:
+                existing_shell_folder = shell_folders.get(shell_folder.identifier)
+
+                # A copy of the shell folder is merged, since the shell folder
+                # itself is added to the journal after the volumes are merged.
+                if not existing_shell_folder:
+                    shell_folders[shell_folder.identifier] = (
+                        extractor.ShellFolder.CopyFromValues(
+                            shell_folder.CopyToValues()
+                        )
+                    )
+                elif not existing_shell_folder.name:
+                    existing_shell_folder.name = shell_folder.name
+                elif (
+                    shell_folder.name
+                    and shell_folder.name != existing_shell_folder.name
+                    and shell_folder.name not in existing_shell_folder.alternate_names
+                ):
+                    existing_shell_folder.alternate_names.append(shell_folder.name)
+
+                if windows_version:
+                    if shell_folder.identifier not in windows_versions_per_shell_folder:
+                        windows_versions_per_shell_folder[shell_folder.identifier] = []
 
-            unknown_shell_folders[shell_folder.identifier] = shell_folder
+                    windows_versions_per_shell_folder[shell_folder.identifier].append(
+                        windows_version
+                    )
+
+                if volume_identifier:
+                    if shell_folder.identifier not in volumes_per_shell_folder:
+                        volumes_per_shell_folder[shell_folder.identifier] = set()
+
+                    volumes_per_shell_folder[shell_folder.identifier].add(
+                        volume_identifier
+                    )
+
+                shell_folder_definition = observed_shell_folder_definitions.get(
+                    shell_folder.identifier, None
+                )
+                if shell_folder_definition:
+                    observed_shell_folders[shell_folder.identifier] = shell_folder
+                    continue
+
+                unknown_shell_folders[shell_folder.identifier] = shell_folder
+
+        # The source is added to the journal after its shell folders have been
+        # stored, so that a resumed run does not skip shell folders that were
+        # not stored.
+        if journal and not resumed:
+            journal.AddCompletedSource(source_definition, volume_results)
+
+    if extraction_result_store:
+        extraction_result_store.Close()
+
+    if journal:
+        journal.Close()
+
+    if completed_sources:
+        logging.info(f"Skipped {completed_sources:d} completed sources.")
+
+    tool.StartPhase("reporting")
 
     mapped_names = {
         "AppSuggestedLocations": "Application Suggested Locations",
@@ -211,6 +831,11 @@ def Main():
                 ):
                     print(f"\t\tAlternate name: {shell_folder.name:s}")
 
+            volume_identifiers = volumes_per_shell_folder.get(identifier)
+            if volume_identifiers:
+                volume_identifiers = ", ".join(sorted(volume_identifiers))
+                print(f"\t\tVolumes: {volume_identifiers:s}")
+
         print("")
 
     if unknown_shell_folders:
@@ -221,7 +846,22 @@ def Main():
                 print(f" ({shell_folder_definition.name:s})", end="")
             print("")
 
+            volume_identifiers = volumes_per_shell_folder.get(identifier)
+            if volume_identifiers:
+                volume_identifiers = ", ".join(sorted(volume_identifiers))
+                print(f"\t\tVolumes: {volume_identifiers:s}")
+
+        print("")
+
+    if statistics:
+        PrintStatistics(statistics, time.perf_counter() - start_time)
+
+    if failed_sources:
+        print("Unable to extract sources:")
+        for source_path in failed_sources:
+            print(f"\t{source_path:s}")
         print("")
+        return 1
 
     return 0
 
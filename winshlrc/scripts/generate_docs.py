@@ -1,8 +1,6 @@
 #!/usr/bin/env python3
 """Script to generate Windows shell documentation."""
 
-import argparse
-import logging
 import os
 import sys
 
@@ -10,6 +8,7 @@ import winshlrc
 
 from winshlrc import versions
 from winshlrc import yaml_definitions_file
+from winshlrc.scripts import cli_tool
 
 
 class ControlPanelItemsIndexRstOutputWriter:
@@ -513,16 +512,14 @@ def Main():
     Returns:
       int: exit code that is provided to sys.exit().
     """
-    argument_parser = argparse.ArgumentParser(
-        description=("Generated Windows shell documentation.")
-    )
+    tool = cli_tool.CLITool("Generated Windows shell documentation.")
 
-    argument_parser.parse_args()
-
-    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+    tool.ParseArguments()
 
     data_path = os.path.join(os.path.dirname(winshlrc.__file__), "data")
 
+    tool.StartPhase("control panel items")
+
     definitions_file = yaml_definitions_file.YAMLControlPanelItemsDefinitionsFile()
 
     control_panel_items = {}
@@ -550,6 +547,8 @@ def Main():
             ) as markdown_writer:
                 markdown_writer.WriteControlPanelItem(control_panel_item_definition)
 
+    tool.StartPhase("known folders")
+
     definitions_file = yaml_definitions_file.YAMLKnownFoldersDefinitionsFile()
 
     known_folders = {}
@@ -585,6 +584,8 @@ def Main():
             with KnownFolderMarkdownOutputWriter(markdown_file_path) as markdown_writer:
                 markdown_writer.WriteKnownFolder(known_folder_definition)
 
+    tool.StartPhase("shell folders")
+
     definitions_file = yaml_definitions_file.YAMLShellFoldersDefinitionsFile()
 
     shell_folders = {}
@@ -1,8 +1,6 @@
 #!/usr/bin/env python3
 """Script to generate Windows shell related source code."""
 
-import argparse
-import logging
 import os
 import sys
 import uuid
@@ -10,6 +8,7 @@ import uuid
 import winshlrc
 
 from winshlrc import yaml_definitions_file
+from winshlrc.scripts import cli_tool
 
 
 class LibfwsiControlPanelItemIdentifierGenerator:
@@ -730,9 +729,8 @@ def Main():
     Returns:
       int: exit code that is provided to sys.exit().
     """
-    argument_parser = argparse.ArgumentParser(
-        description=("Generated Windows shell related source code.")
-    )
+    tool = cli_tool.CLITool("Generated Windows shell related source code.")
+    argument_parser = tool.argument_parser
 
     argument_parser.add_argument(
         "-f",
@@ -753,7 +751,7 @@ def Main():
         help="path of the output source code.",
     )
 
-    options = argument_parser.parse_args()
+    options = tool.ParseArguments()
 
     if not os.path.isdir(options.output):
         print(f"No such output directory: {options.output:s}.")
@@ -769,10 +767,10 @@ def Main():
         print("")
         return 1
 
-    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
-
     data_path = os.path.join(os.path.dirname(winshlrc.__file__), "data")
 
+    tool.StartPhase("control panel items")
+
     definitions_file = yaml_definitions_file.YAMLControlPanelItemsDefinitionsFile()
 
     control_panel_items = {}
@@ -813,6 +811,8 @@ def Main():
 
     # TODO: add plaso output
 
+    tool.StartPhase("known folders")
+
     definitions_file = yaml_definitions_file.YAMLKnownFoldersDefinitionsFile()
 
     known_folders = {}
@@ -879,6 +879,8 @@ def Main():
 
     # TODO: add plaso output
 
+    tool.StartPhase("shell folders")
+
     definitions_file = yaml_definitions_file.YAMLShellFoldersDefinitionsFile()
 
     shell_folders = {}
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""Script to serve look ups of the Windows shell knowledge base."""
+
+import logging
+import os
+import signal
+import socket
+import stat
+import sys
+
+import winshlrc
+
+from winshlrc.scripts import cli_tool
+
+
+def RemoveStaleUnixSocket(path):
+    """Removes a Unix domain socket that no server is listening on.
+
+    The Unix domain socket of a server that was killed is not removed and
+    prevents another server from listening on the same path.
+
+    Args:
+      path (str): path of the Unix domain socket.
+
+    Returns:
+      bool: True if the path is available to listen on, False if a server is
+          listening on the path or the path is not a Unix domain socket.
+    """
+    try:
+        stat_object = os.stat(path)
+    except FileNotFoundError:
+        return True
+
+    if not stat.S_ISSOCK(stat_object.st_mode):
+        return False
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client_socket:
+        try:
+            client_socket.connect(path)
+        except ConnectionRefusedError:
+            pass
+        else:
+            return False
+
+    logging.warning(f"Removing stale Unix domain socket: {path:s}")
+    os.unlink(path)
+
+    return True
+
+
+def Main():
+    """Entry point of console script to serve look ups of the knowledge base.
+
+    Returns:
+      int: exit code that is provided to sys.exit().
+    """
+    tool = cli_tool.CLITool(
+        "Serves look ups of the Windows shell knowledge base on a Unix domain "
+        "socket or localhost TCP port."
+    )
+    argument_parser = tool.argument_parser
+
+    argument_parser.add_argument(
+        "--data",
+        dest="data",
+        action="store",
+        metavar="PATH",
+        default=os.path.join(os.path.dirname(winshlrc.__file__), "data"),
+        help="path of a directory with winshl-kb YAML files.",
+    )
+
+    argument_parser.add_argument(
+        "--port",
+        dest="port",
+        action="store",
+        type=int,
+        metavar="NUMBER",
+        default=None,
+        help="localhost TCP port to listen on.",
+    )
+
+    argument_parser.add_argument(
+        "--reload_interval",
+        "--reload-interval",
+        dest="reload_interval",
+        action="store",
+        type=float,
+        metavar="SECONDS",
+        default=5.0,
+        help=(
+            "interval, in seconds, to check the YAML files for changes, where 0 "
+            "disables reloading."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--unix_socket",
+        "--unix-socket",
+        dest="unix_socket",
+        action="store",
+        metavar="PATH",
+        default=None,
+        help="path of a Unix domain socket to listen on.",
+    )
+
+    options = tool.ParseArguments()
+
+    # pylint: disable=import-outside-toplevel
+    from winshlrc import lookup_server
+
+    if (options.port is None) == (options.unix_socket is None):
+        print("Either a TCP port or a Unix domain socket is required.")
+        print("")
+        argument_parser.print_help()
+        print("")
+        return 1
+
+    if options.unix_socket and not hasattr(lookup_server, "UnixLookupServer"):
+        print("Unix domain sockets are not supported on this platform.")
+        print("")
+        return 1
+
+    if options.unix_socket and not RemoveStaleUnixSocket(options.unix_socket):
+        print(f"Unix domain socket: {options.unix_socket:s} is already in use.")
+        print("")
+        return 1
+
+    tool.StartPhase("reading definitions")
+
+    lookup_service = lookup_server.LookupService(
+        options.data, reload_interval=options.reload_interval
+    )
+    if not lookup_service.Start():
+        print(f"Unable to read definitions files from: {options.data:s}")
+        print("")
+        return 1
+
+    tool.StartPhase("serving")
+
+    try:
+        if options.unix_socket:
+            server = lookup_server.UnixLookupServer(options.unix_socket, lookup_service)
+        else:
+            server = lookup_server.TCPLookupServer(options.port, lookup_service)
+
+    except OSError as exception:
+        lookup_service.Stop()
+
+        print(f"Unable to listen with error: {exception!s}")
+        print("")
+        return 1
+
+    logging.info(f"Listening on: {server.server_address!s}")
+
+    # Stop serving on SIGTERM, as on SIGINT, so that the Unix domain socket is
+    # removed.
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    try:
+        server.serve_forever()
+
+    except KeyboardInterrupt:
+        pass
+
+    finally:
+        server.server_close()
+        lookup_service.Stop()
+
+        if options.unix_socket:
+            os.unlink(options.unix_socket)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(Main())
@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 """Script to combine winshl-kb YAML files."""
 
-import argparse
 import glob
 import os
 import sys
@@ -9,6 +8,7 @@ import uuid
 import yaml
 
 from winshlrc import resources
+from winshlrc.scripts import cli_tool
 
 
 class YAMLOutputWriter:
@@ -66,9 +66,8 @@ def Main():
     Returns:
       int: exit code that is provided to sys.exit().
     """
-    argument_parser = argparse.ArgumentParser(
-        description=("Merges winshl-kb YAML files.")
-    )
+    tool = cli_tool.CLITool("Merges winshl-kb YAML files.")
+    argument_parser = tool.argument_parser
 
     argument_parser.add_argument(
         "source",
@@ -79,7 +78,7 @@ def Main():
         help="path of a directory with winshl-kb YAML files.",
     )
 
-    options = argument_parser.parse_args()
+    options = tool.ParseArguments()
 
     if not options.source:
         print("Source directory missing.")
@@ -88,6 +87,8 @@ def Main():
         print("")
         return 1
 
+    tool.StartPhase("reading definitions")
+
     known_folder_definitions = {}
 
     for path in glob.glob(os.path.join(options.source, "*.yaml")):
@@ -130,6 +131,8 @@ def Main():
                 if name and not known_folder_definition.name:
                     known_folder_definition.name = name
 
+    tool.StartPhase("writing definitions")
+
     with YAMLOutputWriter() as yaml_writer:
         for known_folder_definition in sorted(
             known_folder_definitions.values(),
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Script to search the Windows shell knowledge base by name."""
+
+import os
+import sys
+
+import winshlrc
+
+from winshlrc.scripts import cli_tool
+
+
+def Main():
+    """Entry point of console script to search the knowledge base by name.
+
+    Returns:
+      int: exit code that is provided to sys.exit().
+    """
+    tool = cli_tool.CLITool(
+        "Searches the Windows shell knowledge base for definitions with a name "
+        "similar to the query, such as a localized or truncated folder name."
+    )
+    argument_parser = tool.argument_parser
+
+    argument_parser.add_argument(
+        "--data",
+        dest="data",
+        action="store",
+        metavar="PATH",
+        default=os.path.join(os.path.dirname(winshlrc.__file__), "data"),
+        help="path of a directory with winshl-kb YAML files.",
+    )
+
+    argument_parser.add_argument(
+        "--minimum_score",
+        "--minimum-score",
+        dest="minimum_score",
+        action="store",
+        type=float,
+        metavar="SCORE",
+        default=0.3,
+        help=(
+            "minimum score of a result, between 0.0 and 1.0, where 1.0 "
+            "represents an identical name."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "-n",
+        "--number_of_results",
+        "--number-of-results",
+        dest="number_of_results",
+        action="store",
+        type=int,
+        metavar="NUMBER",
+        default=10,
+        help="maximum number of results.",
+    )
+
+    argument_parser.add_argument(
+        "query",
+        nargs="+",
+        action="store",
+        metavar="NAME",
+        help='name to search for, such as "Control Panel\\All Tasks".',
+    )
+
+    options = tool.ParseArguments()
+
+    # pylint: disable=import-outside-toplevel
+    from winshlrc import knowledge_base as knowledge_base_module
+    from winshlrc import name_search
+
+    tool.StartPhase("reading definitions")
+
+    knowledge_base = knowledge_base_module.WindowsShellKnowledgeBase()
+    knowledge_base.ReadFromDirectory(options.data)
+
+    tool.StartPhase("indexing")
+
+    search_index = name_search.NameSearchIndex()
+    search_index.AddKnowledgeBase(knowledge_base)
+
+    tool.StartPhase("searching")
+
+    results = search_index.Search(
+        " ".join(options.query),
+        maximum_number_of_results=options.number_of_results,
+        minimum_score=options.minimum_score,
+    )
+
+    resource_type_names = knowledge_base_module.RESOURCE_TYPE_NAMES
+
+    for score, identifier, resource_types, name in results:
+        type_names = ",".join(
+            type_name
+            for resource_type, type_name in resource_type_names.items()
+            if resource_types & resource_type
+        )
+        print(f"{score:.2f}\t{identifier:s}\t{type_names:s}\t{name:s}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(Main())
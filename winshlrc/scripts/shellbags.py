@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""Script to resolve Windows shellbags with the Windows shell knowledge base."""
+
+import logging
+import os
+import sys
+
+import winshlrc
+
+from winshlrc.scripts import cli_tool
+
+# Maximum number of shellbag records a worker process passes at once.
+_RECORDS_CHUNK_SIZE = 1000
+
+# Knowledge base and records queue of a worker process, set by InitializeWorker.
+_worker_state = {}
+
+
+def InitializeWorker(knowledge_base, records_queue):
+    """Initializes a worker process.
+
+    The knowledge base is passed once per worker process, instead of with every
+    task, since it is expensive to serialize.
+
+    Args:
+      knowledge_base (WindowsShellKnowledgeBase): knowledge base.
+      records_queue (multiprocessing.Queue): queue to pass chunks of shellbag
+          records to the parent process.
+    """
+    cli_tool.ConfigureLogging()
+
+    _worker_state["knowledge_base"] = knowledge_base
+    _worker_state["records_queue"] = records_queue
+
+
+def ResolveShellbags(
+    knowledge_base, path_specs, ascii_codepage="cp1252", credentials=None, username=None
+):
+    """Resolves the shellbags of user Windows Registry files.
+
+    Args:
+      knowledge_base (WindowsShellKnowledgeBase): knowledge base.
+      path_specs (list[dfvfs.PathSpec]): path specifications of the user Windows
+          Registry files, such as NTUSER.DAT and UsrClass.dat.
+      ascii_codepage (Optional[str]): ASCII string codepage of the shell items.
+      credentials (Optional[list[tuple[dfvfs.PathSpec, str, object]]]): path
+          specification, credential identifier and credential data, used to
+          unlock encrypted volumes.
+      username (Optional[str]): username of the user profile of the Windows
+          Registry files.
+
+    Yields:
+      ShellbagRecord: shellbag record.
+    """
+    # pylint: disable=import-outside-toplevel
+    from dfvfs.resolver import resolver as dfvfs_resolver
+
+    from winshlrc import shellbags
+
+    for path_spec, identifier, data in credentials or []:
+        dfvfs_resolver.Resolver.key_chain.SetCredential(path_spec, identifier, data)
+
+    resolver = shellbags.ShellbagResolver(knowledge_base, ascii_codepage=ascii_codepage)
+
+    for path_spec in path_specs:
+        yield from resolver.ResolveRegistryFilePathSpec(path_spec, username=username)
+
+
+def ResolveShellbagsInWorker(
+    path_specs,
+    ascii_codepage="cp1252",
+    chunk_size=_RECORDS_CHUNK_SIZE,
+    credentials=None,
+    username=None,
+):
+    """Resolves the shellbags of user Windows Registry files in a worker process.
+
+    The shellbag records are passed to the parent process in chunks, as they
+    are resolved, followed by None when done, also when an exception is raised.
+
+    Args:
+      path_specs (list[dfvfs.PathSpec]): path specifications of the user Windows
+          Registry files, such as NTUSER.DAT and UsrClass.dat.
+      ascii_codepage (Optional[str]): ASCII string codepage of the shell items.
+      chunk_size (Optional[int]): maximum number of shellbag records per chunk.
+      credentials (Optional[list[tuple[dfvfs.PathSpec, str, object]]]): path
+          specification, credential identifier and credential data, used to
+          unlock encrypted volumes.
+      username (Optional[str]): username of the user profile of the Windows
+          Registry files.
+    """
+    records_queue = _worker_state["records_queue"]
+
+    try:
+        records = []
+        for record in ResolveShellbags(
+            _worker_state["knowledge_base"],
+            path_specs,
+            ascii_codepage=ascii_codepage,
+            credentials=credentials,
+            username=username,
+        ):
+            records.append(record)
+            if len(records) >= chunk_size:
+                records_queue.put(records)
+                records = []
+
+        if records:
+            records_queue.put(records)
+
+    finally:
+        records_queue.put(None)
+
+
+def ResolveShellbagsInParallel(
+    knowledge_base,
+    path_specs_per_username,
+    number_of_workers,
+    ascii_codepage="cp1252",
+    chunk_size=_RECORDS_CHUNK_SIZE,
+):
+    """Resolves the shellbags of the users in worker processes.
+
+    The user Windows Registry files of different users are resolved in
+    parallel. The shellbag records are passed by the worker processes in
+    bounded chunks, as they are resolved, instead of all records of a user at
+    once.
+
+    Args:
+      knowledge_base (WindowsShellKnowledgeBase): knowledge base.
+      path_specs_per_username (dict[str, list[dfvfs.PathSpec]]): path
+          specifications of the user Windows Registry files per username.
+      number_of_workers (int): maximum number of worker processes.
+      ascii_codepage (Optional[str]): ASCII string codepage of the shell items.
+      chunk_size (Optional[int]): maximum number of shellbag records per chunk.
+
+    Yields:
+      list[ShellbagRecord]: chunk of shellbag records.
+    """
+    # pylint: disable=import-outside-toplevel
+    import concurrent.futures
+    import multiprocessing
+    import queue
+
+    from winshlrc import scan_cache
+
+    # Note that the "spawn" start method is used since the worker process
+    # should not share open file objects with the parent process.
+    mp_context = multiprocessing.get_context("spawn")
+    records_queue = mp_context.Queue()
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=number_of_workers,
+        mp_context=mp_context,
+        initializer=InitializeWorker,
+        initargs=(knowledge_base, records_queue),
+    ) as executor:
+        futures = [
+            executor.submit(
+                ResolveShellbagsInWorker,
+                path_specs,
+                ascii_codepage=ascii_codepage,
+                chunk_size=chunk_size,
+                credentials=scan_cache.GetKeyChainCredentials(path_specs),
+                username=username,
+            )
+            for username, path_specs in path_specs_per_username.items()
+        ]
+
+        number_of_pending_tasks = len(futures)
+        while number_of_pending_tasks:
+            try:
+                records = records_queue.get(timeout=1.0)
+            except queue.Empty:
+                # A worker process that was terminated, for example by running
+                # out of memory, does not signal that its task is done.
+                for future in futures:
+                    if future.done():
+                        future.result()
+                continue
+
+            if records is None:
+                number_of_pending_tasks -= 1
+            else:
+                yield records
+
+        for future in futures:
+            future.result()
+
+
+def PrintRecord(record):
+    """Prints a shellbag record.
+
+    Args:
+      record (ShellbagRecord): shellbag record.
+    """
+    values = [
+        record.username or "",
+        f"{record.key_path:s}\\{record.value_name:s}",
+        record.path,
+        record.identifier or "",
+        record.name or "",
+    ]
+    print("\t".join(values))
+
+
+def Main():
+    """Entry point of console script to resolve Windows shellbags.
+
+    Returns:
+      int: exit code that is provided to sys.exit().
+    """
+    tool = cli_tool.CLITool(
+        "Resolves Windows shellbags (BagMRU) with the Windows shell knowledge base."
+    )
+    argument_parser = tool.argument_parser
+
+    argument_parser.add_argument(
+        "--codepage",
+        dest="codepage",
+        action="store",
+        metavar="CODEPAGE",
+        default="cp1252",
+        help="ASCII string codepage of the shell items.",
+    )
+
+    argument_parser.add_argument(
+        "--data",
+        dest="data",
+        action="store",
+        metavar="PATH",
+        default=os.path.join(os.path.dirname(winshlrc.__file__), "data"),
+        help="path of a directory with winshl-kb YAML files.",
+    )
+
+    argument_parser.add_argument(
+        "--registry_file",
+        "--registry-file",
+        dest="registry_files",
+        action="append",
+        metavar="PATH",
+        default=None,
+        help=(
+            "path of a standalone user Windows Registry file, such as NTUSER.DAT "
+            "or UsrClass.dat, to resolve instead of a source. This option can be "
+            "used multiple times."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--workers",
+        dest="workers",
+        action="store",
+        type=int,
+        metavar="NUMBER",
+        default=os.cpu_count(),
+        help=(
+            "maximum number of worker processes used to resolve the user Windows "
+            "Registry files of different users in parallel."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "source",
+        nargs="?",
+        action="store",
+        metavar="PATH",
+        default=None,
+        help=(
+            "path of the volume containing C:\\Windows or the filename of "
+            "a storage media image containing the C:\\Windows directory."
+        ),
+    )
+
+    options = tool.ParseArguments()
+
+    if not options.source and not options.registry_files:
+        print("Source value is missing.")
+        print("")
+        argument_parser.print_help()
+        print("")
+        return 1
+
+    # pylint: disable=import-outside-toplevel
+    from dfvfs.helpers import command_line as dfvfs_command_line
+    from dfvfs.lib import definitions as dfvfs_definitions
+    from dfvfs.lib import errors as dfvfs_errors
+    from dfvfs.path import factory as dfvfs_path_spec_factory
+
+    from winshlrc import knowledge_base as knowledge_base_module
+    from winshlrc import shellbags
+    from winshlrc import volume_scanner
+
+    tool.StartPhase("reading definitions")
+
+    knowledge_base = knowledge_base_module.WindowsShellKnowledgeBase()
+    knowledge_base.ReadFromDirectory(options.data)
+
+    # Note that number_of_identifiers builds the index, so that the index is
+    # built once, before the knowledge base is passed to worker processes.
+    logging.info(
+        f"Loaded {knowledge_base.number_of_identifiers:d} identifiers from: "
+        f"{options.data:s}"
+    )
+
+    tool.StartPhase("scanning")
+
+    if options.registry_files:
+        path_specs_per_username = {
+            None: [
+                dfvfs_path_spec_factory.Factory.NewPathSpec(
+                    dfvfs_definitions.TYPE_INDICATOR_OS, location=os.path.abspath(path)
+                )
+                for path in options.registry_files
+            ]
+        }
+
+    else:
+        mediator = dfvfs_command_line.CLIVolumeScannerMediator()
+
+        volume_scanner_options = volume_scanner.VolumeScannerOptions()
+        volume_scanner_options.partitions = ["all"]
+        volume_scanner_options.snapshots = ["none"]
+        volume_scanner_options.username = ["none"]
+        volume_scanner_options.volumes = ["none"]
+
+        scanner = volume_scanner.WindowsRegistryVolumeScanner(mediator=mediator)
+
+        try:
+            result = scanner.ScanForWindowsVolume(
+                options.source, options=volume_scanner_options
+            )
+        except dfvfs_errors.ScannerError:
+            result = False
+
+        if not result:
+            print(f"No supported Windows volume found in source: {options.source:s}")
+            print("")
+            return 1
+
+        path_specs_per_username = scanner.GetUserRegistryFilePathSpecs()
+        scanner.Close()
+
+    tool.StartPhase("resolving")
+
+    number_of_records = 0
+
+    # The user Windows Registry files of different users are resolved in
+    # parallel, while the records of a single user are printed as they are
+    # resolved.
+    if options.workers > 1 and len(path_specs_per_username) > 1:
+        for records in ResolveShellbagsInParallel(
+            knowledge_base,
+            path_specs_per_username,
+            options.workers,
+            ascii_codepage=options.codepage,
+        ):
+            for record in records:
+                PrintRecord(record)
+
+            number_of_records += len(records)
+
+    else:
+        resolver = shellbags.ShellbagResolver(
+            knowledge_base, ascii_codepage=options.codepage
+        )
+        for username, path_specs in path_specs_per_username.items():
+            for path_spec in path_specs:
+                for record in resolver.ResolveRegistryFilePathSpec(
+                    path_spec, username=username
+                ):
+                    PrintRecord(record)
+                    number_of_records += 1
+
+    logging.info(f"Resolved {number_of_records:d} shellbags.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(Main())
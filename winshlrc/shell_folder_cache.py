@@ -0,0 +1,119 @@
+"""Persistent cache of extracted shell folders."""
+
+import json
+import logging
+import sqlite3
+
+from winshlrc import sqlite_store
+
+
+class ShellFolderResultCache(sqlite_store.SQLiteStore):
+    """Persistent cache of extracted shell folders.
+
+    The cache stores the shell folders extracted from a Windows Registry file,
+    with the names resolved from string resources, per fingerprint of that file
+    and the settings used to resolve the names, such as the ASCII codepage and
+    the preferred language identifier. Together with the shell folders it stores
+    the fingerprints of the string resources the names were resolved from, so
+    that a cached result can be invalidated when a resource file changes.
+
+    The cache is a SQLite database so that worker processes can share it.
+    """
+
+    _DESCRIPTION = "shell folder cache"
+
+    _FORMAT_VERSION = 1
+
+    _PRAGMAS = ["PRAGMA journal_mode=WAL", "PRAGMA synchronous=NORMAL"]
+
+    _SCHEMA = [
+        (
+            "CREATE TABLE IF NOT EXISTS metadata ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        ),
+        (
+            "CREATE TABLE IF NOT EXISTS shell_folder_results ("
+            "fingerprint TEXT PRIMARY KEY, "
+            "resource_fingerprints TEXT NOT NULL, "
+            "shell_folders TEXT NOT NULL)"
+        ),
+    ]
+
+    # Number of seconds to wait for a worker process that is writing to
+    # the cache.
+    _TIMEOUT = 60.0
+
+    def GetShellFolderResult(self, fingerprint):
+        """Retrieves a cached shell folder result.
+
+        Args:
+          fingerprint (str): fingerprint of the Windows Registry file and
+              the settings used to resolve the names.
+
+        Returns:
+          tuple[dict[str, str], list[tuple[str, str, str, str]]]: fingerprints
+              of the string resources per Windows path and the identifier, class
+              name, name and localized string of the shell folders, or None if
+              no valid result is cached for the fingerprint.
+        """
+        try:
+            row = self._connection.execute(
+                (
+                    "SELECT resource_fingerprints, shell_folders "
+                    "FROM shell_folder_results WHERE fingerprint = ?"
+                ),
+                (fingerprint,),
+            ).fetchone()
+
+        except sqlite3.Error as exception:
+            logging.warning(
+                f"Unable to read shell folder cache: {self._path:s} with error: "
+                f"{exception!s}"
+            )
+            row = None
+
+        if not row:
+            return None
+
+        try:
+            resource_fingerprints = json.loads(row[0])
+            shell_folders = [
+                tuple(shell_folder_values) for shell_folder_values in json.loads(row[1])
+            ]
+        except (TypeError, ValueError):
+            return None
+
+        return resource_fingerprints, shell_folders
+
+    def SetShellFolderResult(self, fingerprint, resource_fingerprints, shell_folders):
+        """Caches a shell folder result.
+
+        Args:
+          fingerprint (str): fingerprint of the Windows Registry file and
+              the settings used to resolve the names.
+          resource_fingerprints (dict[str, str]): fingerprints of the string
+              resources the names were resolved from per Windows path.
+          shell_folders (list[ShellFolder]): shell folders.
+        """
+        shell_folders = [shell_folder.CopyToValues() for shell_folder in shell_folders]
+
+        try:
+            with self._connection:
+                self._connection.execute(
+                    (
+                        "INSERT OR REPLACE INTO shell_folder_results "
+                        "(fingerprint, resource_fingerprints, shell_folders) "
+                        "VALUES (?, ?, ?)"
+                    ),
+                    (
+                        fingerprint,
+                        json.dumps(resource_fingerprints, sort_keys=True),
+                        json.dumps(shell_folders),
+                    ),
+                )
+
+        except sqlite3.Error as exception:
+            logging.warning(
+                f"Unable to write shell folder cache: {self._path:s} with error: "
+                f"{exception!s}"
+            )
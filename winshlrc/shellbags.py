@@ -0,0 +1,273 @@
+"""Windows shellbags (BagMRU) resolver."""
+
+import logging
+import uuid
+
+import pyfwsi
+
+from dfimagetools import windows_registry
+
+from dfvfs.resolver import resolver as dfvfs_resolver
+
+
+class ShellbagRecord:
+    """Shellbag record.
+
+    Attributes:
+      class_type (int): class type of the shell item or None if the shell item
+          could not be parsed.
+      identifier (str): identifier (GUID) of the shell item, such as the shell
+          folder identifier of a root folder shell item, or None if not
+          available.
+      key_path (str): path of the BagMRU key that contains the shell item,
+          relative to the root key of the Windows Registry file.
+      name (str): name of the identifier in the knowledge base or None if not
+          available.
+      path (str): path of the shell item, which consists of the names of
+          the shell items from the BagMRU key down to the shell item.
+      resource_types (int): resource type flags of the identifier in
+          the knowledge base.
+      username (str): username of the user profile of the Windows Registry file
+          or None if not available.
+      value_name (str): name of the BagMRU value that contains the shell item.
+    """
+
+    def __init__(self):
+        """Initializes a shellbag record."""
+        super().__init__()
+        self.class_type = None
+        self.identifier = None
+        self.key_path = None
+        self.name = None
+        self.path = None
+        self.resource_types = 0
+        self.username = None
+        self.value_name = None
+
+
+class ShellbagResolver:
+    """Windows shellbags (BagMRU) resolver.
+
+    The resolver walks the BagMRU keys of user Windows Registry files, such as
+    NTUSER.DAT and UsrClass.dat, parses the shell items with pyfwsi and looks up
+    their identifiers in the knowledge base.
+    """
+
+    # Paths of the BagMRU keys relative to the root key of NTUSER.DAT and
+    # UsrClass.dat.
+    _BAG_MRU_KEY_PATHS = [
+        "\\Local Settings\\Software\\Microsoft\\Windows\\Shell\\BagMRU",
+        "\\Software\\Microsoft\\Windows\\Shell\\BagMRU",
+        "\\Software\\Microsoft\\Windows\\ShellNoRoam\\BagMRU",
+        "\\Wow6432Node\\Local Settings\\Software\\Microsoft\\Windows\\Shell\\BagMRU",
+    ]
+
+    def __init__(self, knowledge_base, ascii_codepage="cp1252"):
+        """Initializes a shellbags resolver.
+
+        Args:
+          knowledge_base (WindowsShellKnowledgeBase): knowledge base.
+          ascii_codepage (Optional[str]): ASCII string codepage of the shell
+              items.
+        """
+        super().__init__()
+        self._ascii_codepage = ascii_codepage
+        self._knowledge_base = knowledge_base
+
+    def _GetBagMRUValues(self, registry_key):
+        """Retrieves the shell item values of a BagMRU key.
+
+        Args:
+          registry_key (dfwinreg.WinRegistryKey): BagMRU key.
+
+        Returns:
+          iterator[dfwinreg.WinRegistryValue]: shell item values, in the order
+              of their number.
+        """
+        registry_values = [
+            registry_value
+            for registry_value in registry_key.GetValues()
+            if registry_value.name.isdigit()
+        ]
+        return iter(sorted(registry_values, key=lambda value: int(value.name)))
+
+    def _GetShellItemValues(self, shell_item):
+        """Retrieves the name and identifier of a shell item.
+
+        Args:
+          shell_item (pyfwsi.item): shell item.
+
+        Returns:
+          tuple[str, str]: name or None if not available and identifier (GUID)
+              or None if not available.
+        """
+        identifier = None
+        name = None
+
+        if isinstance(shell_item, pyfwsi.root_folder):
+            identifier = shell_item.shell_folder_identifier
+
+        elif isinstance(shell_item, pyfwsi.volume):
+            # Strip the trailing path segment separator of volume names, such
+            # as "C:\\", since the path segments are joined by a separator.
+            name = (shell_item.name or "").rstrip("\\") or None
+            identifier = shell_item.shell_folder_identifier
+
+        elif isinstance(shell_item, pyfwsi.file_entry):
+            name = shell_item.name
+            for extension_block in shell_item.extension_blocks:
+                if isinstance(extension_block, pyfwsi.file_entry_extension):
+                    name = extension_block.long_name or name
+
+        elif isinstance(shell_item, pyfwsi.control_panel_item):
+            identifier = shell_item.identifier
+
+        elif isinstance(shell_item, pyfwsi.network_location):
+            name = shell_item.location
+
+        elif isinstance(shell_item, pyfwsi.compressed_folder):
+            name = shell_item.name
+
+        elif isinstance(shell_item, pyfwsi.users_property_view):
+            identifier = shell_item.known_folder_identifier
+
+        return name, identifier or shell_item.delegate_folder_identifier
+
+    def _ResolveValue(self, registry_value, record):
+        """Resolves the shell items of a BagMRU value.
+
+        Args:
+          registry_value (dfwinreg.WinRegistryValue): BagMRU value.
+          record (ShellbagRecord): shellbag record to set the values of.
+
+        Returns:
+          list[str]: names of the shell items.
+        """
+        item_list = pyfwsi.item_list()
+
+        try:
+            item_list.copy_from_byte_stream(
+                registry_value.data, ascii_codepage=self._ascii_codepage
+            )
+        except (IOError, TypeError) as exception:
+            logging.warning(
+                f"Unable to parse shell items of value: {registry_value.name:s} in "
+                f"key: {record.key_path:s} with error: {exception!s}"
+            )
+            return ["<unknown>"]
+
+        names = []
+        for shell_item in iter(item_list.items):
+            name, identifier = self._GetShellItemValues(shell_item)
+
+            record.class_type = shell_item.class_type
+            record.identifier = identifier
+            record.name = None
+            record.resource_types = 0
+
+            if identifier:
+                resource_types, knowledge_base_name = (
+                    self._knowledge_base.ResolveIdentifier(
+                        uuid.UUID(identifier).bytes_le
+                    )
+                )
+                record.name = knowledge_base_name
+                record.resource_types = resource_types
+
+                name = name or knowledge_base_name or f"{{{identifier:s}}}"
+
+            names.append(name or f"<class type: 0x{shell_item.class_type:02x}>")
+
+        return names
+
+    def ResolveBagMRUKey(self, bag_mru_key, username=None):
+        """Resolves the shellbags of a BagMRU key and its sub keys.
+
+        Args:
+          bag_mru_key (dfwinreg.WinRegistryKey): BagMRU key.
+          username (Optional[str]): username of the user profile of the Windows
+              Registry file.
+
+        Yields:
+          ShellbagRecord: shellbag record.
+        """
+        # The BagMRU keys are walked depth-first with a stack of value iterators,
+        # instead of recursion, so that the records are yielded in the order of
+        # the values and deeply nested keys do not exhaust the recursion limit.
+        stack = [(bag_mru_key, self._GetBagMRUValues(bag_mru_key), [])]
+        while stack:
+            registry_key, registry_values, parent_names = stack[-1]
+
+            registry_value = next(registry_values, None)
+            if registry_value is None:
+                stack.pop()
+                continue
+
+            record = ShellbagRecord()
+            record.key_path = registry_key.path
+            record.username = username
+            record.value_name = registry_value.name
+
+            names = parent_names + self._ResolveValue(registry_value, record)
+            record.path = "\\".join(names)
+
+            yield record
+
+            subkey = registry_key.GetSubkeyByName(registry_value.name)
+            if subkey:
+                stack.append((subkey, self._GetBagMRUValues(subkey), names))
+
+    def ResolveRegistryFile(self, registry_file, username=None):
+        """Resolves the shellbags of a user Windows Registry file.
+
+        Args:
+          registry_file (dfwinreg.WinRegistryFile): user Windows Registry file,
+              such as NTUSER.DAT or UsrClass.dat.
+          username (Optional[str]): username of the user profile of the Windows
+              Registry file.
+
+        Yields:
+          ShellbagRecord: shellbag record.
+        """
+        for key_path in self._BAG_MRU_KEY_PATHS:
+            bag_mru_key = registry_file.GetKeyByPath(key_path)
+            if bag_mru_key:
+                yield from self.ResolveBagMRUKey(bag_mru_key, username=username)
+
+    def ResolveRegistryFilePathSpec(self, path_spec, username=None):
+        """Resolves the shellbags of a user Windows Registry file.
+
+        Args:
+          path_spec (dfvfs.PathSpec): path specification of the user Windows
+              Registry file, such as NTUSER.DAT or UsrClass.dat.
+          username (Optional[str]): username of the user profile of the Windows
+              Registry file.
+
+        Yields:
+          ShellbagRecord: shellbag record.
+        """
+        file_object = dfvfs_resolver.Resolver.OpenFileObject(path_spec)
+        if file_object is None:
+            return
+
+        registry_file = windows_registry.REGFWindowsRegistryFile(
+            ascii_codepage=self._ascii_codepage
+        )
+
+        try:
+            # Note that registry_file takes over management of file_object.
+            registry_file.Open(file_object)
+
+        except IOError as exception:
+            file_object.close()
+            logging.warning(
+                f"Unable to open Windows Registry file: {path_spec.location!s} with "
+                f"error: {exception!s}"
+            )
+            return
+
+        try:
+            yield from self.ResolveRegistryFile(registry_file, username=username)
+
+        finally:
+            registry_file.Close()
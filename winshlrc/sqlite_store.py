@@ -0,0 +1,127 @@
+"""SQLite-based store."""
+
+import os
+import pathlib
+import sqlite3
+
+
+class SQLiteStore:
+    """SQLite-based store.
+
+    The store is a SQLite database with a metadata table that contains
+    the format version of the store. Subclasses define the format version,
+    the schema and the PRAGMA statements used when the store is opened.
+    """
+
+    # Description of the store, used in error messages.
+    _DESCRIPTION = "SQLite store"
+
+    _FORMAT_VERSION = 1
+
+    # PRAGMA statements that are executed when the store is opened, unless it
+    # is opened read-only.
+    _PRAGMAS = []
+
+    # Statements that create the tables and indexes of the store, where
+    # the metadata table is required.
+    _SCHEMA = [
+        (
+            "CREATE TABLE IF NOT EXISTS metadata ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        ),
+    ]
+
+    # Number of seconds to wait for another process that is writing to
+    # the store.
+    _TIMEOUT = 5.0
+
+    def __init__(self, path):
+        """Initializes a store.
+
+        Args:
+          path (str): path of the SQLite database file.
+        """
+        super().__init__()
+        self._connection = None
+        self._path = path
+
+    def _CheckFormatVersion(self, read_only=False):
+        """Checks the format version of the store and sets it if not present.
+
+        Args:
+          read_only (Optional[bool]): True if the store was opened read-only,
+              in which case the format version is not set.
+
+        Raises:
+          OSError: if the format version of the store is missing or not
+              supported.
+        """
+        row = self._connection.execute(
+            "SELECT value FROM metadata WHERE key = 'format_version'"
+        ).fetchone()
+
+        if row is None and read_only:
+            raise OSError(f"Missing {self._DESCRIPTION:s} format version.")
+
+        if row is None:
+            # Another process can set the format version after it was read.
+            with self._connection:
+                self._connection.execute(
+                    (
+                        "INSERT OR IGNORE INTO metadata (key, value) "
+                        "VALUES ('format_version', ?)"
+                    ),
+                    (f"{self._FORMAT_VERSION:d}",),
+                )
+
+        elif row[0] != f"{self._FORMAT_VERSION:d}":
+            raise OSError(
+                f"Unsupported {self._DESCRIPTION:s} format version: {row[0]:s}"
+            )
+
+    def Close(self):
+        """Closes the store."""
+        if self._connection:
+            self._connection.close()
+            self._connection = None
+
+    def Open(self, read_only=False):
+        """Opens the store and creates it if it does not exist.
+
+        Args:
+          read_only (Optional[bool]): True if the store should be opened
+              read-only, in which case it is not created and its schema is not
+              changed.
+
+        Raises:
+          OSError: if the store is already open, cannot be opened or its
+              format version is not supported.
+        """
+        if self._connection:
+            raise OSError("Already open.")
+
+        try:
+            if read_only:
+                uri = pathlib.Path(os.path.abspath(self._path)).as_uri()
+                self._connection = sqlite3.connect(
+                    f"{uri:s}?mode=ro", timeout=self._TIMEOUT, uri=True
+                )
+
+            else:
+                self._connection = sqlite3.connect(self._path, timeout=self._TIMEOUT)
+
+                for statement in self._PRAGMAS:
+                    self._connection.execute(statement)
+
+                with self._connection:
+                    for statement in self._SCHEMA:
+                        self._connection.execute(statement)
+
+            self._CheckFormatVersion(read_only=read_only)
+
+        except (OSError, sqlite3.Error) as exception:
+            self.Close()
+            raise OSError(
+                f"Unable to open {self._DESCRIPTION:s}: {self._path:s} with error: "
+                f"{exception!s}"
+            ) from exception
@@ -0,0 +1,122 @@
+"""Extraction statistics."""
+
+import collections
+import time
+
+
+class ExtractionStatistics:
+    """Extraction statistics.
+
+    The statistics consist of counters, such as the number of resource files
+    opened, and the time spent per stage, such as scanning for volumes. Stages
+    can be nested, for example opening resource files happens while resolving
+    names, in which case the time of the outer stage includes that of the inner
+    stage. Nested starts of the same stage are only timed once.
+    """
+
+    # Descriptions of the counters.
+    COUNTER_DESCRIPTIONS = {
+        "class_identifiers": "class identifier keys enumerated",
+        "mui_path_cache_hits": "MUI resource file path cache hits",
+        "mui_path_cache_misses": "MUI resource file path cache misses",
+        "mui_resource_files_found": "MUI resource files found",
+        "registry_files_opened": "Windows Registry files opened",
+        "resource_file_cache_hits": "string resource file cache hits",
+        "resource_file_cache_misses": "string resource file cache misses",
+        "resource_files_missing": "resource files that could not be found",
+        "resource_files_opened": "resource files opened",
+        "shell_folder_cache_hits": "shell folder values cache hits",
+        "shell_folder_cache_misses": "shell folder values cache misses",
+        "shell_folder_result_cache_hits": "shell folder result cache hits",
+        "shell_folder_result_cache_misses": "shell folder result cache misses",
+        "shell_folders": "shell folders extracted",
+        "string_cache_hits": "string cache hits",
+        "string_cache_misses": "string cache misses",
+        "string_tables_decoded": "string table resource items decoded",
+        "unresolved_references": "string references that could not be resolved",
+        "volumes_opened": "Windows volumes opened",
+    }
+
+    # Descriptions of the stages.
+    STAGE_DESCRIPTIONS = {
+        "class_identifier_enumeration": "enumerating class identifier keys",
+        "mui_probing": "probing for MUI resource files",
+        "name_resolution": "resolving names that reference a string resource",
+        "registry_file_hashing": "hashing Windows Registry files",
+        "registry_loading": "loading Windows Registry files",
+        "resource_file_opening": "opening resource files",
+        "string_decoding": "decoding string table resources",
+        "volume_opening": "opening Windows volumes",
+        "volume_scanning": "scanning for Windows volumes",
+        "windows_version_detection": "detecting the Windows version",
+    }
+
+    def __init__(self):
+        """Initializes extraction statistics."""
+        super().__init__()
+        self._stage_depths = collections.Counter()
+        self._stage_start_times = {}
+
+        self.counters = collections.Counter()
+        self.stage_calls = collections.Counter()
+        self.stage_times = collections.Counter()
+
+    def CopyToDict(self):
+        """Copies the extraction statistics to a dictionary.
+
+        Returns:
+          dict[str, dict[str, object]]: counters, number of calls per stage and
+              time per stage in seconds.
+        """
+        return {
+            "counters": dict(self.counters),
+            "stage_calls": dict(self.stage_calls),
+            "stage_times": dict(self.stage_times),
+        }
+
+    def IncrementCounter(self, name, value=1):
+        """Increments a counter.
+
+        Args:
+          name (str): name of the counter.
+          value (Optional[int]): value to increment the counter with.
+        """
+        self.counters[name] += value
+
+    def Merge(self, statistics):
+        """Merges other extraction statistics, such as of a worker process.
+
+        Args:
+          statistics (ExtractionStatistics): extraction statistics to merge.
+        """
+        self.counters.update(statistics.counters)
+        self.stage_calls.update(statistics.stage_calls)
+        self.stage_times.update(statistics.stage_times)
+
+    def StartStage(self, name):
+        """Starts timing a stage.
+
+        Args:
+          name (str): name of the stage.
+        """
+        self._stage_depths[name] += 1
+        if self._stage_depths[name] == 1:
+            self._stage_start_times[name] = time.perf_counter()
+
+    def StopStage(self, name):
+        """Stops timing a stage.
+
+        Args:
+          name (str): name of the stage.
+
+        Raises:
+          RuntimeError: if the stage was not started.
+        """
+        if not self._stage_depths[name]:
+            raise RuntimeError(f"Stage: {name:s} was not started.")
+
+        self._stage_depths[name] -= 1
+        if not self._stage_depths[name]:
+            start_time = self._stage_start_times.pop(name)
+            self.stage_calls[name] += 1
+            self.stage_times[name] += time.perf_counter() - start_time
@@ -4,6 +4,63 @@
 class WindowsVersions:
     """Windows versions."""
 
+    _CLIENT_VERSION_PER_BUILD_NUMBER = {
+        1381: "Windows NT4",
+        2195: "Windows 2000",
+        2600: "Windows XP 32-bit",
+        3790: "Windows XP 64-bit",
+        6000: "Windows Vista",
+        6001: "Windows Vista",
+        6002: "Windows Vista",
+        6003: "Windows Vista",
+        7600: "Windows 7",
+        7601: "Windows 7",
+        9200: "Windows 8.0",
+        9600: "Windows 8.1",
+        10240: "Windows 10 (1507)",
+        10586: "Windows 10 (1511)",
+        14393: "Windows 10 (1607)",
+        15063: "Windows 10 (1703)",
+        16299: "Windows 10 (1709)",
+        17134: "Windows 10 (1803)",
+        17763: "Windows 10 (1809)",
+        18362: "Windows 10 (1903)",
+        18363: "Windows 10 (1909)",
+        19041: "Windows 10 (2004)",
+        19042: "Windows 10 (20H2)",
+        19043: "Windows 10 (21H1)",
+        19044: "Windows 10 (21H2)",
+        19045: "Windows 10 (22H2)",
+        22000: "Windows 11 (21H2)",
+        22621: "Windows 11 (22H2)",
+        22631: "Windows 11 (23H2)",
+        26100: "Windows 11 (24H2)",
+    }
+
+    _SERVER_VERSION_PER_BUILD_NUMBER = {
+        1381: "Windows NT4",
+        2195: "Windows 2000",
+        3790: "Windows 2003",
+        6001: "Windows 2008",
+        6002: "Windows 2008",
+        6003: "Windows 2008",
+        7600: "Windows 2008 R2",
+        7601: "Windows 2008 R2",
+        9200: "Windows 2012",
+        9600: "Windows 2012 R2",
+        14393: "Windows 2016",
+        17763: "Windows 2019",
+        20348: "Windows 2022",
+        26100: "Windows 2025",
+    }
+
+    # Windows 9x variants are identified by their major and minor version.
+    _VERSION_PER_9X_VERSION = {
+        (4, 0): "Windows 95",
+        (4, 10): "Windows 98",
+        (4, 90): "Windows Me",
+    }
+
     _SORT_KEY_PER_VERSION = {
         "Windows 10": 2015,
         "Windows 11": 2021,
@@ -16,6 +73,8 @@ class WindowsVersions:
         "Windows 2012 R2": 2013,
         "Windows 2016": 2016,
         "Windows 2019": 2019,
+        "Windows 2022": 2021,
+        "Windows 2025": 2024,
         "Windows 7": 2009,
         "Windows 8.0": 2012,
         "Windows 8.1": 2013,
@@ -40,3 +99,68 @@ class WindowsVersions:
         """
         sort_key = cls._SORT_KEY_PER_VERSION.get(windows_version, 9999)
         return sort_key, windows_version
+
+    @classmethod
+    def GetVersionByBuildNumber(cls, build_number, product_name=None, release=None):
+        """Retrieves the Windows version for a specific build number.
+
+        Args:
+          build_number (int): build number, such as 17763.
+          product_name (Optional[str]): product name, such as "Windows Server 2019
+              Standard", used to distinguish server from client versions.
+          release (Optional[str]): release identifier, such as "1809" or "21H2",
+              used for Windows 10 and 11 builds that are not known.
+
+        Returns:
+          str: Windows version, such as "Windows 10 (1809)", or None if not
+              available.
+        """
+        if product_name and "server" in product_name.lower():
+            windows_version = cls._SERVER_VERSION_PER_BUILD_NUMBER.get(build_number)
+            if windows_version == "Windows 2003" and " R2" in product_name:
+                windows_version = "Windows 2003 R2"
+
+            return windows_version
+
+        windows_version = cls._CLIENT_VERSION_PER_BUILD_NUMBER.get(build_number)
+        if not windows_version and release:
+            if build_number >= 22000:
+                windows_version = f"Windows 11 ({release:s})"
+            elif build_number >= 10240:
+                windows_version = f"Windows 10 ({release:s})"
+
+        return windows_version
+
+    @classmethod
+    def GetVersionByFileVersion(cls, file_version, product_name=None):
+        """Retrieves the Windows version for a specific file version.
+
+        Args:
+          file_version (str): file version of the kernel executable or version
+              number of Windows 9x, such as "10.0.17763.1" or "4.10.2222".
+          product_name (Optional[str]): product name, such as "Windows Server 2019
+              Standard", used to distinguish server from client versions.
+
+        Returns:
+          str: Windows version, such as "Windows 10 (1809)", or None if not
+              available.
+        """
+        try:
+            version_segments = [int(segment, 10) for segment in file_version.split(".")]
+        except ValueError:
+            return None
+
+        if len(version_segments) < 3:
+            return None
+
+        major_version, minor_version, build_number = version_segments[:3]
+
+        windows_version = cls.GetVersionByBuildNumber(
+            build_number, product_name=product_name
+        )
+        if not windows_version and major_version == 4:
+            windows_version = cls._VERSION_PER_9X_VERSION.get(
+                (major_version, minor_version)
+            )
+
+        return windows_version
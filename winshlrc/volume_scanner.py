@@ -4,6 +4,7 @@ from dfimagetools import windows_registry
 
 from dfvfs.helpers import command_line as dfvfs_command_line
 from dfvfs.helpers import volume_scanner as dfvfs_volume_scanner
+from dfvfs.helpers import windows_path_resolver as dfvfs_windows_path_resolver
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.lib import errors as dfvfs_errors
 from dfvfs.resolver import resolver as dfvfs_resolver
@@ -11,6 +12,8 @@ from dfvfs.resolver import resolver as dfvfs_resolver
 from dfwinreg import interface as dfwinreg_interface
 from dfwinreg import registry as dfwinreg_registry
 
+from winshlrc import registry_cache
+
 
 class VolumeScannerOptions(dfvfs_volume_scanner.VolumeScannerOptions):
     """Volume scanner options.
@@ -84,21 +87,128 @@ class SingleFileWindowsRegistryFileReader(dfwinreg_interface.WinRegistryFileRead
         return registry_file
 
 
-class WindowsRegistryVolumeScanner(dfvfs_volume_scanner.WindowsVolumeScanner):
+class WindowsVolumeScanner(dfvfs_volume_scanner.WindowsVolumeScanner):
+    """Windows volume scanner that can reuse cached volume scan results."""
+
+    def __init__(self, mediator=None, scan_result_cache=None):
+        """Initializes a Windows volume scanner.
+
+        Args:
+          mediator (Optional[dfvfs.VolumeScannerMediator]): a volume scanner
+              mediator.
+          scan_result_cache (Optional[ScanResultCache]): cache of volume scan
+              results or None if scan results should not be cached.
+        """
+        super().__init__(mediator=mediator)
+        self._scan_result_cache = scan_result_cache
+
+    def _OpenWindowsVolume(self, path_spec):
+        """Opens a Windows volume.
+
+        Args:
+          path_spec (dfvfs.PathSpec): file system path specification of the volume.
+
+        Returns:
+          bool: True if the volume contains a Windows directory.
+        """
+        self._file_system = dfvfs_resolver.Resolver.OpenFileSystem(path_spec)
+
+        if path_spec.type_indicator == dfvfs_definitions.TYPE_INDICATOR_OS:
+            mount_point = path_spec
+        else:
+            mount_point = path_spec.parent
+
+        self._path_resolver = dfvfs_windows_path_resolver.WindowsPathResolver(
+            self._file_system, mount_point
+        )
+
+        if not self._ScanFileSystemForWindowsDirectory(self._path_resolver):
+            return False
+
+        self._path_resolver.SetEnvironmentVariable(
+            "SystemRoot", self._windows_directory
+        )
+        self._path_resolver.SetEnvironmentVariable("WinDir", self._windows_directory)
+
+        return True
+
+    def GetWindowsVolumePathSpecs(self, source_path, options=None):
+        """Scans a source for volumes that can contain a Windows directory.
+
+        Args:
+          source_path (str): source path.
+          options (Optional[VolumeScannerOptions]): volume scanner options. If None
+              the default volume scanner options are used, which are defined in the
+              VolumeScannerOptions class.
+
+        Returns:
+          list[dfvfs.PathSpec]: file system path specifications of the volumes.
+
+        Raises:
+          ScannerError: if the source path does not exists, or if the source path
+              is not a file or directory, or if the format of or within
+              the source file is not supported.
+        """
+        if not options:
+            options = VolumeScannerOptions()
+
+        scan_result = None
+        if self._scan_result_cache:
+            scan_result = self._scan_result_cache.GetScanResult(source_path, options)
+
+        if scan_result:
+            source_type, base_path_specs = scan_result
+
+        else:
+            scan_context = self._ScanSource(source_path)
+
+            source_type = scan_context.source_type
+            if source_type == dfvfs_definitions.SOURCE_TYPE_FILE:
+                base_path_specs = []
+            else:
+                base_path_specs = self._GetBasePathSpecs(scan_context, options)
+
+            if self._scan_result_cache:
+                self._scan_result_cache.SetScanResult(
+                    source_path, options, source_type, base_path_specs
+                )
+
+        self._source_path = source_path
+        self._source_type = source_type
+
+        return base_path_specs
+
+
+class WindowsRegistryVolumeScanner(WindowsVolumeScanner):
     """Windows Registry volume scanner.
 
     Attributes:
       registry (dfwinreg.WinRegistry): Windows Registry.
     """
 
-    def __init__(self, mediator=None):
+    # Paths of the user Windows Registry files relative to the user profile.
+    _USER_REGISTRY_FILE_PATHS = [
+        "NTUSER.DAT",
+        "AppData\\Local\\Microsoft\\Windows\\UsrClass.dat",
+        "Local Settings\\Application Data\\Microsoft\\Windows\\UsrClass.dat",
+    ]
+
+    def __init__(self, mediator=None, registry_file_cache=None, scan_result_cache=None):
         """Initializes a Windows Registry collector.
 
         Args:
           mediator (Optional[dfvfs.VolumeScannerMediator]): a volume scanner
               mediator.
+          registry_file_cache (Optional[WindowsRegistryFileCache]): cache of
+              Windows Registry files or None to use the default cache, which is
+              shared with the Windows shell extractor.
+          scan_result_cache (Optional[ScanResultCache]): cache of volume scan
+              results or None if scan results should not be cached.
         """
-        super().__init__(mediator=mediator)
+        super().__init__(mediator=mediator, scan_result_cache=scan_result_cache)
+        self._registry_file_cache = (
+            registry_file_cache or registry_cache.DEFAULT_REGISTRY_FILE_CACHE
+        )
         self._single_file = False
         self._users_path = False
 
@@ -161,6 +271,54 @@ class WindowsRegistryVolumeScanner(dfvfs_volume_scanner.WindowsVolumeScanner):
 
         return username
 
+    def Close(self):
+        """Closes the Windows Registry.
+
+        Windows Registry files stored in a volume are released to the Windows
+        Registry file cache.
+        """
+        if self.registry:
+            if isinstance(self.registry, registry_cache.CachedWinRegistry):
+                self.registry.Close()
+            self.registry = None
+
+    def GetUserRegistryFilePathSpecs(self):
+        """Retrieves the path specifications of the user Windows Registry files.
+
+        The user Windows Registry files of all user profiles are retrieved,
+        independent of the selected username.
+
+        Returns:
+          dict[str, list[dfvfs.PathSpec]]: path specifications of the NTUSER.DAT
+              and UsrClass.dat files per username.
+        """
+        if not self._users_path or not self._path_resolver:
+            return {}
+
+        users_path_spec = self._path_resolver.ResolvePath(self._users_path)
+        if not users_path_spec:
+            return {}
+
+        path_specs_per_username = {}
+
+        users_file_entry = dfvfs_resolver.Resolver.OpenFileEntry(users_path_spec)
+        for sub_file_entry in users_file_entry.sub_file_entries:
+            if not sub_file_entry.IsDirectory():
+                continue
+
+            path_specs = []
+            for path in self._USER_REGISTRY_FILE_PATHS:
+                path_spec = self._path_resolver.ResolvePath(
+                    f"{self._users_path:s}\\{sub_file_entry.name:s}\\{path:s}"
+                )
+                if path_spec:
+                    path_specs.append(path_spec)
+
+            if path_specs:
+                path_specs_per_username[sub_file_entry.name] = path_specs
+
+        return path_specs_per_username
+
     def IsSingleFileRegistry(self):
         """Determines if the Registry consists of a single file.
 
@@ -186,7 +344,12 @@ class WindowsRegistryVolumeScanner(dfvfs_volume_scanner.WindowsVolumeScanner):
               is not a file or directory, or if the format of or within
               the source file is not supported.
         """
-        result = super().ScanForWindowsVolume(source_path, options=options)
+        if not options:
+            options = VolumeScannerOptions()
+
+        base_path_specs = self.GetWindowsVolumePathSpecs(source_path, options=options)
+
+        result = bool(base_path_specs) and self._OpenWindowsVolume(base_path_specs[0])
 
         registry_file_reader = None
         if self._source_type == dfvfs_definitions.SOURCE_TYPE_FILE:
@@ -201,16 +364,21 @@ class WindowsRegistryVolumeScanner(dfvfs_volume_scanner.WindowsVolumeScanner):
                     "UserProfile", f"{self._users_path:s}\\{username:s}"
                 )
 
-            registry_file_reader = (
-                windows_registry.StorageMediaImageWindowsRegistryFileReader(
-                    self._file_system, self._path_resolver
-                )
+            registry_file_reader = registry_cache.CachedWindowsRegistryFileReader(
+                self._file_system, self._path_resolver, self._registry_file_cache
             )
 
         if registry_file_reader:
-            self.registry = dfwinreg_registry.WinRegistry(
-                registry_file_reader=registry_file_reader
-            )
+            self.Close()
+
+            if self._single_file:
+                self.registry = dfwinreg_registry.WinRegistry(
+                    registry_file_reader=registry_file_reader
+                )
+            else:
+                self.registry = registry_cache.CachedWinRegistry(
+                    registry_file_reader=registry_file_reader
+                )
 
         return bool(registry_file_reader)
 
@@ -122,8 +122,14 @@ class YAMLKnownFoldersDefinitionsFile:
 
     Where:
     * alternate_display_names, defines alternate diplay names of the known folder;
+    * csidl, defines the CSIDL names of the known folder, such as CSIDL_DRIVES;
+    * default_path, defines the default path of the known folder;
     * display_name, defines the name of the known folder;
     * identifier, defines the known folder identifier;
+    * legacy_default_path, defines the default path of the known folder on
+      Windows versions before Vista;
+    * legacy_display_name, defines the display name of the known folder on
+      Windows versions before Vista;
     * name, defines the name of the known folder;
     * windows_versions, defines Windows versions the known folder was seen.
     """
@@ -172,6 +178,7 @@ class YAMLKnownFoldersDefinitionsFile:
         known_folder_definition.alternate_display_names = (
             yaml_known_folder_definition.get("alternate_display_names", [])
         )
+        known_folder_definition.csidl = yaml_known_folder_definition.get("csidl", [])
         known_folder_definition.default_path = yaml_known_folder_definition.get(
             "default_path"
         )
@@ -179,6 +186,12 @@ class YAMLKnownFoldersDefinitionsFile:
             "display_name"
         )
         known_folder_definition.identifier = identifier
+        known_folder_definition.legacy_default_path = yaml_known_folder_definition.get(
+            "legacy_default_path"
+        )
+        known_folder_definition.legacy_display_name = yaml_known_folder_definition.get(
+            "legacy_display_name"
+        )
         known_folder_definition.name = yaml_known_folder_definition.get("name")
         known_folder_definition.windows_versions = yaml_known_folder_definition.get(
             "windows_versions", []